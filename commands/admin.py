@@ -64,7 +64,7 @@ class CmdApprove(MuxCommand):
             return
 
         # Set both the tag and the attribute
-        target.db.approved = True
+        target.set_approved(True)
         target.tags.remove("unapproved", category="approval")
         target.tags.add("approved", category="approval")
         
@@ -149,7 +149,7 @@ class CmdUnapprove(MuxCommand):
             return
 
         # Remove approved status and add unapproved tag
-        target.db.approved = False
+        target.set_approved(False)
         target.tags.remove("approved", category="approval")
         target.tags.add("unapproved", category="approval")
         
@@ -236,7 +236,7 @@ class CmdMassUnapprove(MuxCommand):
         total_groups_removed = 0
         
         for char in approved_chars:
-            char.db.approved = False
+            char.set_approved(False)
             char.tags.add("unapproved", category="approval")
             if char.tags.has("approved", category="approval"):
                 char.tags.remove("approved", category="approval")
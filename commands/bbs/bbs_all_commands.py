@@ -12,8 +12,10 @@ from evennia import create_object
 from evennia.server.sessionhandler import SESSION_HANDLER
 
 # Local Imports
-from typeclasses.bbs_controller import BBSController
+from typeclasses.bbs_controller import BBSController, format_time
 from world.utils.bbs_utils import get_or_create_bbs_controller
+from world.bbs.access import BBS_ACCESS
+from world.bbs.search import MIN_TERM_LENGTH, parse_date, post_terms
 from typeclasses.groups import Group, get_group_by_name, get_character_groups
 import pytz
 from world.utils.time_utils import TIME_MANAGER
@@ -36,6 +38,8 @@ class CmdBBS(default_cmds.MuxCommand):
       +bbs/readall <board>       - Mark all posts in a board as read
       +bbs/unsubscribe <board>   - Unsubscribe from a board (hide it from your listings)
       +bbs/subscribe <board>     - Resubscribe to a board you previously unsubscribed from
+      +bbs/search <words> [board:<board>] [author:<name>] [after:<date>] [before:<date>][=<page>]
+                                - Search posts you can read; dates are YYYY-MM-DD
       
     Admin/Builder commands:
       +bbs/create <name> = <description>[/group=<group1>,<group2>...]
@@ -104,6 +108,8 @@ class CmdBBS(default_cmds.MuxCommand):
       +bbs/post announcements/Welcome! = Hello everyone!
       +bbs/edit 1/1 = This is the corrected message.
       +bbs/delete 1/1
+      +bbs/search curfew board:announcements after:2025-01-01
+      +bbs/search author:Storyteller=2
       +bbs/create Staff = Staff Discussion
       +bbs/create IC = In Character / private /group=Vampire,Werewolf
       +bbs/readonly Announcements
@@ -131,7 +137,7 @@ class CmdBBS(default_cmds.MuxCommand):
             exclude_char (Character, optional): Character to exclude from notification
         """
         session_list = SESSION_HANDLER.get_sessions()
-        controller = get_or_create_bbs_controller()
+        notified = set()
         
         for session in session_list:
             if not session.logged_in:
@@ -140,8 +146,13 @@ class CmdBBS(default_cmds.MuxCommand):
             if not puppet or (exclude_char and puppet == exclude_char):
                 continue
             
-            # Check if user has access to the board
-            if controller.has_access(board['id'], puppet.key):
+            # A character with several sessions is only checked and messaged once
+            if puppet.id in notified:
+                continue
+            notified.add(puppet.id)
+            
+            # Check if user has access to the board, from the cached access sets
+            if BBS_ACCESS.can_read(puppet, board['id']):
                 # Check if user has unsubscribed from the board
                 unsubscribed_boards = puppet.attributes.get("unsubscribed_bbs_boards", [])
                 if board['id'] in unsubscribed_boards:
@@ -256,6 +267,8 @@ class CmdBBS(default_cmds.MuxCommand):
                 self.do_unsubscribe()
             elif switch == "subscribe":
                 self.do_subscribe()
+            elif switch == "search":
+                self.do_search()
             
             # Admin/Builder commands
             elif switch in ["create", "editboard", "lock", "pin", "unpin", "deleteboard", "readonly", "viewas"]:
@@ -583,7 +596,7 @@ class CmdBBS(default_cmds.MuxCommand):
     def do_scan(self):
         """Handle the scan switch - show unread posts on all accessible boards."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
@@ -598,6 +611,7 @@ class CmdBBS(default_cmds.MuxCommand):
         # Sort boards by ID
         sorted_boards = sorted(boards.items(), key=lambda x: x[0])
 
+        readable_boards = []
         for board_id, board in sorted_boards:
             if not controller.has_access(board_id, self.caller.key):
                 continue
@@ -606,12 +620,16 @@ class CmdBBS(default_cmds.MuxCommand):
             if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
                 continue
 
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            if not unread_posts:
+            readable_boards.append((board_id, board))
+
+        # One query counts unread posts on every readable board
+        unread_counts = controller.get_unread_counts(self.caller.key, [board for _, board in readable_boards])
+        for board_id, board in readable_boards:
+            if board_id not in unread_counts:
                 continue
 
-            total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+            total_unread += unread_counts[board_id]
+            unread_boards.append((board['name'], unread_counts[board_id]))
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
@@ -628,12 +646,8 @@ class CmdBBS(default_cmds.MuxCommand):
         output.append("|wUnread Postings on the Global Bulletin Board|n")
         output.append(f"{'|b-|n'*78}")
 
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, self.caller.key):
-                continue
-            
-            # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
+        for board_id, board in readable_boards:
+            if board_id not in unread_counts:
                 continue
 
             unread_posts = controller.get_unread_posts(board_id, self.caller.key)
@@ -701,14 +715,13 @@ class CmdBBS(default_cmds.MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, self.caller.key)
+        controller.mark_board_read(board['id'], self.caller.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read.")
 
     def list_boards(self, controller):
         """List all available boards."""
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
@@ -724,6 +737,7 @@ class CmdBBS(default_cmds.MuxCommand):
 
         # Sort boards by ID and convert to list of tuples
         sorted_boards = sorted(boards.items(), key=lambda x: x[0])
+        unread_counts = controller.get_unread_counts(self.caller.key, boards.values())
 
         for board_id, board in sorted_boards:
             # Skip boards the character doesn't have access to
@@ -750,17 +764,14 @@ class CmdBBS(default_cmds.MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post)
+            if board['last_post_at']:
+                # Only show date, not time
+                last_post = self.format_date(board['last_post_at'])
 
             num_posts = len(board['posts'])
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            unread_count = len(unread_posts)
+            unread_count = unread_counts.get(board_id, 0)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
             # Fix alignment by using format string with exact spacing
@@ -794,6 +805,8 @@ class CmdBBS(default_cmds.MuxCommand):
         posts = board['posts']
         pinned_posts = [post for post in posts if post.get('pinned', False)]
         unpinned_posts = [post for post in posts if not post.get('pinned', False)]
+        post_numbers = {post['id']: number for number, post in enumerate(posts, 1)}
+        read_marker = controller.get_read_marker(board['id'], self.caller.key)
 
         # Table Header
         output = []
@@ -823,17 +836,17 @@ class CmdBBS(default_cmds.MuxCommand):
 
         # List pinned posts first with correct IDs
         for i, post in enumerate(pinned_posts):
-            post_id = posts.index(post) + 1
+            post_id = post_numbers[post['id']]
             formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
+            is_unread = not read_marker.is_read(post['id'])
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
         # List unpinned posts with correct IDs
         for post in unpinned_posts:
-            post_id = posts.index(post) + 1
+            post_id = post_numbers[post['id']]
             formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
+            is_unread = not read_marker.is_read(post['id'])
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -962,6 +975,8 @@ class CmdBBS(default_cmds.MuxCommand):
         posts = board['posts']
         pinned_posts = [post for post in posts if post.get('pinned', False)]
         unpinned_posts = [post for post in posts if not post.get('pinned', False)]
+        post_numbers = {post['id']: number for number, post in enumerate(posts, 1)}
+        read_marker = controller.get_read_marker(board['id'], target_player.key)
 
         # Table Header
         output = []
@@ -979,17 +994,17 @@ class CmdBBS(default_cmds.MuxCommand):
 
         # List pinned posts first with correct IDs
         for i, post in enumerate(pinned_posts):
-            post_id = posts.index(post) + 1
+            post_id = post_numbers[post['id']]
             formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
+            is_unread = not read_marker.is_read(post['id'])
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
         # List unpinned posts with correct IDs
         for post in unpinned_posts:
-            post_id = posts.index(post) + 1
+            post_id = post_numbers[post['id']]
             formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
+            is_unread = not read_marker.is_read(post['id'])
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -1000,7 +1015,7 @@ class CmdBBS(default_cmds.MuxCommand):
 
     def list_boards_as_player(self, controller, target_player):
         """List all available boards as if viewed by the target player."""
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
@@ -1014,6 +1029,7 @@ class CmdBBS(default_cmds.MuxCommand):
 
         # Sort boards by ID and convert to list of tuples
         sorted_boards = sorted(boards.items(), key=lambda x: x[0])
+        unread_counts = controller.get_unread_counts(target_player.key, boards.values())
 
         for board_id, board in sorted_boards:
             # Skip boards the character doesn't have access to
@@ -1034,17 +1050,14 @@ class CmdBBS(default_cmds.MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post, target_player)
+            if board['last_post_at']:
+                # Only show date, not time
+                last_post = self.format_date(board['last_post_at'], target_player)
 
             num_posts = len(board['posts'])
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            unread_count = len(unread_posts)
+            unread_count = unread_counts.get(board_id, 0)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
             # Fix alignment by using format string with exact spacing
@@ -1061,7 +1074,7 @@ class CmdBBS(default_cmds.MuxCommand):
     def do_scan_as_player(self, target_player):
         """Handle the scan switch - show unread posts on all accessible boards as if viewed by the target player."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
@@ -1073,16 +1086,17 @@ class CmdBBS(default_cmds.MuxCommand):
         # Sort boards by ID
         sorted_boards = sorted(boards.items(), key=lambda x: x[0])
 
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
-                continue
+        readable_boards = [(board_id, board) for board_id, board in sorted_boards
+                           if controller.has_access(board_id, target_player.key)]
 
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            if not unread_posts:
+        # One query counts unread posts on every readable board
+        unread_counts = controller.get_unread_counts(target_player.key, [board for _, board in readable_boards])
+        for board_id, board in readable_boards:
+            if board_id not in unread_counts:
                 continue
 
-            total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+            total_unread += unread_counts[board_id]
+            unread_boards.append((board['name'], unread_counts[board_id]))
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
@@ -1099,8 +1113,8 @@ class CmdBBS(default_cmds.MuxCommand):
         output.append(f"|wUnread Postings on the Global Bulletin Board (as {target_player.key})|n")
         output.append(f"{'|b-|n'*78}")
 
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
+        for board_id, board in readable_boards:
+            if board_id not in unread_counts:
                 continue
 
             unread_posts = controller.get_unread_posts(board_id, target_player.key)
@@ -1151,8 +1165,7 @@ class CmdBBS(default_cmds.MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, target_player.key)
+        controller.mark_board_read(board['id'], target_player.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read for {target_player.key}.")
 
@@ -1186,6 +1199,79 @@ class CmdBBS(default_cmds.MuxCommand):
         self.caller.msg(f"{post['content']}")
         self.caller.msg(f"{'|b=|n'*78}")
 
+    def do_search(self):
+        """Search the posts on every board the caller can read."""
+        usage = ("Usage: +bbs/search <words> [board:<board>] [author:<name>] "
+                 "[after:<YYYY-MM-DD>] [before:<YYYY-MM-DD>][=<page>]")
+        query = self.lhs if self.rhs else self.args
+        query = query.strip() if query else ""
+        if not query:
+            self.caller.msg(usage)
+            return
+
+        page = 1
+        if self.rhs:
+            try:
+                page = int(self.rhs.strip())
+            except ValueError:
+                self.caller.msg(f"Page must be a number. {usage}")
+                return
+
+        # Split filters (key:value) from the words to search for
+        filters = {}
+        words = []
+        for part in query.split():
+            key, sep, value = part.partition(":")
+            if sep and key.lower() in ("board", "author", "after", "before") and value:
+                filters[key.lower()] = value
+            else:
+                words.append(part)
+        terms = " ".join(words)
+        if not terms and not filters:
+            self.caller.msg(usage)
+            return
+        if not post_terms(terms) and not filters:
+            # Every word is too short to be indexed, so nothing would narrow the search
+            self.caller.msg(f"Search words must be at least {MIN_TERM_LENGTH} letters long. {usage}")
+            return
+
+        try:
+            after = parse_date(filters["after"]) if "after" in filters else None
+            before = parse_date(filters["before"]) if "before" in filters else None
+        except ValueError:
+            self.caller.msg(f"Dates must be written as YYYY-MM-DD. {usage}")
+            return
+
+        controller = get_or_create_bbs_controller()
+        result = controller.search_posts(
+            self.caller.key, terms, board_reference=filters.get("board"),
+            author=filters.get("author"), after=after, before=before, page=page
+        )
+        if result is None:
+            self.caller.msg(f"No board you can read found with the name or number '{filters['board']}'.")
+            return
+
+        posts, total, page, total_pages = result
+        if not total:
+            self.caller.msg(f"No posts found matching '{query}'.")
+            return
+
+        output = []
+        output.append(f"{'|b=|n'*78}")
+        output.append(f"|wSearch results for '{query}' ({total} found, page {page} of {total_pages})|n")
+        output.append("|w{:<9} {:<20} {:<30} {:<11} {:<15}|n".format("ID", "Board", "Message", "Posted", "By"))
+        output.append(f"{'|b-|n'*78}")
+        for post in posts:
+            post_ref = f"{post.board_id}/{post.number}"
+            formatted_time = self.format_date(format_time(post.created_at))
+            output.append(f"{post_ref:<9} {post.board.name[:20]:<20} |w{post.title[:30]:<30}|n "
+                          f"{formatted_time:<11} {post.author}")
+        output.append(f"{'|b-|n'*78}")
+        if page < total_pages:
+            output.append(f"|cMore:|n |y+bbs/search {query}={page + 1}|n")
+        output.append(f"{'|b=|n'*78}")
+        self.caller.msg("\n".join(output))
+
     def do_unsubscribe(self):
         """Handle the unsubscribe switch.
         
@@ -60,7 +60,6 @@ class CmdCreateBoard(default_cmds.MuxCommand):
             controller = BBSController.objects.get(db_key="BBSController")
         except BBSController.DoesNotExist:
             controller = create_object(BBSController, key="BBSController")
-            controller.db.boards = {}  # Initialize with an empty boards dictionary if needed
             self.caller.msg("BBSController created.")
 
         # Create the board
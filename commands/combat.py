@@ -2,8 +2,12 @@
 Chronicles of Darkness Combat Commands - Refactored Version
 """
 
+import copy
+
+from django.db import transaction
+from django.utils import timezone
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia.utils import evtable
+from evennia.utils import evtable, logger
 # from .combat_core import CombatTracker, WeaponData  # Disabled - module doesn't exist
 from .base import BasePyReachCommand, BuilderMixin
 from world.utils.permission_utils import check_builder_permission
@@ -11,6 +15,8 @@ from world.utils.permission_utils import check_builder_permission
 # Combat system implementation
 from world.utils.dice_utils import roll_dice, RollType
 from world.equipment_database import WEAPON_DATABASE as WEAPON_DATA, WeaponData, ArmorData
+from world.cofd.models import CombatInstance, CombatParticipant
+from world.utils.initiative import InitiativeQueue
 import secrets
 from utils.search_helpers import search_character
 
@@ -47,18 +53,122 @@ def search_combat_target(caller, target_name):
     
     return target
 
+# Participant flags kept in CombatParticipant.state rather than their own columns
+PARTICIPANT_STATE = (
+    'prone', 'in_cover', 'cover_rating', 'all_out_attack', 'dodge_applied',
+    'actions_taken', 'grapple_controller', 'grapple_actions', 'aim_bonus', 'holding',
+)
+# Participant flags holding another combatant, saved as its object id
+PARTICIPANT_REFERENCES = ('grappling_with', 'aim_target')
+PARTICIPANT_FIELDS = ('team', 'initiative', 'has_acted', 'defense_applied', 'conditions', 'order', 'state')
+
+
+def new_participant_data(team):
+    """Get the tracker data for a character joining combat."""
+    return {
+        'team': team,
+        'initiative': 0,
+        'has_acted': False,
+        'defense_applied': 0,
+        'conditions': [],
+        'prone': False,
+        'in_cover': False,
+        'cover_rating': 0,
+        'all_out_attack': False,
+        'dodge_applied': False,
+        'actions_taken': 0,
+        'holding': False,
+        'grappling_with': None,
+        'grapple_controller': None,
+        'grapple_actions': {
+            'control_weapon': False,
+            'held': False,
+            'restrained': False,
+            'taking_cover': False
+        }
+    }
+
+
+class ParticipantData(dict):
+    """
+    One participant's tracker data, noting when it's changed.
+
+    Setting a key, or fetching one of the nested containers to change it,
+    adds the character to the tracker's touched set so the next flush
+    compares and saves them. Reading with get() doesn't.
+    """
+    
+    NESTED = ('conditions', 'grapple_actions')
+    
+    def __init__(self, character, touched, data):
+        super().__init__(data)
+        self.character = character
+        self.touched = touched
+    
+    def __getitem__(self, key):
+        if key in self.NESTED:
+            self.touched.add(self.character)
+        return super().__getitem__(key)
+    
+    def __setitem__(self, key, value):
+        self.touched.add(self.character)
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        self.touched.add(self.character)
+        super().__delitem__(key)
+    
+    def update(self, *args, **kwargs):
+        self.touched.add(self.character)
+        super().update(*args, **kwargs)
+
+
 class CombatTracker:
-    """Full combat tracker implementation for Chronicles of Darkness"""
+    """
+    Full combat tracker implementation for Chronicles of Darkness
+
+    The tracker's state is written behind to CombatInstance and
+    CombatParticipant rows: flush() runs when someone joins, leaves or rolls
+    initiative and once at the end of each turn, and writes only what
+    changed since the last flush. Attacks and other actions during a turn
+    just change the in-memory state, and only participants whose data was
+    touched since the last flush are compared. COMBATS rebuilds trackers
+    from the rows after a reload.
+
+    Turn order comes from an InitiativeQueue, so joining, leaving, delaying
+    and advancing turns don't re-sort the fight.
+
+    Args:
+        location: Room the fight is in
+        persist (bool): Save to the database; False for simulated fights
+    """
     
-    def __init__(self, location):
+    def __init__(self, location, persist=True):
         self.location = location
         self.participants = {}  # character: {data}
-        self.initiative_order = []
+        self.initiative = InitiativeQueue()
         self.current_actor = None
         self.round_number = 1
         self.turn_number = 1
-        self.teams = {}  # team_number: [characters]
+        self.teams = {}  # team_number: {character: None}, an ordered set
         self.next_team = 1
+        self.persist = persist
+        self.instance = None
+        self._rows = {}  # character: CombatParticipant
+        self._flushed = {}  # character: field values as last written
+        self._touched = set()  # characters changed, joined or left since the last flush
+        self._flushed_combat = None
+    
+    @property
+    def initiative_order(self):
+        """Participants in initiative order, highest first."""
+        return self.initiative.order()
+    
+    @staticmethod
+    def _tiebreak_stats(character):
+        """Get (Dexterity, Composure) for breaking initiative ties."""
+        attributes = character.db.stats.get("attributes", {})
+        return attributes.get("dexterity", 1), attributes.get("composure", 1)
         
     def add_participant(self, character, team=None):
         """Add a character to combat"""
@@ -72,36 +182,21 @@ class CombatTracker:
             
         # Initialize team if needed
         if team not in self.teams:
-            self.teams[team] = []
+            self.teams[team] = {}
             
         # Add to team
-        self.teams[team].append(character)
+        self.teams[team][character] = None
         
         # Initialize participant data
-        self.participants[character] = {
-            'team': team,
-            'initiative': 0,
-            'has_acted': False,
-            'defense_applied': 0,
-            'conditions': [],
-            'prone': False,
-            'in_cover': False,
-            'cover_rating': 0,
-            'all_out_attack': False,
-            'dodge_applied': False,
-            'actions_taken': 0,
-            'grappling_with': None,
-            'grapple_controller': None,
-            'grapple_actions': {
-                'control_weapon': False,
-                'held': False,
-                'restrained': False,
-                'taking_cover': False
-            }
-        }
+        self.participants[character] = ParticipantData(character, self._touched, new_participant_data(team))
+        self._touched.add(character)
+        
+        # Join the order at initiative 0 until initiative is rolled
+        self.initiative.add(character, 0, *self._tiebreak_stats(character))
         
         # Announce to location
         self.location.msg_contents(f"{character.name} joins combat on team {team}!")
+        self.flush()
         
     def remove_participant(self, character):
         """Remove a character from combat"""
@@ -110,15 +205,15 @@ class CombatTracker:
             
         # Remove from team
         team = self.participants[character]['team']
-        if team in self.teams and character in self.teams[team]:
-            self.teams[team].remove(character)
+        if team in self.teams:
+            self.teams[team].pop(character, None)
             
         # Remove from participants
         del self.participants[character]
+        self._touched.add(character)
         
         # Remove from initiative order
-        if character in self.initiative_order:
-            self.initiative_order.remove(character)
+        self.initiative.remove(character)
             
         # Update current actor if needed
         if self.current_actor == character:
@@ -126,6 +221,7 @@ class CombatTracker:
             
         # Announce to location
         self.location.msg_contents(f"{character.name} leaves combat.")
+        self.flush()
         
     def get_team(self, character):
         """Get character's team number"""
@@ -156,43 +252,43 @@ class CombatTracker:
         self.participants[character]['initiative'] = total_initiative
         
         # Update initiative order
-        self.update_initiative_order()
-        
-        return roll, init_attr
-        
-    def update_initiative_order(self):
-        """Update the initiative order based on current initiatives"""
-        # Sort by initiative (highest first)
-        self.initiative_order = sorted(
-            self.participants.keys(),
-            key=lambda char: self.participants[char]['initiative'],
-            reverse=True
-        )
+        self.initiative.add(character, total_initiative, *self._tiebreak_stats(character))
         
         # Set current actor to first in order if not set
-        if not self.current_actor and self.initiative_order:
-            self.current_actor = self.initiative_order[0]
+        if not self.current_actor:
+            self.current_actor, _ = self.initiative.next()
+        self.flush()
+        
+        return roll, init_attr
             
+    def start(self):
+        """
+        Begin the round from the top of the initiative order.
+
+        roll_initiative() makes the first character to roll the current actor
+        straight away, so anyone who rolls higher after them waits for the
+        next round. A fight whose initiative is all rolled up front calls
+        this once everyone has rolled, so the highest initiative acts first.
+        """
+        self.initiative.restart()
+        self.current_actor, _ = self.initiative.next()
+        self.turn_number = 1
+        self.flush()
+        
     def advance_turn(self):
         """Advance to the next character's turn"""
-        if not self.initiative_order:
+        next_actor, new_round = self.initiative.next()
+        if next_actor is None:
             return
             
-        # Find current actor index
-        if self.current_actor in self.initiative_order:
-            current_index = self.initiative_order.index(self.current_actor)
-            next_index = (current_index + 1) % len(self.initiative_order)
-        else:
-            next_index = 0
-            
         # If we've cycled through everyone, advance round
-        if next_index == 0:
+        if new_round:
             self.advance_round()
         else:
             self.turn_number += 1
             
         # Set next actor
-        self.current_actor = self.initiative_order[next_index]
+        self.current_actor = next_actor
         
         # Reset per-turn flags for new actor
         self.reset_turn_flags(self.current_actor)
@@ -240,6 +336,9 @@ class CombatTracker:
                 f"{self.current_actor.name}'s turn!"
             )
         
+        # Write the finished turn's changes
+        self.flush()
+        
     def advance_round(self):
         """Advance to the next round"""
         self.round_number += 1
@@ -251,9 +350,60 @@ class CombatTracker:
             self.participants[character]['actions_taken'] = 0
             self.participants[character]['all_out_attack'] = False
             self.participants[character]['dodge_applied'] = False
+            # Held actions not taken last round are lost
+            self.participants[character]['holding'] = False
             
         self.location.msg_contents(f"Beginning Round {self.round_number}")
         
+    def delay_action(self, character, initiative):
+        """
+        Delay a character's action to a lower initiative for the rest of combat.
+        
+        Raises:
+            ValueError: If they've already acted or are holding, or the
+                initiative isn't lower than theirs
+        """
+        self.initiative.delay(character, initiative)
+        self.participants[character]['initiative'] = initiative
+        self.location.msg_contents(f"{character.name} delays their action to initiative {initiative}.")
+        if character == self.current_actor:
+            self.advance_turn()
+        else:
+            self.flush()
+    
+    def hold_action(self, character):
+        """
+        Hold a character's action to take at any point later this round.
+        
+        Raises:
+            ValueError: If they've already acted or are already holding
+        """
+        self.initiative.hold(character)
+        self.participants[character]['holding'] = True
+        self.location.msg_contents(f"{character.name} holds their action.")
+        if character == self.current_actor:
+            self.advance_turn()
+        else:
+            self.flush()
+    
+    def release_action(self, character):
+        """
+        Take a held action now. The round carries on from where it was
+        once they've acted.
+        
+        Raises:
+            ValueError: If they aren't holding an action
+        """
+        self.initiative.release(character)
+        self.participants[character]['holding'] = False
+        self.current_actor = character
+        self.reset_turn_flags(character)
+        self.location.msg_contents(
+            f"Round {self.round_number}, Turn {self.turn_number}: "
+            f"{character.name} acts on their held action!"
+        )
+        self.flush()
+        
     def reset_turn_flags(self, character):
         """Reset per-turn flags for a character"""
         if character in self.participants:
@@ -437,15 +587,253 @@ class CombatTracker:
         """End combat and clean up"""
         self.location.msg_contents("Combat has ended!")
         
+        # Close the saved fight so it isn't restored after a reload
+        if self.instance is not None:
+            self.flush()
+            self.instance.is_active = False
+            self.instance.ended_at = timezone.now()
+            self.instance.save(update_fields=['is_active', 'ended_at'])
+        
         # Clear combat tracker from location
-        if hasattr(self.location, 'combat_tracker'):
-            del self.location.combat_tracker
+        COMBATS.forget(self.location)
             
         # Reset participant flags
         for character in self.participants:
             # Clear combat-specific attributes
             if hasattr(character.db, 'in_combat'):
                 del character.db.in_combat
+    
+    # Persistence
+    
+    def _participant_fields(self, character):
+        """Get the CombatParticipant field values for a participant."""
+        data = self.participants[character]
+        state = {key: data.get(key) for key in PARTICIPANT_STATE if key in data}
+        for key in PARTICIPANT_REFERENCES:
+            other = data.get(key)
+            state[key] = other.id if other else None
+        return {
+            'team': data['team'],
+            'initiative': data['initiative'],
+            'has_acted': data['has_acted'],
+            'defense_applied': data['defense_applied'],
+            'conditions': copy.deepcopy(data.get('conditions', [])),
+            'order': self.initiative.sequence(character) if character in self.initiative else -1,
+            'state': copy.deepcopy(state),
+        }
+    
+    def _combat_fields(self):
+        """Get the CombatInstance field values for the fight."""
+        return {
+            'current_turn': self.turn_number,
+            'round_number': self.round_number,
+            'next_team': self.next_team,
+            'current_actor': self.current_actor,
+            'round_position': self.initiative.round_position(),
+        }
+    
+    def _snapshot(self, characters):
+        return {character: self._participant_fields(character)
+                for character in characters if character in self.participants}
+    
+    def flush(self):
+        """
+        Write changes since the last flush to the database.
+        
+        Participants touched since the last flush are compared with what
+        was last written, and only new, changed and departed ones are saved,
+        in one transaction. Nothing is written for a fight nobody has joined
+        yet.
+        
+        Returns:
+            int: Number of participant rows written or deleted
+        """
+        if not self.persist or (self.instance is None and not self.participants):
+            self._touched.clear()
+            return 0
+        
+        snapshot = self._snapshot(self._touched)
+        combat_fields = self._combat_fields()
+        created = [character for character in snapshot if character not in self._rows]
+        changed = [character for character in snapshot
+                   if character in self._rows and snapshot[character] != self._flushed.get(character)]
+        removed = [character for character in self._touched
+                   if character in self._rows and character not in snapshot]
+        if not (created or changed or removed) and combat_fields == self._flushed_combat:
+            self._touched.clear()
+            return 0
+        
+        instance = self.instance
+        try:
+            with transaction.atomic():
+                if instance is None:
+                    instance = CombatInstance.objects.create(
+                        name=f"Combat in {self.location.key}", location=self.location, **combat_fields
+                    )
+                elif combat_fields != self._flushed_combat:
+                    for name, value in combat_fields.items():
+                        setattr(instance, name, value)
+                    instance.save(update_fields=list(combat_fields))
+                
+                rows = {}
+                for character in created:
+                    rows[character] = CombatParticipant.objects.create(
+                        combat=instance, character=character, **snapshot[character]
+                    )
+                updated = []
+                for character in changed:
+                    row = self._rows[character]
+                    for name, value in snapshot[character].items():
+                        setattr(row, name, value)
+                    updated.append(row)
+                if updated:
+                    CombatParticipant.objects.bulk_update(updated, PARTICIPANT_FIELDS)
+                if removed:
+                    CombatParticipant.objects.filter(
+                        id__in=[self._rows[character].id for character in removed]
+                    ).delete()
+        except Exception as e:
+            # Keep the last flushed state so the next flush retries these changes
+            logger.log_err(f"CombatTracker: Failed to save combat in {self.location.key}: {e}")
+            return 0
+        
+        # Only kept once committed, so a rolled-back create is made again next time
+        self.instance = instance
+        for character in removed:
+            del self._rows[character]
+            del self._flushed[character]
+        self._rows.update(rows)
+        self._flushed.update(snapshot)
+        self._flushed_combat = combat_fields
+        self._touched.clear()
+        return len(created) + len(changed) + len(removed)
+    
+    @classmethod
+    def from_instance(cls, instance, location):
+        """
+        Rebuild a tracker from a saved fight.
+        
+        Args:
+            instance (CombatInstance): An active saved fight
+            location: The fight's room
+        
+        Returns:
+            CombatTracker: The tracker, matching what was last flushed
+        """
+        tracker = cls(location)
+        tracker.instance = instance
+        tracker.turn_number = instance.current_turn
+        tracker.round_number = instance.round_number
+        tracker.next_team = instance.next_team
+        
+        rows = sorted(instance.participants.select_related('character'), key=lambda row: row.order)
+        characters = {row.character_id: row.character for row in rows}
+        for row in rows:
+            character = row.character
+            state = row.state or {}
+            data = new_participant_data(row.team)
+            data.update({key: value for key, value in state.items() if key in PARTICIPANT_STATE})
+            data.update({
+                'initiative': row.initiative,
+                'has_acted': row.has_acted,
+                'defense_applied': row.defense_applied,
+                'conditions': list(row.conditions or []),
+            })
+            for key in PARTICIPANT_REFERENCES:
+                if state.get(key) is not None:
+                    data[key] = characters.get(state[key])
+            tracker.participants[character] = ParticipantData(character, tracker._touched, data)
+            tracker.teams.setdefault(row.team, {})[character] = None
+            tracker._rows[character] = row
+            if row.order >= 0:
+                # The saved sequence keeps equal ties breaking the same way
+                tracker.initiative.add(character, row.initiative, *tracker._tiebreak_stats(character),
+                                       sequence=row.order)
+        
+        current = instance.current_actor if instance.current_actor in tracker.participants else None
+        held = [character for character, data in tracker.participants.items() if data.get('holding')]
+        tracker.initiative.resume(current, held, instance.round_position)
+        tracker.current_actor = current
+        if current is None and tracker.participants:
+            tracker.current_actor, _ = tracker.initiative.next()
+        
+        tracker._flushed = tracker._snapshot(tracker.participants)
+        tracker._flushed_combat = tracker._combat_fields()
+        tracker._touched.clear()
+        return tracker
+
+
+class CombatRegistry:
+    """
+    Active combat trackers by room.
+    
+    Trackers are also set as location.combat_tracker, which doesn't survive a
+    reload. The registry rebuilds them from the saved fights at server start,
+    or on first use if a room dropped out of the cache.
+    """
+    
+    def __init__(self):
+        self._trackers = {}  # location id: CombatTracker
+    
+    def get(self, location, create=True):
+        """
+        Get a room's combat tracker.
+        
+        Args:
+            location: The room
+            create (bool): Start a new tracker if the room has no fight
+        
+        Returns:
+            CombatTracker: The tracker, or None if there's no fight and
+                create is False
+        """
+        tracker = getattr(location, 'combat_tracker', None) or self._trackers.get(location.id)
+        if tracker is None:
+            instance = (CombatInstance.objects.filter(location=location, is_active=True)
+                        .order_by('-id').first())
+            if instance is not None:
+                tracker = CombatTracker.from_instance(instance, location)
+            elif create:
+                tracker = CombatTracker(location)
+            else:
+                return None
+        location.combat_tracker = tracker
+        self._trackers[location.id] = tracker
+        return tracker
+    
+    def forget(self, location):
+        """Drop a room's tracker once its fight has ended."""
+        self._trackers.pop(getattr(location, 'id', None), None)
+        if hasattr(location, 'combat_tracker'):
+            del location.combat_tracker
+    
+    def restore(self):
+        """
+        Rebuild the tracker of every active saved fight.
+        
+        Fights whose room was deleted are closed.
+        
+        Returns:
+            int: Number of fights restored
+        """
+        restored = 0
+        for instance in CombatInstance.objects.filter(is_active=True).select_related('location'):
+            if instance.location is None:
+                instance.is_active = False
+                instance.ended_at = timezone.now()
+                instance.save(update_fields=['is_active', 'ended_at'])
+                continue
+            self.get(instance.location)
+            restored += 1
+        return restored
+    
+    def flush_all(self):
+        """Write every tracker's pending changes, e.g. before a reload."""
+        for tracker in list(self._trackers.values()):
+            tracker.flush()
+
+
+COMBATS = CombatRegistry()
 
 class CmdCombat(BasePyReachCommand, BuilderMixin):
     """
@@ -508,7 +896,9 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         +combat/remove <armor> - Remove armor
         
         Other Actions:
-        +combat/delay - Delay action until later in turn
+        +combat/delay <initiative> - Delay action to a lower initiative
+        +combat/delay - Hold action to take any time later this round
+        +combat/act - Take your held action now
         +combat/wait - Wait and see (end turn)
         +combat/willpower - Spend Willpower (+3 dice or +2 Defense)
         +combat/surprise <target> - Attempt surprise attack
@@ -521,10 +911,7 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
     def func(self):
         """Execute the command"""
         # Get or create combat tracker for this location
-        if not hasattr(self.caller.location, 'combat_tracker'):
-            self.caller.location.combat_tracker = CombatTracker(self.caller.location)
-            
-        self.combat = self.caller.location.combat_tracker
+        self.combat = COMBATS.get(self.caller.location)
         
         if not self.switches:
             self.caller.msg("Use +combat/help for combat commands. Common: /init, /status, /join")
@@ -631,6 +1018,8 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         # Other actions
         elif switch == "delay":
             self.delay_action()
+        elif switch == "act":
+            self.act_held()
         elif switch == "wait":
             self.wait()
         elif switch == "willpower":
@@ -1208,8 +1597,7 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         roll_types = weapon.get_roll_type_modifiers()
         
         # Roll attack
-        from world.utils.dice_utils import roll_dice, RollType
-        rolls, successes, ones = roll_dice(final_pool, roll_types=roll_types)
+        rolls, successes, ones = self._roll_attack(final_pool, roll_types)
         
         # Apply Defense reduction for next attack (only if Defense applied)
         if weapon.applies_defense():
@@ -1289,8 +1677,7 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         roll_types = weapon.get_roll_type_modifiers()
         
         # Roll attack
-        from world.utils.dice_utils import roll_dice, RollType
-        rolls, successes, ones = roll_dice(final_pool, roll_types=roll_types)
+        rolls, successes, ones = self._roll_attack(final_pool, roll_types)
         
         # Apply Defense reduction for next attack (only if Defense applied)
         if weapon.applies_defense():
@@ -1361,8 +1748,7 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         roll_types = weapon.get_roll_type_modifiers()
         
         # Roll attack
-        from world.utils.dice_utils import roll_dice, RollType
-        rolls, successes, ones = roll_dice(final_pool, roll_types=roll_types)
+        rolls, successes, ones = self._roll_attack(final_pool, roll_types)
         
         # Apply Defense reduction for next attack
         self.combat.participants[target]['defense_applied'] = defense_applied + 1
@@ -1406,6 +1792,15 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
                 f"({successes} successes vs Defense {current_defense})"
             )
     
+    def _roll_attack(self, dice_pool, roll_types):
+        """
+        Roll an attack pool.
+
+        Returns:
+            tuple: (rolls, successes, ones), as from roll_dice()
+        """
+        return roll_dice(dice_pool, roll_types=roll_types)
+    
     def _get_wound_penalty(self, character):
         """Get wound penalty from health damage"""
         # TODO: Implement proper health system integration
@@ -1870,8 +2265,34 @@ class CmdCombat(BasePyReachCommand, BuilderMixin):
         self.caller.msg("Armor system not yet fully implemented.")
     
     def delay_action(self):
-        """Delay action - placeholder"""
-        self.caller.msg("Delay system not yet implemented.")
+        """Delay to a lower initiative, or hold the action if none is given"""
+        if not self._check_turn():
+            return
+        
+        try:
+            if not self.args:
+                self.combat.hold_action(self.caller)
+                self.caller.msg("You hold your action. Use +combat/act to take it later this round.")
+                return
+            try:
+                initiative = int(self.args)
+            except ValueError:
+                self.caller.msg("Usage: +combat/delay [initiative]")
+                return
+            self.combat.delay_action(self.caller, initiative)
+        except ValueError as e:
+            self.caller.msg(str(e))
+    
+    def act_held(self):
+        """Take a held action"""
+        if self.caller not in self.combat.participants:
+            self.caller.msg("You are not in combat.")
+            return
+        
+        try:
+            self.combat.release_action(self.caller)
+        except ValueError as e:
+            self.caller.msg(str(e))
     
     def wait(self):
         """Wait/end turn - placeholder"""
@@ -183,6 +183,7 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
       +census
       +census <template>
       +census <stat_category>
+      +census/rebuild          - Recompute census counters and the stat index (staff)
     """
     key = "+census"
     aliases = ["census"]
@@ -255,6 +256,10 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
 
     def func(self):
         """Execute the census command."""
+        if "rebuild" in self.switches or "reindex" in self.switches:
+            self.rebuild()
+            return
+            
         if not self.args:
             # Show overall population by template
             counts = self.get_template_counts()
@@ -301,159 +306,39 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
         self.msg("Available options: vampire, mage, changeling, werewolf, mortal, mortal+, hunter, demon, beast, deviant, promethean, groups")
         self.msg("Or stat categories: attributes, skills, merits, advantages")
 
-    def get_all_characters(self):
-        """Get all approved characters in the game."""
-        from typeclasses.characters import Character
-        from evennia.utils.search import search_object
-        
-        all_chars = search_object("", typeclass=Character)
-        # Filter to only approved characters with stats
-        approved_chars = []
-        for char in all_chars:
-            if (hasattr(char, 'db') and 
-                char.db.approved and 
-                char.db.stats):
-                approved_chars.append(char)
+    def rebuild(self):
+        """Recompute census counters and the stat index from every character."""
+        if not self.caller.check_permstring("Builder"):
+            self.msg("Only staff can rebuild the census.")
+            return
         
-        return approved_chars
+        from world.cofd.census import rebuild_census
+        from world.cofd.stat_index import rebuild_stat_index
+        indexed = rebuild_stat_index()
+        counted = rebuild_census()
+        self.msg(f"Census rebuilt: {counted} approved characters counted, {indexed} characters indexed.")
 
     def get_template_counts(self):
-        """Get counts of characters by template."""
-        characters = self.get_all_characters()
-        counts = {}
+        """Get counts of approved characters by template, from the running counters."""
+        from world.cofd.census import get_counts, TEMPLATE_SCOPE
         
-        for char in characters:
-            template = char.db.stats.get("other", {}).get("template", "Unknown")
-            if template == "Unknown":
-                template = "Mortal"  # Default fallback
-            
-            counts[template] = counts.get(template, 0) + 1
-        
-        return counts
+        return get_counts(TEMPLATE_SCOPE)
 
     def get_template_subcounts(self, template):
-        """Get subcounts for a specific template (clans, tribes, etc.)."""
-        characters = self.get_all_characters()
-        counts = {}
-        
-        # Template-specific field mappings - PRIMARY field comes first
-        template_fields = {
-            'Vampire': ['clan', 'covenant'],
-            'Mage': ['path', 'order', 'legacy'],
-            'Changeling': ['seeming', 'kith', 'court', 'entitlement'],
-            'Werewolf': ['tribe', 'auspice', 'lodge'],
-            'Hunter': ['compact', 'profession'],
-            'Mortal': ['profession', 'organization'],
-            'Mortal+': ['type', 'organization'],
-            'Demon': ['incarnation', 'agenda', 'catalyst'],
-            'Beast': ['family', 'hunger', 'horror'],
-            'Deviant': ['origin', 'clade', 'scar'],
-            'Promethean': ['lineage', 'refinement', 'creator'],
-            'Geist': ['archetype', 'threshold']
-        }
+        """Get subcounts for a specific template (clans, tribes, etc.), from the running counters."""
+        from world.cofd.census import get_counts, subtype_scope
         
-        fields_to_check = template_fields.get(template, ['clan', 'covenant', 'tribe', 'court', 'order'])
-        
-        for char in characters:
-            char_template = char.db.stats.get("other", {}).get("template", "Unknown")
-            if char_template != template:
-                continue
-                
-            bio = char.db.stats.get("bio", {})
-            
-            # Try to build a meaningful category string from available fields
-            # For most templates, we'll use the primary field (first in list)
-            primary_field = fields_to_check[0] if fields_to_check else None
-            
-            if primary_field:
-                value = bio.get(primary_field)
-                
-                # Check if value is valid
-                if value and value != "<not set>" and str(value).strip():
-                    # For some templates, combine multiple fields for better categorization
-                    if template == 'Changeling' and len(fields_to_check) >= 3:
-                        # For Changeling: Show "Seeming (Court)" format
-                        seeming = bio.get('seeming', '')
-                        court = bio.get('court', '')
-                        
-                        if seeming and seeming != "<not set>" and str(seeming).strip():
-                            if court and court != "<not set>" and str(court).strip():
-                                category_name = f"{seeming} ({court})"
-                            else:
-                                category_name = f"{seeming}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Vampire' and len(fields_to_check) >= 2:
-                        # For Vampire: Show "Clan (Covenant)" format
-                        clan = bio.get('clan', '')
-                        covenant = bio.get('covenant', '')
-                        
-                        if clan and clan != "<not set>" and str(clan).strip():
-                            if covenant and covenant != "<not set>" and str(covenant).strip():
-                                category_name = f"{clan} ({covenant})"
-                            else:
-                                category_name = f"{clan}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Werewolf' and len(fields_to_check) >= 2:
-                        # For Werewolf: Show "Tribe (Auspice)" format
-                        tribe = bio.get('tribe', '')
-                        auspice = bio.get('auspice', '')
-                        
-                        if tribe and tribe != "<not set>" and str(tribe).strip():
-                            if auspice and auspice != "<not set>" and str(auspice).strip():
-                                category_name = f"{tribe} ({auspice})"
-                            else:
-                                category_name = f"{tribe}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Mage' and len(fields_to_check) >= 2:
-                        # For Mage: Show "Path (Order)" format
-                        path = bio.get('path', '')
-                        order = bio.get('order', '')
-                        
-                        if path and path != "<not set>" and str(path).strip():
-                            if order and order != "<not set>" and str(order).strip():
-                                category_name = f"{path} ({order})"
-                            else:
-                                category_name = f"{path}"
-                        else:
-                            category_name = "Unspecified"
-                    else:
-                        # Default: just use primary field with label
-                        category_name = f"{value}"
-                    
-                    counts[category_name] = counts.get(category_name, 0) + 1
-                else:
-                    counts["Unspecified"] = counts.get("Unspecified", 0) + 1
-            else:
-                # No fields defined for this template
-                counts["Unspecified"] = counts.get("Unspecified", 0) + 1
-        
-        return counts
+        return get_counts(subtype_scope(template))
 
     def get_stat_category_counts(self, category):
         """Get counts for a specific stat category."""
-        characters = self.get_all_characters()
-        counts = {}
+        from world.cofd.stat_index import count_stats
         
-        for char in characters:
-            stats = char.db.stats.get(category, {})
-            
-            if category == "merits":
-                # For merits, count each merit name
-                for merit_name, merit_data in stats.items():
-                    if isinstance(merit_data, dict) and merit_data.get("dots", 0) > 0:
-                        display_name = f"{merit_name.replace('_', ' ').title()}"
-                        counts[display_name] = counts.get(display_name, 0) + 1
-            else:
-                # For other categories, count stat names and their values
-                for stat_name, value in stats.items():
-                    if value and value > 0:  # Only count stats with positive values
-                        display_name = f"{stat_name.replace('_', ' ').title()}"
-                        if display_name not in counts:
-                            counts[display_name] = 0
-                        counts[display_name] += 1
+        counts = {}
+        # Only count stats with positive values (merits by their dots)
+        for stat_name, count in count_stats(category, minimum=1).items():
+            display_name = f"{stat_name.replace('_', ' ').title()}"
+            counts[display_name] = counts.get(display_name, 0) + count
         
         return counts
 
@@ -6,7 +6,7 @@ Implements the standard CoD dice pool mechanics with 10-sided dice.
 from evennia.commands.default.muxcommand import MuxCommand
 from evennia.utils.utils import inherits_from
 from world.conditions import STANDARD_CONDITIONS
-from world.utils.dice_utils import roll_dice, interpret_roll_results, roll_to_job_display, roll_to_room_display, format_roll_display, RollType
+from world.utils.dice_utils import roll_dice, roll_odds, interpret_roll_results, roll_to_job_display, roll_to_room_display, format_roll_display, RollType
 from django.utils import timezone
 
 class CmdRoll(MuxCommand):
@@ -19,6 +19,7 @@ class CmdRoll(MuxCommand):
         +roll[/8|9|10|rote|reflex|damage|job] <stat> + <skill> + <modifier>
         +roll/job <dice pool>=<job id>
         +roll/job <stat> + <skill>=<job id>
+        +roll/odds[/8|9|10|rote] <dice pool or stat + skill>[=<successes>]
     
     Switches:
         /8 - 8-again (roll again on 8 or higher)
@@ -28,6 +29,8 @@ class CmdRoll(MuxCommand):
         /reflex - Reflexive action (no action cost)
         /damage - Damage roll (no wound penalties apply)
         /job - Roll to a job (uses expansive format, adds to job comments)
+        /odds - Show the odds of a roll instead of rolling it. Give a number
+                of successes after = to see the chance of getting at least that many.
         
     Multiple switches can be combined, e.g.:
         +roll/8/rote Strength + Weaponry
@@ -39,6 +42,8 @@ class CmdRoll(MuxCommand):
         +roll/damage Strength + 2
         +roll/job Wits + Investigation=123
         +roll/job/8 5=456
+        +roll/odds/9 7=3
+        +roll/odds/rote Wits + Investigation
     """
     
     key = "+roll"
@@ -50,12 +55,15 @@ class CmdRoll(MuxCommand):
         super().parse()  # Initialize switches and other MuxCommand attributes
         
         args = self.args.strip()
+        self.parse_error = False
         self.dice_pool = 0
         self.modifier = 0
         self.roll_type = None  # 'stat_skill', 'direct', 'stat_skill_mod', 'job'
         self.roll_types = set()
         self.job_id = None
         self.is_job_roll = False
+        self.is_odds_roll = False
+        self.target_successes = None
         self.stat_name = None
         self.skill_name = None
         
@@ -76,13 +84,26 @@ class CmdRoll(MuxCommand):
                     self.roll_types.add(RollType.DAMAGE)
                 elif switch == "job":
                     self.is_job_roll = True
+                elif switch == "odds":
+                    self.is_odds_roll = True
         
         # If no roll types specified, use normal (10-again)
         if not self.roll_types:
             self.roll_types = {RollType.NORMAL}
         
+        # Odds take an optional success target instead of a job ID
+        if self.is_odds_roll:
+            if "=" in args:
+                args, target = args.split("=", 1)
+                try:
+                    self.target_successes = int(target.strip())
+                except ValueError:
+                    self.caller.msg("Invalid number of successes specified.")
+                    self.parse_error = True
+                    return
+            self._parse_dice_expression(args, is_job=False)
         # Handle job rolls specially
-        if self.is_job_roll and "=" in args:
+        elif self.is_job_roll and "=" in args:
             dice_part, job_part = args.split("=", 1)
             dice_part = dice_part.strip()
             job_part = job_part.strip()
@@ -265,7 +286,7 @@ class CmdRoll(MuxCommand):
 
     def func(self):
         """Execute the roll command."""
-        if not hasattr(self, 'dice_pool'):
+        if self.parse_error or not hasattr(self, 'dice_pool'):
             return
             
         # Apply modifier and wound penalties
@@ -284,6 +305,10 @@ class CmdRoll(MuxCommand):
         
         final_pool = self.dice_pool + self.modifier + wound_penalty
         
+        if self.is_odds_roll:
+            self.show_odds(final_pool, wound_penalty)
+            return
+        
         # Roll the dice using the utility function
         rolls, successes, ones = roll_dice(final_pool, 8, self.roll_types)
         
@@ -352,6 +377,48 @@ class CmdRoll(MuxCommand):
                 # Award beat for dramatic failure
                 self.award_beat("dramatic_failure")
 
+    def show_odds(self, final_pool, wound_penalty=0):
+        """
+        Show the chance of each result for a roll without rolling it.
+
+        Args:
+            final_pool (int): Dice pool after modifiers and wound penalties
+            wound_penalty (int): Wound penalty included in the pool
+        """
+        try:
+            odds = roll_odds(final_pool, self.roll_types)
+        except ValueError as e:
+            self.caller.msg(f"|r{e}|n")
+            return
+
+        if self.stat_name and self.skill_name:
+            roll_desc = f"{self.stat_name.title()} + {self.skill_name.title()} ({final_pool} dice)"
+        elif self.stat_name:
+            roll_desc = f"{self.stat_name.title()} ({final_pool} dice)"
+        else:
+            roll_desc = f"{final_pool} dice"
+        if wound_penalty != 0:
+            roll_desc += f" (includes {wound_penalty:+d} wound penalty)"
+        if final_pool <= 0:
+            roll_desc += " |y(Chance Die)|n"
+
+        modes = [roll_type.value for roll_type in sorted(self.roll_types, key=lambda r: r.value)
+                 if roll_type != RollType.NORMAL]
+        if modes:
+            roll_desc += f" [{', '.join(modes)}]"
+
+        lines = [
+            f"|yODDS>|n {roll_desc}",
+            f"  Expected successes: |w{odds.expected:.2f}|n",
+            f"  At least 1 success: |g{odds.at_least(1):.1%}|n",
+            f"  Exceptional (5+): |g{odds.exceptional:.1%}|n",
+            f"  Dramatic failure: |r{odds.dramatic_failure:.1%}|n",
+        ]
+        if self.target_successes is not None and self.target_successes not in (1, 5):
+            lines.insert(2, f"  At least {self.target_successes} successes: "
+                            f"|g{odds.at_least(self.target_successes):.1%}|n")
+        self.caller.msg("\n".join(lines))
+
     def handle_job_roll(self, rolls, successes, ones, stat_name, skill_name, stat_value, skill_value, character_name, wound_penalty=0):
         """Handle rolls made to jobs."""
         from world.jobs.models import Job
@@ -420,16 +487,7 @@ class CmdRoll(MuxCommand):
             enhanced_comment_text = job_roll_display
             
             # Add the roll as a comment to the job
-            roll_comment = {
-                "author": character_name,
-                "text": enhanced_comment_text,
-                "created_at": timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            if not job.comments:
-                job.comments = []
-            job.comments.append(roll_comment)
-            job.save()
+            job.add_comment(character_name, enhanced_comment_text)
             
             # Notify job participants about the roll
             from commands.jobs.jobs_commands import CmdJobs
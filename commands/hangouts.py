@@ -9,7 +9,7 @@ group-specific locations accessible to group members.
 from evennia import default_cmds
 from evennia.utils.evtable import EvTable
 import evennia
-from typeclasses.groups import Group
+from typeclasses.groups import Group, get_character_groups
 from utils.search_helpers import search_character
 
 
@@ -182,18 +182,13 @@ class CmdHangouts(default_cmds.MuxCommand):
         caller = self.caller
         group_hangouts = []
         
-        # Get all groups
-        all_groups = Group.objects.all()
-        
-        for group in all_groups:
-            # Check if caller is a member
-            if group.is_member(caller):
-                # Check if group has a hangout location set
-                if hasattr(group.db, 'hangout_location') and group.db.hangout_location:
-                    hangout_room = group.db.hangout_location
-                    # Verify the room still exists
-                    if hasattr(hangout_room, 'name'):
-                        group_hangouts.append((group, hangout_room))
+        for group in get_character_groups(caller):
+            # Check if group has a hangout location set
+            if hasattr(group.db, 'hangout_location') and group.db.hangout_location:
+                hangout_room = group.db.hangout_location
+                # Verify the room still exists
+                if hasattr(hangout_room, 'name'):
+                    group_hangouts.append((group, hangout_room))
         
         # Sort by group name
         group_hangouts.sort(key=lambda x: x[0].name)
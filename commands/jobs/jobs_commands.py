@@ -3,7 +3,10 @@ from django.db import models, transaction, connection
 from evennia.utils import create, evtable, logger
 from evennia.comms.models import ChannelDB
 from evennia.commands.default.muxcommand import MuxCommand
-from world.jobs.models import Job, JobTemplate, Queue, JobAttachment, ArchivedJob, Queue
+from world.jobs.models import (
+    Job, JobTemplate, Queue, JobAttachment, ArchivedJob, JobComment, JobReadMarker,
+    allocate_archive_id, reset_job_counters
+)
 from evennia.utils.search import search_account, search_object
 from django.db import models, transaction, connection
 from evennia.utils.utils import crop
@@ -20,19 +23,27 @@ from evennia.accounts.models import AccountDB
 from utils.search_helpers import search_character
 from evennia.comms.models import Msg
 
+# Jobs shown per page of +jobs
+JOBS_PAGE_SIZE = 20
+
+# Related rows every job listing displays, fetched with the jobs
+JOB_LIST_RELATED = ('requester', 'assignee', 'queue')
+
 class CmdJobs(MuxCommand):
     """
     View and manage jobs
     The following aliases are available: +requests, +request, +myjob, +job, +myjobs
     Usage:
       +jobs                      - List all jobs
+      +jobs/page <#>             - Show another page of the job list
       +myjobs                    - List jobs you created or are assigned to
       +jobs/mine                 - List jobs assigned to you (staff only)
       +jobs <#>                  - View details of a specific job
       +jobs/create <category>/<title>=<text> [= <template>] <args>
       +jobs/comment <#>=<text>   - Add a comment to a job
       +jobs/add <#>=<text>       - Alias for +jobs/comment
-      +jobs/close <#>           - Close a job
+      +jobs/close <#>[=<reason>] - Close a job; it is archived in the background
+      +jobs/closequeue          - Show closed jobs waiting to be archived
       +jobs/reopen <#>          - Reopen an archived job
       +jobs/addplayer <#>=<player>
       +jobs/removeplayer <#>=<player>
@@ -113,6 +124,8 @@ class CmdJobs(MuxCommand):
             self.create_job()
         elif "comment" in self.switches or "add" in self.switches:
             self.add_comment()
+        elif "closequeue" in self.switches:
+            self.view_closure_queue()
         elif "close" in self.switches:
             self.close_job()
         elif "reopen" in self.switches:
@@ -135,6 +148,8 @@ class CmdJobs(MuxCommand):
             self.attach_object()
         elif "remove" in self.switches:
             self.remove_object()
+        elif "page" in self.switches:
+            self.list_jobs_page()
         elif "list" in self.switches:
             self.list_jobs()
         elif "mine" in self.switches:
@@ -158,7 +173,16 @@ class CmdJobs(MuxCommand):
         else:
             self.caller.msg("Invalid switch. See help +jobs for usage.")
 
-    def list_jobs(self):
+    def list_jobs_page(self):
+        """Show one page of the job list."""
+        try:
+            page = int(self.args.strip())
+        except ValueError:
+            self.caller.msg("Usage: +jobs/page <#>")
+            return
+        self.list_jobs(page)
+
+    def list_jobs(self, page=1):
         if self.caller.check_permstring("Admin"):
             jobs = Job.objects.filter(status__in=['open', 'claimed']).order_by('-created_at')
         else:
@@ -168,10 +192,17 @@ class CmdJobs(MuxCommand):
                 status__in=['open', 'claimed']
             ).distinct().order_by('-created_at')
 
-        if not jobs:
+        total = jobs.count()
+        if not total:
             self.caller.msg("You have no open jobs.")
             return
 
+        total_pages = (total + JOBS_PAGE_SIZE - 1) // JOBS_PAGE_SIZE
+        page = min(max(1, page), total_pages)
+        start = (page - 1) * JOBS_PAGE_SIZE
+        jobs = list(jobs.select_related(*JOB_LIST_RELATED)[start:start + JOBS_PAGE_SIZE])
+        read_times = JobReadMarker.read_times(self.caller.account, jobs)
+
         # Define column widths
         col_widths = {
             'job_id': 6,    # "Job # "
@@ -202,7 +233,7 @@ class CmdJobs(MuxCommand):
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since(read_times.get(job.id))
             title_marker = "|r*|n " if unread else "  "
             
             # Format each field with proper width
@@ -218,6 +249,8 @@ class CmdJobs(MuxCommand):
             row = f"{job_id}{queue}{title}{originator}{assignee}{status}"
             output += row + "\n"
 
+        if total_pages > 1:
+            output += f"Page {page} of {total_pages} ({total} jobs). Use +jobs/page <#> to see more.\n"
         output += footer(width=78, fillchar="|r-|n")
         self.caller.msg(output)
 
@@ -268,11 +301,12 @@ class CmdJobs(MuxCommand):
                 if i < len(paragraphs) - 1:
                     output += "\n"
             
-            if job.comments:
+            comments = list(job.comments.all())
+            if comments:
                 output += divider("Comments", width=78, fillchar="-", color="|r", text_color="|c") + "\n"
-                for comment in job.comments:
-                    output += f"|c{comment['author']} [{comment['created_at']}]:|n\n"
-                    output += comment['text'] + "\n\n"
+                for comment in comments:
+                    output += f"|c{comment.author} [{comment.timestamp}]:|n\n"
+                    output += comment.text + "\n\n"
             
             output += divider("", width=78, fillchar="-", color="|r") + "\n"
             self.caller.msg(output)
@@ -529,16 +563,7 @@ class CmdJobs(MuxCommand):
                 self.caller.msg("You don't have permission to comment on this job.")
                 return
 
-            new_comment = {
-                "author": self.caller.account.username,
-                "text": comment,
-                "created_at": timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            if not job.comments:
-                job.comments = []
-            job.comments.append(new_comment)
-            job.save()
+            job.add_comment(self.caller.account.username, comment)
 
             self.caller.msg(f"Comment added to job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, "commented on")
@@ -555,7 +580,7 @@ class CmdJobs(MuxCommand):
 
     def close_job(self):
         try:
-            job_id = int(self.args)
+            job_id = int(self.args.split("=", 1)[0].strip())
             job = Job.objects.get(id=job_id)
             
             if not self.caller.check_permstring("Admin"):
@@ -569,15 +594,11 @@ class CmdJobs(MuxCommand):
 
             is_approved = "close" in self.switches
             job.approved = is_approved
-            success, subject, message, recipients = job.close(self.caller.account, reason)
             
-            if success:
+            # Archiving and the requester's mail are handled in the background
+            if job.close(self.caller.account, reason):
                 status = "closed" if is_approved else "rejected"
-                self.caller.msg(f"Job #{job_id} has been {status} and archived.")
-                
-                # Send mail notifications
-                self.send_mail_notification(job, f"Job #{job_id} has been {status}.\n\nReason: {reason}")
-                
+                self.caller.msg(f"Job #{job_id} has been {status} and queued for archiving.")
                 self.post_to_jobs_channel(self.caller.name, job.id, status)
             else:
                 self.caller.msg(f"Job #{job_id} is already closed or rejected.")
@@ -585,6 +606,28 @@ class CmdJobs(MuxCommand):
         except (ValueError, Job.DoesNotExist):
             self.caller.msg("Invalid job ID.")
 
+    def view_closure_queue(self):
+        """Show closed jobs still waiting to be archived."""
+        if not self.caller.check_permstring("Admin"):
+            self.caller.msg("You don't have permission to view the closure queue.")
+            return
+
+        from world.scripts.job_closure_script import job_closure_status
+        status = job_closure_status()
+
+        output = header("Job Closure Queue", width=78, fillchar="|r-|n") + "\n"
+        output += f"|cArchiver:|n {'running' if status['running'] else '|rnot running|n'}\n"
+        output += f"|cPending:|n {len(status['pending'])}\n"
+        for closure in status['pending']:
+            output += f"  Job #{closure.job_id}: {crop(closure.job.title, width=40)} "
+            output += f"(queued {closure.queued_at.strftime('%Y-%m-%d %H:%M:%S')})\n"
+        if status['failed']:
+            output += f"|rFailed:|n {len(status['failed'])}\n"
+            for closure in status['failed']:
+                output += f"  Job #{closure.job_id}: {crop(closure.last_error, width=60)}\n"
+        output += footer(width=78, fillchar="|r-|n")
+        self.caller.msg(output)
+
     def add_player(self):
         if not self.args or "=" not in self.args:
             self.caller.msg("Usage: +jobs/addplayer <#>=<player>")
@@ -636,16 +679,7 @@ class CmdJobs(MuxCommand):
             job.participants.add(player)
             
             # Create a comment in the job about the addition
-            new_comment = {
-                "author": self.caller.account.username,
-                "text": f"Added {player.username} to this job.",
-                "created_at": timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            if not job.comments:
-                job.comments = []
-            job.comments.append(new_comment)
-            job.save()
+            job.add_comment(self.caller.account.username, f"Added {player.username} to this job.")
             
             self.caller.msg(f"Player {player.username} successfully added to job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, f"added {player.username} to")
@@ -730,15 +764,7 @@ class CmdJobs(MuxCommand):
             player_username = player.username
             
             # Create a comment in the job about the removal
-            new_comment = {
-                "author": self.caller.account.username,
-                "text": f"Removed {player.username} from this job.",
-                "created_at": timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            if not job.comments:
-                job.comments = []
-            job.comments.append(new_comment)
+            job.add_comment(self.caller.account.username, f"Removed {player.username} from this job.")
             
             # Send notification to the removed player
             removed_notification = f"You have been removed from Job #{job_id}: {job.title} by {self.caller.name}"
@@ -978,24 +1004,12 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the maximum archive_id from both tables
-                max_archived = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                max_job = Job.objects.exclude(archive_id__isnull=True).aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max(max_archived, max_job) + 1
-                
-                logger.log_info(f"Max archive_id from ArchivedJob: {max_archived}")
-                logger.log_info(f"Max archive_id from Job: {max_job}")
-                logger.log_info(f"Calculated next_archive_id: {next_archive_id}")
-
-                # Verify the archive_id is truly unique
-                while (ArchivedJob.objects.filter(archive_id=next_archive_id).exists() or 
-                       Job.objects.filter(archive_id=next_archive_id).exists()):
-                    next_archive_id += 1
-                    logger.log_info(f"Archive ID {next_archive_id-1} was taken, trying {next_archive_id}")
+                # Take the next archive_id from the counter
+                next_archive_id = allocate_archive_id()
+                logger.log_info(f"Allocated archive_id: {next_archive_id}")
 
                 # Create comments text
-                comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
-                                           for comment in job.comments])
+                comments_text = job.comments_text()
                 
                 # Add the approval comment if provided
                 if comment:
@@ -1037,11 +1051,7 @@ class CmdJobs(MuxCommand):
 
                 # Add the approval comment if provided
                 if comment:
-                    job.comments.append({
-                        'author': self.caller.name,
-                        'text': f"Approved: {comment}",
-                        'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                    job.add_comment(self.caller.name, f"Approved: {comment}")
 
                 logger.log_info(f"Attempting to save job #{job.id} with archive_id: {job.archive_id}")
                 job.save()
@@ -1090,13 +1100,11 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                # Take the next archive_id from the counter
+                next_archive_id = allocate_archive_id()
 
                 # Create comments text
-                comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
-                                           for comment in job.comments])
+                comments_text = job.comments_text()
 
                 # Add the rejection comment if provided
                 if comment:
@@ -1124,11 +1132,7 @@ class CmdJobs(MuxCommand):
 
                 # Add the rejection comment if provided
                 if comment:
-                    job.comments.append({
-                        'author': self.caller.name,
-                        'text': f"Rejected: {comment}",
-                        'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                    job.add_comment(self.caller.name, f"Rejected: {comment}")
 
                 job.save()
 
@@ -1624,13 +1628,11 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                # Take the next archive_id from the counter
+                next_archive_id = allocate_archive_id()
 
                 # Create comments text
-                comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
-                                           for comment in job.comments])
+                comments_text = job.comments_text()
 
                 # Add the status change comment
                 comments_text += f"\n\nStatus Change [{timezone.now().strftime('%Y-%m-%d %H:%M:%S')}]: {reason}"
@@ -1656,11 +1658,7 @@ class CmdJobs(MuxCommand):
                 job.archive_id = next_archive_id
 
                 # Add the status change comment
-                job.comments.append({
-                    'author': self.caller.name,
-                    'text': f"{new_status.title()}: {reason}",
-                    'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
+                job.add_comment(self.caller.name, f"{new_status.title()}: {reason}")
 
                 job.save()
 
@@ -1741,6 +1739,7 @@ class CmdJobs(MuxCommand):
                 requester=self.caller.account,
                 status__in=['open', 'claimed']
             ).order_by('-created_at')
+        jobs = list(jobs.select_related(*JOB_LIST_RELATED))
 
         if not jobs:
             self.caller.msg("You have no open jobs.")
@@ -1754,12 +1753,13 @@ class CmdJobs(MuxCommand):
         output += ANSIString("|r" + "-" * 78 + "|n") + "\n"
 
         # Add each job as a row without cropping
+        read_times = JobReadMarker.read_times(self.caller.account, jobs)
         for job in jobs:
             assignee = job.assignee.username if job.assignee else "-----"
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since(read_times.get(job.id))
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -1794,29 +1794,16 @@ class CmdJobs(MuxCommand):
                 requester=archived_job.requester,
                 assignee=archived_job.assignee,
                 queue=archived_job.queue,
-                status='open',
-                comments=[]  # Start with empty comments
+                status='open'
             )
 
             # Add a system comment about reopening
-            new_job.comments.append({
-                'author': 'System',
-                'text': f"Job reopened by {self.caller.name} (Previous job #{job_id})",
-                'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
+            new_job.add_comment('System', f"Job reopened by {self.caller.name} (Previous job #{job_id})")
 
             # If there were previous comments, add them with a header
             if archived_job.comments:
-                new_job.comments.append({
-                    'author': 'System',
-                    'text': "--- Previous Comments ---",
-                    'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                new_job.comments.append({
-                    'author': 'System',
-                    'text': archived_job.comments,
-                    'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
+                new_job.add_comment('System', "--- Previous Comments ---")
+                new_job.add_comment('System', archived_job.comments)
 
             # Try to add any participants that were on the old job
             try:
@@ -1879,7 +1866,8 @@ class CmdJobs(MuxCommand):
         jobs = Job.objects.filter(
             assignee=self.caller.account,
             status__in=['open', 'claimed']
-        ).order_by('-created_at')
+        ).select_related(*JOB_LIST_RELATED).order_by('-created_at')
+        jobs = list(jobs)
 
         if not jobs:
             self.caller.msg("You have no jobs assigned to you.")
@@ -1893,11 +1881,12 @@ class CmdJobs(MuxCommand):
         output += ANSIString("|r" + "-" * 78 + "|n") + "\n"
 
         # Add each job as a row without cropping
+        read_times = JobReadMarker.read_times(self.caller.account, jobs)
         for job in jobs:
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since(read_times.get(job.id))
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -2004,7 +1993,9 @@ class CmdJobs(MuxCommand):
                     'assignee_id': job.assignee.id if job.assignee else None,
                     'queue_id': job.queue.id,
                     'status': job.status,
-                    'comments': job.comments,
+                    'comments': [(comment.author, comment.text, comment.created_at)
+                                 for comment in job.comments.all()],
+                    'last_activity_at': job.last_activity_at,
                     'created_at': job.created_at,
                     'participant_ids': [p.id for p in job.participants.all()],
                     'participant_usernames': participant_usernames,
@@ -2025,6 +2016,9 @@ class CmdJobs(MuxCommand):
                 # Delete all jobs without archive_id
                 Job.objects.filter(archive_id__isnull=True).delete()
 
+                # Restart job and archive numbering from 1
+                reset_job_counters()
+
                 # Reset sequences based on database engine
                 with connection.cursor() as cursor:
                     db_engine = connection.settings_dict['ENGINE']
@@ -2052,9 +2046,13 @@ class CmdJobs(MuxCommand):
                         assignee_id=job_info['assignee_id'],
                         queue_id=job_info['queue_id'],
                         status=job_info['status'],
-                        comments=job_info['comments'],
-                        created_at=job_info['created_at']
+                        created_at=job_info['created_at'],
+                        last_activity_at=job_info['last_activity_at']
                     )
+                    JobComment.objects.bulk_create([
+                        JobComment(job=new_job, author=author, text=text, created_at=created_at)
+                        for author, text, created_at in job_info['comments']
+                    ])
                     
                     old_id = job_info['original_id']
                     new_id = new_job.id
@@ -2138,11 +2136,7 @@ class CmdJobs(MuxCommand):
             job.queue = new_queue
             
             # Add a comment about the transfer
-            job.comments.append({
-                'author': self.caller.name,
-                'text': f"Transferred job from {old_category} to {new_category}",
-                'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
+            job.add_comment(self.caller.name, f"Transferred job from {old_category} to {new_category}")
             
             # Save the job with its new queue
             job.save()
@@ -7,6 +7,9 @@ from world.cofd.lookup_data import (
     get_clan_description, get_covenant_description,
     get_path_info, get_order_description, get_template_description
 )
+from world.cofd.lookup_cache import LOOKUP_PAGE_CACHE, MessageRecorder
+from world.cofd.lookup_categories import LOOKUP_CATEGORIES
+from world.cofd.lookup_index import paginate
 from world.utils.formatting import header, footer, divider, format_stat
 import re
 
@@ -20,6 +23,9 @@ class CmdLookup(MuxCommand):
         +lookup <category>                   - List all items in category
         +lookup <category> <name>            - Show details for specific item
         +lookup/search <term>                - Search for stats containing term
+        +lookup/search <term>=<page>         - Show another page of search results
+        +lookup/cache                        - Show rendered-page cache stats (staff)
+        +lookup/cache/clear                  - Clear the rendered-page cache (staff)
         
     Common Categories:
         attributes, skills, merits, disciplines, powers, clans, bloodlines, covenants,
@@ -82,14 +88,27 @@ class CmdLookup(MuxCommand):
     help_category = "Character Creation"
     
     def get_theme_colors(self):
-        """Get theme colors from server config or defaults."""
+        """Get theme colors from server config or defaults, read once per command."""
+        if getattr(self, "_theme_colors", None):
+            return self._theme_colors
+        
+        # Default colors (cyan for informational)
+        self._theme_colors = ('c', 'c', 'c')
         theme_colors = ServerConfig.objects.conf("LOOKUP_THEME_COLORS")
         if theme_colors:
             colors = theme_colors.split(",")
             if len(colors) >= 3:
-                return colors[0], colors[1], colors[2]
-        # Default colors (cyan for informational)
-        return 'c', 'c', 'c'
+                self._theme_colors = (colors[0], colors[1], colors[2])
+        return self._theme_colors
+    
+    def supports_utf8(self):
+        """Check whether the caller's session accepts UTF-8 output."""
+        if self.session:
+            utf8_support = self.session.protocol_flags.get("UTF-8", None)
+            encoding = self.session.protocol_flags.get("ENCODING", "utf-8").lower()
+            if utf8_support is False or encoding not in ["utf-8", "utf8"]:
+                return False
+        return True
     
     def format_header(self, content):
         """
@@ -136,8 +155,11 @@ class CmdLookup(MuxCommand):
         return footer
     
     def func(self):
-        if not self.args and not self.switches:
-            self.show_categories()
+        # Theme colors are read at most once per invocation
+        self._theme_colors = None
+        
+        if "cache" in self.switches:
+            self.manage_cache()
             return
             
         if "search" in self.switches:
@@ -145,568 +167,72 @@ class CmdLookup(MuxCommand):
             return
             
         args = self.args.strip().lower()
+        parts = args.split()
         
-        # Handle specific lookups
-        if args.startswith("attributes"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a stat name lookup with category filter
-                stat_name = " ".join(parts[1:])
-                self.show_stat_details(stat_name, category_filter="attributes")
-            else:
-                self.show_attributes()
-        elif args.startswith("skills"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a filter or a stat name
-                skill_filters = ["mental", "physical", "social"]
-                if parts[1] in skill_filters:
-                    self.show_skills(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="skills")
-            else:
-                self.show_skills(None)
-        elif args.startswith("merits"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a filter or a stat name
-                merit_filters = ["mental", "physical", "social", "supernatural", "fighting", "style",
-                               "vampire", "mage", "werewolf", "changeling", "geist", "demon", 
-                               "deviant", "hunter", "mummy", "promethean", "mortal+", "mortal_plus",
-                               "psychic", "ghoul", "dhampir", "atariya", "psychic_vampire", "general",
-                               "plain", "infected", "lost boy", "dreamer"]
-                if parts[1] in merit_filters:
-                    self.show_merits(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="merits")
-            else:
-                self.show_merits(None)
-        elif args.startswith("disciplines") or args.startswith("discipline"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific discipline lookup
-                discipline_name = " ".join(parts[1:])
-                self.show_discipline_details(discipline_name)
-            else:
-                self.show_disciplines()
-        elif args.startswith("discipline_powers") or args.startswith("powers"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a discipline filter or a stat name
-                discipline_names = ["animalism", "auspex", "celerity", "dominate", "majesty", "nightmare", 
-                                  "obfuscate", "protean", "resilience", "vigor", "cachexy", "crochan", "dead_signal"]
-                if parts[1] in discipline_names:
-                    self.show_discipline_powers(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="powers")
-            else:
-                self.show_discipline_powers(None)
-        elif args.startswith("coils"):
-            parts = args.split()
-            mystery = parts[1] if len(parts) > 1 else None
-            self.show_coils(mystery)
-        elif args.startswith("bloodline"):
-            parts = args.split()
-            bloodline = parts[1] if len(parts) > 1 else None
-            self.show_bloodline_disciplines(bloodline)
-        elif args.startswith("devotions") or args.startswith("devotion"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a devotion type filter or a stat name
-                devotion_types = ["general", "carthian", "invictus", "nereid"]
-                if parts[1] in devotion_types:
-                    self.show_devotions(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="devotions")
-            else:
-                self.show_devotions(None)
-        elif args.startswith("scales"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a mystery filter or a stat name
-                mystery_names = ["ascendant", "quintessence", "voivode", "wyrm", "zirnitra", "ziva", "other"]
-                if parts[1] in mystery_names:
-                    self.show_scales(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="scales")
-            else:
-                self.show_scales(None)
-        elif args.startswith("theban"):
-            parts = args.split()
-            if len(parts) > 1:
-                rank_arg = parts[1]
-                if rank_arg.isdigit():
-                    self.show_theban(int(rank_arg))
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="theban")
-            else:
-                self.show_theban(None)
-        elif args.startswith("cruac"):
-            parts = args.split()
-            if len(parts) > 1:
-                rank_arg = parts[1]
-                if rank_arg.isdigit():
-                    self.show_cruac(int(rank_arg))
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="cruac")
-            else:
-                self.show_cruac(None)
-        elif args == "arcana":
-            self.show_arcana()
-        elif args.startswith("spells"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's an arcana filter or a stat name
-                arcana_names = ["death", "fate", "forces", "life", "matter", "mind", "prime", "space", "spirit", "time"]
-                if parts[1] in arcana_names:
-                    self.show_spells(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="spells")
-            else:
-                self.show_spells(None)
-        elif args.startswith("clans") or args.startswith("clan"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific clan lookup
-                clan_name = " ".join(parts[1:])
-                self.show_clan_details(clan_name)
-            else:
-                self.show_clans()
-        elif args.startswith("bloodlines") or args.startswith("bloodline"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific bloodline lookup
-                bloodline_name = " ".join(parts[1:])
-                self.show_bloodline_details(bloodline_name)
-            else:
-                self.show_bloodlines()
-        elif args.startswith("covenants") or args.startswith("covenant"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific covenant lookup
-                covenant_name = " ".join(parts[1:])
-                self.show_covenant_details(covenant_name)
-            else:
-                self.show_covenants()
-        elif args.startswith("paths") or args.startswith("path"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific path lookup
-                path_name = " ".join(parts[1:])
-                self.show_path_details(path_name)
-            else:
-                self.show_paths()
-        elif args.startswith("orders") or args.startswith("order"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific order lookup
-                order_name = " ".join(parts[1:])
-                self.show_order_details(order_name)
-            else:
-                self.show_orders()
-        elif args.startswith("legacies") or args.startswith("legacy"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific legacy lookup
-                legacy_name = " ".join(parts[1:])
-                self.show_legacy_details(legacy_name)
-            else:
-                self.show_legacies()
-        elif args.startswith("templates") or args.startswith("template"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific template lookup
-                template_name = " ".join(parts[1:])
-                self.show_template_details(template_name)
-            else:
-                self.show_templates()
-        elif args.startswith("auspices") or args.startswith("auspice"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific auspice lookup
-                auspice_name = " ".join(parts[1:])
-                self.show_auspice_details(auspice_name)
-            else:
-                self.show_auspices()
-        elif args.startswith("tribes") or args.startswith("tribe"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific tribe lookup
-                tribe_name = " ".join(parts[1:])
-                self.show_tribe_details(tribe_name)
-            else:
-                self.show_tribes()
-        elif args.startswith("gifts"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a gift category filter or a stat name
-                gift_categories = ["agony", "blood", "death", "disease", "dominance", "elementals",
-                                 "evasion", "fervor", "hunger", "insight", "inspiration", "knowledge",
-                                 "nature", "rage", "shaping", "stealth", "strength", "technology",
-                                 "warding", "weather", "change", "hunting", "pack",
-                                 "crescent_moon", "full_moon", "gibbous_moon", "half_moon", "new_moon",
-                                 "cunning", "glory", "honor", "purity", "wisdom"]
-                if parts[1] in gift_categories:
-                    self.show_werewolf_gifts(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="gifts")
-            else:
-                self.show_werewolf_gifts(None)
-        elif args.startswith("lodges") or args.startswith("lodge"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific lodge lookup
-                lodge_name = " ".join(parts[1:])
-                self.show_lodge_details(lodge_name)
-            else:
-                self.show_lodges()
-        elif args.startswith("contracts"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a contract category filter or a stat name
-                contract_categories = ["crown", "jewel", "mirror", "shield", "steed", "sword", 
-                                     "chalice", "coin", "stars", "thorn", "goblin"]
-                if parts[1] in contract_categories:
-                    self.show_changeling_contracts(parts[1])
-                else:
-                    # It's a stat name lookup with category filter
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="contracts")
-            else:
-                self.show_changeling_contracts(None)
-        elif args.startswith("seemings") or args.startswith("seeming"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific seeming lookup
-                seeming_name = " ".join(parts[1:])
-                self.show_seeming_details(seeming_name)
-            else:
-                self.show_seemings()
-        elif args.startswith("courts") or args.startswith("court"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific court lookup
-                court_name = " ".join(parts[1:])
-                self.show_court_details(court_name)
-            else:
-                self.show_courts()
-        elif args.startswith("kiths") or args.startswith("kith"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific kith lookup
-                kith_name = " ".join(parts[1:])
-                self.show_kith_details(kith_name)
-            else:
-                self.show_kiths()
-        elif args.startswith("entitlements") or args.startswith("entitlement"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific entitlement lookup
-                entitlement_name = " ".join(parts[1:])
-                self.show_entitlement_details(entitlement_name)
-            else:
-                self.show_entitlements()
-        elif args.startswith("keys"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific key lookup
-                key_name = " ".join(parts[1:])
-                self.show_geist_key(key_name)
-            else:
-                self.show_geist_keys()
-        elif args.startswith("haunts"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific haunt lookup
-                haunt_name = " ".join(parts[1:])
-                self.show_geist_haunt(haunt_name)
-            else:
-                self.show_geist_haunts()
-        elif args.startswith("incarnations") or args.startswith("incarnation"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific incarnation lookup
-                incarnation_name = " ".join(parts[1:])
-                self.show_incarnation_details(incarnation_name)
-            else:
-                self.show_incarnations()
-        elif args.startswith("agendas") or args.startswith("agenda"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific agenda lookup
-                agenda_name = " ".join(parts[1:])
-                self.show_agenda_details(agenda_name)
-            else:
-                self.show_agendas()
-        elif args.startswith("embeds") or args.startswith("embed"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific embed lookup
-                embed_name = " ".join(parts[1:])
-                self.show_embed_details(embed_name)
-            else:
-                self.show_embeds()
-        elif args.startswith("exploits") or args.startswith("exploit"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific exploit lookup
-                exploit_name = " ".join(parts[1:])
-                self.show_exploit_details(exploit_name)
-            else:
-                self.show_exploits()
-        elif args.startswith("demon_modifications") or args.startswith("modifications") or args.startswith("modification"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific modification lookup
-                modification_name = " ".join(parts[1:])
-                self.show_demon_modification_details(modification_name)
-            else:
-                self.show_demon_modifications()
-        elif args.startswith("demon_technologies") or args.startswith("technologies") or args.startswith("technology"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific technology lookup
-                technology_name = " ".join(parts[1:])
-                self.show_demon_technology_details(technology_name)
-            else:
-                self.show_demon_technologies()
-        elif args.startswith("demon_propulsions") or args.startswith("propulsions") or args.startswith("propulsion"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific propulsion lookup
-                propulsion_name = " ".join(parts[1:])
-                self.show_demon_propulsion_details(propulsion_name)
-            else:
-                self.show_demon_propulsions()
-        elif args.startswith("demon_processes") or args.startswith("processes") or args.startswith("process"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific process lookup
-                process_name = " ".join(parts[1:])
-                self.show_demon_process_details(process_name)
-            else:
-                self.show_demon_processes()
-        elif args.startswith("transmutations") or args.startswith("transmutation"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific transmutation lookup
-                transmutation_name = " ".join(parts[1:])
-                self.show_transmutation_details(transmutation_name)
-            else:
-                self.show_transmutations()
-        elif args.startswith("alembics"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific alembic lookup
-                alembic_name = " ".join(parts[1:])
-                self.show_alembic_details(alembic_name)
-            else:
-                self.show_alembics()
-        elif args.startswith("bestowments") or args.startswith("bestowment"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific bestowment lookup
-                bestowment_name = " ".join(parts[1:])
-                self.show_bestowment_details(bestowment_name)
-            else:
-                self.show_bestowments()
-        elif args.startswith("endowments"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's an endowment type filter or a stat name
-                endowment_types = ["advanced_armory", "animal_control_kit", "benediction", "castigation", 
-                                 "dreamscape", "elixir", "enkoimesis", "goetic_gospel", "horror_within", 
-                                 "infusion", "ink", "inspiration", "lives_remembered", "perispiritism", 
-                                 "relic", "rites_du_cheval", "rites_of_denial", "seitokuten", 
-                                 "teleinformatics", "thaumatechnology", "xenotechnology"]
-                if parts[1] in endowment_types:
-                    self.show_endowments(parts[1])
-                else:
-                    # It's a stat name lookup with category filter (keep spaces for endowments)
-                    stat_name = " ".join(parts[1:])
-                    self.show_stat_details(stat_name, category_filter="endowments")
-            else:
-                self.show_endowments(None)
-        elif args.startswith("tactics") or args.startswith("tactic"):
-            parts = args.split()
-            if len(parts) > 1:
-                # Check if it's a tactics category filter or a stat name
-                tactic_categories = ["mental", "physical", "social"]
-                if parts[1] in tactic_categories:
-                    self.show_tactics(parts[1])
-                else:
-                    # It's a stat name lookup
-                    tactic_name = " ".join(parts[1:])
-                    self.show_tactic_details(tactic_name)
-            else:
-                self.show_tactics(None)
-        elif args.startswith("compacts") or args.startswith("compact"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific compact lookup
-                compact_name = " ".join(parts[1:])
-                self.show_compact_details(compact_name)
-            else:
-                self.show_compacts()
-        elif args.startswith("conspiracies") or args.startswith("conspiracy"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific conspiracy lookup
-                conspiracy_name = " ".join(parts[1:])
-                self.show_conspiracy_details(conspiracy_name)
-            else:
-                self.show_conspiracies()
-        elif args.startswith("lineages") or args.startswith("lineage"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific lineage lookup
-                lineage_name = " ".join(parts[1:])
-                self.show_lineage_details(lineage_name)
-            else:
-                self.show_lineages()
-        elif args.startswith("athanors") or args.startswith("athanor"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific athanor lookup
-                athanor_name = " ".join(parts[1:])
-                self.show_athanor_details(athanor_name)
-            else:
-                self.show_athanors()
-        elif args.startswith("guilds") or args.startswith("guild"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific guild lookup
-                guild_name = " ".join(parts[1:])
-                self.show_guild_details(guild_name)
-            else:
-                self.show_guilds()
-        elif args.startswith("decrees") or args.startswith("decree"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific decree lookup
-                decree_name = " ".join(parts[1:])
-                self.show_decree_details(decree_name)
-            else:
-                self.show_decrees()
-        elif args.startswith("judges") or args.startswith("judge"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific judge lookup
-                judge_name = " ".join(parts[1:])
-                self.show_judge_details(judge_name)
-            else:
-                self.show_judges()
-        elif args.startswith("utterances") or args.startswith("utterance"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific utterance lookup
-                utterance_name = " ".join(parts[1:])
-                self.show_utterance_details(utterance_name)
-            else:
-                self.show_utterances()
-        elif args.startswith("affinities") or args.startswith("affinity"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific affinity lookup
-                affinity_name = " ".join(parts[1:])
-                self.show_affinity_details(affinity_name)
-            else:
-                self.show_affinities()
-        elif args.startswith("burdens") or args.startswith("burden"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific burden lookup
-                burden_name = " ".join(parts[1:])
-                self.show_burden_details(burden_name)
-            else:
-                self.show_burdens()
-        elif args.startswith("krewe"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific krewe type lookup
-                krewe_name = " ".join(parts[1:])
-                self.show_krewe_details(krewe_name)
-            else:
-                self.show_krewe_types()
-        elif args.startswith("ceremonies") or args.startswith("ceremony"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific ceremony lookup
-                ceremony_name = " ".join(parts[1:])
-                self.show_ceremony_details(ceremony_name)
-            else:
-                self.show_ceremonies()
-        elif args.startswith("origins") or args.startswith("origin"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific origin lookup
-                origin_name = " ".join(parts[1:])
-                self.show_origin_details(origin_name)
-            else:
-                self.show_origins()
-        elif args.startswith("clades") or args.startswith("clade"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific clade lookup
-                clade_name = " ".join(parts[1:])
-                self.show_clade_details(clade_name)
-            else:
-                self.show_clades()
-        elif args.startswith("variations"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific variation lookup
-                variation_name = " ".join(parts[1:])
-                self.show_deviant_variation(variation_name)
-            else:
-                self.show_variations()
-        elif args.startswith("adaptations"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific adaptation lookup
-                adaptation_name = " ".join(parts[1:])
-                self.show_deviant_adaptation(adaptation_name)
-            else:
-                self.show_adaptations()
-        elif args.startswith("scars"):
-            parts = args.split()
-            if len(parts) > 1:
-                # It's a specific scar lookup
-                scar_name = " ".join(parts[1:])
-                self.show_deviant_scar(scar_name)
-            else:
-                self.show_scars()
-        elif args == "mortal+" or args == "mortal_plus":
-            self.show_mortal_plus_types()
-        elif args == "psychic" or args == "psychic_powers":
-            self.show_psychic_powers()
-        elif args == "tells" or args == "wolf_blooded":
-            self.show_wolf_blooded_tells()
-        elif args == "specialties" or args.startswith("specialties"):
-            parts = args.split()
-            skill = parts[1] if len(parts) > 1 else None
-            self.show_specialties(skill)
+        # Resolve the category handler from the registry in a single lookup
+        category = LOOKUP_CATEGORIES.resolve(parts[0]) if parts else None
+        
+        # Pages only depend on static data, so serve them from the rendered-page cache
+        theme = self.get_theme_colors()
+        LOOKUP_PAGE_CACHE.check_theme(theme)
+        if category:
+            cache_key = (category.name, " ".join(parts[1:]), theme, self.supports_utf8())
         else:
-            # Try to find specific stat
-            self.show_stat_details(args)
+            cache_key = (None, args, theme, self.supports_utf8())
+        
+        messages = LOOKUP_PAGE_CACHE.get(cache_key)
+        if messages is None:
+            messages = self.render_page(category, parts, args)
+            LOOKUP_PAGE_CACHE.put(cache_key, messages)
+        
+        for text, kwargs in messages:
+            self.caller.msg(text, **kwargs)
+    
+    def render_page(self, category, parts, args):
+        """
+        Render a lookup page, capturing its output instead of sending it.
+        
+        Returns:
+            list: (text, kwargs) pairs for each message the page sent
+        """
+        caller = self.caller
+        recorder = MessageRecorder(caller)
+        self.caller = recorder
+        try:
+            if not args:
+                self.show_categories()
+            elif category:
+                category.dispatch(self, parts[1:], args)
+            else:
+                # Try to find specific stat
+                self.show_stat_details(args)
+        finally:
+            self.caller = caller
+        return recorder.messages
+    
+    def manage_cache(self):
+        """Show or clear the rendered-page cache (staff only)."""
+        if not self.caller.check_permstring("Builder"):
+            self.caller.msg("Only staff can view the lookup cache.")
+            return
+        
+        if "clear" in self.switches:
+            LOOKUP_PAGE_CACHE.clear()
+            LOOKUP_PAGE_CACHE.reset_stats()
+            self.caller.msg("Lookup page cache cleared.")
+            return
+        
+        stats = LOOKUP_PAGE_CACHE.stats()
+        msg = self.format_header("Lookup Page Cache")
+        msg += "\n\n"
+        msg += f"|cCached Pages:|n {stats['pages']} / {stats['max_pages']}\n"
+        msg += f"|cHits:|n {stats['hits']}\n"
+        msg += f"|cMisses:|n {stats['misses']}\n"
+        msg += f"|cHit Rate:|n {stats['hit_rate']:.1%}\n"
+        msg += f"|cEvictions:|n {stats['evictions']}\n"
+        msg += f"|cInvalidations:|n {stats['invalidations']}\n\n"
+        msg += self.format_footer("Use +lookup/cache/clear to reset")
+        self.caller.msg(msg)
     
     def show_categories(self):
         """Show available lookup categories in a compact 4-column format."""
@@ -1907,79 +1433,41 @@ class CmdLookup(MuxCommand):
         
         self.caller.msg(msg)
     
+    # Key index categories searched by show_stat_details, per +lookup category filter
+    STAT_DETAIL_FILTERS = {
+        "scales": ["ritual"],
+        "theban": ["ritual"],
+        "cruac": ["ritual"],
+        "rituals": ["ritual"],
+        "powers": ["discipline_power"],
+        "disciplines": ["discipline_power"],
+        "discipline_powers": ["discipline_power"],
+        "devotions": ["devotion"],
+        "gifts": ["gift"],
+        "contracts": ["contract"],
+        "keys": ["key"],
+        "haunts": ["haunt"],
+        "spells": ["spell"],
+        "endowments": ["endowment"],
+    }
+    STAT_DETAIL_CATEGORIES = ["ritual", "discipline_power", "devotion", "gift", "contract",
+                              "key", "haunt", "spell", "endowment"]
+    
     def show_stat_details(self, stat_name, category_filter=None):
         """Show detailed information about a specific stat, optionally filtered by category."""
-        # Collect all matches across categories
+        # Collect all matches across categories from the shared key index
         matches = []
         
-        # Check rituals (scales, theban, cruac) if not filtering or if filtering for these
-        if not category_filter or category_filter in ["scales", "theban", "cruac", "rituals"]:
-            from world.cofd.powers.vampire_rituals import get_ritual_power
-            ritual_key = stat_name.lower().replace(" ", "_")
-            ritual_data = get_ritual_power(ritual_key)
-            if ritual_data:
-                matches.append(("ritual", ritual_key, ritual_data))
-        
-        # Check discipline powers
-        if not category_filter or category_filter in ["powers", "disciplines", "discipline_powers"]:
-            from world.cofd.powers.vampire_disciplines import get_discipline_power
-            power_key = stat_name.lower().replace(" ", "_")
-            power_data = get_discipline_power(power_key)
-            if power_data:
-                matches.append(("discipline_power", power_key, power_data))
-        
-        # Check devotions
-        if not category_filter or category_filter == "devotions":
-            from world.cofd.powers.vampire_disciplines import ALL_DEVOTIONS
-            devotion_key = stat_name.lower().replace(" ", "_")
-            if devotion_key in ALL_DEVOTIONS:
-                matches.append(("discipline_power", devotion_key, ALL_DEVOTIONS[devotion_key]))
-        
-        # Check werewolf gifts
-        if not category_filter or category_filter == "gifts":
-            from world.cofd.powers.werewolf_gifts import get_gift
-            gift_key = stat_name.lower().replace(" ", "_")
-            gift_data = get_gift(gift_key)
-            if gift_data:
-                matches.append(("gift", gift_key, gift_data))
-        
-        # Check changeling contracts
-        if not category_filter or category_filter == "contracts":
-            from world.cofd.powers.changeling_contracts import get_contract
-            contract_key = stat_name.lower().replace(" ", "_")
-            contract_data = get_contract(contract_key)
-            if contract_data:
-                matches.append(("contract", contract_key, contract_data))
-        
-        # Check geist keys
-        if not category_filter or category_filter == "keys":
-            key_name_normalized = stat_name.lower().replace(" ", " ")
-            keys_data = LOOKUP_DATA.geist_data['keys_detailed']
-            if key_name_normalized in keys_data:
-                matches.append(("key", key_name_normalized, keys_data[key_name_normalized]))
-        
-        # Check geist haunts
-        if not category_filter or category_filter == "haunts":
-            haunt_name_normalized = stat_name.lower().replace(" ", "_")
-            haunts_data = LOOKUP_DATA.geist_data['haunts_detailed']
-            if haunt_name_normalized in haunts_data:
-                matches.append(("haunt", haunt_name_normalized, haunts_data[haunt_name_normalized]))
-        
-        # Check spells
-        if not category_filter or category_filter == "spells":
-            from world.cofd.powers.mage_spells import get_spell
-        spell_key = stat_name.lower().replace(" ", "_")
-        spell_data = get_spell(spell_key)
-        if spell_data:
-                matches.append(("spell", spell_key, spell_data))
-        
-        # Check endowments
-        if not category_filter or category_filter == "endowments":
-            from world.cofd.powers.hunter_endowments import get_endowment
-            endowment_key = stat_name.lower()  # Keep spaces for endowments
-            endowment_data = get_endowment(endowment_key)
-            if endowment_data:
-                matches.append(("endowment", endowment_key, endowment_data))
+        if category_filter:
+            categories = self.STAT_DETAIL_FILTERS.get(category_filter, [])
+        else:
+            categories = self.STAT_DETAIL_CATEGORIES
+        
+        for stat_type, key, data in LOOKUP_DATA.find(stat_name, categories):
+            # Devotions display like discipline powers
+            if stat_type == "devotion":
+                stat_type = "discipline_power"
+            matches.append((stat_type, key, data))
         
         # Check general stats (attributes, skills, merits, etc.)
         if not category_filter or category_filter in ["attributes", "skills", "merits", "advantages", "anchors"]:
@@ -3865,18 +3353,29 @@ class CmdLookup(MuxCommand):
             self.caller.msg(msg)
     
     def search_stats(self):
-        """Search for stats containing the given term."""
-        if not self.args:
-            self.caller.msg("Usage: +lookup/search <search term>")
+        """Search for stats matching the given term, one page at a time."""
+        search_term = self.lhs if self.rhs else self.args
+        search_term = search_term.strip() if search_term else ""
+        if not search_term:
+            self.caller.msg("Usage: +lookup/search <search term>[=<page>]")
             return
         
-        search_results = LOOKUP_DATA.search_stats(self.args)
+        page = 1
+        if self.rhs:
+            try:
+                page = int(self.rhs.strip())
+            except ValueError:
+                self.caller.msg("Page must be a number. Usage: +lookup/search <search term>=<page>")
+                return
+        
+        search_results = LOOKUP_DATA.search_stats(search_term)
         
         if search_results:
-            msg = f"|wSearch results for '{self.args}':|n\n"
+            page_results, page, total_pages = paginate(search_results, page)
+            msg = f"|wSearch results for '{search_term}' ({len(search_results)} found, page {page} of {total_pages}):|n\n"
             formatted_results = []
             
-            for stat_type, name, data in search_results[:20]:  # Limit to 20 results
+            for stat_type, name, data in page_results:
                 if stat_type == 'attribute':
                     formatted_results.append(f"|wAttribute:|n {name.title()} ({data.att_type})")
                 elif stat_type == 'skill':
@@ -3886,7 +3385,7 @@ class CmdLookup(MuxCommand):
                 elif stat_type == 'discipline':
                     formatted_results.append(f"|wDiscipline:|n {name.title()}")
                 elif stat_type == 'discipline_power':
-                    formatted_results.append(f"|wDiscipline Power:|n {name} ({data['discipline'].title()})")
+                    formatted_results.append(f"|wDiscipline Power:|n {name} ({data['discipline'].replace('_', ' ').title()})")
                 elif stat_type == 'gift':
                     gift_type = data.get('gift_type', 'gift').replace('_', ' ').title()
                     formatted_results.append(f"|wWerewolf Gift:|n {name} ({gift_type})")
@@ -3895,13 +3394,16 @@ class CmdLookup(MuxCommand):
                     formatted_results.append(f"|w{ritual_type.title()}:|n {name}")
                 elif stat_type == 'arcanum':
                     formatted_results.append(f"|wArcanum:|n {name.title()}")
+                else:
+                    type_display = stat_type.replace('_', ' ').title()
+                    formatted_results.append(f"|w{type_display}:|n {name}")
             
             msg += "\n".join(formatted_results)
-            if len(search_results) > 20:
-                msg += f"\n\n|y... and {len(search_results) - 20} more results.|n"
+            if page < total_pages:
+                msg += f"\n\n|cMore:|n |y+lookup/search {search_term}={page + 1}|n"
             msg += f"\n\n|cUse:|n |y+lookup <stat_name>|n for detailed information."
         else:
-            msg = f"No results found for '{self.args}'."
+            msg = f"No results found for '{search_term}'."
         
         self.caller.msg(msg)
     
@@ -4352,7 +3854,7 @@ class CmdLookup(MuxCommand):
             "courtless": "Independent changelings who reject court politics"
         }
         
-        if court_key not in LOOKUP_DATA.changeling_data['courts']:
+        if not LOOKUP_DATA.resolve(court_name, 'court'):
             self.caller.msg(f"Court '{court_name}' not found.")
             self.caller.msg("|cUse:|n +lookup courts - to see all available courts")
             return
@@ -4377,7 +3879,7 @@ class CmdLookup(MuxCommand):
             "psychopomp": "Angels of death and transition"
         }
         
-        if incarnation_key not in LOOKUP_DATA.demon_data['incarnations']:
+        if not LOOKUP_DATA.resolve(incarnation_name, 'incarnation'):
             self.caller.msg(f"Incarnation '{incarnation_name}' not found.")
             self.caller.msg("|cUse:|n +lookup incarnations - to see all available incarnations")
             return
@@ -4402,7 +3904,7 @@ class CmdLookup(MuxCommand):
             "tempter": "Corrupting humans for their own ends"
         }
         
-        if agenda_key not in LOOKUP_DATA.demon_data['agendas']:
+        if not LOOKUP_DATA.resolve(agenda_name, 'agenda'):
             self.caller.msg(f"Agenda '{agenda_name}' not found.")
             self.caller.msg("|cUse:|n +lookup agendas - to see all available agendas")
             return
@@ -4684,7 +4186,7 @@ class CmdLookup(MuxCommand):
             "vulcanus": "Powers of the Divine Fire"
         }
         
-        if transmutation_key not in LOOKUP_DATA.promethean_data['transmutations']:
+        if not LOOKUP_DATA.resolve(transmutation_name, 'transmutation'):
             self.caller.msg(f"Transmutation '{transmutation_name}' not found.")
             self.caller.msg("|cUse:|n +lookup transmutations - to see all available transmutations")
             return
@@ -4703,7 +4205,7 @@ class CmdLookup(MuxCommand):
         """Show detailed information about a specific promethean bestowment."""
         bestowment_key = bestowment_name.lower().replace(" ", "_")
         
-        if bestowment_key not in [b.lower().replace(" ", "_") for b in LOOKUP_DATA.promethean_data['bestowments']]:
+        if not LOOKUP_DATA.resolve(bestowment_name, 'bestowment'):
             self.caller.msg(f"Bestowment '{bestowment_name}' not found.")
             self.caller.msg("|cUse:|n +lookup bestowments - to see all available bestowments")
             return
@@ -4731,7 +4233,7 @@ class CmdLookup(MuxCommand):
             "zeka": "Created from metal and machine parts, the Manufactured"
         }
         
-        if lineage_key not in LOOKUP_DATA.promethean_data['lineages']:
+        if not LOOKUP_DATA.resolve(lineage_name, 'lineage'):
             self.caller.msg(f"Lineage '{lineage_name}' not found.")
             self.caller.msg("|cUse:|n +lookup lineages - to see all available lineages")
             return
@@ -4775,7 +4277,7 @@ class CmdLookup(MuxCommand):
             "amenti": "Independent mummies with no guild affiliation"
         }
         
-        if guild_key not in LOOKUP_DATA.mummy_data['guilds']:
+        if not LOOKUP_DATA.resolve(guild_name, 'guild'):
             self.caller.msg(f"Guild '{guild_name}' not found.")
             self.caller.msg("|cUse:|n +lookup guilds - to see all available guilds")
             return
@@ -4801,7 +4303,7 @@ class CmdLookup(MuxCommand):
             "vengeance": "Strike down enemies of the Judges"
         }
         
-        if decree_key not in LOOKUP_DATA.mummy_data['decrees']:
+        if not LOOKUP_DATA.resolve(decree_name, 'decree'):
             self.caller.msg(f"Decree '{decree_name}' not found.")
             self.caller.msg("|cUse:|n +lookup decrees - to see all available decrees")
             return
@@ -4831,7 +4333,7 @@ class CmdLookup(MuxCommand):
             "sobek": "The Crocodile, god of the Nile and military prowess"
         }
         
-        if judge_key not in LOOKUP_DATA.mummy_data['judges']:
+        if not LOOKUP_DATA.resolve(judge_name, 'judge'):
             self.caller.msg(f"Judge '{judge_name}' not found.")
             self.caller.msg("|cUse:|n +lookup judges - to see all available judges")
             return
@@ -4861,7 +4363,7 @@ class CmdLookup(MuxCommand):
             "word": "Power of command and compulsion"
         }
         
-        if utterance_key not in LOOKUP_DATA.mummy_data['utterances']:
+        if not LOOKUP_DATA.resolve(utterance_name, 'utterance'):
             self.caller.msg(f"Utterance '{utterance_name}' not found.")
             self.caller.msg("|cUse:|n +lookup utterances - to see all available utterances")
             return
@@ -4890,7 +4392,7 @@ class CmdLookup(MuxCommand):
             "sheut": "The shadow-self in the underworld"
         }
         
-        if affinity_key not in LOOKUP_DATA.mummy_data['affinities']:
+        if not LOOKUP_DATA.resolve(affinity_name, 'affinity'):
             self.caller.msg(f"Affinity '{affinity_name}' not found.")
             self.caller.msg("|cUse:|n +lookup affinities - to see all available affinities")
             return
@@ -4915,7 +4417,7 @@ class CmdLookup(MuxCommand):
             "vengeful": "Died angry, with unfinished business"
         }
         
-        if burden_key not in LOOKUP_DATA.geist_data['burdens']:
+        if not LOOKUP_DATA.resolve(burden_name, 'burden'):
             self.caller.msg(f"Burden '{burden_name}' not found.")
             self.caller.msg("|cUse:|n +lookup burdens - to see all available burdens")
             return
@@ -4941,7 +4443,7 @@ class CmdLookup(MuxCommand):
             "academic": "Focused on research and knowledge"
         }
         
-        if krewe_key not in LOOKUP_DATA.geist_data['krewe_types']:
+        if not LOOKUP_DATA.resolve(krewe_name, 'krewe'):
             self.caller.msg(f"Krewe type '{krewe_name}' not found.")
             self.caller.msg("|cUse:|n +lookup krewe - to see all available krewe types")
             return
@@ -4960,7 +4462,7 @@ class CmdLookup(MuxCommand):
         """Show detailed information about a specific geist ceremony."""
         ceremony_key = ceremony_name.lower().replace(" ", "_")
         
-        if ceremony_key not in LOOKUP_DATA.geist_data['ceremonies']:
+        if not LOOKUP_DATA.resolve(ceremony_name, 'ceremony'):
             self.caller.msg(f"Ceremony '{ceremony_name}' not found.")
             self.caller.msg("|cUse:|n +lookup ceremonies - to see all available ceremonies")
             return
@@ -4987,7 +4489,7 @@ class CmdLookup(MuxCommand):
             "technocracy": "Remade by reality engineers and techno-mages"
         }
         
-        if origin_key not in LOOKUP_DATA.deviant_data['origins']:
+        if not LOOKUP_DATA.resolve(origin_name, 'origin'):
             self.caller.msg(f"Origin '{origin_name}' not found.")
             self.caller.msg("|cUse:|n +lookup origins - to see all available origins")
             return
@@ -5016,7 +4518,7 @@ class CmdLookup(MuxCommand):
             "remnant": "Rebuilt from death or destruction"
         }
         
-        if clade_key not in LOOKUP_DATA.deviant_data['clades']:
+        if not LOOKUP_DATA.resolve(clade_name, 'clade'):
             self.caller.msg(f"Clade '{clade_name}' not found.")
             self.caller.msg("|cUse:|n +lookup clades - to see all available clades")
             return
@@ -475,10 +475,7 @@ class CmdStat(MuxCommand):
                 return
             
             if isinstance(value, int) and 1 <= value <= 5:
-                # Initialize attributes dict if missing
-                if "attributes" not in target.db.stats:
-                    target.db.stats["attributes"] = {}
-                target.db.stats["attributes"][stat] = value
+                target.stats.set("attributes", stat, value)
                 stat_set = True
                 
                 # Update base_attributes for werewolves in Hishu form
@@ -509,10 +506,7 @@ class CmdStat(MuxCommand):
                 return
             
             if isinstance(value, int) and 0 <= value <= 5:
-                # Initialize skills dict if missing
-                if "skills" not in target.db.stats:
-                    target.db.stats["skills"] = {}
-                target.db.stats["skills"][stat] = value
+                target.stats.set("skills", stat, value)
                 stat_set = True
             else:
                 self.caller.msg("Skills must be between 0 and 5.")
@@ -523,10 +517,7 @@ class CmdStat(MuxCommand):
                       "blood_potency", "gnosis", "primal_urge", "wyrd", "synergy", 
                       "azoth", "primum", "satiety", "deviation", "psyche"]:
             if isinstance(value, int) and value >= 0:
-                # Initialize advantages dict if missing
-                if "advantages" not in target.db.stats:
-                    target.db.stats["advantages"] = {}
-                target.db.stats["advantages"][stat] = value
+                target.stats.set("advantages", stat, value)
                 stat_set = True
             else:
                 self.caller.msg("Advantages must be positive numbers.")
@@ -592,20 +583,14 @@ class CmdStat(MuxCommand):
                 self.caller.msg("Bio field values cannot exceed 50 characters.")
                 return
             
-            # Ensure bio category exists
-            if "bio" not in target.db.stats:
-                target.db.stats["bio"] = {}
-            
-            # Store in bio category
-            target.db.stats["bio"][bio_field] = str(value)
-            stat_set = True
-            
-            # Also store virtue/vice in anchors for backward compatibility
-            if stat in ["virtue", "vice"]:
-                # Initialize anchors dict if missing
-                if "anchors" not in target.db.stats:
-                    target.db.stats["anchors"] = {}
-                target.db.stats["anchors"][stat] = str(value)
+            with target.stats.batch():
+                # Store in bio category
+                target.stats.set("bio", bio_field, str(value))
+                stat_set = True
+                
+                # Also store virtue/vice in anchors for backward compatibility
+                if stat in ["virtue", "vice"]:
+                    target.stats.set("anchors", stat, str(value))
         
         # Check template-specific bio fields
         elif stat in ["path", "order", "mask", "dirge", "clan", "covenant", "bone", "blood", 
@@ -781,23 +766,16 @@ class CmdStat(MuxCommand):
                     self.caller.msg("Bio field values cannot exceed 50 characters.")
                     return
                 
-                # Initialize bio dict if missing
-                if "bio" not in target.db.stats:
-                    target.db.stats["bio"] = {}
                 # Store in bio category
-                target.db.stats["bio"][stat] = str(value).title()
+                target.stats.set("bio", stat, str(value).title())
                 stat_set = True
         
         # Check anchors (for backward compatibility)
         elif stat in ["virtue", "vice"]:
-            # Initialize anchors dict if missing
-            if "anchors" not in target.db.stats:
-                target.db.stats["anchors"] = {}
-            target.db.stats["anchors"][stat] = str(value)
-            # Also store in bio for new system
-            if "bio" not in target.db.stats:
-                target.db.stats["bio"] = {}
-            target.db.stats["bio"][stat] = str(value)
+            with target.stats.batch():
+                target.stats.set("anchors", stat, str(value))
+                # Also store in bio for new system
+                target.stats.set("bio", stat, str(value))
             stat_set = True
         
         # Check template (staff only, or self if not approved)
@@ -932,7 +910,7 @@ class CmdStat(MuxCommand):
             # Clear other character-specific data
             target.db.willpower_current = None
             target.db.aspirations = []
-            target.db.approved = False  # Template changes require re-approval
+            target.set_approved(False)  # Template changes require re-approval
             
             self.caller.msg(f"Template changed to {value.title()}. All stats have been wiped clean.")
             self.caller.msg("Character is now unapproved and ready for fresh character generation.")
@@ -982,7 +960,7 @@ class CmdStat(MuxCommand):
                     return
                 
                 # Set the breed
-                target.db.stats["other"]["breed"] = value.lower().replace(" ", "_")
+                target.stats.set("other", "breed", value.lower().replace(" ", "_"))
                 self.caller.msg(f"Set {target.name}'s breed to {breed_info['display_name']}.")
                 
                 # Initialize changing breed form data
@@ -1018,7 +996,7 @@ class CmdStat(MuxCommand):
                 self.caller.msg("Beats and experience cannot be negative.")
                 return
                 
-            target.db.stats["other"][stat] = value
+            target.stats.set("other", stat, value)
             stat_set = True
             
             # Update base_size for werewolves in Hishu form
@@ -1053,10 +1031,10 @@ class CmdStat(MuxCommand):
             
             # Special handling for Geist characters - Synergy is an advantage, not integrity
             if character_template.lower() == "geist" and stat.lower() == "synergy":
-                target.db.stats["advantages"]["synergy"] = value
+                target.stats.set("advantages", "synergy", value)
             else:
                 # Store as integrity for other templates
-                target.db.stats["other"]["integrity"] = value
+                target.stats.set("other", "integrity", value)
             stat_set = True
         
         # Check specialties
@@ -1115,18 +1093,7 @@ class CmdStat(MuxCommand):
         # Skip if: forced as power, bio, attribute, or skill (already handled)
         if not stat_set and (force_category == "merit" or force_category is None):
             try:
-                from world.cofd.merits.general_merits import merits_dict as general_merits_dict
-                from world.cofd.merits.mage_merits import mage_merits_dict
-                from world.cofd.merits.vampire_merits import vampire_merits_dict
-                from world.cofd.merits.werewolf_merits import werewolf_merits_dict
-                from world.cofd.merits.changeling_merits import changeling_merits_dict
-                from world.cofd.merits.geist_merits import geist_merits_dict
-                from world.cofd.merits.demon_merits import demon_merits_dict
-                from world.cofd.merits.deviant_merits import deviant_merits_dict
-                from world.cofd.merits.hunter_merits import hunter_merits_dict
-                from world.cofd.merits.mummy_merits import mummy_merits_dict
-                from world.cofd.merits.promethean_merits import promethean_merits_dict
-                from world.cofd.merits.minor_template_merits import minor_template_merits_dict
+                from world.cofd.lookup_data import LOOKUP_DATA
                 from world.cofd.merit_utilities import (
                     parse_merit_instance, check_merit_approved_status, set_merit
                 )
@@ -1134,18 +1101,8 @@ class CmdStat(MuxCommand):
                 # Parse base merit name and instance
                 base_merit_name, instance_name = parse_merit_instance(stat)
                 
-                # Check all merit dictionaries
-                all_merit_dicts = [
-                    general_merits_dict, mage_merits_dict, vampire_merits_dict, werewolf_merits_dict,
-                    changeling_merits_dict, geist_merits_dict, demon_merits_dict, deviant_merits_dict,
-                    hunter_merits_dict, mummy_merits_dict, promethean_merits_dict, minor_template_merits_dict
-                ]
-                
-                merit = None
-                for merit_dict in all_merit_dicts:
-                    if base_merit_name in merit_dict:
-                        merit = merit_dict[base_merit_name]
-                        break
+                # Resolve through the shared canonical-key index used by +lookup
+                merit = LOOKUP_DATA.find_merit(base_merit_name)
                 
                 # If merit/ was forced and merit not found, give error
                 if force_category == "merit" and not merit:
@@ -1395,12 +1352,8 @@ class CmdStat(MuxCommand):
                     self.caller.msg("Powers must be between 0 and 5 dots.")
                     return
                 
-                # Ensure powers category exists
-                if "powers" not in target.db.stats:
-                    target.db.stats["powers"] = {}
-                
                 # Set the power
-                target.db.stats["powers"][stat] = value
+                target.stats.set("powers", stat, value)
                 stat_set = True
                 
                 # Message about power setting
@@ -1421,7 +1374,7 @@ class CmdStat(MuxCommand):
         
         # Custom stat handling
         if not stat_set:
-            target.db.stats["other"][stat] = value
+            target.stats.set("other", stat, value)
             stat_set = True
         
         if stat_set:
@@ -1448,17 +1401,13 @@ class CmdStat(MuxCommand):
             else:
                 # Check if this was a merit (display confirmation message was already sent by set_merit)
                 try:
-                    from world.cofd.merits.general_merits import merits_dict as general_merits_dict
-                    from world.cofd.merits.mage_merits import mage_merits_dict
-                    from world.cofd.merits.vampire_merits import vampire_merits_dict
+                    from world.cofd.lookup_data import LOOKUP_DATA
                     from world.cofd.merit_utilities import parse_merit_instance
                     
                     base_merit_name, instance_name = parse_merit_instance(stat)
                     
-                    # Check if it's in any merit dictionary
-                    is_merit = (base_merit_name in general_merits_dict or 
-                               base_merit_name in mage_merits_dict or 
-                               base_merit_name in vampire_merits_dict)
+                    # Check if it's a known merit
+                    is_merit = LOOKUP_DATA.find_merit(base_merit_name) is not None
                     
                     # If it wasn't a merit, give generic confirmation
                     if not is_merit:
@@ -1466,13 +1415,11 @@ class CmdStat(MuxCommand):
                 except ImportError:
                     self.caller.msg(f"Set {target.name}'s {stat} to {value}.")
             
-            # Auto-calculate derived stats if setting attributes
-            if stat in ["strength", "dexterity", "stamina", "composure", "resolve", "wits", "size"]:
-                target.calculate_derived_stats(self.caller)
-            
-            # Auto-calculate power pools if setting power stats
-            if stat in ["blood_potency", "gnosis", "primal_urge", "wyrd", "synergy", 
-                       "azoth", "primum", "deviation"]:
+            # Recompute only the derived stats and power pools that depend on this stat
+            if hasattr(target, 'recompute_derived'):
+                target.recompute_derived([stat], self.caller)
+            elif stat in ["blood_potency", "gnosis", "primal_urge", "wyrd", "synergy",
+                         "azoth", "primum", "deviation"]:
                 if hasattr(target, 'calculate_power_pools'):
                     target.calculate_power_pools(self.caller)
                 else:
@@ -1967,7 +1914,7 @@ class CmdStat(MuxCommand):
             self.caller.msg(f"{target.name} is already approved.")
             return
         
-        target.db.approved = True
+        target.set_approved(True)
         self.caller.msg(f"{target.name} has been approved. Their stats are now locked.")
         target.msg("Your character has been approved! Your stats are now locked.")
     
@@ -1989,7 +1936,7 @@ class CmdStat(MuxCommand):
             self.caller.msg(f"{target.name} is not approved.")
             return
         
-        target.db.approved = False
+        target.set_approved(False)
         self.caller.msg(f"{target.name} has been unapproved. They can now modify their stats.")
         target.msg("Your character has been unapproved. You can now modify your stats.")
 
@@ -30,7 +30,48 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    from django.conf import settings
+    from evennia.utils import logger
+    from world.cofd.lookup_data import LOOKUP_DATA
+    from typeclasses.groups import index_groups
+    from world.jobs.models import migrate_legacy_job_comments
+    from commands.combat import COMBATS
+    from world.cofd.stat_index import ensure_stat_index
+    from world.cofd.census import ensure_census
+
+    # Warm the reference data for the game lines this game actually runs
+    try:
+        LOOKUP_DATA.preload(getattr(settings, "LOOKUP_PRELOAD_GAME_LINES", []))
+    except ValueError as e:
+        logger.log_err(f"LOOKUP_PRELOAD_GAME_LINES: {e}")
+
+    LOOKUP_DATA.snapshot.load()
+    if LOOKUP_DATA.snapshot.status != "loaded":
+        logger.log_info(f"Lookup data snapshot is {LOOKUP_DATA.snapshot.status}; "
+                        "importing source modules. Run 'python -m world.cofd.lookup_snapshot' to rebuild.")
+
+    # Tag any groups and memberships that predate the group tag index
+    index_groups()
+
+    # Move job comments and view times out of the legacy JSON fields
+    migrated = migrate_legacy_job_comments()
+    if migrated:
+        logger.log_info(f"Moved comments and read markers for {migrated} job(s) into their own tables")
+
+    # Fill the stat index behind +census and stat searches on first deploy
+    indexed = ensure_stat_index()
+    if indexed:
+        logger.log_info(f"Built the stat index for {indexed} character(s)")
+
+    # Same for the +census counters
+    counted = ensure_census()
+    if counted:
+        logger.log_info(f"Built the census counters from {counted} approved character(s)")
+
+    # Pick fights back up where they were before the reload
+    restored = COMBATS.restore()
+    if restored:
+        logger.log_info(f"Restored {restored} active combat(s)")
 
 
 def at_server_stop():
@@ -38,7 +79,10 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    from commands.combat import COMBATS
+
+    # Save actions taken since the last turn ended
+    COMBATS.flush_all()
 
 
 def at_server_reload_start():
@@ -20,9 +20,11 @@ lock functions from evennia.locks.lockfuncs.
 
 """
 
+from evennia.accounts.models import AccountDB
+from evennia.objects.models import ObjectDB
 from evennia.utils import logger
 from world.cofd.models import Group, GroupMembership
-from typeclasses.groups import get_group_by_id
+from typeclasses.groups import GROUP_INDEX
 
 def group_member(accessing_obj, accessed_obj, *args, **kwargs):
     """
@@ -31,8 +33,16 @@ def group_member(accessing_obj, accessed_obj, *args, **kwargs):
     This function is used in group channel locks to restrict access to group members.
     Usage in locks: "group_member(group_id)"
     
+    It runs for every subscriber on every channel message, so membership is
+    checked against the group's cached member id set rather than by loading
+    the group. Group.add_member/remove_member invalidate the set.
+    
+    Members are characters, so only objects are compared against the set;
+    an Account passes if one of its puppets is a member. (Account and object
+    ids come from different tables and can collide.)
+    
     Args:
-        accessing_obj: The object trying to access (usually a Character)
+        accessing_obj: The object trying to access (a Character, or an Account)
         accessed_obj: The object being accessed (usually a Channel)
         *args: Should contain the group_id as the first argument
         
@@ -47,13 +57,16 @@ def group_member(accessing_obj, accessed_obj, *args, **kwargs):
     except (ValueError, IndexError):
         return False
     
-    # Get the group by ID
-    group = get_group_by_id(group_id)
-    if not group:
+    if isinstance(accessing_obj, ObjectDB):
+        characters = [accessing_obj]
+    elif isinstance(accessing_obj, AccountDB):
+        characters = accessing_obj.get_all_puppets()
+    else:
         return False
     
-    # Check if the accessing object is a member
-    return group.is_member(accessing_obj)
+    # A group that doesn't exist has no members
+    member_ids = GROUP_INDEX.member_ids(group_id)
+    return any(character.id in member_ids for character in characters)
 
 
 # def myfalse(accessing_obj, accessed_obj, *args, **kwargs):
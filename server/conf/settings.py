@@ -49,10 +49,16 @@ SPECIAL_CHAR_SUBSTITUTIONS = {
     '%t': '     ',   # Tab (5 spaces)
 }
 
+# Game lines whose +lookup reference data is loaded at server start. Others
+# load on first use. Valid names: merits, vampire, mage, werewolf, changeling,
+# geist, demon, mummy, promethean, deviant, hunter, mortal_plus, changing_breeds
+LOOKUP_PRELOAD_GAME_LINES = []
+
 # Add your custom apps to the existing INSTALLED_APPS
 INSTALLED_APPS += [
     'world.cofd',
     'world.jobs',
+    'world.bbs',
 ]
 """
 BASE ANSI MARKUP CONFIGURATION
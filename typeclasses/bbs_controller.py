@@ -1,7 +1,103 @@
+from collections.abc import Sequence
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
 from evennia import DefaultObject, evennia
 from evennia.utils.utils import datetime_format
-from datetime import datetime
 from typeclasses.groups import Group, get_group_by_name, get_character_groups
+from world.bbs import search
+from world.bbs.access import BBS_ACCESS
+from world.bbs.models import Board, Post, ReadMarker
+
+# Format of the created_at/edited_at strings in post dicts, always UTC
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Board settings stored in their own columns; anything else goes in Board.extra
+BOARD_FIELDS = ('name', 'description', 'read_only', 'locked', 'group_names', 'access_list')
+
+# Keys of a board dict that are computed rather than stored
+COMPUTED_BOARD_KEYS = ('id', 'posts', 'post_count', 'last_post_at', 'latest_post_id')
+
+
+def format_time(value):
+    """Format a stored datetime as a UTC TIME_FORMAT string, or None."""
+    if value is None:
+        return None
+    if timezone.is_aware(value):
+        value = value.astimezone(dt_timezone.utc)
+    return value.strftime(TIME_FORMAT)
+
+
+def parse_time(value):
+    """Parse a TIME_FORMAT string from the old Attribute storage, or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.strptime(value, TIME_FORMAT)
+    except (TypeError, ValueError):
+        return None
+    if settings.USE_TZ:
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed
+
+
+def post_to_dict(post):
+    """Convert a Post row to the dict layout the BBS commands use."""
+    return {
+        'id': post.id,
+        'title': post.title,
+        'content': post.content,
+        'author': post.author,
+        'created_at': format_time(post.created_at),
+        'edited_at': format_time(post.edited_at),
+        'pinned': post.pinned,
+    }
+
+
+class PostList(Sequence):
+    """
+    The posts of one board, oldest first, as the list of post dicts the
+    commands expect. len() is a COUNT and posts[i] fetches a single row;
+    iterating loads the whole board once.
+    """
+
+    def __init__(self, board_id, count=None):
+        self.board_id = board_id
+        self._count = count
+        self._posts = None
+
+    def _queryset(self):
+        return Post.objects.filter(board_id=self.board_id).order_by('id')
+
+    def _all(self):
+        if self._posts is None:
+            self._posts = [post_to_dict(post) for post in self._queryset()]
+            self._count = len(self._posts)
+        return self._posts
+
+    def __len__(self):
+        if self._posts is not None:
+            return len(self._posts)
+        if self._count is None:
+            self._count = self._queryset().count()
+        return self._count
+
+    def __getitem__(self, index):
+        if self._posts is not None or isinstance(index, slice):
+            return self._all()[index]
+        if index < 0:
+            index += len(self)
+        post = self._queryset()[index:index + 1].first() if index >= 0 else None
+        if post is None:
+            raise IndexError("post index out of range")
+        return post_to_dict(post)
+
+    def __iter__(self):
+        return iter(self._all())
+
 
 class BBSController(DefaultObject):
     """
@@ -13,44 +109,168 @@ class BBSController(DefaultObject):
         """
         Called when the server starts.
         """
-        # Initialize read_posts if it doesn't exist
-        if not self.attributes.has('read_posts'):
-            self.attributes.add('read_posts', {})
+        self.migrate_legacy_boards()
+        self.migrate_legacy_read_posts()
         return super().at_server_start()
 
-    def at_object_creation(self):
+    def _find_next_available_board_id(self):
         """
-        Initialize the BBSController object. This is called only once, 
-        when the object is first created.
+        Find the next available board ID by looking for gaps in the sequence
+        or returning the next number after the highest existing ID.
+        """
+        existing_ids = Board.objects.order_by('id').values_list('id', flat=True)
+        # Look for gaps in the sequence
+        next_id = 1
+        for board_id in existing_ids:
+            if board_id != next_id:
+                return next_id
+            next_id += 1
+        return next_id
+
+    def migrate_legacy_boards(self):
         """
-        self.db.boards = {}  # Dictionary to store all boards
-        self.db.next_board_id = 1  # Start board numbering from 1
-        self.attributes.add('read_posts', {})  # Dictionary to store read posts per character
+        Move boards and posts from the old db.boards Attribute into the
+        database. Runs once; the old data is kept as db.legacy_boards.
 
-    @property
-    def read_posts(self):
+        Returns:
+            int: Number of boards migrated
         """
-        Property to ensure read_posts is always initialized.
+        legacy = self.attributes.get('boards')
+        if not legacy:
+            return 0
+        if hasattr(legacy, 'deserialize'):
+            legacy = legacy.deserialize()
+
+        migrated = 0
+        with transaction.atomic():
+            for board_id, data in sorted(legacy.items()):
+                if Board.objects.filter(id=board_id).exists():
+                    continue
+                board = Board.objects.create(
+                    id=board_id,
+                    name=data['name'],
+                    description=data.get('description') or "",
+                    read_only=data.get('read_only', False),
+                    locked=data.get('locked', False),
+                    group_names=list(data.get('group_names') or []),
+                    access_list=dict(data.get('access_list') or {}),
+                    extra={key: value for key, value in data.items()
+                           if key not in BOARD_FIELDS and key not in COMPUTED_BOARD_KEYS},
+                )
+                # Keep list order, which post numbers and read markers depend on
+                Post.objects.bulk_create([
+                    Post(
+                        board=board,
+                        title=post.get('title', ""),
+                        content=post.get('content', ""),
+                        author=post.get('author', ""),
+                        created_at=parse_time(post.get('created_at')) or timezone.now(),
+                        edited_at=parse_time(post.get('edited_at')),
+                        pinned=post.get('pinned', False),
+                    )
+                    for post in data.get('posts', [])
+                ])
+                migrated += 1
+
+        BBS_ACCESS.invalidate_boards()
+        if migrated:
+            search.rebuild_search_index()
+        self.attributes.add('legacy_boards', legacy)
+        self.attributes.remove('boards')
+        self.attributes.remove('next_board_id')
+        return migrated
+
+    def migrate_legacy_read_posts(self):
         """
-        if not self.attributes.has('read_posts'):
-            self.attributes.add('read_posts', {})
-        return self.attributes.get('read_posts')
+        Convert the old read_posts Attribute ({character: {board_id: set of
+        post indices}}) into read markers. Runs once, after the boards have
+        been migrated; the old data is kept as db.legacy_read_posts.
 
-    def _find_next_available_board_id(self):
+        Returns:
+            int: Number of read markers created
         """
-        Find the next available board ID by looking for gaps in the sequence
-        or returning the next number after the highest existing ID.
+        legacy = self.attributes.get('read_posts')
+        if not legacy:
+            return 0
+        if hasattr(legacy, 'deserialize'):
+            legacy = legacy.deserialize()
+
+        post_ids = {}
+        markers = []
+        for character_name, boards in legacy.items():
+            for board_id, indices in boards.items():
+                if board_id not in post_ids:
+                    post_ids[board_id] = list(Post.objects.filter(board_id=board_id)
+                                              .order_by('id').values_list('id', flat=True))
+                ids = post_ids[board_id]
+                read_ids = {ids[index] for index in indices if 0 <= index < len(ids)}
+                if not read_ids:
+                    continue
+                marker = ReadMarker(board_id=board_id, character_name=character_name)
+                # The mark covers the unbroken run of read posts from the start
+                for post_id in ids:
+                    if post_id not in read_ids:
+                        break
+                    marker.last_read_id = post_id
+                marker.read_above = sorted(post_id for post_id in read_ids if post_id > marker.last_read_id)
+                markers.append(marker)
+
+        with transaction.atomic():
+            ReadMarker.objects.bulk_create(markers, ignore_conflicts=True)
+        self.attributes.add('legacy_read_posts', legacy)
+        self.attributes.remove('read_posts')
+        return len(markers)
+
+    def reset(self):
+        """Delete every board, post and read marker."""
+        with transaction.atomic():
+            Board.objects.all().delete()
+        BBS_ACCESS.invalidate_boards()
+
+    def _boards_queryset(self):
+        """Boards annotated with their post count and latest post time."""
+        return Board.objects.annotate(
+            post_count=Count('posts'),
+            last_post_at=Max('posts__created_at'),
+            latest_post_id=Max('posts__id'),
+        )
+
+    def _board_record(self, board):
         """
-        if not self.db.boards:
-            return 1
-            
-        existing_ids = sorted(self.db.boards.keys())
-        # Look for gaps in the sequence
-        for i, board_id in enumerate(existing_ids, 1):
-            if i != board_id:
-                return i
-        # If no gaps found, return next number after highest
-        return existing_ids[-1] + 1
+        Build the dict the commands use for a board.
+
+        Extra settings come first so stored columns always win.
+        """
+        post_count = getattr(board, 'post_count', None)
+        record = dict(board.extra)
+        record.update({
+            'id': board.id,
+            'name': board.name,
+            'description': board.description,
+            'read_only': board.read_only,
+            'locked': board.locked,
+            'group_names': list(board.group_names),
+            'access_list': dict(board.access_list),
+            'posts': PostList(board.id, post_count),
+            'post_count': post_count,
+            'last_post_at': format_time(getattr(board, 'last_post_at', None)),
+            'latest_post_id': getattr(board, 'latest_post_id', None),
+        })
+        return record
+
+    def _get_board_model(self, board_reference):
+        """Get the Board row for an ID or name, or None."""
+        try:
+            return Board.objects.get(id=int(board_reference))
+        except (ValueError, TypeError, Board.DoesNotExist):
+            pass
+        return Board.objects.filter(name__iexact=str(board_reference)).first()
+
+    def _get_post_model(self, board_id, post_index):
+        """Get the Post at a 0-based position on a board, or None."""
+        if post_index < 0:
+            return None
+        return Post.objects.filter(board_id=board_id).order_by('id')[post_index:post_index + 1].first()
 
     def create_board(self, name, description, read_only=False, group_names=None):
         """
@@ -61,21 +281,18 @@ class BBSController(DefaultObject):
             read_only (bool): Whether the board is read-only
             group_names (list, optional): List of group names this board is restricted to
         """
-        if any(board['name'].lower() == name.lower() for board in self.db.boards.values()):
+        if Board.objects.filter(name__iexact=name).exists():
             raise ValueError("A board with this name already exists.")
         
-        # Use next available ID instead of next_board_id
-        board_id = self._find_next_available_board_id()
-        board = {
-            'id': board_id,
-            'name': name,
-            'description': description,
-            'read_only': read_only,
-            'posts': [],
-            'group_names': group_names or [],  # Store as list of group names
-        }
-        self.db.boards[board_id] = board
-        self.db.next_board_id = self._find_next_available_board_id()
+        # Use next available ID so deleted board numbers are reused
+        Board.objects.create(
+            id=self._find_next_available_board_id(),
+            name=name,
+            description=description,
+            read_only=read_only,
+            group_names=group_names or [],  # Store as list of group names
+        )
+        BBS_ACCESS.invalidate_boards()
 
     def get_board(self, board_reference):
         """
@@ -87,22 +304,28 @@ class BBSController(DefaultObject):
         Returns:
             dict: The board data if found, None otherwise
         """
-        boards = self.db.boards
+        boards = self._boards_queryset()
         
         # Try to convert to integer for ID lookup
         try:
-            board_id = int(board_reference)
-            if board_id in boards:
-                return boards[board_id]
+            board = boards.filter(id=int(board_reference)).first()
+            if board:
+                return self._board_record(board)
         except (ValueError, TypeError):
             pass
             
         # If not found by ID or not a valid ID, try name lookup
-        for board in boards.values():
-            if board['name'].lower() == str(board_reference).lower():
-                return board
-                
-        return None
+        board = boards.filter(name__iexact=str(board_reference)).first()
+        return self._board_record(board) if board else None
+
+    def get_boards(self):
+        """
+        Get every board, in ID order.
+        
+        Returns:
+            dict: {board_id: board data}
+        """
+        return {board.id: self._board_record(board) for board in self._boards_queryset().order_by('id')}
 
     def get_board_id(self, board_reference):
         """
@@ -121,20 +344,12 @@ class BBSController(DefaultObject):
         """
         Create a new post on a specified board.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return "Board not found"
-        now = datetime.now()
-        post = {
-            'title': title,
-            'content': content,
-            'author': author,
-            'created_at': now.strftime("%Y-%m-%d %H:%M:%S"),  # Format as YYYY-MM-DD HH:MM:SS
-            'edited_at': None,
-            'pinned': False  # Initialize pinned status
-        }
-        board['posts'].append(post)
-        return f"Post '{title}' created on board '{board['name']}'."
+        post = Post.objects.create(board=board, title=title, content=content, author=author)
+        search.index_post(post)
+        return f"Post '{title}' created on board '{board.name}'."
 
     def get_posts(self, board_reference):
         """
@@ -147,41 +362,49 @@ class BBSController(DefaultObject):
         """
         Edit an existing post's content.
         """
-        board = self.get_board(board_reference)
-        if board and 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['content'] = new_content
-            board['posts'][post_index]['edited_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Format as YYYY-MM-DD HH:MM:SS
+        board = self._get_board_model(board_reference)
+        post = self._get_post_model(board.id, post_index) if board else None
+        if post:
+            post.content = new_content
+            post.edited_at = timezone.now()
+            post.save(update_fields=['content', 'edited_at'])
+            search.index_post(post)
 
     def delete_post(self, board_reference, post_index):
         """
         Delete a post from a board.
         """
-        board = self.get_board(board_reference)
-        if board and 0 <= post_index < len(board['posts']):
-            del board['posts'][post_index]
+        board = self._get_board_model(board_reference)
+        post = self._get_post_model(board.id, post_index) if board else None
+        if post:
+            post.delete()
 
     def pin_post(self, board_reference, post_index):
         """
         Pin a post to the top of the board.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return "Board not found"
-        if 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['pinned'] = True
-            return f"Post {post_index + 1} in board '{board['name']}' has been pinned."
+        post = self._get_post_model(board.id, post_index)
+        if post:
+            post.pinned = True
+            post.save(update_fields=['pinned'])
+            return f"Post {post_index + 1} in board '{board.name}' has been pinned."
         return "Post not found"
 
     def unpin_post(self, board_reference, post_index):
         """
         Unpin a post from the top of the board.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return "Board not found"
-        if 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['pinned'] = False
-            return f"Post {post_index + 1} in board '{board['name']}' has been unpinned."
+        post = self._get_post_model(board.id, post_index)
+        if post:
+            post.pinned = False
+            post.save(update_fields=['pinned'])
+            return f"Post {post_index + 1} in board '{board.name}' has been unpinned."
         return "Post not found"
 
     def grant_access(self, board_reference, character_name, access_level="full_access"):
@@ -191,9 +414,10 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character to grant access.
         :param access_level: (str) "full_access" or "read_only".
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if board:
-            board['access_list'][character_name] = access_level
+            board.access_list = {**board.access_list, character_name: access_level}
+            board.save(update_fields=['access_list'])
 
     def revoke_access(self, board_reference, character_name):
         """
@@ -201,9 +425,11 @@ class BBSController(DefaultObject):
         :param board_reference: (str or int) The name or ID of the board.
         :param character_name: (str) The name of the character to revoke access.
         """
-        board = self.get_board(board_reference)
-        if board and character_name in board['access_list']:
-            del board['access_list'][character_name]
+        board = self._get_board_model(board_reference)
+        if board and character_name in board.access_list:
+            board.access_list = {name: level for name, level in board.access_list.items()
+                                 if name != character_name}
+            board.save(update_fields=['access_list'])
 
     def has_group_access(self, board, character_name):
         """
@@ -217,82 +443,41 @@ class BBSController(DefaultObject):
         if not board.get('group_names'):
             return True  # No group restriction
             
-        try:
-            # Check if character is a member of any of the required groups
-            for group_name in board['group_names']:
-                group = get_group_by_name(group_name)
-                if group:
-                    # Find character by name
-                    character = evennia.search_object(character_name, typeclass="typeclasses.characters.Character")
-                    if character:
-                        member = group.is_member(character[0])
-                    else:
-                        member = False
-                else:
-                    member = False
-                if member:
-                    return True
-            return False
-        except Exception:
+        character = BBS_ACCESS.find_character(character_name)
+        if not character:
             return False
+        return board['id'] in BBS_ACCESS.get(character).readable
 
     def has_access(self, board_id, character_name):
         """Check if a character has access to a board."""
-        board = self.get_board(board_id)
+        board = self._get_board_model(board_id)
         if not board:
             return False
             
-        # Check if character is an admin/builder
-        try:
-            character = evennia.search_object(character_name)[0]
-            if character.locks.check_lockstring(character, "perm(Admin)") or character.locks.check_lockstring(character, "perm(Builder)"):
-                return True
-        except:
-            pass
-            
-        # If board has group restrictions, check group access
-        if board.get('group_names'):
-            return self.has_group_access(board, character_name)
-            
-        # If no group restrictions, everyone has access
-        return True
+        # Staff status and group membership are resolved once per character and cached
+        return BBS_ACCESS.can_read_by_name(character_name, board.id)
 
     def has_write_access(self, board_id, character_name):
         """Check if a character has write access to a board."""
-        board = self.get_board(board_id)
+        board = self._get_board_model(board_id)
         if not board:
             return False
             
-        # Check if character is an admin/builder
-        try:
-            character = evennia.search_object(character_name)[0]
-            if character.locks.check_lockstring(character, "perm(Admin)") or character.locks.check_lockstring(character, "perm(Builder)"):
-                return True
-        except:
-            pass
-            
-        # Read-only boards only allow admin/builder writes
-        if board.get('read_only', False):
-            return False
-            
-        # If board has group restrictions, check group access
-        if board.get('group_names'):
-            return self.has_group_access(board, character_name)
-            
-        # If no group restrictions, everyone has write access unless read-only
-        return True
+        # Admins/builders can always write; read-only boards refuse everyone else
+        return BBS_ACCESS.can_write_by_name(character_name, board.id)
 
     def delete_board(self, board_reference):
         """
         Delete an entire board along with its posts.
         :param board_reference: (str or int) The name or ID of the board to delete.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if board:
-            del self.db.boards[board['id']]
-            # Update next_board_id to recycle IDs
-            self.db.next_board_id = self._find_next_available_board_id()
-            return f"Board '{board['name']}' and all its posts have been deleted."
+            name = board.name
+            # Posts are removed with it; the board number is reused by the next board
+            board.delete()
+            BBS_ACCESS.invalidate_boards()
+            return f"Board '{name}' and all its posts have been deleted."
         return "Board not found"
 
     def save_board(self, board_reference, updated_board_data):
@@ -301,26 +486,76 @@ class BBSController(DefaultObject):
         :param board_reference: (str or int) The name or ID of the board to update.
         :param updated_board_data: (dict) Dictionary containing updated board data.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if board:
-            # Update the board's dictionary with new values
+            # Update the board's stored settings with new values
+            extra = dict(board.extra)
             for key, value in updated_board_data.items():
-                board[key] = value
-            return f"Board '{board['name']}' has been updated."
+                if key in COMPUTED_BOARD_KEYS:
+                    continue
+                if key in BOARD_FIELDS:
+                    setattr(board, key, value)
+                else:
+                    extra[key] = value
+            board.extra = extra
+            board.save()
+            # Group restrictions or the read-only flag may have changed
+            BBS_ACCESS.invalidate_boards()
+            return f"Board '{board.name}' has been updated."
         return "Board not found"
 
+    def edit_board(self, board_reference, field, value):
+        """
+        Update a single board setting.
+        :param board_reference: (str or int) The name or ID of the board to update.
+        :param field: (str) The setting to change, e.g. 'description'.
+        :param value: The new value.
+        """
+        return self.save_board(board_reference, {field: value})
 
     def lock_board(self, board_reference):
         """
         Lock a board to prevent new posts from being made.
         :param board_reference: (str or int) The name or ID of the board to lock.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if board:
-            board['locked'] = True
-            return f"Board '{board['name']}' has been locked."
+            board.locked = True
+            board.save(update_fields=['locked'])
+            return f"Board '{board.name}' has been locked."
         return "Board not found"
 
+    def get_read_marker(self, board_id, character_name):
+        """
+        Get what a character has read on a board.
+        :param board_id: (int) The ID of the board.
+        :param character_name: (str) The name of the character.
+        :return: (ReadMarker) The stored marker, or an unsaved one with nothing read.
+        """
+        marker = ReadMarker.objects.filter(board_id=board_id, character_name=character_name).first()
+        return marker or ReadMarker(board_id=board_id, character_name=character_name)
+
+    def _mark_read(self, board_id, post_id, character_name):
+        """Record one post as read, advancing the mark past any run of read posts."""
+        with transaction.atomic():
+            marker, _ = ReadMarker.objects.select_for_update().get_or_create(
+                board_id=board_id, character_name=character_name
+            )
+            if marker.is_read(post_id):
+                return
+            read_above = set(marker.read_above)
+            read_above.add(post_id)
+
+            # Deleted posts don't exist to block the run, so only existing ids are walked
+            newer_ids = (Post.objects.filter(board_id=board_id, id__gt=marker.last_read_id)
+                         .order_by('id').values_list('id', flat=True)[:len(read_above)])
+            for newer_id in newer_ids:
+                if newer_id not in read_above:
+                    break
+                marker.last_read_id = newer_id
+            marker.read_above = sorted(read_id for read_id in read_above if read_id > marker.last_read_id)
+            marker.save()
+
     def mark_post_read(self, board_reference, post_index, character_name):
         """
         Mark a post as read by a character.
@@ -328,24 +563,38 @@ class BBSController(DefaultObject):
         :param post_index: (int) The index of the post.
         :param character_name: (str) The name of the character who read the post.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return False
             
-        if not self.has_access(board_reference, character_name):
+        if not self.has_access(board.id, character_name):
             return False
             
-        board_id = board['id']
-        read_posts = self.read_posts
+        post = self._get_post_model(board.id, post_index)
+        if not post:
+            return False
             
-        if character_name not in read_posts:
-            read_posts[character_name] = {}
+        self._mark_read(board.id, post.id, character_name)
+        return True
+
+    def mark_board_read(self, board_reference, character_name):
+        """
+        Mark every post on a board as read by a character.
+        :param board_reference: (str or int) The name or ID of the board.
+        :param character_name: (str) The name of the character.
+        :return: (bool) True if the board was found and accessible.
+        """
+        board = self.get_board(board_reference)
+        if not board:
+            return False
             
-        if board_id not in read_posts[character_name]:
-            read_posts[character_name][board_id] = set()
+        if not self.has_access(board['id'], character_name):
+            return False
             
-        read_posts[character_name][board_id].add(post_index)
-        self.attributes.add('read_posts', read_posts)
+        ReadMarker.objects.update_or_create(
+            board_id=board['id'], character_name=character_name,
+            defaults={'last_read_id': board['latest_post_id'] or 0, 'read_above': []}
+        )
         return True
 
     def is_post_unread(self, board_reference, post_index, character_name):
@@ -356,23 +605,18 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character.
         :return: (bool) True if the post is unread, False otherwise.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return False
             
-        if not self.has_access(board_reference, character_name):
+        if not self.has_access(board.id, character_name):
             return False
             
-        board_id = board['id']
-        read_posts = self.read_posts
-            
-        if character_name not in read_posts:
-            return True
-            
-        if board_id not in read_posts[character_name]:
-            return True
+        post = self._get_post_model(board.id, post_index)
+        if not post:
+            return False
             
-        return post_index not in read_posts[character_name][board_id]
+        return not self.get_read_marker(board.id, character_name).is_read(post.id)
 
     def get_unread_posts(self, board_reference, character_name):
         """
@@ -381,18 +625,73 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character.
         :return: (list) List of unread post indices.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return []
             
-        if not self.has_access(board_reference, character_name):
+        if not self.has_access(board.id, character_name):
             return []
             
-        unread = []
-        for i in range(len(board['posts'])):
-            if self.is_post_unread(board_reference, i, character_name):
-                unread.append(i + 1)  # Convert to 1-based index
-        return unread
+        marker = self.get_read_marker(board.id, character_name)
+        posts = Post.objects.filter(board_id=board.id)
+        # Everything up to the mark is read, so numbering of newer posts starts after it
+        first_number = posts.filter(id__lte=marker.last_read_id).count() + 1
+        newer_ids = posts.filter(id__gt=marker.last_read_id).order_by('id').values_list('id', flat=True)
+        return [number for number, post_id in enumerate(newer_ids, first_number)
+                if post_id not in marker.read_above]
+
+    def get_unread_counts(self, character_name, boards):
+        """
+        Count a character's unread posts on several boards in one query.
+        Access is not checked; pass only boards the character can read.
+        :param character_name: (str) The name of the character.
+        :param boards: (iterable) Board dicts from get_board() or get_boards().
+        :return: (dict) {board_id: unread count} for boards with unread posts.
+        """
+        boards = {board['id']: board for board in boards}
+        markers = {marker.board_id: marker for marker in
+                   ReadMarker.objects.filter(character_name=character_name, board_id__in=boards)}
+
+        condition = Q()
+        for board_id, board in boards.items():
+            marker = markers.get(board_id)
+            last_read_id = marker.last_read_id if marker else 0
+            # Nothing newer than the mark means nothing unread, without touching posts
+            if not board['latest_post_id'] or board['latest_post_id'] <= last_read_id:
+                continue
+            board_condition = Q(board_id=board_id, id__gt=last_read_id)
+            if marker and marker.read_above:
+                board_condition &= ~Q(id__in=marker.read_above)
+            condition |= board_condition
+
+        if not condition:
+            return {}
+        rows = Post.objects.filter(condition).values('board_id').annotate(unread=Count('id'))
+        return {row['board_id']: row['unread'] for row in rows}
+
+    def search_posts(self, character_name, terms, board_reference=None, author=None,
+                     after=None, before=None, page=1):
+        """
+        Search the posts a character can read.
+        :param character_name: (str) The name of the searching character.
+        :param terms: (str) Words that must all appear in the post.
+        :param board_reference: (str or int, optional) Only search this board.
+        :param author: (str, optional) Only posts by this author.
+        :param after: (datetime, optional) Only posts made on or after this day.
+        :param before: (datetime, optional) Only posts made on or before this day.
+        :param page: (int) 1-based page of results.
+        :return: (tuple) (posts, total, page, total_pages), or None if the board
+            wasn't found or can't be read. Each post has a 'number' attribute.
+        """
+        if board_reference is not None:
+            board = self._get_board_model(board_reference)
+            if not board or not self.has_access(board.id, character_name):
+                return None
+            board_ids = [board.id]
+        else:
+            board_ids = [board_id for board_id in Board.objects.values_list('id', flat=True)
+                         if BBS_ACCESS.can_read_by_name(character_name, board_id)]
+        return search.search_posts(terms, board_ids, author=author, after=after, before=before, page=page)
 
     def add_group_to_board(self, board_reference, group_name):
         """
@@ -403,7 +702,7 @@ class BBSController(DefaultObject):
         Returns:
             str: Status message
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return "Board not found"
             
@@ -412,14 +711,13 @@ class BBSController(DefaultObject):
         if not group:
             return f"Error: Group '{group_name}' does not exist"
             
-        if 'group_names' not in board:
-            board['group_names'] = []
-            
-        if group_name in board['group_names']:
+        if group_name in board.group_names:
             return f"Group '{group_name}' is already associated with this board"
             
-        board['group_names'].append(group_name)
-        return f"Added group '{group_name}' to board '{board['name']}'"
+        board.group_names = list(board.group_names) + [group_name]
+        board.save(update_fields=['group_names'])
+        BBS_ACCESS.invalidate_boards()
+        return f"Added group '{group_name}' to board '{board.name}'"
 
     def remove_group_from_board(self, board_reference, group_name):
         """
@@ -430,15 +728,17 @@ class BBSController(DefaultObject):
         Returns:
             str: Status message
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return "Board not found"
             
-        if 'group_names' not in board or group_name not in board['group_names']:
+        if group_name not in board.group_names:
             return f"Group '{group_name}' is not associated with this board"
             
-        board['group_names'].remove(group_name)
-        return f"Removed group '{group_name}' from board '{board['name']}'"
+        board.group_names = [name for name in board.group_names if name != group_name]
+        board.save(update_fields=['group_names'])
+        BBS_ACCESS.invalidate_boards()
+        return f"Removed group '{group_name}' from board '{board.name}'"
 
     def get_board_groups(self, board_reference):
         """
@@ -448,18 +748,19 @@ class BBSController(DefaultObject):
         Returns:
             list: List of group names
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_model(board_reference)
         if not board:
             return []
             
-        return board.get('group_names', [])
+        return list(board.group_names)
 
     def set_read_only(self, board_name, read_only=True):
         """Set a board to read-only mode."""
-        board = self.get_board(board_name)
+        board = self._get_board_model(board_name)
         if not board:
             return f"No board found with the name '{board_name}'."
             
-        board['read_only'] = read_only
-        self.save_board(board_name, board)
+        board.read_only = read_only
+        board.save(update_fields=['read_only'])
+        BBS_ACCESS.invalidate_boards()
         return f"Board '{board_name}' has been set to {'read-only' if read_only else 'writable'} mode."
@@ -7,8 +7,9 @@ is setup to be the "default" character type created by the default
 creation commands.
 
 The character typeclass is where we store stats, powers, pools, and so on for each character. A character's
-stats are stored on their character object using a dictionary (self.db.stats), and the same for powers, pools,
-and so on.
+stats are stored on their character object one Attribute per category (see world.stats), and read as a
+dictionary through self.db.stats. New code should read and write stats through the StatHandler (self.stats),
+which caches the sheet in memory and only writes back changed categories.
 
 """
 
@@ -17,6 +18,8 @@ from evennia.utils.utils import lazy_property
 from world.conditions import ConditionHandler
 from world.tilts import TiltHandler
 from world.experience import ExperienceHandler, EXPERIENCE_COSTS
+from world.stats import StatHandler, StatsDbHolder
+from world.cofd import derived_stats
 from world.cofd.template_registry import template_registry
 from world.utils.health_utils import calculate_wound_penalty
 
@@ -49,6 +52,21 @@ class Character(ObjectParent, DefaultCharacter):
         """
         return ExperienceHandler(self)
 
+    @lazy_property
+    def stats(self):
+        """
+        Returns the stat handler for this character.
+        """
+        return StatHandler(self)
+
+    @lazy_property
+    def db(self):
+        """
+        Attribute access as for any object, except that db.stats is served
+        from the per-category stat storage.
+        """
+        return StatsDbHolder(self, super().db)
+
     def at_object_creation(self):
         """
         Called when the character is first created.
@@ -91,6 +109,17 @@ class Character(ObjectParent, DefaultCharacter):
         self.db.aspirations = ["", "", ""]
         self.db.equipment = {}
         
+    def at_object_delete(self):
+        """
+        Called just before the character is deleted; takes it off the census.
+        """
+        from world.cofd.census import remove_character_census
+
+        if not super().at_object_delete():
+            return False
+        remove_character_census(self)
+        return True
+
     def at_login(self):
         """
         Called when the character logs in.
@@ -120,6 +149,20 @@ class Character(ObjectParent, DefaultCharacter):
         Add a stat to the character.
         """
         
+    def set_approved(self, approved):
+        """
+        Set the character's approval status.
+        
+        Args:
+            approved (bool): Whether the character is approved
+        """
+        from world.cofd.census import update_character_census
+        from world.cofd.stat_index import sync_approval
+        
+        self.db.approved = bool(approved)
+        sync_approval(self, approved)
+        update_character_census(self)
+        
     def get_integrity_name(self, template=None):
         """
         Get the template-specific integrity name using the template registry.
@@ -131,7 +174,7 @@ class Character(ObjectParent, DefaultCharacter):
             str: The appropriate integrity stat name for the template
         """
         if template is None:
-            template = self.db.stats.get("other", {}).get("template", "Mortal")
+            template = self.stats.template
             
         return template_registry.get_integrity_name(template)
 
@@ -146,7 +189,7 @@ class Character(ObjectParent, DefaultCharacter):
             int: Starting integrity value for the template
         """
         if template is None:
-            template = self.db.stats.get("other", {}).get("template", "Mortal")
+            template = self.stats.template
             
         return template_registry.get_starting_integrity(template)
 
@@ -170,7 +213,7 @@ class Character(ObjectParent, DefaultCharacter):
         starting_integrity = template_registry.get_starting_integrity(new_template)
         
         # Completely wipe the stats dictionary but initialize with defaults
-        self.db.stats = {
+        stats = {
             "attributes": {
                 # Mental attributes
                 "intelligence": 1,
@@ -240,13 +283,13 @@ class Character(ObjectParent, DefaultCharacter):
         # Add template-specific bio fields
         template_fields = template_registry.get_bio_fields(str(new_template))
         for field in template_fields:
-            self.db.stats["bio"][field] = "<not set>"
+            stats["bio"][field] = "<not set>"
             
             # Also add virtue/vice to anchors if they exist
             if field in ["virtue", "vice"]:
-                if "anchors" not in self.db.stats:
-                    self.db.stats["anchors"] = {}
-                self.db.stats["anchors"][field] = "<not set>"
+                stats["anchors"][field] = "<not set>"
+        
+        self.stats.replace_all(stats)
         
         # Reset pools tracking
         self.db.willpower_current = None
@@ -306,47 +349,39 @@ class Character(ObjectParent, DefaultCharacter):
             return True, message
         
         # Get old and new template fields for bio updates
-        old_template = self.db.stats.get("other", {}).get("template", "Mortal")
+        old_template = self.stats.template
         old_fields = set(template_registry.get_bio_fields(old_template))
         new_fields = set(template_registry.get_bio_fields(new_template))
         
-        # Set the new template
-        if "other" not in self.db.stats:
-            self.db.stats["other"] = {}
-        self.db.stats["other"]["template"] = str(new_template).title()
-        
-        # Clean up any legacy "sphere" field
-        if "sphere" in self.db.stats["other"]:
-            del self.db.stats["other"]["sphere"]
-        
-        # Update bio fields based on template change
-        if "bio" not in self.db.stats:
-            self.db.stats["bio"] = {}
-            
         bio_changes = []
         
-        # Remove fields that are not needed for the new template
-        fields_to_remove = old_fields - new_fields
-        for field in fields_to_remove:
-            if field in self.db.stats["bio"]:
-                del self.db.stats["bio"][field]
-                bio_changes.append(f"Removed {field}")
-                
-                # Also remove from anchors if it's virtue/vice
-                if field in ["virtue", "vice"] and "anchors" in self.db.stats:
-                    self.db.stats["anchors"].pop(field, None)
-        
-        # Add placeholders for new required fields
-        fields_to_add = new_fields - old_fields
-        for field in fields_to_add:
-            self.db.stats["bio"][field] = "<not set>"
-            bio_changes.append(f"Added {field}")
-                
-            # Also add to anchors if it's virtue/vice
-            if field in ["virtue", "vice"]:
-                if "anchors" not in self.db.stats:
-                    self.db.stats["anchors"] = {}
-                self.db.stats["anchors"][field] = "<not set>"
+        # Write other, bio and anchors back together
+        with self.stats.batch():
+            # Set the new template
+            self.stats.set("other", "template", str(new_template).title())
+            
+            # Clean up any legacy "sphere" field
+            self.stats.remove("other", "sphere")
+            
+            # Remove fields that are not needed for the new template
+            fields_to_remove = old_fields - new_fields
+            for field in fields_to_remove:
+                if self.stats.remove("bio", field):
+                    bio_changes.append(f"Removed {field}")
+                    
+                    # Also remove from anchors if it's virtue/vice
+                    if field in ["virtue", "vice"]:
+                        self.stats.remove("anchors", field)
+            
+            # Add placeholders for new required fields
+            fields_to_add = new_fields - old_fields
+            for field in fields_to_add:
+                self.stats.set("bio", field, "<not set>")
+                bio_changes.append(f"Added {field}")
+                    
+                # Also add to anchors if it's virtue/vice
+                if field in ["virtue", "vice"]:
+                    self.stats.set("anchors", field, "<not set>")
         
         # Assign template in registry for tracking
         template_registry.assign_template(self, new_template, caller)
@@ -362,47 +397,13 @@ class Character(ObjectParent, DefaultCharacter):
     def get_template_bio_fields(self, template=None):
         """Get valid bio fields for a specific template using the template registry"""
         if template is None:
-            template = self.db.stats.get("other", {}).get("template", "Mortal")
+            template = self.stats.template
             
         return template_registry.get_bio_fields(template)
     
     def calculate_derived_stats(self, caller=None):
         """Calculate derived stats based on attributes"""
-        attrs = self.db.stats.get("attributes", {})
-        skills = self.db.stats.get("skills", {})
-        other = self.db.stats.get("other", {})
-        
-        # Initialize advantages if needed
-        if "advantages" not in self.db.stats:
-            self.db.stats["advantages"] = {}
-        
-        updated_stats = []
-        
-        # Health = Size + Stamina
-        if "stamina" in attrs:
-            size = other.get("size", 5)  # Default size is 5
-            self.db.stats["advantages"]["health"] = size + attrs["stamina"]
-            updated_stats.append("health")
-        
-        # Willpower = Resolve + Composure  
-        if "resolve" in attrs and "composure" in attrs:
-            self.db.stats["advantages"]["willpower"] = attrs["resolve"] + attrs["composure"]
-            updated_stats.append("willpower")
-        
-        # Speed = Strength + Dexterity + 5
-        if "strength" in attrs and "dexterity" in attrs:
-            self.db.stats["advantages"]["speed"] = attrs["strength"] + attrs["dexterity"] + 5
-            updated_stats.append("speed")
-        
-        # Defense = Lower of Wits or Dexterity 
-        if "wits" in attrs and "dexterity" in attrs:
-            self.db.stats["advantages"]["defense"] = min(attrs["wits"], attrs["dexterity"])
-            updated_stats.append("defense")
-        
-        # Initiative = Dexterity + Composure
-        if "dexterity" in attrs and "composure" in attrs:
-            self.db.stats["advantages"]["initiative"] = attrs["dexterity"] + attrs["composure"]
-            updated_stats.append("initiative")
+        updated_stats = derived_stats.recompute(self.stats, kind="derived")
         
         # Send message to caller if provided
         if caller:
@@ -411,83 +412,36 @@ class Character(ObjectParent, DefaultCharacter):
             else:
                 caller.msg("No derived stats could be calculated with current attributes.")
         
-        # Mark stats as modified so Evennia persists the changes
-        self.db.stats = self.db.stats
-        
         return updated_stats
 
     def calculate_power_pools(self, caller=None):
         """Calculate supernatural power pools based on power stats"""
-        advantages = self.db.stats.get("advantages", {})
-        other = self.db.stats.get("other", {})
-        template = other.get("template", "Mortal").lower()
-        
-        # Standard supernatural pool lookup table
-        pool_lookup = {
-            1: 10, 2: 11, 3: 12, 4: 13, 5: 15,
-            6: 20, 7: 25, 8: 30, 9: 50, 10: 75
-        }
-        
-        updated_pools = []
-        
-        # Template-specific power pool calculations
-        # Store pool maximums in advantages dictionary for sheet display
-        if template == "vampire" and "blood_potency" in advantages:
-            blood_potency = advantages["blood_potency"]
-            if blood_potency == 0:
-                # Blood Potency 0 uses Stamina
-                attrs = self.db.stats.get("attributes", {})
-                stamina = attrs.get("stamina", 1)
-                advantages["vitae"] = stamina
-            else:
-                advantages["vitae"] = pool_lookup.get(blood_potency, 10)
-            updated_pools.append("vitae")
-            
-        elif template == "changeling" and "wyrd" in advantages:
-            wyrd = advantages["wyrd"]
-            advantages["glamour"] = pool_lookup.get(wyrd, 10)
-            updated_pools.append("glamour")
-            
-        elif template == "werewolf" and "primal_urge" in advantages:
-            primal_urge = advantages["primal_urge"]
-            advantages["essence"] = pool_lookup.get(primal_urge, 10)
-            updated_pools.append("essence")
-            
-        elif template == "mage" and "gnosis" in advantages:
-            gnosis = advantages["gnosis"]
-            advantages["mana"] = pool_lookup.get(gnosis, 10)
-            updated_pools.append("mana")
-            
-        elif template == "geist" and "synergy" in advantages:
-            synergy = advantages["synergy"]
-            advantages["plasm"] = pool_lookup.get(synergy, 10)
-            updated_pools.append("plasm")
-            
-        elif template == "promethean" and "azoth" in advantages:
-            azoth = advantages["azoth"]
-            advantages["pyros"] = pool_lookup.get(azoth, 10)
-            updated_pools.append("pyros")
-            
-        elif template == "demon" and "primum" in advantages:
-            primum = advantages["primum"]
-            advantages["aether"] = pool_lookup.get(primum, 10)
-            updated_pools.append("aether")
-            
-        elif template == "deviant" and "deviation" in advantages:
-            deviation = advantages["deviation"]
-            advantages["instability"] = pool_lookup.get(deviation, 10)
-            updated_pools.append("instability")
+        updated_pools = derived_stats.recompute(self.stats, kind="pool")
         
         # Send message to caller if provided
         if caller and updated_pools:
             caller.msg(f"Updated power pools: {', '.join(updated_pools)}")
         
-        # Mark stats as modified so Evennia persists the changes
-        if updated_pools:
-            self.db.stats = self.db.stats
-        
         return updated_pools
 
+    def recompute_derived(self, changed, caller=None):
+        """
+        Recompute only the derived stats and pools that depend on changed stats.
+        
+        Args:
+            changed (iterable): Changed stat names, or (category, stat) pairs
+            caller: Optional object to notify of the updated stats
+            
+        Returns:
+            list: Names of the derived stats and pools that were recalculated
+        """
+        updated = derived_stats.recompute(self.stats, changed)
+        
+        if caller and updated:
+            caller.msg(f"Updated derived stats: {', '.join(updated)}")
+        
+        return updated
+
     def recalculate_derived_stats(self, caller=None):
         """Recalculate derived stats for a character"""
         if not self.db.stats:
@@ -499,15 +453,14 @@ class Character(ObjectParent, DefaultCharacter):
     
     def validate_template_field(self, field, value):
         """Validate template-specific field values using the template registry"""
-        template = self.db.stats.get("other", {}).get("template", "Mortal")
-        return template_registry.validate_field(template, field, value)
+        return template_registry.validate_field(self.stats.template, field, value)
     
     def cleanup_misplaced_stats(self, caller=None):
         """Clean up stats that were stored with spaces in wrong categories"""
         if not self.db.stats:
             return
         
-        other = self.db.stats.get("other", {})
+        other = self.stats.get_category("other")
         changes_made = []
         
         # Define proper mappings for commonly misplaced stats
@@ -519,21 +472,16 @@ class Character(ObjectParent, DefaultCharacter):
         }
         
         # Check for misplaced stats and move them
-        for space_name, (correct_category, underscore_name) in stat_mappings.items():
-            if space_name in other:
-                value = other[space_name]
-                
-                # Ensure correct category exists
-                if correct_category not in self.db.stats:
-                    self.db.stats[correct_category] = {}
-                
-                # Move the stat to correct location
-                self.db.stats[correct_category][underscore_name] = value
-                
-                # Remove from wrong location
-                del other[space_name]
-                
-                changes_made.append(f"Moved '{space_name}' to {correct_category} as '{underscore_name}'")
+        with self.stats.batch():
+            for space_name, (correct_category, underscore_name) in stat_mappings.items():
+                if space_name in other:
+                    # Move the stat to correct location
+                    self.stats.set(correct_category, underscore_name, other[space_name])
+                    
+                    # Remove from wrong location
+                    self.stats.remove("other", space_name)
+                    
+                    changes_made.append(f"Moved '{space_name}' to {correct_category} as '{underscore_name}'")
         
         if changes_made and caller:
             caller.msg("Fixed misplaced stats: " + ", ".join(changes_made))
@@ -569,11 +517,11 @@ class Character(ObjectParent, DefaultCharacter):
     def check_single_merit_prerequisite(self, prereq):
         """Check a single merit prerequisite requirement."""
         prereq = prereq.strip()
-        stats = self.db.stats or {}
+        stats = self.stats
         
         # Handle template-based prerequisites (no colon)
         if ":" not in prereq:
-            current_template = stats.get("other", {}).get("template", "Mortal").lower()
+            current_template = stats.template.lower()
             
             # Handle negative prerequisites (non_template)
             if prereq.startswith("non_"):
@@ -598,17 +546,17 @@ class Character(ObjectParent, DefaultCharacter):
             return False
             
         # Check attributes
-        current_value = stats.get("attributes", {}).get(stat_name, 1)
+        current_value = stats.get("attributes", stat_name, 1)
         if current_value >= required_value:
             return True
             
         # Check skills
-        current_value = stats.get("skills", {}).get(stat_name, 0)
+        current_value = stats.get("skills", stat_name, 0)
         if current_value >= required_value:
             return True
             
         # Check merits
-        current_value = stats.get("merits", {}).get(stat_name, {}).get("dots", 0)
+        current_value = stats.get("merits", stat_name, {}).get("dots", 0)
         if current_value >= required_value:
             return True
             
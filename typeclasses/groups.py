@@ -7,8 +7,15 @@ with proper Evennia TypeClasses for better integration and functionality.
 
 from evennia import DefaultObject, create_object, logger
 from evennia.comms.models import ChannelDB
+from evennia.objects.models import ObjectDB
 from evennia.utils import create as utils_create
 from django.conf import settings
+from world.bbs.access import BBS_ACCESS
+
+# Tag categories indexing group ids (on groups) and memberships (on members,
+# keyed by group id), so lookups use the tag table's indexes
+GROUP_ID_CATEGORY = "group_id"
+GROUP_MEMBER_CATEGORY = "group_member"
 
 
 class Group(DefaultObject):
@@ -86,10 +93,7 @@ class Group(DefaultObject):
     def _assign_group_id(self):
         """Assign a unique group ID."""
         # Get all existing group IDs
-        existing_ids = []
-        for obj in Group.objects.all():
-            if hasattr(obj, 'db') and obj.db.group_id:
-                existing_ids.append(obj.db.group_id)
+        existing_ids = GROUP_INDEX.used_ids()
         
         # Find the lowest available ID
         group_id = 1
@@ -97,6 +101,7 @@ class Group(DefaultObject):
             group_id += 1
         
         self.db.group_id = group_id
+        self.tags.add(str(group_id), category=GROUP_ID_CATEGORY)
     
     def _create_group_channel(self):
         """Create the associated channel for this group."""
@@ -207,14 +212,23 @@ class Group(DefaultObject):
         self.db.members = members
         return members
     
+    @property
+    def membership_tag(self):
+        """Returns the tag key marking members of this group."""
+        return str(self.db.group_id)
+    
     def is_member(self, character):
         """Check if a character is a member of this group."""
-        return character in self.members
+        if not character or not hasattr(character, 'tags'):
+            return False
+        return character.tags.has(self.membership_tag, category=GROUP_MEMBER_CATEGORY)
     
     def add_member(self, character):
         """Add a character to the group."""
         if not self.is_member(character):
             self.db.members.append(character)
+            character.tags.add(self.membership_tag, category=GROUP_MEMBER_CATEGORY)
+            GROUP_INDEX.invalidate_members(self.db.group_id)
             
             # Initialize member data if not exists
             if character not in self.db.member_data:
@@ -238,6 +252,9 @@ class Group(DefaultObject):
             if channel:
                 channel.connect(character)
             
+            # Board access depends on group membership
+            BBS_ACCESS.invalidate_character(character)
+            
             logger.log_info(f"Added {character.name} to group '{self.name}'")
             return True
         return False
@@ -245,7 +262,10 @@ class Group(DefaultObject):
     def remove_member(self, character):
         """Remove a character from the group."""
         if self.is_member(character):
-            self.db.members.remove(character)
+            if character in self.db.members:
+                self.db.members.remove(character)
+            character.tags.remove(self.membership_tag, category=GROUP_MEMBER_CATEGORY)
+            GROUP_INDEX.invalidate_members(self.db.group_id)
             
             # Remove member data
             if character in self.db.member_data:
@@ -267,6 +287,9 @@ class Group(DefaultObject):
             if channel:
                 channel.disconnect(character)
             
+            # Board access depends on group membership
+            BBS_ACCESS.invalidate_character(character)
+            
             logger.log_info(f"Removed {character.name} from group '{self.name}'")
             return True
         return False
@@ -664,8 +687,120 @@ class Group(DefaultObject):
             logger.log_info(f"Deleted channel '{self.channel_name}'")
         
         # Call parent delete
+        group_id = self.db.group_id
+        GROUP_INDEX.forget(group_id)
         super().delete()
-        logger.log_info(f"Deleted group '{self.name}' (ID #{self.db.group_id})")
+        logger.log_info(f"Deleted group '{self.name}' (ID #{group_id})")
+
+
+class GroupIndex:
+    """
+    Lookups of groups by group id, remembering groups already found, and a
+    cached set of member ids per group for lock checks.
+    
+    Member sets are invalidated explicitly by Group.add_member, remove_member
+    and delete, which are the only places membership tags change.
+
+    Usage:
+        GROUP_INDEX.get(3)
+        GROUP_INDEX.member_ids(3)
+        GROUP_INDEX.used_ids()
+    """
+    
+    def __init__(self):
+        self._groups = {}
+        self._members = {}
+    
+    def get(self, group_id):
+        """
+        Get a group by its group ID.
+        
+        Returns:
+            Group or None
+        """
+        group = self._groups.get(group_id)
+        if group is not None and group.pk and group.db.group_id == group_id:
+            return group
+        
+        group = Group.objects.filter(
+            db_tags__db_key=str(group_id), db_tags__db_category=GROUP_ID_CATEGORY
+        ).first()
+        if group is None:
+            self._groups.pop(group_id, None)
+        else:
+            self._groups[group_id] = group
+        return group
+    
+    def member_ids(self, group_id):
+        """
+        Get the object ids of a group's members, loading them on a miss.
+        
+        Returns:
+            frozenset: Member object ids; empty if there is no such group
+        """
+        members = self._members.get(group_id)
+        if members is None:
+            members = self._members[group_id] = frozenset(ObjectDB.objects.filter(
+                db_tags__db_key=str(group_id), db_tags__db_category=GROUP_MEMBER_CATEGORY
+            ).values_list('id', flat=True))
+        return members
+    
+    def invalidate_members(self, group_id):
+        """Forget a group's cached member set after its membership changed."""
+        self._members.pop(group_id, None)
+    
+    def forget(self, group_id):
+        """Forget a group, e.g. when it is deleted."""
+        self._groups.pop(group_id, None)
+        self._members.pop(group_id, None)
+    
+    def clear(self):
+        """Forget everything."""
+        self._groups.clear()
+        self._members.clear()
+    
+    def used_ids(self):
+        """
+        Get every group ID in use.
+        
+        Returns:
+            set: Group IDs, read from the tag table without loading groups
+        """
+        keys = Group.objects.filter(db_tags__db_category=GROUP_ID_CATEGORY).values_list(
+            'db_tags__db_key', flat=True
+        )
+        return {int(key) for key in keys if key.isdigit()}
+
+
+GROUP_INDEX = GroupIndex()
+
+
+def index_groups():
+    """
+    Tag groups, and their members, that were created before group IDs and
+    memberships were indexed. Only untagged groups are loaded, so this is
+    cheap to run on every server start.
+    
+    Returns:
+        int: Number of groups indexed
+    """
+    count = 0
+    for group in Group.objects.exclude(db_tags__db_category=GROUP_ID_CATEGORY):
+        if group.db.group_id is None:
+            group._assign_group_id()
+        else:
+            group.tags.add(str(group.db.group_id), category=GROUP_ID_CATEGORY)
+        
+        for member in group.members:
+            if hasattr(member, 'tags'):
+                member.tags.add(group.membership_tag, category=GROUP_MEMBER_CATEGORY)
+                BBS_ACCESS.invalidate_character(member)
+        GROUP_INDEX.invalidate_members(group.db.group_id)
+        count += 1
+    
+    if count:
+        logger.log_info(f"Indexed {count} group(s) by ID and membership")
+    return count
 
 
 # Convenience functions for group management
@@ -714,10 +849,7 @@ def get_group_by_id(group_id):
     Returns:
         Group or None: The group object if found
     """
-    for group in Group.objects.all():
-        if hasattr(group, 'db') and group.db.group_id == group_id:
-            return group
-    return None
+    return GROUP_INDEX.get(group_id)
 
 
 def get_group_by_name(name):
@@ -764,5 +896,14 @@ def get_character_groups(character):
     Returns:
         list: List of group objects the character belongs to
     """
-    all_groups = Group.objects.all()
-    return [group for group in all_groups if group.is_member(character)] 
\ No newline at end of file
+    if not character or not hasattr(character, 'tags'):
+        return []
+    
+    groups = []
+    for key in character.tags.get(category=GROUP_MEMBER_CATEGORY, return_list=True):
+        group = GROUP_INDEX.get(int(key)) if key.isdigit() else None
+        if group:
+            groups.append(group)
+    groups.sort(key=lambda group: group.id)
+    return groups
+ 
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Cached bulletin board access.
+
+Working out whether a character can read or write a board means finding the
+character by name, checking staff permissions and checking membership of
+each of the board's groups. The access cache does that once per character
+and keeps the resulting sets of readable and writable board ids until
+something they depend on changes:
+
+- Group.add_member/remove_member invalidate the character they touch.
+- Creating, deleting or editing a board's groups or read-only flag
+  invalidates every character.
+- Each entry remembers the character's and account's permissions, so a
+  permission change is noticed on the next lookup.
+
+BBS_ACCESS is the global cache used by BBSController and the notification
+fan-out in the +bbs command.
+"""
+
+STAFF_LOCKS = ("perm(Admin)", "perm(Builder)")
+
+
+class AccessEntry:
+    """Boards one character can read and write."""
+
+    __slots__ = ("readable", "writable", "staff", "permissions")
+
+    def __init__(self, readable, writable, staff, permissions):
+        self.readable = readable
+        self.writable = writable
+        self.staff = staff
+        self.permissions = permissions
+
+
+class BoardAccessCache:
+    """
+    Cache of character id -> readable and writable board ids.
+
+    Usage:
+        BBS_ACCESS.can_read(character, board_id)
+        BBS_ACCESS.can_write_by_name("Alice", board_id)
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._names = {}
+        self._boards = None
+
+    # Invalidation
+
+    def invalidate_character(self, character):
+        """Forget one character's access, e.g. after a group membership change."""
+        self._entries.pop(getattr(character, "id", character), None)
+
+    def invalidate_boards(self):
+        """Forget every character's access after a board's restrictions changed."""
+        self._boards = None
+        self._entries.clear()
+
+    def clear(self):
+        """Forget everything, including name lookups."""
+        self.invalidate_boards()
+        self._names.clear()
+
+    # Lookups
+
+    def _board_rules(self):
+        """Get (board id, lowercase group names, read only) for every board."""
+        if self._boards is None:
+            from world.bbs.models import Board
+            self._boards = [
+                (board_id, frozenset(name.lower() for name in group_names or ()), read_only)
+                for board_id, group_names, read_only
+                in Board.objects.values_list("id", "group_names", "read_only")
+            ]
+        return self._boards
+
+    def find_character(self, character_name):
+        """
+        Find a character by name, remembering the result.
+
+        Returns:
+            Character or None
+        """
+        key = character_name.lower()
+        character = self._names.get(key)
+        if character is not None and character.pk and character.key.lower() == key:
+            return character
+
+        from evennia import search_object
+        matches = search_object(character_name, typeclass="typeclasses.characters.Character")
+        character = matches[0] if matches else None
+        if character is None:
+            self._names.pop(key, None)
+        else:
+            self._names[key] = character
+        return character
+
+    @staticmethod
+    def _permissions(character):
+        """Fingerprint of the permissions staff access depends on."""
+        account = getattr(character, "account", None)
+        return (
+            tuple(sorted(character.permissions.all())),
+            tuple(sorted(account.permissions.all())) if account else (),
+            bool(account and account.is_superuser),
+        )
+
+    def _compute(self, character, permissions):
+        """Work out a character's access from scratch."""
+        from typeclasses.groups import get_character_groups
+
+        staff = any(character.locks.check_lockstring(character, lock) for lock in STAFF_LOCKS)
+        groups = frozenset(group.key.lower() for group in get_character_groups(character))
+
+        readable = set()
+        writable = set()
+        for board_id, board_groups, read_only in self._board_rules():
+            if board_groups and not board_groups & groups:
+                continue
+            readable.add(board_id)
+            if not read_only:
+                writable.add(board_id)
+        return AccessEntry(frozenset(readable), frozenset(writable), staff, permissions)
+
+    def get(self, character):
+        """
+        Get a character's access, computing it on a miss.
+
+        Returns:
+            AccessEntry
+        """
+        permissions = self._permissions(character)
+        entry = self._entries.get(character.id)
+        if entry is None or entry.permissions != permissions:
+            entry = self._entries[character.id] = self._compute(character, permissions)
+        return entry
+
+    def _unrestricted(self):
+        """Access for a name that matches no character: boards without group restrictions."""
+        readable = {board_id for board_id, board_groups, _ in self._board_rules() if not board_groups}
+        writable = {board_id for board_id, board_groups, read_only in self._board_rules()
+                    if not board_groups and not read_only}
+        return AccessEntry(frozenset(readable), frozenset(writable), False, None)
+
+    def can_read(self, character, board_id):
+        """Check if a character can read a board."""
+        entry = self.get(character)
+        return entry.staff or board_id in entry.readable
+
+    def can_write(self, character, board_id):
+        """Check if a character can post to a board."""
+        entry = self.get(character)
+        return entry.staff or board_id in entry.writable
+
+    def can_read_by_name(self, character_name, board_id):
+        """Check if the character with a name can read a board."""
+        character = self.find_character(character_name)
+        if character is None:
+            return board_id in self._unrestricted().readable
+        return self.can_read(character, board_id)
+
+    def can_write_by_name(self, character_name, board_id):
+        """Check if the character with a name can post to a board."""
+        character = self.find_character(character_name)
+        if character is None:
+            return board_id in self._unrestricted().writable
+        return self.can_write(character, board_id)
+
+
+BBS_ACCESS = BoardAccessCache()
@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+class BbsConfig(AppConfig):
+    name = 'world.bbs'
+    verbose_name = "Bulletin Boards"
@@ -0,0 +1,103 @@
+from django.db import models
+from django.utils import timezone
+from evennia.utils.idmapper.models import SharedMemoryModel
+
+
+class Board(SharedMemoryModel):
+    """
+    A bulletin board.
+
+    The primary key is the board number players use (+bbs 3), so it is
+    assigned by the controller and reused after a board is deleted.
+    """
+    id = models.PositiveIntegerField(primary_key=True)
+    name = models.CharField(max_length=255, unique=True)
+    description = models.TextField(blank=True, default="")
+    read_only = models.BooleanField(default=False)
+    locked = models.BooleanField(default=False)
+    group_names = models.JSONField(default=list)
+    access_list = models.JSONField(default=dict)
+    # Any other settings staff commands store on a board, e.g. 'public'
+    extra = models.JSONField(default=dict)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        app_label = 'bbs'
+        ordering = ['id']
+
+    def __str__(self):
+        return f"#{self.id} {self.name}"
+
+
+class Post(models.Model):
+    """
+    A single post on a board.
+
+    Posts are plain models rather than SharedMemoryModels so a game with a
+    long board history doesn't keep every post it ever loaded in memory.
+    Posts are numbered by their position on the board, oldest first. The id
+    only ever increases, so it doubles as the sequence number read markers
+    compare against.
+    """
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='posts')
+    title = models.CharField(max_length=255)
+    content = models.TextField()
+    author = models.CharField(max_length=255, db_index=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    edited_at = models.DateTimeField(null=True, blank=True)
+    pinned = models.BooleanField(default=False)
+
+    class Meta:
+        app_label = 'bbs'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['board', 'id']),
+            models.Index(fields=['board', 'created_at']),
+            models.Index(fields=['created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.board_id}: {self.title}"
+
+
+class ReadMarker(models.Model):
+    """
+    What one character has read on one board.
+
+    Every post with an id up to last_read_id has been read, plus the few
+    newer posts listed in read_above that were read out of order. A post is
+    unread when its id is above the mark and not in read_above, so unread
+    checks never need a row per post.
+    """
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='read_markers')
+    character_name = models.CharField(max_length=255)
+    last_read_id = models.PositiveIntegerField(default=0)
+    read_above = models.JSONField(default=list)
+
+    class Meta:
+        app_label = 'bbs'
+        unique_together = ('character_name', 'board')
+
+    def __str__(self):
+        return f"{self.character_name} on {self.board_id}: {self.last_read_id}"
+
+    def is_read(self, post_id):
+        """Check if a post has been read."""
+        return post_id <= self.last_read_id or post_id in self.read_above
+
+
+class PostTerm(models.Model):
+    """
+    One entry in the inverted index for +bbs/search: a word that appears
+    in a post's title or content. Rows are rewritten when the post is
+    created or edited and go away with it when it is deleted.
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = 'bbs'
+        unique_together = ('term', 'post')
+
+    def __str__(self):
+        return f"{self.term} -> {self.post_id}"
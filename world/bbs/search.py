@@ -0,0 +1,130 @@
+"""
+Full-text search over bulletin board posts.
+
+Each post's title and content are split into terms stored as PostTerm rows,
+an inverted index from word to post. BBSController keeps it up to date as
+posts are created and edited (deleted posts take their rows with them), so
+a search is one indexed query per term however much history the boards hold.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+
+from world.bbs.models import Post, PostTerm
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 64
+DATE_FORMAT = "%Y-%m-%d"
+DEFAULT_PAGE_SIZE = 20
+
+# Posts indexed per batch when rebuilding
+REBUILD_BATCH_SIZE = 500
+
+
+def post_terms(*texts):
+    """
+    Get the distinct search terms in some text.
+
+    Returns:
+        set: Lowercase alphanumeric words of at least MIN_TERM_LENGTH characters
+    """
+    terms = set()
+    for text in texts:
+        for token in TOKEN_PATTERN.findall((text or "").lower()):
+            if len(token) >= MIN_TERM_LENGTH:
+                terms.add(token[:MAX_TERM_LENGTH])
+    return terms
+
+
+def _term_rows(post):
+    return [PostTerm(post_id=post.id, term=term) for term in post_terms(post.title, post.content)]
+
+
+def index_post(post):
+    """Replace a post's index entries after it was created or edited."""
+    with transaction.atomic():
+        PostTerm.objects.filter(post_id=post.id).delete()
+        PostTerm.objects.bulk_create(_term_rows(post))
+
+
+def rebuild_search_index():
+    """
+    Rebuild the whole index from every post.
+
+    Returns:
+        int: Number of posts indexed
+    """
+    count = 0
+    with transaction.atomic():
+        PostTerm.objects.all().delete()
+        batch = []
+        for post in Post.objects.only('id', 'title', 'content').iterator(chunk_size=REBUILD_BATCH_SIZE):
+            batch.extend(_term_rows(post))
+            count += 1
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                PostTerm.objects.bulk_create(batch)
+                batch = []
+        PostTerm.objects.bulk_create(batch)
+    return count
+
+
+def parse_date(value):
+    """
+    Parse a YYYY-MM-DD date filter.
+
+    Returns:
+        datetime: Midnight UTC at the start of the day
+
+    Raises:
+        ValueError: If the date isn't in YYYY-MM-DD form
+    """
+    parsed = datetime.strptime(value, DATE_FORMAT)
+    if settings.USE_TZ:
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed
+
+
+def search_posts(terms, board_ids, author=None, after=None, before=None, page=1, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Find posts containing every term, newest first.
+
+    Args:
+        terms (str): Search text; every word must appear in the post
+        board_ids (iterable): Boards to search, already limited to what the searcher may read
+        author (str): Only posts by this author
+        after (datetime): Only posts made on or after this day
+        before (datetime): Only posts made on or before this day
+        page (int): 1-based page number
+        page_size (int): Results per page
+
+    Returns:
+        tuple: (posts, total, page, total_pages). Each post has a 'number'
+            attribute with its position on its board.
+    """
+    posts = Post.objects.filter(board_id__in=list(board_ids))
+    for term in post_terms(terms):
+        posts = posts.filter(id__in=PostTerm.objects.filter(term=term).values('post_id'))
+    if author:
+        posts = posts.filter(author__iexact=author)
+    if after:
+        posts = posts.filter(created_at__gte=after)
+    if before:
+        posts = posts.filter(created_at__lt=before + timedelta(days=1))
+
+    total = posts.count()
+    total_pages = max(1, (total + page_size - 1) // page_size)
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+
+    # Post numbers are positions on the board, counted in the same query
+    position = (Post.objects.filter(board_id=OuterRef('board_id'), id__lte=OuterRef('id'))
+                .values('board_id').annotate(total=Count('id')).values('total'))
+    results = list(posts.select_related('board')
+                   .annotate(number=Subquery(position, output_field=IntegerField()))
+                   .order_by('-id')[start:start + page_size])
+    return results, total, page, total_pages
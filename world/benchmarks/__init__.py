@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for PyReach hot paths.
+
+Each module runs standalone from the game directory, e.g.:
+    python -m world.benchmarks.lookup_dispatch
+"""
@@ -0,0 +1,114 @@
+"""
+Lock cost of fanning one group channel message out to its subscribers.
+
+Each subscriber of a group channel passes the channel's
+listen:group_member(<id>) lock for every message. "Before" replays the
+original lockfunc: get_group_by_id scanned every group comparing
+db.group_id, then is_member rebuilt the group's member list and searched it.
+"After" calls the shipped server.conf.lockfuncs.group_member, with
+GROUP_INDEX primed with the channel group's member ids as it is after the
+first message. Groups are in-memory stand-ins and subscribers are unsaved
+ObjectDB instances, so only lock evaluation is timed, not database access or
+message delivery.
+
+The lockfunc needs Evennia's Django setup, so run it from the game
+directory with:
+
+    evennia shell
+    >>> from world.benchmarks.group_channel_fanout import run
+    >>> run(subscribers=200, groups=50, messages=200)
+"""
+
+import timeit
+
+
+class _Attributes:
+    """Stand-in for an object's db attribute namespace."""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class _Group:
+    """Stand-in for a typeclassed group."""
+
+    def __init__(self, obj_id, **attributes):
+        self.id = obj_id
+        self.db = _Attributes(**attributes)
+
+
+def _character(obj_id):
+    """An unsaved ObjectDB with just an id, kept out of the idmapper cache."""
+    from evennia.objects.models import ObjectDB
+
+    character = ObjectDB.__new__(ObjectDB)
+    character.id = obj_id
+    return character
+
+
+def build_world(subscribers, groups):
+    """
+    Build groups of equal size with the channel's group last.
+
+    Returns:
+        tuple: (groups, subscribers of the last group)
+    """
+    all_groups = []
+    next_id = 1
+    for group_id in range(1, groups + 1):
+        members = [_character(next_id + index) for index in range(subscribers)]
+        next_id += subscribers
+        all_groups.append(_Group(next_id, group_id=group_id, members=members))
+        next_id += 1
+    return all_groups, all_groups[-1].db.members
+
+
+def legacy_group_member(all_groups, accessing_obj, group_id):
+    """The original lockfunc: scan groups, then scan the member list."""
+    group = None
+    for candidate in all_groups:
+        if candidate.db.group_id == group_id:
+            group = candidate
+            break
+    if not group:
+        return False
+    members = [member for member in group.db.members if member]
+    group.db.members = members
+    return accessing_obj in members
+
+
+def run(subscribers=200, groups=50, messages=200):
+    """Time lock checks for one message to every subscriber and print a table."""
+    from server.conf.lockfuncs import group_member
+    from typeclasses.groups import GROUP_INDEX
+
+    all_groups, channel_subscribers = build_world(subscribers, groups)
+    group_id = groups
+    lock_arg = str(group_id)
+
+    # Prime the member set the way the first message's lock checks would
+    GROUP_INDEX.forget(group_id)
+    GROUP_INDEX._members[group_id] = frozenset(member.id for member in channel_subscribers)
+
+    def legacy_fanout():
+        for subscriber in channel_subscribers:
+            legacy_group_member(all_groups, subscriber, group_id)
+
+    def shipped_fanout():
+        for subscriber in channel_subscribers:
+            group_member(subscriber, None, lock_arg)
+
+    try:
+        assert all(legacy_group_member(all_groups, s, group_id) for s in channel_subscribers)
+        assert all(group_member(s, None, lock_arg) for s in channel_subscribers)
+
+        before = timeit.timeit(legacy_fanout, number=messages) / messages * 1e6
+        after = timeit.timeit(shipped_fanout, number=messages) / messages * 1e6
+    finally:
+        GROUP_INDEX.forget(group_id)
+
+    print(f"{subscribers} subscribers, {groups} groups, {messages} messages")
+    print(f"{'path':<10}{'per message (us)':>18}{'per check (ns)':>16}")
+    print(f"{'before':<10}{before:>18.1f}{before / subscribers * 1000:>16.0f}")
+    print(f"{'after':<10}{after:>18.1f}{after / subscribers * 1000:>16.0f}")
+    print(f"speedup: {before / after:.1f}x")
@@ -0,0 +1,86 @@
+"""
+Dispatch latency for +lookup categories, before and after the category registry.
+
+"Before" replays the original CmdLookup.func elif ladder: args.startswith()
+checks in their original order until the category matches. "After" is the
+registry path: split off the first word and resolve it with one dict lookup.
+Only category resolution is timed, not rendering.
+
+Usage:
+    python -m world.benchmarks.lookup_dispatch [iterations]
+"""
+
+import sys
+import timeit
+
+from world.cofd.lookup_categories import LOOKUP_CATEGORIES
+
+# Prefixes tested by the original elif ladder, in order. Entries marked
+# exact=True used == instead of startswith().
+LEGACY_LADDER = [
+    (("attributes",), False), (("skills",), False), (("merits",), False),
+    (("disciplines", "discipline"), False), (("discipline_powers", "powers"), False),
+    (("coils",), False), (("bloodline",), False), (("devotions", "devotion"), False),
+    (("scales",), False), (("theban",), False), (("cruac",), False), (("arcana",), True),
+    (("spells",), False), (("clans", "clan"), False), (("bloodlines", "bloodline"), False),
+    (("covenants", "covenant"), False), (("paths", "path"), False), (("orders", "order"), False),
+    (("legacies", "legacy"), False), (("templates", "template"), False),
+    (("auspices", "auspice"), False), (("tribes", "tribe"), False), (("gifts",), False),
+    (("lodges", "lodge"), False), (("contracts",), False), (("seemings", "seeming"), False),
+    (("courts", "court"), False), (("kiths", "kith"), False),
+    (("entitlements", "entitlement"), False), (("keys",), False), (("haunts",), False),
+    (("incarnations", "incarnation"), False), (("agendas", "agenda"), False),
+    (("embeds", "embed"), False), (("exploits", "exploit"), False),
+    (("demon_modifications", "modifications", "modification"), False),
+    (("demon_technologies", "technologies", "technology"), False),
+    (("demon_propulsions", "propulsions", "propulsion"), False),
+    (("demon_processes", "processes", "process"), False),
+    (("transmutations", "transmutation"), False), (("alembics",), False),
+    (("bestowments", "bestowment"), False), (("endowments",), False),
+    (("tactics", "tactic"), False), (("compacts", "compact"), False),
+    (("conspiracies", "conspiracy"), False), (("lineages", "lineage"), False),
+    (("athanors", "athanor"), False), (("guilds", "guild"), False),
+    (("decrees", "decree"), False), (("judges", "judge"), False),
+    (("utterances", "utterance"), False), (("affinities", "affinity"), False),
+    (("burdens", "burden"), False), (("krewe",), False),
+    (("ceremonies", "ceremony"), False), (("origins", "origin"), False),
+    (("clades", "clade"), False), (("variations",), False), (("adaptations",), False),
+    (("scars",), False), (("mortal+", "mortal_plus"), True),
+    (("psychic", "psychic_powers"), True), (("tells", "wolf_blooded"), True),
+    (("specialties",), False),
+]
+
+
+def legacy_resolve(args):
+    """Return the index of the elif branch the original ladder would take."""
+    for index, (prefixes, exact) in enumerate(LEGACY_LADDER):
+        for prefix in prefixes:
+            if (args == prefix) if exact else args.startswith(prefix):
+                return index
+    return None
+
+
+def registry_resolve(args):
+    """Resolve a category the way CmdLookup.func does now."""
+    parts = args.split()
+    return LOOKUP_CATEGORIES.resolve(parts[0]) if parts else None
+
+
+def run(iterations=20000):
+    """Time both dispatch paths for every registered category and print a table."""
+    print(f"{'category':<16}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    total_before = total_after = 0.0
+    for category in LOOKUP_CATEGORIES.all_categories():
+        args = category.name
+        before = timeit.timeit(lambda: legacy_resolve(args), number=iterations) / iterations * 1e9
+        after = timeit.timeit(lambda: registry_resolve(args), number=iterations) / iterations * 1e9
+        total_before += before
+        total_after += after
+        print(f"{args:<16}{before:>14.0f}{after:>14.0f}{before / after:>9.1f}x")
+    count = len(LOOKUP_CATEGORIES.all_categories())
+    print(f"{'mean':<16}{total_before / count:>14.0f}{total_after / count:>14.0f}"
+          f"{total_before / total_after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
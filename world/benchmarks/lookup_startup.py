@@ -0,0 +1,72 @@
+"""
+Startup cost of the +lookup reference data.
+
+Each measurement runs in a fresh interpreter so module caches from earlier
+runs don't hide the import cost. "import" is the time to import the module
+alone, which is what every reload pays. "first access" adds loading one game
+line, and "load all" loads every game line and builds the search index, which
+is what the old eager LookupData paid at import. The last two scenarios
+compare loading every game line from the snapshot (when one has been built
+with python -m world.cofd.lookup_snapshot) against the source modules.
+
+commands.lookup needs Evennia importable; it is reported as unavailable
+otherwise.
+
+Usage:
+    python -m world.benchmarks.lookup_startup [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ("import world.cofd.lookup_data",
+     "import world.cofd.lookup_data"),
+    ("import commands.lookup",
+     "import commands.lookup"),
+    ("first access: vampire",
+     "from world.cofd.lookup_data import LOOKUP_DATA; LOOKUP_DATA.vampire_data"),
+    ("first access: merits",
+     "from world.cofd.lookup_data import LOOKUP_DATA; LOOKUP_DATA.find_merit('resources')"),
+    ("load all + search index",
+     "from world.cofd.lookup_data import LOOKUP_DATA; LOOKUP_DATA.search_index"),
+    ("load all, snapshot",
+     "from world.cofd.lookup_data import LOOKUP_DATA; LOOKUP_DATA.load_all()"),
+    ("load all, source modules",
+     "from world.cofd.lookup_data import LookupData; LookupData().load_all()"),
+]
+
+TIMER = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def time_statement(statement):
+    """Run a statement in a fresh interpreter and return its wall time, or None on error."""
+    result = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run(runs=5):
+    """Time every scenario and print the median of several runs."""
+    print(f"{'scenario':<28}{'median (ms)':>14}{'min (ms)':>12}")
+    for label, statement in SCENARIOS:
+        timings = [time_statement(statement) for _ in range(runs)]
+        if None in timings:
+            print(f"{label:<28}{'unavailable':>14}")
+            continue
+        print(f"{label:<28}{statistics.median(timings) * 1000:>14.1f}"
+              f"{min(timings) * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
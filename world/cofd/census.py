@@ -0,0 +1,199 @@
+"""
+Incremental +census counters.
+
+Every approved character contributes one count to its template line and one
+to its template's subtype line (e.g. 'Daeva (Invictus)'). The lines a
+character currently counts toward are remembered on the character, so a
+change only moves those counts: -1 on the lines it left and +1 on the ones it
+joined. +census then reads a handful of CensusCounter rows, whatever the
+population size.
+
+update_character_census() is called when a character is approved or
+unapproved, changes template, or has a bio field saved through its
+StatHandler, and remove_character_census() when it is deleted.
+rebuild_census() recomputes everything from scratch; ensure_census() runs it
+at server start when there are no counters yet, e.g. on first deploy.
+"""
+
+from django.db import transaction
+from django.db.models import F
+
+from world.cofd.models import CensusCounter
+
+TEMPLATE_SCOPE = "template"
+
+# Attribute remembering the counter lines a character counts toward
+CENSUS_KEYS_ATTRIBUTE = "census_keys"
+
+# Template-specific bio fields - PRIMARY field comes first
+TEMPLATE_FIELDS = {
+    'Vampire': ['clan', 'covenant'],
+    'Mage': ['path', 'order', 'legacy'],
+    'Changeling': ['seeming', 'kith', 'court', 'entitlement'],
+    'Werewolf': ['tribe', 'auspice', 'lodge'],
+    'Hunter': ['compact', 'profession'],
+    'Mortal': ['profession', 'organization'],
+    'Mortal+': ['type', 'organization'],
+    'Demon': ['incarnation', 'agenda', 'catalyst'],
+    'Beast': ['family', 'hunger', 'horror'],
+    'Deviant': ['origin', 'clade', 'scar'],
+    'Promethean': ['lineage', 'refinement', 'creator'],
+    'Geist': ['archetype', 'threshold']
+}
+DEFAULT_FIELDS = ['clan', 'covenant', 'tribe', 'court', 'order']
+
+# Templates whose subtype is shown as "Primary (Secondary)"
+PAIRED_FIELDS = {
+    'Changeling': ('seeming', 'court'),
+    'Vampire': ('clan', 'covenant'),
+    'Werewolf': ('tribe', 'auspice'),
+    'Mage': ('path', 'order'),
+}
+
+
+def subtype_scope(template):
+    """Counter scope for one template's subtype breakdown."""
+    return f"{TEMPLATE_SCOPE}:{template}"
+
+
+def _is_set(value):
+    return value and value != "<not set>" and str(value).strip()
+
+
+def subtype_label(template, bio):
+    """
+    Build the census label for one character, e.g. 'Daeva (Invictus)'.
+
+    Args:
+        template (str): The character's template
+        bio (dict): The character's bio fields
+
+    Returns:
+        str: The label, or 'Unspecified'
+    """
+    fields = TEMPLATE_FIELDS.get(template, DEFAULT_FIELDS)
+    primary_field = fields[0] if fields else None
+    if not primary_field or not _is_set(bio.get(primary_field)):
+        return "Unspecified"
+
+    if template in PAIRED_FIELDS:
+        primary, secondary = PAIRED_FIELDS[template]
+        if _is_set(bio.get(secondary)):
+            return f"{bio[primary]} ({bio[secondary]})"
+        return f"{bio[primary]}"
+
+    return f"{bio[primary_field]}"
+
+
+def census_keys(character):
+    """
+    Get the (scope, label) counter lines a character counts toward.
+
+    Returns:
+        list: Empty for unapproved characters
+    """
+    if not character.attributes.get("approved"):
+        return []
+    template = character.stats.template
+    bio = character.stats.get_category("bio")
+    return [
+        (TEMPLATE_SCOPE, template),
+        (subtype_scope(template), subtype_label(template, bio)),
+    ]
+
+
+def _adjust(scope, label, delta):
+    """Add delta to one counter, creating it if needed."""
+    updated = CensusCounter.objects.filter(scope=scope, label=label).update(count=F("count") + delta)
+    if not updated:
+        CensusCounter.objects.create(scope=scope, label=label, count=max(delta, 0))
+
+
+def update_character_census(character):
+    """
+    Move a character's census counts to match its current approval, template and bio.
+
+    Returns:
+        bool: True if any counter changed
+    """
+    old_keys = {tuple(key) for key in (character.attributes.get(CENSUS_KEYS_ATTRIBUTE) or [])}
+    new_keys = set(census_keys(character))
+    if old_keys == new_keys:
+        return False
+
+    with transaction.atomic():
+        for scope, label in old_keys - new_keys:
+            _adjust(scope, label, -1)
+        for scope, label in new_keys - old_keys:
+            _adjust(scope, label, 1)
+    character.attributes.add(CENSUS_KEYS_ATTRIBUTE, [list(key) for key in sorted(new_keys)])
+    return True
+
+
+def remove_character_census(character):
+    """
+    Take a character's counts off the census, e.g. when it is deleted.
+
+    Returns:
+        bool: True if any counter changed
+    """
+    old_keys = {tuple(key) for key in (character.attributes.get(CENSUS_KEYS_ATTRIBUTE) or [])}
+    if not old_keys:
+        return False
+
+    with transaction.atomic():
+        for scope, label in old_keys:
+            _adjust(scope, label, -1)
+    character.attributes.remove(CENSUS_KEYS_ATTRIBUTE)
+    return True
+
+
+def get_counts(scope):
+    """
+    Read the counters for one census scope.
+
+    Returns:
+        dict: {label: count} for lines with a positive count
+    """
+    return dict(CensusCounter.objects.filter(scope=scope, count__gt=0).values_list("label", "count"))
+
+
+def rebuild_census():
+    """
+    Recompute every counter from the characters themselves.
+
+    Returns:
+        int: Number of approved characters counted
+    """
+    from typeclasses.characters import Character
+
+    totals = {}
+    counted = 0
+    characters = list(Character.objects.all_family())
+    for character in characters:
+        keys = census_keys(character)
+        character.attributes.add(CENSUS_KEYS_ATTRIBUTE, [list(key) for key in keys])
+        if keys:
+            counted += 1
+        for key in keys:
+            totals[key] = totals.get(key, 0) + 1
+
+    with transaction.atomic():
+        CensusCounter.objects.all().delete()
+        CensusCounter.objects.bulk_create(
+            CensusCounter(scope=scope, label=label, count=count)
+            for (scope, label), count in totals.items()
+        )
+    return counted
+
+
+def ensure_census():
+    """
+    Build the counters if they have never been built.
+
+    Returns:
+        int: Number of approved characters counted, 0 if counters already existed
+    """
+    if CensusCounter.objects.exists():
+        return 0
+    return rebuild_census()
@@ -0,0 +1,311 @@
+"""
+Derived stat dependency graph.
+
+Derived stats (health, willpower, defense, ...) and template power pools are
+declared once with the stats they depend on. Changing a stat then recomputes
+only the derived values that depend on it, directly or through another derived
+value, in dependency order, and writes them back in a single StatHandler save.
+
+The core derived stats are registered here. Template modules under
+world/cofd/templates register their own pools and derived stats alongside
+their template definitions:
+
+    register_power_pool("glamour", "wyrd", "changeling")
+
+    register_derived_stat(DerivedStat(
+        "vitae", kind="pool", templates=["vampire"],
+        depends_on=[("advantages", "blood_potency"), ("attributes", "stamina")],
+        compute=vitae_pool,
+    ))
+"""
+
+# Standard supernatural pool lookup table: power stat dots -> pool maximum
+POOL_LOOKUP = {
+    1: 10, 2: 11, 3: 12, 4: 13, 5: 15,
+    6: 20, 7: 25, 8: 30, 9: 50, 10: 75
+}
+
+DEFAULT_SIZE = 5
+
+# Merits that change Size, keyed the ways +stat may store them
+SIZE_MERITS = {
+    "giant": 1,
+    "small_framed": -1,
+    "small-framed": -1,
+}
+
+
+class DerivedStat:
+    """
+    A stat computed from other stats.
+
+    Args:
+        name (str): Stat key the value is stored under
+        compute (callable): compute(stats) -> value, or None when it can't be
+            calculated from the current sheet. stats is the character's StatHandler.
+        depends_on (list): (category, stat) pairs the value is computed from
+        category (str): Sheet category the value is stored in
+        templates (list): Lowercase template names this applies to; empty for all
+        kind (str): 'derived' for derived stats, 'pool' for power pools
+    """
+
+    __slots__ = ("name", "compute", "depends_on", "category", "templates", "kind")
+
+    def __init__(self, name, compute, depends_on, category="advantages", templates=None, kind="derived"):
+        self.name = name
+        self.compute = compute
+        self.depends_on = tuple(tuple(dependency) for dependency in depends_on)
+        self.category = category
+        self.templates = frozenset(template.lower() for template in (templates or ()))
+        self.kind = kind
+
+    def applies_to(self, template):
+        """Check if this stat applies to a template."""
+        return not self.templates or template.lower() in self.templates
+
+
+class DerivedStatRegistry:
+    """Registry of derived stats and the reverse index from stats to what depends on them."""
+
+    def __init__(self):
+        self._stats = {}
+        self._dependents = {}
+        self._order = None
+
+    def register(self, derived_stat):
+        """Register a derived stat, replacing any with the same name."""
+        if derived_stat.name in self._stats:
+            self.unregister(derived_stat.name)
+        self._stats[derived_stat.name] = derived_stat
+        for category, stat in derived_stat.depends_on:
+            self._dependents.setdefault(stat, []).append((category, derived_stat.name))
+        self._order = None
+        return derived_stat
+
+    def unregister(self, name):
+        """Remove a derived stat by name."""
+        derived_stat = self._stats.pop(name, None)
+        if derived_stat is None:
+            return
+        for category, stat in derived_stat.depends_on:
+            dependents = self._dependents.get(stat, [])
+            dependents[:] = [entry for entry in dependents if entry != (category, name)]
+            if not dependents:
+                self._dependents.pop(stat, None)
+        self._order = None
+
+    def get(self, name):
+        """Get a derived stat by name."""
+        return self._stats.get(name)
+
+    def all(self):
+        """Get every derived stat, in dependency order."""
+        return [self._stats[name] for name in self._topological_order()]
+
+    def _topological_order(self):
+        """Order derived stats so each comes after any derived stat it depends on."""
+        if self._order is not None:
+            return self._order
+
+        order = []
+        state = {}
+
+        def visit(name, path):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Derived stat cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for category, stat in self._stats[name].depends_on:
+                dependency = self._stats.get(stat)
+                if dependency is not None and dependency.category == category:
+                    visit(stat, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self._stats:
+            visit(name, [])
+        self._order = order
+        return order
+
+    def affected(self, changed, template=None, kind=None):
+        """
+        Find the derived stats that need recomputing after some stats changed.
+
+        Args:
+            changed (iterable): Changed stats, as (category, stat) pairs or bare
+                stat names matching any category
+            template (str): Only include stats applying to this template
+            kind (str): Only include stats of this kind
+
+        Returns:
+            list: DerivedStat objects in dependency order
+        """
+        pending = []
+        for entry in changed:
+            if isinstance(entry, (tuple, list)):
+                pending.append(tuple(entry))
+            else:
+                pending.append((None, entry))
+
+        names = set()
+        while pending:
+            category, stat = pending.pop()
+            for dependent_category, dependent in self._dependents.get(stat, ()):
+                if category is not None and category != dependent_category:
+                    continue
+                if dependent not in names:
+                    names.add(dependent)
+                    pending.append((self._stats[dependent].category, dependent))
+
+        return [derived_stat for derived_stat in self.all()
+                if derived_stat.name in names and self._included(derived_stat, template, kind)]
+
+    def select(self, template=None, kind=None):
+        """Get every derived stat for a template and kind, in dependency order."""
+        return [derived_stat for derived_stat in self.all() if self._included(derived_stat, template, kind)]
+
+    @staticmethod
+    def _included(derived_stat, template, kind):
+        if kind is not None and derived_stat.kind != kind:
+            return False
+        return template is None or derived_stat.applies_to(template)
+
+
+DERIVED_STATS = DerivedStatRegistry()
+
+
+def register_derived_stat(derived_stat):
+    """Register a derived stat with the global registry."""
+    return DERIVED_STATS.register(derived_stat)
+
+
+def _load_template_stats(template):
+    """Import a template's module so the pools and derived stats it registers are available."""
+    from world.cofd.templates import load_template_module
+    load_template_module(template)
+
+
+def recompute(stats, changed=None, kind=None):
+    """
+    Recompute derived stats on a character's sheet.
+
+    Args:
+        stats (StatHandler): The character's stat handler
+        changed (iterable): Stats that changed; None recomputes everything
+        kind (str): Only recompute 'derived' stats or 'pool's
+
+    Returns:
+        list: Names of the derived stats that could be calculated
+    """
+    template = stats.template
+    _load_template_stats(template)
+    if changed is None:
+        targets = DERIVED_STATS.select(template, kind)
+    else:
+        targets = DERIVED_STATS.affected(changed, template, kind)
+
+    updated = []
+    # Values are written as they are computed so later stats see earlier ones,
+    # but the sheet is only saved once
+    with stats.batch():
+        for derived_stat in targets:
+            value = derived_stat.compute(stats)
+            if value is None:
+                continue
+            stats.set(derived_stat.category, derived_stat.name, value)
+            updated.append(derived_stat.name)
+    return updated
+
+
+# Helpers for compute functions
+
+def stat_value(stats, category, name):
+    """Get a stat as an int, or None if it isn't set."""
+    value = stats.get(category, name)
+    if isinstance(value, dict):
+        value = value.get("dots")
+    return value if isinstance(value, int) else None
+
+
+def effective_size(stats):
+    """Size including Size-changing merits."""
+    size = stats.get("other", "size", DEFAULT_SIZE)
+    if not isinstance(size, int):
+        size = DEFAULT_SIZE
+    for merit, modifier in SIZE_MERITS.items():
+        if stat_value(stats, "merits", merit):
+            size += modifier
+    return size
+
+
+def _sum_of(*stat_names, bonus=0):
+    """Build a compute function adding attributes, or None if any is missing."""
+    def compute(stats):
+        values = [stat_value(stats, "attributes", name) for name in stat_names]
+        if None in values:
+            return None
+        return sum(values) + bonus
+    return compute
+
+
+def health(stats):
+    """Health = Size + Stamina."""
+    stamina = stat_value(stats, "attributes", "stamina")
+    if stamina is None:
+        return None
+    return effective_size(stats) + stamina
+
+
+def defense(stats):
+    """Defense = lower of Wits or Dexterity, plus Athletics."""
+    wits = stat_value(stats, "attributes", "wits")
+    dexterity = stat_value(stats, "attributes", "dexterity")
+    if wits is None or dexterity is None:
+        return None
+    return min(wits, dexterity) + (stat_value(stats, "skills", "athletics") or 0)
+
+
+def register_power_pool(pool, power_stat, template, power_category="advantages"):
+    """
+    Register a template's standard power pool, looked up from its power stat.
+
+    Args:
+        pool (str): Pool stat name, e.g. 'glamour'
+        power_stat (str): Power stat the pool is based on, e.g. 'wyrd'
+        template (str): Template the pool belongs to
+        power_category (str): Category the power stat is stored in
+    """
+    def compute(stats):
+        power = stat_value(stats, power_category, power_stat)
+        if power is None:
+            return None
+        return POOL_LOOKUP.get(power, 10)
+
+    return register_derived_stat(DerivedStat(
+        pool, compute, depends_on=[(power_category, power_stat)],
+        templates=[template], kind="pool",
+    ))
+
+
+register_derived_stat(DerivedStat(
+    "health", health,
+    depends_on=[("other", "size"), ("attributes", "stamina")]
+    + [("merits", merit) for merit in SIZE_MERITS],
+))
+register_derived_stat(DerivedStat(
+    "willpower", _sum_of("resolve", "composure"),
+    depends_on=[("attributes", "resolve"), ("attributes", "composure")],
+))
+register_derived_stat(DerivedStat(
+    "speed", _sum_of("strength", "dexterity", bonus=5),
+    depends_on=[("attributes", "strength"), ("attributes", "dexterity")],
+))
+register_derived_stat(DerivedStat(
+    "defense", defense,
+    depends_on=[("attributes", "wits"), ("attributes", "dexterity"), ("skills", "athletics")],
+))
+register_derived_stat(DerivedStat(
+    "initiative", _sum_of("dexterity", "composure"),
+    depends_on=[("attributes", "dexterity"), ("attributes", "composure")],
+))
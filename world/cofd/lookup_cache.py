@@ -0,0 +1,107 @@
+"""
+LRU cache of rendered +lookup pages.
+
+CoFD reference data only changes on code reload, so a +lookup page is
+fully determined by its category, filter, theme colors and whether the
+client gets ASCII or UTF-8 output. Pages are cached under that key and the
+whole cache is dropped when the lookup theme changes or templates are
+reinstalled.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAX_PAGES = 512
+
+
+class RenderedPageCache:
+    """
+    Least-recently-used cache of rendered pages with hit/miss counters.
+
+    Each cached value is the list of messages a page sent to the caller.
+    """
+
+    def __init__(self, max_pages=DEFAULT_MAX_PAGES):
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+        self._theme = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def check_theme(self, theme):
+        """Drop all pages if the theme differs from the one they were rendered with."""
+        if self._theme is not None and theme != self._theme:
+            self.clear()
+        self._theme = theme
+
+    def get(self, key):
+        """Return the cached messages for a key, or None on a miss."""
+        messages = self._pages.get(key)
+        if messages is None:
+            self.misses += 1
+            return None
+        self._pages.move_to_end(key)
+        self.hits += 1
+        return messages
+
+    def put(self, key, messages):
+        """Store rendered messages, evicting the least recently used page if full."""
+        self._pages[key] = messages
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Invalidate every cached page. Counters are kept."""
+        if self._pages:
+            self.invalidations += 1
+        self._pages.clear()
+
+    def reset_stats(self):
+        """Zero the hit/miss counters."""
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: pages, max_pages, hits, misses, hit_rate, evictions, invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            'pages': len(self._pages),
+            'max_pages': self.max_pages,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def __len__(self):
+        return len(self._pages)
+
+
+class MessageRecorder:
+    """
+    Stand-in for the caller that records messages instead of sending them.
+
+    Every other attribute is forwarded to the real caller, so render code
+    that inspects the caller keeps working.
+    """
+
+    def __init__(self, caller):
+        self._caller = caller
+        self.messages = []
+
+    def msg(self, text=None, **kwargs):
+        self.messages.append((text, kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._caller, name)
+
+
+LOOKUP_PAGE_CACHE = RenderedPageCache()
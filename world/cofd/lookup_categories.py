@@ -0,0 +1,321 @@
+"""
+Category registry for the +lookup command.
+
+Each +lookup category declares its handlers, aliases and filter vocabulary
+here. CmdLookup resolves the first word of its arguments with a single
+dictionary lookup instead of walking a chain of startswith() checks, and
+data modules can add new categories with register_category() without
+touching the dispatcher.
+
+Handlers are either names of CmdLookup methods or callables that take the
+command instance as their first argument.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+
+Handler = Union[str, Callable]
+
+
+def any_filter(arg):
+    """Filter predicate that accepts any argument (e.g. coils <mystery>)."""
+    return True
+
+
+def rank_filter(arg):
+    """Filter predicate for numeric ranks (e.g. theban 3)."""
+    return arg.isdigit()
+
+
+@dataclass
+class LookupCategory:
+    """
+    A +lookup category.
+
+    Dispatch rules for "+lookup <name> [args]":
+        - No args: call list_handler with no arguments.
+        - First arg matches filters: call list_handler with that filter.
+        - detail_handler set: call it with the remaining args joined.
+        - stat_filter set: show_stat_details(args, category_filter=stat_filter).
+        - Otherwise: show_stat_details on the full argument string.
+    """
+    name: str
+    list_handler: Handler
+    detail_handler: Optional[Handler] = None
+    aliases: tuple = ()
+    filters: Union[frozenset, Callable, None] = None
+    filter_type: Optional[Callable] = None
+    stat_filter: Optional[str] = None
+    game_line: str = ""
+    keys: tuple = field(init=False, default=())
+
+    def __post_init__(self):
+        self.keys = (self.name, *self.aliases)
+        if self.filters is not None and not callable(self.filters):
+            self.filters = frozenset(self.filters)
+
+    def is_filter(self, arg):
+        """Check whether an argument is one of this category's filters."""
+        if self.filters is None:
+            return False
+        if callable(self.filters):
+            return self.filters(arg)
+        return arg in self.filters
+
+    @staticmethod
+    def _call(cmd, handler, *args):
+        if callable(handler):
+            return handler(cmd, *args)
+        return getattr(cmd, handler)(*args)
+
+    def dispatch(self, cmd, arguments, raw_args):
+        """
+        Run the handler for this category.
+
+        Args:
+            cmd (CmdLookup): The running command
+            arguments (list): Words after the category name
+            raw_args (str): The full normalized argument string
+        """
+        if not arguments:
+            return self._call(cmd, self.list_handler)
+
+        first = arguments[0]
+        if self.is_filter(first):
+            value = self.filter_type(first) if self.filter_type else first
+            return self._call(cmd, self.list_handler, value)
+
+        rest = " ".join(arguments)
+        if self.detail_handler:
+            return self._call(cmd, self.detail_handler, rest)
+        if self.stat_filter:
+            return cmd.show_stat_details(rest, category_filter=self.stat_filter)
+        return cmd.show_stat_details(raw_args)
+
+
+class LookupCategoryRegistry:
+    """Registry of +lookup categories keyed by name and alias."""
+
+    def __init__(self):
+        self._by_key = {}
+        self._categories = []
+
+    def register(self, name, list_handler, detail_handler=None, aliases=(), filters=None,
+                 filter_type=None, stat_filter=None, game_line=""):
+        """
+        Register a +lookup category.
+
+        Args:
+            name (str): Primary category name (first word after +lookup)
+            list_handler: Handler listing the category, optionally with a filter
+            detail_handler: Handler showing a single named entry
+            aliases (tuple): Alternate names for the category
+            filters: Filter vocabulary (collection) or predicate (callable)
+            filter_type (callable): Conversion applied to a matched filter
+            stat_filter (str): show_stat_details category filter for names
+            game_line (str): Game line the category belongs to, for reference
+
+        Returns:
+            LookupCategory: The registered category
+
+        Raises:
+            ValueError: If the name or an alias is already registered
+        """
+        category = LookupCategory(
+            name=name, list_handler=list_handler, detail_handler=detail_handler,
+            aliases=tuple(aliases), filters=filters, filter_type=filter_type,
+            stat_filter=stat_filter, game_line=game_line
+        )
+        for key in category.keys:
+            if key in self._by_key:
+                raise ValueError(f"+lookup category '{key}' is already registered")
+        for key in category.keys:
+            self._by_key[key] = category
+        self._categories.append(category)
+        return category
+
+    def unregister(self, name):
+        """Remove a category and all of its aliases."""
+        category = self._by_key.get(name)
+        if not category:
+            return
+        for key in category.keys:
+            self._by_key.pop(key, None)
+        self._categories.remove(category)
+
+    def resolve(self, key):
+        """Return the category registered under a name or alias, or None."""
+        return self._by_key.get(key)
+
+    def all_categories(self):
+        """Return all registered categories in registration order."""
+        return list(self._categories)
+
+    def __contains__(self, key):
+        return key in self._by_key
+
+
+LOOKUP_CATEGORIES = LookupCategoryRegistry()
+
+
+def register_category(name, list_handler, detail_handler=None, **kwargs):
+    """Register a category with the global +lookup registry."""
+    return LOOKUP_CATEGORIES.register(name, list_handler, detail_handler, **kwargs)
+
+
+# Filter vocabularies
+SKILL_FILTERS = ["mental", "physical", "social"]
+MERIT_FILTERS = [
+    "mental", "physical", "social", "supernatural", "fighting", "style",
+    "vampire", "mage", "werewolf", "changeling", "geist", "demon",
+    "deviant", "hunter", "mummy", "promethean", "mortal+", "mortal_plus",
+    "psychic", "ghoul", "dhampir", "atariya", "psychic_vampire", "general",
+    "plain", "infected", "lost boy", "dreamer"
+]
+DISCIPLINE_FILTERS = [
+    "animalism", "auspex", "celerity", "dominate", "majesty", "nightmare",
+    "obfuscate", "protean", "resilience", "vigor", "cachexy", "crochan", "dead_signal"
+]
+DEVOTION_FILTERS = ["general", "carthian", "invictus", "nereid"]
+SCALE_FILTERS = ["ascendant", "quintessence", "voivode", "wyrm", "zirnitra", "ziva", "other"]
+ARCANA_FILTERS = ["death", "fate", "forces", "life", "matter", "mind", "prime", "space", "spirit", "time"]
+GIFT_FILTERS = [
+    "agony", "blood", "death", "disease", "dominance", "elementals",
+    "evasion", "fervor", "hunger", "insight", "inspiration", "knowledge",
+    "nature", "rage", "shaping", "stealth", "strength", "technology",
+    "warding", "weather", "change", "hunting", "pack",
+    "crescent_moon", "full_moon", "gibbous_moon", "half_moon", "new_moon",
+    "cunning", "glory", "honor", "purity", "wisdom"
+]
+CONTRACT_FILTERS = [
+    "crown", "jewel", "mirror", "shield", "steed", "sword",
+    "chalice", "coin", "stars", "thorn", "goblin"
+]
+ENDOWMENT_FILTERS = [
+    "advanced_armory", "animal_control_kit", "benediction", "castigation",
+    "dreamscape", "elixir", "enkoimesis", "goetic_gospel", "horror_within",
+    "infusion", "ink", "inspiration", "lives_remembered", "perispiritism",
+    "relic", "rites_du_cheval", "rites_of_denial", "seitokuten",
+    "teleinformatics", "thaumatechnology", "xenotechnology"
+]
+TACTIC_FILTERS = ["mental", "physical", "social"]
+
+
+# Core stats
+register_category("attributes", "show_attributes", stat_filter="attributes")
+register_category("skills", "show_skills", filters=SKILL_FILTERS, stat_filter="skills")
+register_category("merits", "show_merits", filters=MERIT_FILTERS, stat_filter="merits")
+register_category("specialties", "show_specialties", filters=any_filter)
+register_category("templates", "show_templates", "show_template_details", aliases=("template",))
+
+# Vampire
+register_category("disciplines", "show_disciplines", "show_discipline_details",
+                  aliases=("discipline",), game_line="vampire")
+register_category("powers", "show_discipline_powers", aliases=("discipline_powers",),
+                  filters=DISCIPLINE_FILTERS, stat_filter="powers", game_line="vampire")
+register_category("coils", "show_coils", filters=any_filter, game_line="vampire")
+register_category("bloodline_disciplines", "show_bloodline_disciplines", filters=any_filter,
+                  game_line="vampire")
+register_category("devotions", "show_devotions", aliases=("devotion",),
+                  filters=DEVOTION_FILTERS, stat_filter="devotions", game_line="vampire")
+register_category("scales", "show_scales", filters=SCALE_FILTERS, stat_filter="scales",
+                  game_line="vampire")
+register_category("theban", "show_theban", filters=rank_filter, filter_type=int,
+                  stat_filter="theban", game_line="vampire")
+register_category("cruac", "show_cruac", filters=rank_filter, filter_type=int,
+                  stat_filter="cruac", game_line="vampire")
+register_category("clans", "show_clans", "show_clan_details", aliases=("clan",), game_line="vampire")
+register_category("bloodlines", "show_bloodlines", "show_bloodline_details",
+                  aliases=("bloodline",), game_line="vampire")
+register_category("covenants", "show_covenants", "show_covenant_details",
+                  aliases=("covenant",), game_line="vampire")
+
+# Mage
+register_category("arcana", "show_arcana", game_line="mage")
+register_category("spells", "show_spells", filters=ARCANA_FILTERS, stat_filter="spells", game_line="mage")
+register_category("paths", "show_paths", "show_path_details", aliases=("path",), game_line="mage")
+register_category("orders", "show_orders", "show_order_details", aliases=("order",), game_line="mage")
+register_category("legacies", "show_legacies", "show_legacy_details", aliases=("legacy",), game_line="mage")
+
+# Werewolf
+register_category("auspices", "show_auspices", "show_auspice_details", aliases=("auspice",),
+                  game_line="werewolf")
+register_category("tribes", "show_tribes", "show_tribe_details", aliases=("tribe",), game_line="werewolf")
+register_category("lodges", "show_lodges", "show_lodge_details", aliases=("lodge",), game_line="werewolf")
+register_category("gifts", "show_werewolf_gifts", filters=GIFT_FILTERS, stat_filter="gifts",
+                  game_line="werewolf")
+
+# Changeling
+register_category("contracts", "show_changeling_contracts", filters=CONTRACT_FILTERS,
+                  stat_filter="contracts", game_line="changeling")
+register_category("seemings", "show_seemings", "show_seeming_details", aliases=("seeming",),
+                  game_line="changeling")
+register_category("courts", "show_courts", "show_court_details", aliases=("court",), game_line="changeling")
+register_category("kiths", "show_kiths", "show_kith_details", aliases=("kith",), game_line="changeling")
+register_category("entitlements", "show_entitlements", "show_entitlement_details",
+                  aliases=("entitlement",), game_line="changeling")
+
+# Geist
+register_category("keys", "show_geist_keys", "show_geist_key", game_line="geist")
+register_category("haunts", "show_geist_haunts", "show_geist_haunt", game_line="geist")
+register_category("burdens", "show_burdens", "show_burden_details", aliases=("burden",), game_line="geist")
+register_category("krewe", "show_krewe_types", "show_krewe_details", game_line="geist")
+register_category("ceremonies", "show_ceremonies", "show_ceremony_details", aliases=("ceremony",),
+                  game_line="geist")
+
+# Demon
+register_category("incarnations", "show_incarnations", "show_incarnation_details",
+                  aliases=("incarnation",), game_line="demon")
+register_category("agendas", "show_agendas", "show_agenda_details", aliases=("agenda",), game_line="demon")
+register_category("embeds", "show_embeds", "show_embed_details", aliases=("embed",), game_line="demon")
+register_category("exploits", "show_exploits", "show_exploit_details", aliases=("exploit",), game_line="demon")
+register_category("modifications", "show_demon_modifications", "show_demon_modification_details",
+                  aliases=("demon_modifications", "modification"), game_line="demon")
+register_category("technologies", "show_demon_technologies", "show_demon_technology_details",
+                  aliases=("demon_technologies", "technology"), game_line="demon")
+register_category("propulsions", "show_demon_propulsions", "show_demon_propulsion_details",
+                  aliases=("demon_propulsions", "propulsion"), game_line="demon")
+register_category("processes", "show_demon_processes", "show_demon_process_details",
+                  aliases=("demon_processes", "process"), game_line="demon")
+
+# Promethean
+register_category("transmutations", "show_transmutations", "show_transmutation_details",
+                  aliases=("transmutation",), game_line="promethean")
+register_category("alembics", "show_alembics", "show_alembic_details", game_line="promethean")
+register_category("bestowments", "show_bestowments", "show_bestowment_details",
+                  aliases=("bestowment",), game_line="promethean")
+register_category("lineages", "show_lineages", "show_lineage_details", aliases=("lineage",),
+                  game_line="promethean")
+register_category("athanors", "show_athanors", "show_athanor_details", aliases=("athanor",),
+                  game_line="promethean")
+
+# Hunter
+register_category("endowments", "show_endowments", filters=ENDOWMENT_FILTERS,
+                  stat_filter="endowments", game_line="hunter")
+register_category("tactics", "show_tactics", "show_tactic_details", aliases=("tactic",),
+                  filters=TACTIC_FILTERS, game_line="hunter")
+register_category("compacts", "show_compacts", "show_compact_details", aliases=("compact",),
+                  game_line="hunter")
+register_category("conspiracies", "show_conspiracies", "show_conspiracy_details",
+                  aliases=("conspiracy",), game_line="hunter")
+
+# Mummy
+register_category("guilds", "show_guilds", "show_guild_details", aliases=("guild",), game_line="mummy")
+register_category("decrees", "show_decrees", "show_decree_details", aliases=("decree",), game_line="mummy")
+register_category("judges", "show_judges", "show_judge_details", aliases=("judge",), game_line="mummy")
+register_category("utterances", "show_utterances", "show_utterance_details", aliases=("utterance",),
+                  game_line="mummy")
+register_category("affinities", "show_affinities", "show_affinity_details", aliases=("affinity",),
+                  game_line="mummy")
+
+# Deviant
+register_category("origins", "show_origins", "show_origin_details", aliases=("origin",), game_line="deviant")
+register_category("clades", "show_clades", "show_clade_details", aliases=("clade",), game_line="deviant")
+register_category("variations", "show_variations", "show_deviant_variation", game_line="deviant")
+register_category("adaptations", "show_adaptations", "show_deviant_adaptation", game_line="deviant")
+register_category("scars", "show_scars", "show_deviant_scar", game_line="deviant")
+
+# Mortal+
+register_category("mortal+", "show_mortal_plus_types", aliases=("mortal_plus",), game_line="mortal_plus")
+register_category("psychic", "show_psychic_powers", aliases=("psychic_powers",), game_line="mortal_plus")
+register_category("tells", "show_wolf_blooded_tells", aliases=("wolf_blooded",), game_line="mortal_plus")
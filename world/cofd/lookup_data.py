@@ -1,114 +1,184 @@
 """
 Consolidated data structure for the character creation lookup system.
 This module combines all stat types and provides enhanced lookup functionality.
+
+Only the core stat dictionaries are imported up front. Each game line's data
+(merits, Vampire powers, Mage spells, ...) is imported the first time it is
+accessed, so a reload only pays for the game lines actually in use. Game
+lines listed in settings.LOOKUP_PRELOAD_GAME_LINES are loaded at server start.
+
+When an up-to-date snapshot exists (see world.cofd.lookup_snapshot), game
+lines are unpickled from it instead of executing the source modules.
 """
 
 from world.cofd.stat_dictionary import (
     attribute_dictionary, skill_dictionary, 
     advantage_dictionary, anchor_dictionary
 )
-from world.cofd.merits.atariya_merits import atariya_merits
-from world.cofd.merits.vampire_merits import vampire_merits
-from world.cofd.merits.mage_merits import mage_merits
-from world.cofd.merits.werewolf_merits import werewolf_merits
-from world.cofd.merits.changeling_merits import changeling_merits
-from world.cofd.merits.geist_merits import geist_merits
-from world.cofd.merits.demon_merits import demon_merits
-from world.cofd.merits.deviant_merits import deviant_merits
-from world.cofd.merits.hunter_merits import hunter_merits
-from world.cofd.merits.mummy_merits import mummy_merits
-from world.cofd.merits.promethean_merits import promethean_merits
-from world.cofd.merits.ghost_merits import ghost_merits
-from world.cofd.merits.immortal_merits import immortal_merits
-from world.cofd.merits.infected_merits import infected_merits
-from world.cofd.merits.location_merits import location_merits
-from world.cofd.merits.lostboys_merits import lostboys_merits
-from world.cofd.merits.mortal_merits import mortal_merits
-from world.cofd.merits.plain_merits import plain_merits
-from world.cofd.merits.psychic_vampire_merits import psychic_vampire_merits
-from world.cofd.merits.restricted_merits import restricted_merits
-from world.cofd.merits.skinchanger_merits import skinchanger_merits
-from world.cofd.merits.style_merits import style_merits
-from world.cofd.merits.universal_merits import universal_merits
-from world.cofd.templates.vampire import VAMPIRE_CLANS, VAMPIRE_BLOODLINES, VAMPIRE_COVENANTS, VAMPIRE_DISCIPLINES
-from world.cofd.powers.vampire_clans import get_all_clans, get_all_bloodlines
-from world.cofd.powers.vampire_covenants import get_all_covenants
-from world.cofd.powers.vampire_disciplines import (
-    ALL_DISCIPLINE_POWERS, DISCIPLINE_POWER_CATEGORIES,
-    ALL_COILS, COILS_BY_MYSTERY,
-    ALL_BLOODLINE_DISCIPLINES, BLOODLINE_DISCIPLINES_BY_BLOODLINE,
-    ALL_DEVOTIONS, DEVOTIONS_BY_TYPE
-)
-from world.cofd.powers.vampire_rituals import (
-    ALL_SCALES, SCALES_BY_MYSTERY,
-    ALL_THEBAN, THEBAN_BY_RANK,
-    ALL_CRUAC, CRUAC_BY_RANK,
-    ALL_BLOODLINE_DEVOTIONS_EXTENDED, PENUMBRAE_CRUAC
-)
-from world.cofd.templates.mage import MAGE_PATHS, MAGE_ORDERS, MAGE_ARCANA, LEGACIES_BY_PATH, LEGACIES_BY_ORDER, UNLINKED_LEGACIES, ALL_LEGACIES
-from world.cofd.powers.mage_paths import get_all_paths
-from world.cofd.powers.mage_orders_detailed import get_all_orders_detailed
-from world.cofd.powers.mage_legacies_detailed import get_all_legacies as get_all_legacies_detailed
-from world.cofd.templates.demon import DEMON_INCARNATIONS, DEMON_AGENDAS, DEMON_EMBEDS, DEMON_EXPLOITS_LIST
-from world.cofd.powers.demon_form import (
-    DEMON_MODIFICATIONS, DEMON_TECHNOLOGIES, DEMON_PROPULSIONS, DEMON_PROCESSES,
-    ALL_DEMON_MODIFICATIONS, ALL_DEMON_TECHNOLOGIES, ALL_DEMON_PROPULSIONS, ALL_DEMON_PROCESSES
-)
-from world.cofd.powers.demon_powers import (
-    ALL_EMBEDS, DEMON_EXPLOITS,
-    EMBEDS_BY_INCARNATION, EMBEDS_CACOPHONY, EMBEDS_INSTRUMENTAL, EMBEDS_MUNDANE, EMBEDS_VOCAL,
-    ALL_EMBED_NAMES, ALL_EXPLOIT_NAMES
-)
-from world.cofd.templates.mortal_plus import ALL_MORTAL_PLUS_TYPES, PSYCHIC_POWERS
-from world.cofd.templates.werewolf import WEREWOLF_AUSPICES, WEREWOLF_TRIBES, WEREWOLF_LODGES
-from world.cofd.powers.werewolf_gifts import ALL_WEREWOLF_GIFTS
-from world.cofd.powers.werewolf_auspices import get_all_auspices
-from world.cofd.powers.werewolf_tribes import get_all_tribes, get_all_lodges
-from world.cofd.powers.changeling_contracts import ALL_CHANGELING_CONTRACTS
-from world.cofd.powers.changeling_kiths import ALL_KITHS
-from world.cofd.powers.changeling_seemings import get_all_seemings, get_all_entitlements
-from world.cofd.templates.changeling import CHANGELING_SEEMINGS, CHANGELING_COURTS, CHANGELING_KITHS, CHANGELING_ENTITLEMENTS
-from world.cofd.templates.promethean import PROMETHEAN_TEMPLATE
-from world.cofd.powers.promethean_powers import (
-    PROMETHEAN_TRANSMUTATIONS, PROMETHEAN_ALEMBICS, 
-    PROMETHEAN_BESTOWMENTS, PROMETHEAN_LINEAGES
-)
-from world.cofd.templates.legacy_promethean import ATHANORS_BY_LINEAGE
-from world.cofd.powers.hunter_endowments import ADVANCED_ARMORY, ANIMAL_CONTROL_KIT, BENEDICTION, CASTIGATION, DREAMSCAPE, ELIXIR, ENKOIMESIS, GOETIC_GOSPEL, HORROR_WITHIN, INFUSION, INK, INSPIRATION, LIVES_REMEMBERED, PERISPIRITISM, RELIC, RITES_DU_CHEVAL, RITES_OF_DENIAL, SEITOKUTEN, TELEINFORMATICS, THAUMATECHNOLOGY, XENOTECHNOLOGY
-from world.cofd.templates.hunter import HUNTER_CONSPIRACIES, HUNTER_COMPACTS, HUNTER_TACTICS, HUNTER_ENDOWMENTS
-from world.cofd.powers.hunter_tactics import get_all_tactics, MENTAL_TACTICS, PHYSICAL_TACTICS, SOCIAL_TACTICS
-from world.cofd.powers.hunter_organizations import ALL_COMPACTS, ALL_CONSPIRACIES, get_all_organizations
-from world.cofd.templates.mummy import (
-    MUMMY_GUILDS, MUMMY_DECREES, MUMMY_JUDGES,
-    MUMMY_AFFINITIES_DATA, MUMMY_UTTERANCES_DATA,
-    ALL_AFFINITY_NAMES, ALL_UTTERANCE_NAMES
-)
-from world.cofd.templates.geist import GEIST_BURDENS, GEIST_KREWE_TYPES, GEIST_HAUNTS, GEIST_KEYS, GEIST_CEREMONIES
-from world.cofd.powers.geist_powers import ALL_HAUNTS, GEIST_KEY_DETAILS
-from world.cofd.templates.deviant import DEVIANT_ORIGINS, DEVIANT_CLADES, DEVIANT_SCARS, DEVIANT_VARIATIONS, DEVIANT_ADAPTATIONS
-from world.cofd.templates.mortal_plus import (
-    ALL_MORTAL_PLUS_TYPES, PSYCHIC_POWERS, PROXIMUS_FAMILIES,
-    DEMON_BLOODED_LEVELS, GAME_LINE_HERITAGE, WOLF_BLOODED_TELLS
-)
-from world.cofd.powers.changing_breeds_favors import (
-    CHANGING_BREED_FAVORS, CHANGING_BREED_ASPECTS,
-    ALL_FAVOR_NAMES, ALL_ASPECT_NAMES, TRICKSTER_ONLY_ASPECTS
-)
-from world.cofd.templates.legacy_changingbreeds import (
-    LEGACY_CHANGING_BREEDS, CHANGING_BREED_CATEGORIES,
-    CHANGING_BREED_ACCORDS, ACCORD_SPECIALTIES, RESPECT_TYPES
+from world.cofd.lookup_index import (
+    KeyIndex, KEY_INDEX_SECTIONS, KEY_CATEGORY_LINES,
+    build_search_index
 )
+from world.cofd.lookup_snapshot import LookupSnapshot
 import re
 
 
+
 class LookupData:
     """Consolidated data structure for character creation lookups."""
     
-    def __init__(self):
+    # Categories checked by find_stat, in priority order
+    STAT_CATEGORIES = ['attribute', 'skill', 'advantage', 'anchor', 'merit']
+    
+    # Lazily loaded game lines and the attributes each one provides
+    GAME_LINES = {
+        'merits': (
+            'universal_merits', 'vampire_merits', 'mage_merits', 'werewolf_merits',
+            'changeling_merits', 'geist_merits', 'demon_merits', 'deviant_merits',
+            'hunter_merits', 'mummy_merits', 'promethean_merits', 'ghost_merits',
+            'immortal_merits', 'infected_merits', 'location_merits', 'lostboys_merits',
+            'mortal_merits', 'plain_merits', 'psychic_vampire_merits', 'restricted_merits',
+            'skinchanger_merits', 'style_merits', 'atariya_merits', 'all_merits',
+        ),
+        'vampire': ('vampire_data',),
+        'mage': ('mage_data',),
+        'werewolf': ('werewolf_data',),
+        'changeling': ('changeling_data',),
+        'geist': ('geist_data',),
+        'demon': ('demon_data',),
+        'mummy': ('mummy_data',),
+        'promethean': ('promethean_data',),
+        'deviant': ('deviant_data',),
+        'hunter': ('hunter_data',),
+        'mortal_plus': ('mortal_plus_data',),
+        'changing_breeds': ('changing_breeds_data',),
+    }
+    
+    def __init__(self, snapshot=None):
+        """
+        Args:
+            snapshot (LookupSnapshot): Prebuilt game line data to use when
+                current. None always imports the source modules.
+        """
+        self.snapshot = snapshot
         self.attributes = attribute_dictionary
         self.skills = skill_dictionary
         self.advantages = advantage_dictionary
         self.anchors = anchor_dictionary
+        
+        # Skill specialties
+        self.specialties = {
+            # Mental Skills
+            'academics': ['Anthropology', 'Art History', 'English', 'History', 'Law', 'Literature', 'Religion', 'Research', 'Translation'],
+            'computer': ['Data Retrieval', 'Graphics', 'Hacking', 'Internet', 'Programming', 'Security', 'Social Media'],
+            'crafts': ['Automotive', 'Cosmetics', 'Fashion', 'Forging', 'Graffiti', 'Jury-Rigging', 'Painting', 'Perfumery', 'Repair', 'Sculpting'],
+            'investigation': ['Artifacts', 'Autopsy', 'Body Language', 'Crime Scenes', 'Cryptography', 'Dreams', 'Lab Work', 'Riddles'],
+            'medicine': ['First Aid', 'Pathology', 'Pharmaceuticals', 'Physical Therapy', 'Surgery'],
+            'occult': ['Angels', 'Alchemy', 'Mystic Places', 'Casting Lots', 'Phrenology', 'Sorcery', 'Supernatural Being (specify)', 'Superstition', 'Witchcraft'],
+            'politics': ['Bureaucracy', 'Church', 'Democratic', 'Invictus', 'Local', 'Organized Crime', 'Scandals'],
+            'science': ['Physics', 'Chemistry', 'Neuroscience', 'Virology', 'Alchemy', 'Genetics', 'Hematology'],
+            # Physical Skills
+            'athletics': ['Acrobatics', 'Archery', 'Climbing', 'Jumping', 'Parkour', 'Swimming', 'Throwing'],
+            'brawl': ['Biting', 'Boxing', 'Dirty Fighting', 'Grappling', 'Martial Arts', 'Threats', 'Throws'],
+            'drive': ['Defensive Driving', 'Evasion', 'Off-Road Driving', 'Motorcycles', 'Pursuit', 'Stunts'],
+            'firearms': ['Handguns', 'Rifles', 'Shotguns', 'Trick Shots'],
+            'larceny': ['Breaking and Entering', 'Concealment', 'Lockpicking', 'Pickpocketing', 'Safecracking', 'Security Systems', 'Sleight of Hand'],
+            'stealth': ['Camouflage', 'Crowds', 'In Plain Sight', 'Rural', 'Shadowing', 'Stakeout', 'Staying Motionless'],
+            'survival': ['Foraging', 'Hunting', 'Navigation', 'Shelter', 'Weather'],
+            'weaponry': ['Chains', 'Clubs', 'Improvised Weapons', 'Spears', 'Swords'],
+            # Social Skills
+            'animal_ken': ['Animalism', 'Canines', 'Felines', 'Reptiles', 'Threatening', 'Training'],
+            'empathy': ['Calming', 'Emotion', 'Lies', 'Motives', 'Personalities'],
+            'expression': ['Dance', 'Drama', 'Journalism', 'Musical Instrument', 'Performance Art', 'Singing', 'Speeches'],
+            'intimidation': ['Direct Threats', 'Interrogation', 'Stare Down', 'Torture', 'Veiled Threats'],
+            'persuasion': ['Confidence Scam', 'Fast Talking', 'Inspiring', 'Sales Pitch', 'Seduction', 'Sermon'],
+            'socialize': ['Bar Hopping', 'Church Lock-in', 'Dress Balls', 'Formal Events', 'Frat Parties', 'Political Fundraisers', 'the Club'],
+            'streetwise': ['Black Market', 'Gangs', 'Navigation', 'Rumors', 'Undercover'],
+            'subterfuge': ['Detecting Lies', 'Doublespeak', 'Hiding Emotion', 'Little White Lies', 'Misdirection']
+        }
+        
+        # Canonical keys for detail lookups and +stat validation. Each game
+        # line adds its section when it is loaded.
+        self.loaded_game_lines = set()
+        self.key_index = KeyIndex()
+        KEY_INDEX_SECTIONS['core'](self.key_index, self)
+        self._search_index = None
+    
+    def __getattr__(self, name):
+        # Only reached for attributes that are not set yet, i.e. unloaded game lines
+        game_line = _LAZY_ATTRIBUTES.get(name)
+        if game_line is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self.load_game_line(game_line)
+        return self.__dict__[name]
+    
+    def load_game_line(self, game_line):
+        """
+        Import a game line's data and index it, if not already loaded.
+        
+        Args:
+            game_line (str): A key of GAME_LINES (e.g. 'vampire', 'merits')
+            
+        Raises:
+            ValueError: If the game line is unknown
+        """
+        if game_line in self.loaded_game_lines or game_line == 'core':
+            return
+        if game_line not in self.GAME_LINES:
+            raise ValueError(f"Unknown game line '{game_line}'. "
+                             f"Valid game lines: {', '.join(self.GAME_LINES)}")
+        
+        values = self.snapshot.get(game_line) if self.snapshot else None
+        if values is not None:
+            self.__dict__.update(values)
+        else:
+            getattr(self, f"_load_{game_line}")()
+        self.loaded_game_lines.add(game_line)
+        KEY_INDEX_SECTIONS[game_line](self.key_index, self)
+    
+    def preload(self, game_lines):
+        """Load the given game lines now instead of on first access."""
+        for game_line in game_lines:
+            self.load_game_line(game_line)
+    
+    def load_all(self):
+        """Load every game line."""
+        self.preload(self.GAME_LINES)
+    
+    @property
+    def search_index(self):
+        """Full-text index for +lookup/search, built over every game line on first use."""
+        if self._search_index is None:
+            self.load_all()
+            self._search_index = build_search_index(self)
+        return self._search_index
+    
+    def _load_merits(self):
+        """Load merit lists for every template."""
+        from world.cofd.merits.atariya_merits import atariya_merits
+        from world.cofd.merits.changeling_merits import changeling_merits
+        from world.cofd.merits.demon_merits import demon_merits
+        from world.cofd.merits.deviant_merits import deviant_merits
+        from world.cofd.merits.geist_merits import geist_merits
+        from world.cofd.merits.ghost_merits import ghost_merits
+        from world.cofd.merits.hunter_merits import hunter_merits
+        from world.cofd.merits.immortal_merits import immortal_merits
+        from world.cofd.merits.infected_merits import infected_merits
+        from world.cofd.merits.location_merits import location_merits
+        from world.cofd.merits.lostboys_merits import lostboys_merits
+        from world.cofd.merits.mage_merits import mage_merits
+        from world.cofd.merits.mortal_merits import mortal_merits
+        from world.cofd.merits.mummy_merits import mummy_merits
+        from world.cofd.merits.plain_merits import plain_merits
+        from world.cofd.merits.promethean_merits import promethean_merits
+        from world.cofd.merits.psychic_vampire_merits import psychic_vampire_merits
+        from world.cofd.merits.restricted_merits import restricted_merits
+        from world.cofd.merits.skinchanger_merits import skinchanger_merits
+        from world.cofd.merits.style_merits import style_merits
+        from world.cofd.merits.universal_merits import universal_merits
+        from world.cofd.merits.vampire_merits import vampire_merits
+        from world.cofd.merits.werewolf_merits import werewolf_merits
+        
         self.universal_merits = universal_merits
         self.vampire_merits = vampire_merits
         self.mage_merits = mage_merits
@@ -120,7 +190,7 @@ class LookupData:
         self.hunter_merits = hunter_merits
         self.mummy_merits = mummy_merits
         self.promethean_merits = promethean_merits
-        self.ghost_merits = ghost_merits\
+        self.ghost_merits = ghost_merits
         self.immortal_merits = immortal_merits
         self.infected_merits = infected_merits
         self.location_merits = location_merits
@@ -131,8 +201,34 @@ class LookupData:
         self.restricted_merits = restricted_merits
         self.skinchanger_merits = skinchanger_merits
         self.style_merits = style_merits
+        self.atariya_merits = atariya_merits
+        self.all_merits = (
+            universal_merits + mortal_merits + style_merits + location_merits +
+            plain_merits + restricted_merits + vampire_merits + mage_merits +
+            werewolf_merits + changeling_merits + geist_merits + demon_merits +
+            deviant_merits + hunter_merits + mummy_merits + promethean_merits +
+            ghost_merits + immortal_merits + infected_merits + lostboys_merits +
+            psychic_vampire_merits + skinchanger_merits + atariya_merits
+        )
+    
+    def _load_vampire(self):
+        """Load Vampire data."""
+        from world.cofd.templates.vampire import VAMPIRE_CLANS, VAMPIRE_BLOODLINES, VAMPIRE_COVENANTS, VAMPIRE_DISCIPLINES
+        from world.cofd.powers.vampire_clans import get_all_clans, get_all_bloodlines
+        from world.cofd.powers.vampire_covenants import get_all_covenants
+        from world.cofd.powers.vampire_disciplines import (
+            ALL_DISCIPLINE_POWERS, DISCIPLINE_POWER_CATEGORIES,
+            ALL_COILS, COILS_BY_MYSTERY,
+            ALL_BLOODLINE_DISCIPLINES, BLOODLINE_DISCIPLINES_BY_BLOODLINE,
+            ALL_DEVOTIONS, DEVOTIONS_BY_TYPE
+        )
+        from world.cofd.powers.vampire_rituals import (
+            ALL_SCALES, SCALES_BY_MYSTERY,
+            ALL_THEBAN, THEBAN_BY_RANK,
+            ALL_CRUAC, CRUAC_BY_RANK,
+            ALL_BLOODLINE_DEVOTIONS_EXTENDED, PENUMBRAE_CRUAC
+        )
         
-        # Template-specific data
         self.vampire_data = {
             'clans': VAMPIRE_CLANS,
             'bloodlines': VAMPIRE_BLOODLINES,
@@ -158,6 +254,14 @@ class LookupData:
             'bloodlines_detailed': get_all_bloodlines(),
             'covenants_detailed': get_all_covenants()
         }
+    
+    def _load_mage(self):
+        """Load Mage data."""
+        from world.cofd.templates.mage import MAGE_PATHS, MAGE_ORDERS, MAGE_ARCANA, LEGACIES_BY_PATH, LEGACIES_BY_ORDER, UNLINKED_LEGACIES, ALL_LEGACIES
+        from world.cofd.powers.mage_paths import get_all_paths
+        from world.cofd.powers.mage_orders_detailed import get_all_orders_detailed
+        from world.cofd.powers.mage_legacies_detailed import get_all_legacies as get_all_legacies_detailed
+        from world.cofd.powers.mage_spells import ALL_MAGE_SPELLS
         
         self.mage_data = {
             'paths': MAGE_PATHS,
@@ -169,8 +273,72 @@ class LookupData:
             'all_legacies': ALL_LEGACIES,
             'paths_detailed': get_all_paths(),
             'orders_detailed': get_all_orders_detailed(),
-            'legacies_detailed': get_all_legacies_detailed()
+            'legacies_detailed': get_all_legacies_detailed(),
+            'spells': ALL_MAGE_SPELLS
         }
+    
+    def _load_werewolf(self):
+        """Load Werewolf data."""
+        from world.cofd.templates.werewolf import WEREWOLF_AUSPICES, WEREWOLF_TRIBES, WEREWOLF_LODGES
+        from world.cofd.powers.werewolf_gifts import ALL_WEREWOLF_GIFTS
+        from world.cofd.powers.werewolf_auspices import get_all_auspices
+        from world.cofd.powers.werewolf_tribes import get_all_tribes, get_all_lodges
+        
+        self.werewolf_data = {
+            'auspices': WEREWOLF_AUSPICES,
+            'tribes': WEREWOLF_TRIBES,
+            'lodges': WEREWOLF_LODGES,
+            'gifts': ALL_WEREWOLF_GIFTS,
+            'auspices_detailed': get_all_auspices(),
+            'tribes_detailed': get_all_tribes(),
+            'lodges_detailed': get_all_lodges()
+        }
+    
+    def _load_changeling(self):
+        """Load Changeling data."""
+        from world.cofd.templates.changeling import CHANGELING_SEEMINGS, CHANGELING_COURTS, CHANGELING_KITHS, CHANGELING_ENTITLEMENTS
+        from world.cofd.powers.changeling_contracts import ALL_CHANGELING_CONTRACTS
+        from world.cofd.powers.changeling_kiths import ALL_KITHS
+        from world.cofd.powers.changeling_seemings import get_all_seemings, get_all_entitlements
+        
+        self.changeling_data = {
+            'seemings': CHANGELING_SEEMINGS,
+            'contracts': ALL_CHANGELING_CONTRACTS,
+            'courts': CHANGELING_COURTS,
+            'kiths': CHANGELING_KITHS,
+            'kiths_detailed': ALL_KITHS,
+            'seemings_detailed': get_all_seemings(),
+            'entitlements': CHANGELING_ENTITLEMENTS,
+            'entitlements_detailed': get_all_entitlements()
+        }
+    
+    def _load_geist(self):
+        """Load Geist data."""
+        from world.cofd.templates.geist import GEIST_BURDENS, GEIST_KREWE_TYPES, GEIST_HAUNTS, GEIST_KEYS, GEIST_CEREMONIES
+        from world.cofd.powers.geist_powers import ALL_HAUNTS, GEIST_KEY_DETAILS
+        
+        self.geist_data = {
+            'burdens': GEIST_BURDENS,
+            'krewe_types': GEIST_KREWE_TYPES,
+            'haunts': GEIST_HAUNTS,
+            'haunts_detailed': ALL_HAUNTS,
+            'keys': GEIST_KEYS,
+            'keys_detailed': GEIST_KEY_DETAILS,
+            'ceremonies': GEIST_CEREMONIES
+        }
+    
+    def _load_demon(self):
+        """Load Demon data."""
+        from world.cofd.templates.demon import DEMON_INCARNATIONS, DEMON_AGENDAS
+        from world.cofd.powers.demon_form import (
+            DEMON_MODIFICATIONS, DEMON_TECHNOLOGIES, DEMON_PROPULSIONS, DEMON_PROCESSES,
+            ALL_DEMON_MODIFICATIONS, ALL_DEMON_TECHNOLOGIES, ALL_DEMON_PROPULSIONS, ALL_DEMON_PROCESSES
+        )
+        from world.cofd.powers.demon_powers import (
+            ALL_EMBEDS, DEMON_EXPLOITS,
+            EMBEDS_BY_INCARNATION, EMBEDS_CACOPHONY, EMBEDS_INSTRUMENTAL, EMBEDS_MUNDANE, EMBEDS_VOCAL,
+            ALL_EMBED_NAMES, ALL_EXPLOIT_NAMES
+        )
         
         self.demon_data = {
             'incarnations': DEMON_INCARNATIONS,
@@ -193,17 +361,15 @@ class LookupData:
             'propulsion_names': ALL_DEMON_PROPULSIONS,
             'process_names': ALL_DEMON_PROCESSES
         }
+    
+    def _load_mummy(self):
+        """Load Mummy data."""
+        from world.cofd.templates.mummy import (
+            MUMMY_GUILDS, MUMMY_DECREES, MUMMY_JUDGES,
+            MUMMY_AFFINITIES_DATA, MUMMY_UTTERANCES_DATA,
+            ALL_AFFINITY_NAMES, ALL_UTTERANCE_NAMES
+        )
         
-        self.mortal_plus_data = {
-            'types': ALL_MORTAL_PLUS_TYPES,
-            'psychic_powers': PSYCHIC_POWERS,
-            'demon_blooded_levels': DEMON_BLOODED_LEVELS,
-            'game_line_heritage': GAME_LINE_HERITAGE,
-            'wolf_blooded_tells': WOLF_BLOODED_TELLS,
-            'proximus_families': PROXIMUS_FAMILIES,
-        }
-        
-        # Mummy data
         self.mummy_data = {
             'guilds': MUMMY_GUILDS,
             'decrees': MUMMY_DECREES,
@@ -213,19 +379,25 @@ class LookupData:
             'utterance_names': ALL_UTTERANCE_NAMES,
             'affinity_names': ALL_AFFINITY_NAMES
         }
+    
+    def _load_promethean(self):
+        """Load Promethean data."""
+        from world.cofd.powers.promethean_powers import (
+            PROMETHEAN_TRANSMUTATIONS, PROMETHEAN_ALEMBICS, 
+            PROMETHEAN_BESTOWMENTS, PROMETHEAN_LINEAGES
+        )
+        from world.cofd.templates.legacy_promethean import ATHANORS_BY_LINEAGE
         
-        # Geist data
-        self.geist_data = {
-            'burdens': GEIST_BURDENS,
-            'krewe_types': GEIST_KREWE_TYPES,
-            'haunts': GEIST_HAUNTS,
-            'haunts_detailed': ALL_HAUNTS,
-            'keys': GEIST_KEYS,
-            'keys_detailed': GEIST_KEY_DETAILS,
-            'ceremonies': GEIST_CEREMONIES
+        self.promethean_data = {
+            'transmutations': PROMETHEAN_TRANSMUTATIONS,
+            'alembics': PROMETHEAN_ALEMBICS,
+            'bestowments': PROMETHEAN_BESTOWMENTS,
+            'lineages': PROMETHEAN_LINEAGES,
+            'athanors': ATHANORS_BY_LINEAGE
         }
-        
-        # Deviant data
+    
+    def _load_deviant(self):
+        """Load Deviant data."""
         from world.cofd.templates.deviant import (
             DEVIANT_ORIGINS, DEVIANT_CLADES, DEVIANT_VARIATIONS, DEVIANT_SCARS
         )
@@ -234,7 +406,7 @@ class LookupData:
             DEVIANT_ORIGINS_DETAILED, DEVIANT_CLADES_DETAILED,
             DEVIANT_ADAPTATIONS, ADAPTATION_CATEGORIES
         )
-        
+
         self.deviant_data = {
             'origins': DEVIANT_ORIGINS,
             'origins_detailed': DEVIANT_ORIGINS_DETAILED,
@@ -248,51 +420,13 @@ class LookupData:
             'adaptation_categories': ADAPTATION_CATEGORIES,
             'forms': DEVIANT_FORMS
         }
-        
-        self.changing_breeds_data = {
-            'breeds': LEGACY_CHANGING_BREEDS,
-            'categories': CHANGING_BREED_CATEGORIES,
-            'accords': CHANGING_BREED_ACCORDS,
-            'accord_specialties': ACCORD_SPECIALTIES,
-            'respect_types': RESPECT_TYPES,
-            'favors': CHANGING_BREED_FAVORS,
-            'aspects': CHANGING_BREED_ASPECTS,
-            'favor_names': ALL_FAVOR_NAMES,
-            'aspect_names': ALL_ASPECT_NAMES,
-            'trickster_aspects': TRICKSTER_ONLY_ASPECTS
-        }
-        
-        # Werewolf data
-        self.werewolf_data = {
-            'auspices': WEREWOLF_AUSPICES,
-            'tribes': WEREWOLF_TRIBES,
-            'lodges': WEREWOLF_LODGES,
-            'gifts': ALL_WEREWOLF_GIFTS,
-            'auspices_detailed': get_all_auspices(),
-            'tribes_detailed': get_all_tribes(),
-            'lodges_detailed': get_all_lodges()
-        }
-        
-        # Changeling data
-        self.changeling_data = {
-            'seemings': CHANGELING_SEEMINGS,
-            'contracts': ALL_CHANGELING_CONTRACTS,
-            'courts': CHANGELING_COURTS,
-            'kiths': CHANGELING_KITHS,
-            'kiths_detailed': ALL_KITHS,
-            'seemings_detailed': get_all_seemings(),
-            'entitlements': CHANGELING_ENTITLEMENTS,
-            'entitlements_detailed': get_all_entitlements()
-        }
-        
-        # Promethean data
-        self.promethean_data = {
-            'transmutations': PROMETHEAN_TRANSMUTATIONS,
-            'alembics': PROMETHEAN_ALEMBICS,
-            'bestowments': PROMETHEAN_BESTOWMENTS,
-            'lineages': PROMETHEAN_LINEAGES,
-            'athanors': ATHANORS_BY_LINEAGE
-        }
+    
+    def _load_hunter(self):
+        """Load Hunter data."""
+        from world.cofd.powers.hunter_endowments import ADVANCED_ARMORY, ANIMAL_CONTROL_KIT, BENEDICTION, CASTIGATION, DREAMSCAPE, ELIXIR, ENKOIMESIS, GOETIC_GOSPEL, HORROR_WITHIN, INFUSION, INK, INSPIRATION, LIVES_REMEMBERED, PERISPIRITISM, RELIC, RITES_DU_CHEVAL, RITES_OF_DENIAL, SEITOKUTEN, TELEINFORMATICS, THAUMATECHNOLOGY, XENOTECHNOLOGY
+        from world.cofd.templates.hunter import HUNTER_CONSPIRACIES, HUNTER_COMPACTS, HUNTER_TACTICS
+        from world.cofd.powers.hunter_tactics import get_all_tactics, MENTAL_TACTICS, PHYSICAL_TACTICS, SOCIAL_TACTICS
+        from world.cofd.powers.hunter_organizations import ALL_COMPACTS, ALL_CONSPIRACIES, get_all_organizations
         
         # Hunter data - need to build the endowments dict from imported modules
         hunter_endowments = {
@@ -332,215 +466,101 @@ class LookupData:
             'conspiracies_detailed': ALL_CONSPIRACIES,
             'organizations': get_all_organizations()
         }
+    
+    def _load_mortal_plus(self):
+        """Load Mortal Plus data."""
+        from world.cofd.templates.mortal_plus import (
+            ALL_MORTAL_PLUS_TYPES, PSYCHIC_POWERS, PROXIMUS_FAMILIES,
+            DEMON_BLOODED_LEVELS, GAME_LINE_HERITAGE, WOLF_BLOODED_TELLS
+        )
         
-        # Skill specialties
-        self.specialties = {
-            # Mental Skills
-            'academics': ['Anthropology', 'Art History', 'English', 'History', 'Law', 'Literature', 'Religion', 'Research', 'Translation'],
-            'computer': ['Data Retrieval', 'Graphics', 'Hacking', 'Internet', 'Programming', 'Security', 'Social Media'],
-            'crafts': ['Automotive', 'Cosmetics', 'Fashion', 'Forging', 'Graffiti', 'Jury-Rigging', 'Painting', 'Perfumery', 'Repair', 'Sculpting'],
-            'investigation': ['Artifacts', 'Autopsy', 'Body Language', 'Crime Scenes', 'Cryptography', 'Dreams', 'Lab Work', 'Riddles'],
-            'medicine': ['First Aid', 'Pathology', 'Pharmaceuticals', 'Physical Therapy', 'Surgery'],
-            'occult': ['Angels', 'Alchemy', 'Mystic Places', 'Casting Lots', 'Phrenology', 'Sorcery', 'Supernatural Being (specify)', 'Superstition', 'Witchcraft'],
-            'politics': ['Bureaucracy', 'Church', 'Democratic', 'Invictus', 'Local', 'Organized Crime', 'Scandals'],
-            'science': ['Physics', 'Chemistry', 'Neuroscience', 'Virology', 'Alchemy', 'Genetics', 'Hematology'],
-            # Physical Skills
-            'athletics': ['Acrobatics', 'Archery', 'Climbing', 'Jumping', 'Parkour', 'Swimming', 'Throwing'],
-            'brawl': ['Biting', 'Boxing', 'Dirty Fighting', 'Grappling', 'Martial Arts', 'Threats', 'Throws'],
-            'drive': ['Defensive Driving', 'Evasion', 'Off-Road Driving', 'Motorcycles', 'Pursuit', 'Stunts'],
-            'firearms': ['Handguns', 'Rifles', 'Shotguns', 'Trick Shots'],
-            'larceny': ['Breaking and Entering', 'Concealment', 'Lockpicking', 'Pickpocketing', 'Safecracking', 'Security Systems', 'Sleight of Hand'],
-            'stealth': ['Camouflage', 'Crowds', 'In Plain Sight', 'Rural', 'Shadowing', 'Stakeout', 'Staying Motionless'],
-            'survival': ['Foraging', 'Hunting', 'Navigation', 'Shelter', 'Weather'],
-            'weaponry': ['Chains', 'Clubs', 'Improvised Weapons', 'Spears', 'Swords'],
-            # Social Skills
-            'animal_ken': ['Animalism', 'Canines', 'Felines', 'Reptiles', 'Threatening', 'Training'],
-            'empathy': ['Calming', 'Emotion', 'Lies', 'Motives', 'Personalities'],
-            'expression': ['Dance', 'Drama', 'Journalism', 'Musical Instrument', 'Performance Art', 'Singing', 'Speeches'],
-            'intimidation': ['Direct Threats', 'Interrogation', 'Stare Down', 'Torture', 'Veiled Threats'],
-            'persuasion': ['Confidence Scam', 'Fast Talking', 'Inspiring', 'Sales Pitch', 'Seduction', 'Sermon'],
-            'socialize': ['Bar Hopping', 'Church Lock-in', 'Dress Balls', 'Formal Events', 'Frat Parties', 'Political Fundraisers', 'the Club'],
-            'streetwise': ['Black Market', 'Gangs', 'Navigation', 'Rumors', 'Undercover'],
-            'subterfuge': ['Detecting Lies', 'Doublespeak', 'Hiding Emotion', 'Little White Lies', 'Misdirection']
+        self.mortal_plus_data = {
+            'types': ALL_MORTAL_PLUS_TYPES,
+            'psychic_powers': PSYCHIC_POWERS,
+            'demon_blooded_levels': DEMON_BLOODED_LEVELS,
+            'game_line_heritage': GAME_LINE_HERITAGE,
+            'wolf_blooded_tells': WOLF_BLOODED_TELLS,
+            'proximus_families': PROXIMUS_FAMILIES,
+        }
+    
+    def _load_changing_breeds(self):
+        """Load Changing Breeds data."""
+        from world.cofd.powers.changing_breeds_favors import (
+            CHANGING_BREED_FAVORS, CHANGING_BREED_ASPECTS,
+            ALL_FAVOR_NAMES, ALL_ASPECT_NAMES, TRICKSTER_ONLY_ASPECTS
+        )
+        from world.cofd.templates.legacy_changingbreeds import (
+            LEGACY_CHANGING_BREEDS, CHANGING_BREED_CATEGORIES,
+            CHANGING_BREED_ACCORDS, ACCORD_SPECIALTIES, RESPECT_TYPES
+        )
+        
+        self.changing_breeds_data = {
+            'breeds': LEGACY_CHANGING_BREEDS,
+            'categories': CHANGING_BREED_CATEGORIES,
+            'accords': CHANGING_BREED_ACCORDS,
+            'accord_specialties': ACCORD_SPECIALTIES,
+            'respect_types': RESPECT_TYPES,
+            'favors': CHANGING_BREED_FAVORS,
+            'aspects': CHANGING_BREED_ASPECTS,
+            'favor_names': ALL_FAVOR_NAMES,
+            'aspect_names': ALL_ASPECT_NAMES,
+            'trickster_aspects': TRICKSTER_ONLY_ASPECTS
         }
     
     def find_stat(self, stat_name):
         """Find a stat by name across all categories."""
-        stat_name = stat_name.lower().replace(" ", "_")
-        
-        # Check attributes
-        if stat_name in self.attributes:
-            return ('attribute', self.attributes[stat_name])
-        
-        # Check skills
-        if stat_name in self.skills:
-            return ('skill', self.skills[stat_name])
-        
-        # Check advantages
-        if stat_name in self.advantages:
-            return ('advantage', self.advantages[stat_name])
-        
-        # Check anchors
-        if stat_name in self.anchors:
-            return ('anchor', self.anchors[stat_name])
-        
-        # Check merits
-        for merit in self.all_merits:
-            if merit.name.lower().replace(" ", "_") == stat_name:
-                return ('merit', merit)
-        
+        matches = self.find(stat_name, self.STAT_CATEGORIES)
+        if matches:
+            category, key, data = matches[0]
+            return (category, data)
         return None
     
-    def search_stats(self, search_term):
-        """Search for stats containing the given term."""
-        search_term = search_term.lower()
-        results = []
-        
-        # Search attributes
-        for name, attr in self.attributes.items():
-            if search_term in name.lower():
-                results.append(('attribute', name, attr))
-        
-        # Search skills
-        for name, skill in self.skills.items():
-            if search_term in name.lower():
-                results.append(('skill', name, skill))
-        
-        # Search merits
-        for merit in self.all_merits:
-            if (search_term in merit.name.lower() or 
-                search_term in merit.description.lower()):
-                results.append(('merit', merit.name, merit))
-        
-        # Search disciplines
-        for discipline in self.vampire_data['disciplines']:
-            if search_term in discipline.lower():
-                results.append(('discipline', discipline, None))
-        
-        # Search discipline powers
-        for power_key, power_data in self.vampire_data['discipline_powers'].items():
-            if (search_term in power_key.lower() or 
-                search_term in power_data['name'].lower() or
-                search_term in power_data['description'].lower()):
-                results.append(('discipline_power', power_data['name'], power_data))
-        
-        # Search ritual powers (Scales, Theban, Cruac)
-        for ritual_key, ritual_data in self.vampire_data['scales'].items():
-            if (search_term in ritual_key.lower() or
-                search_term in ritual_data['name'].lower() or
-                search_term in ritual_data['description'].lower()):
-                results.append(('ritual', ritual_data['name'], ritual_data))
-        
-        for miracle_key, miracle_data in self.vampire_data['theban'].items():
-            if (search_term in miracle_key.lower() or
-                search_term in miracle_data['name'].lower() or
-                search_term in miracle_data['description'].lower()):
-                results.append(('ritual', miracle_data['name'], miracle_data))
-        
-        for rite_key, rite_data in self.vampire_data['cruac'].items():
-            if (search_term in rite_key.lower() or
-                search_term in rite_data['name'].lower() or
-                search_term in rite_data['description'].lower()):
-                results.append(('ritual', rite_data['name'], rite_data))
-        
-        # Search werewolf gifts
-        for gift_key, gift_data in self.werewolf_data['gifts'].items():
-            if (search_term in gift_key.lower() or
-                search_term in gift_data['name'].lower() or
-                search_term in gift_data['description'].lower()):
-                results.append(('gift', gift_data['name'], gift_data))
-        
-        # Search changeling contracts
-        for contract_key, contract_data in self.changeling_data['contracts'].items():
-            if (search_term in contract_key.lower() or
-                search_term in contract_data['name'].lower() or
-                search_term in contract_data['description'].lower()):
-                results.append(('contract', contract_data['name'], contract_data))
-        
-        # Search geist keys
-        for key_name, key_data in self.geist_data['keys_detailed'].items():
-            if (search_term in key_name.lower() or
-                search_term in key_data['name'].lower() or
-                search_term in key_data['description'].lower()):
-                results.append(('key', key_data['name'], key_data))
-        
-        # Search geist haunts
-        for haunt_name, haunt_powers in self.geist_data['haunts_detailed'].items():
-            for power_key, power_data in haunt_powers.items():
-                if (search_term in haunt_name.lower() or
-                    search_term in power_key.lower() or
-                    search_term in power_data['name'].lower() or
-                    search_term in power_data['description'].lower()):
-                    results.append(('haunt', power_data['name'], power_data))
-        
-        # Search arcana
-        for arcanum in self.mage_data['arcana']:
-            if search_term in arcanum.lower():
-                results.append(('arcanum', arcanum, None))
-        
-        # Search mummy affinities
-        for affinity_key, affinity_data in self.mummy_data['affinities'].items():
-            if (search_term in affinity_key.lower() or
-                search_term in affinity_data['name'].lower() or
-                search_term in affinity_data['description'].lower()):
-                results.append(('affinity', affinity_data['name'], affinity_data))
-        
-        # Search mummy utterances
-        for utterance_key, utterance_data in self.mummy_data['utterances'].items():
-            if (search_term in utterance_key.lower() or
-                search_term in utterance_data['name'].lower() or
-                search_term in utterance_data['description'].lower()):
-                results.append(('utterance', utterance_data['name'], utterance_data))
-        
-        # Search demon modifications
-        for mod_key, mod_data in self.demon_data['modifications'].items():
-            if (search_term in mod_key.lower() or
-                search_term in mod_data['name'].lower() or
-                search_term in mod_data['system'].lower() or
-                search_term in mod_data['appearance'].lower()):
-                results.append(('demon_modification', mod_data['name'], mod_data))
-        
-        # Search demon technologies
-        for tech_key, tech_data in self.demon_data['technologies'].items():
-            if (search_term in tech_key.lower() or
-                search_term in tech_data['name'].lower() or
-                search_term in tech_data['system'].lower() or
-                search_term in tech_data['appearance'].lower()):
-                results.append(('demon_technology', tech_data['name'], tech_data))
-        
-        # Search demon propulsions
-        for prop_key, prop_data in self.demon_data['propulsions'].items():
-            if (search_term in prop_key.lower() or
-                search_term in prop_data['name'].lower() or
-                search_term in prop_data['system'].lower() or
-                search_term in prop_data['appearance'].lower()):
-                results.append(('demon_propulsion', prop_data['name'], prop_data))
-        
-        # Search demon processes
-        for proc_key, proc_data in self.demon_data['processes'].items():
-            if (search_term in proc_key.lower() or
-                search_term in proc_data['name'].lower() or
-                search_term in proc_data['system'].lower() or
-                search_term in proc_data['appearance'].lower()):
-                results.append(('demon_process', proc_data['name'], proc_data))
-        
-        # Search demon embeds
-        for embed_key, embed_data in self.demon_data['embeds'].items():
-            if (search_term in embed_key.lower() or
-                search_term in embed_data['name'].lower() or
-                search_term in embed_data.get('description', '').lower() or
-                search_term in embed_data.get('effect', '').lower()):
-                results.append(('demon_embed', embed_data['name'], embed_data))
+    def find(self, name, categories=None):
+        """
+        Look up a name across key index categories, loading their game lines.
+        
+        Args:
+            name (str): User-supplied name, in any case or spacing
+            categories (list): Categories to check, in priority order.
+                Defaults to every category, which loads every game line.
+                
+        Returns:
+            list: (category, key, data) tuples
+        """
+        if categories is None:
+            self.load_all()
+        else:
+            for category in categories:
+                self.load_game_line(KEY_CATEGORY_LINES.get(category, 'core'))
+        return self.key_index.find(name, categories)
+    
+    def resolve(self, name, category):
+        """
+        Resolve a name to its canonical key and data within one category.
         
-        # Search demon exploits
-        for exploit_key, exploit_data in self.demon_data['exploits'].items():
-            if (search_term in exploit_key.lower() or
-                search_term in exploit_data['name'].lower() or
-                search_term in exploit_data.get('description', '').lower() or
-                search_term in exploit_data.get('effect', '').lower()):
-                results.append(('demon_exploit', exploit_data['name'], exploit_data))
+        Args:
+            name (str): User-supplied name, in any case or spacing
+            category (str): Key index category (e.g. 'merit', 'gift', 'court')
+            
+        Returns:
+            tuple: (key, data) or None if not found
+        """
+        self.load_game_line(KEY_CATEGORY_LINES.get(category, 'core'))
+        return self.key_index.get(name, category)
+    
+    def find_merit(self, merit_name):
+        """Find a merit object by name, or None."""
+        result = self.resolve(merit_name, 'merit')
+        return result[1] if result else None
+    
+    def search_stats(self, search_term):
+        """
+        Search for stats matching the given term.
         
-        return results
+        Results come from the prebuilt inverted index and are ranked by
+        where the term matched (key > name > description).
+        """
+        return self.search_index.search(search_term)
     
     def get_merits_by_type(self, merit_type=None, template=None):
         """Get merits filtered by type and/or template."""
@@ -686,8 +706,15 @@ class LookupData:
         return ", ".join(display_parts)
 
 
+# Attribute name -> game line that provides it, for LookupData.__getattr__
+_LAZY_ATTRIBUTES = {
+    attribute: game_line
+    for game_line, attributes in LookupData.GAME_LINES.items()
+    for attribute in attributes
+}
+
 # Global instance for easy access
-LOOKUP_DATA = LookupData()
+LOOKUP_DATA = LookupData(snapshot=LookupSnapshot())
 
 
 def get_attribute_description(attr_name):
@@ -0,0 +1,503 @@
+"""
+Indexes over the consolidated CoFD lookup data.
+
+SearchIndex is an inverted full-text index for +lookup/search, and KeyIndex
+maps canonical stat keys to their data for O(1) detail lookups. Both are
+built once over everything LookupData aggregates so commands never lower
+and scan every merit, power and description per call.
+"""
+
+import re
+from bisect import bisect_left
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+KEY_STRIP_PATTERN = re.compile(r"[()'\u2019:,.!?]")
+KEY_SEPARATOR_PATTERN = re.compile(r"[\s\-_]+")
+
+# Relative weight of the field a token was found in (key > name > description)
+FIELD_WEIGHTS = {
+    'key': 3,
+    'name': 2,
+    'description': 1,
+}
+
+# Multipliers for how a query term matched an indexed token
+EXACT_MATCH = 3
+PREFIX_MATCH = 2
+INFIX_MATCH = 1
+
+DEFAULT_PAGE_SIZE = 20
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def normalize_key(name):
+    """
+    Canonicalize a stat name or key for index lookups.
+
+    "Jack-of-All-Trades", "jack of all trades" and "jack_of_all_trades"
+    all normalize to "jack_of_all_trades".
+    """
+    key = KEY_STRIP_PATTERN.sub("", str(name).strip().lower())
+    return KEY_SEPARATOR_PATTERN.sub("_", key).strip("_")
+
+
+def trigrams(token):
+    """Return the set of character trigrams for a token."""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class SearchIndex:
+    """
+    Tokenized inverted index with prefix and trigram (infix) matching.
+
+    Entries are stored as (stat_type, name, data) tuples, the same shape
+    LookupData.search_stats has always returned.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.postings = {}
+        self.vocabulary = []
+        self.trigram_index = {}
+
+    def add(self, stat_type, name, data, key=None, texts=()):
+        """
+        Add an entry to the index.
+
+        Args:
+            stat_type (str): Result category (merit, gift, spell, ...)
+            name (str): Display name of the entry
+            data: Underlying data object or dict
+            key (str): Lookup key for the entry, if any
+            texts (iterable): Description-like fields to index
+        """
+        entry_id = len(self.entries)
+        self.entries.append((stat_type, name, data))
+
+        fields = [('key', key), ('name', name)]
+        fields.extend(('description', text) for text in texts)
+
+        for field, text in fields:
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                posting = self.postings.setdefault(token, {})
+                if posting.get(entry_id, 0) < weight:
+                    posting[entry_id] = weight
+
+    def finalize(self):
+        """Build the sorted vocabulary and trigram index after all adds."""
+        self.vocabulary = sorted(self.postings)
+        self.trigram_index = {}
+        for token in self.vocabulary:
+            for gram in trigrams(token):
+                self.trigram_index.setdefault(gram, set()).add(token)
+
+    def _matching_tokens(self, term):
+        """Map every indexed token matching a query term to its match multiplier."""
+        matches = {}
+
+        # Prefix matches are a contiguous run of the sorted vocabulary
+        start = bisect_left(self.vocabulary, term)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches[token] = EXACT_MATCH if token == term else PREFIX_MATCH
+
+        # Infix matches narrowed down by shared trigrams
+        if len(term) >= 3:
+            candidates = None
+            for gram in trigrams(term):
+                tokens = self.trigram_index.get(gram)
+                if not tokens:
+                    candidates = set()
+                    break
+                candidates = set(tokens) if candidates is None else candidates & tokens
+            for token in candidates or ():
+                if token not in matches and term in token:
+                    matches[token] = INFIX_MATCH
+
+        return matches
+
+    def search(self, query):
+        """
+        Search the index.
+
+        Every query term must match an entry. Entries are ranked by the sum
+        over terms of field weight times match quality, then by name.
+
+        Returns:
+            list: (stat_type, name, data) tuples in rank order
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for token, multiplier in self._matching_tokens(term).items():
+                for entry_id, weight in self.postings[token].items():
+                    score = weight * multiplier
+                    if term_scores.get(entry_id, 0) < score:
+                        term_scores[entry_id] = score
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {entry_id: scores[entry_id] + score
+                          for entry_id, score in term_scores.items()
+                          if entry_id in scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(),
+                        key=lambda item: (-item[1], str(self.entries[item[0]][1]).lower()))
+        return [self.entries[entry_id] for entry_id, _ in ranked]
+
+
+class KeyIndex:
+    """
+    Canonical-key index mapping normalized names and aliases to stat data.
+
+    A single name may exist in several categories (Resilience is both a
+    Discipline and a Merit), so each key maps to {category: (key, data)}
+    where key is the original key used by the source data module.
+    """
+
+    def __init__(self):
+        self.keys = {}
+
+    def add(self, category, key, data, aliases=()):
+        """Register data under its key and any aliases for a category."""
+        for name in (key, *aliases):
+            if not name:
+                continue
+            entries = self.keys.setdefault(normalize_key(name), {})
+            entries.setdefault(category, (key, data))
+
+    def get(self, name, category):
+        """
+        Look up a name within a single category.
+
+        Returns:
+            tuple: (key, data) or None if not found
+        """
+        entries = self.keys.get(normalize_key(name))
+        if not entries:
+            return None
+        return entries.get(category)
+
+    def find(self, name, categories=None):
+        """
+        Look up a name across categories.
+
+        Args:
+            name (str): The name to resolve
+            categories (list): Categories to check, in priority order.
+                Defaults to every category the name is registered in.
+
+        Returns:
+            list: (category, key, data) tuples
+        """
+        entries = self.keys.get(normalize_key(name))
+        if not entries:
+            return []
+        if categories is None:
+            categories = entries
+        return [(category, *entries[category]) for category in categories if category in entries]
+
+
+def paginate(results, page=1, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Slice a result list into a page.
+
+    Returns:
+        tuple: (page_results, page, total_pages) with page clamped to range
+    """
+    total_pages = max(1, (len(results) + page_size - 1) // page_size)
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+    return results[start:start + page_size], page, total_pages
+
+
+def _add_dict_entries(index, stat_type, source, text_fields=('description',)):
+    """Index a {key: {'name': ..., <text fields>}} data dictionary."""
+    for key, data in source.items():
+        name = data.get('name', key.replace('_', ' ').title())
+        texts = [data.get(field, '') for field in text_fields]
+        index.add(stat_type, name, data, key=key, texts=texts)
+
+
+def build_search_index(lookup_data):
+    """
+    Build the search index over all data aggregated by a LookupData instance.
+
+    Touches every game line, so all of them are loaded as a side effect.
+
+    Args:
+        lookup_data (LookupData): The consolidated lookup data
+
+    Returns:
+        SearchIndex: A finalized index ready for queries
+    """
+    index = SearchIndex()
+
+    for name, attr in lookup_data.attributes.items():
+        index.add('attribute', name, attr, key=name, texts=[attr.description])
+
+    for name, skill in lookup_data.skills.items():
+        index.add('skill', name, skill, key=name, texts=[skill.description])
+
+    for merit in lookup_data.all_merits:
+        index.add('merit', merit.name, merit, texts=[merit.description])
+
+    vampire = lookup_data.vampire_data
+    for discipline in vampire['disciplines']:
+        index.add('discipline', discipline, None, key=discipline)
+    _add_dict_entries(index, 'discipline_power', vampire['discipline_powers'])
+    _add_dict_entries(index, 'discipline_power', vampire['coils'])
+    _add_dict_entries(index, 'discipline_power', vampire['bloodline_disciplines'])
+    _add_dict_entries(index, 'devotion', vampire['devotions'])
+    _add_dict_entries(index, 'ritual', vampire['scales'])
+    _add_dict_entries(index, 'ritual', vampire['theban'])
+    _add_dict_entries(index, 'ritual', vampire['cruac'])
+
+    for arcanum in lookup_data.mage_data['arcana']:
+        index.add('arcanum', arcanum, None, key=arcanum)
+    _add_dict_entries(index, 'spell', lookup_data.mage_data['spells'])
+
+    _add_dict_entries(index, 'gift', lookup_data.werewolf_data['gifts'])
+    _add_dict_entries(index, 'contract', lookup_data.changeling_data['contracts'])
+    _add_dict_entries(index, 'key', lookup_data.geist_data['keys_detailed'])
+
+    for haunt_name, haunt_powers in lookup_data.geist_data['haunts_detailed'].items():
+        for power_key, power_data in haunt_powers.items():
+            index.add('haunt', power_data['name'], power_data, key=power_key,
+                      texts=[haunt_name, power_data.get('description', '')])
+
+    _add_dict_entries(index, 'affinity', lookup_data.mummy_data['affinities'])
+    _add_dict_entries(index, 'utterance', lookup_data.mummy_data['utterances'])
+
+    demon = lookup_data.demon_data
+    form_fields = ('system', 'appearance')
+    _add_dict_entries(index, 'demon_modification', demon['modifications'], form_fields)
+    _add_dict_entries(index, 'demon_technology', demon['technologies'], form_fields)
+    _add_dict_entries(index, 'demon_propulsion', demon['propulsions'], form_fields)
+    _add_dict_entries(index, 'demon_process', demon['processes'], form_fields)
+    _add_dict_entries(index, 'demon_embed', demon['embeds'], ('description', 'effect'))
+    _add_dict_entries(index, 'demon_exploit', demon['exploits'], ('description', 'effect'))
+
+    _add_dict_entries(index, 'endowment', lookup_data.hunter_data['endowments'])
+    _add_dict_entries(index, 'tactic', lookup_data.hunter_data['tactics_detailed'])
+
+    index.finalize()
+    return index
+
+
+def _add_keyed_entries(index, category, source):
+    """Index a {key: data} dictionary, aliasing dict data by its display names."""
+    for key, data in source.items():
+        aliases = []
+        if isinstance(data, dict):
+            aliases.append(data.get('name'))
+            alternate_names = data.get('alternate_names')
+            if isinstance(alternate_names, (list, tuple)):
+                aliases.extend(alternate_names)
+        elif hasattr(data, 'name'):
+            aliases.append(data.name)
+        index.add(category, key, data, aliases)
+
+
+def _add_listed_entries(index, category, source):
+    """Index a list of names, where the name is both key and data."""
+    for name in source:
+        index.add(category, name, name)
+
+
+def _index_core_keys(index, lookup_data):
+    _add_keyed_entries(index, 'attribute', lookup_data.attributes)
+    _add_keyed_entries(index, 'skill', lookup_data.skills)
+    _add_keyed_entries(index, 'advantage', lookup_data.advantages)
+    _add_keyed_entries(index, 'anchor', lookup_data.anchors)
+
+
+def _index_merit_keys(index, lookup_data):
+    for merit in lookup_data.all_merits:
+        index.add('merit', merit.name, merit)
+
+
+def _index_vampire_keys(index, lookup_data):
+    vampire = lookup_data.vampire_data
+    _add_listed_entries(index, 'discipline', vampire['disciplines'])
+    _add_keyed_entries(index, 'discipline_power', vampire['discipline_powers'])
+    _add_keyed_entries(index, 'coil', vampire['coils'])
+    _add_keyed_entries(index, 'bloodline_discipline', vampire['bloodline_disciplines'])
+    _add_keyed_entries(index, 'devotion', vampire['devotions'])
+    for rituals in ('scales', 'theban', 'cruac', 'penumbrae_cruac'):
+        _add_keyed_entries(index, 'ritual', vampire[rituals])
+    _add_keyed_entries(index, 'clan', vampire['clans_detailed'])
+    _add_listed_entries(index, 'clan', vampire['clans'])
+    _add_keyed_entries(index, 'bloodline', vampire['bloodlines_detailed'])
+    _add_listed_entries(index, 'bloodline', vampire['bloodlines'])
+    _add_keyed_entries(index, 'covenant', vampire['covenants_detailed'])
+    _add_listed_entries(index, 'covenant', vampire['covenants'])
+
+
+def _index_mage_keys(index, lookup_data):
+    mage = lookup_data.mage_data
+    _add_listed_entries(index, 'arcanum', mage['arcana'])
+    _add_keyed_entries(index, 'spell', mage['spells'])
+    _add_keyed_entries(index, 'path', mage['paths_detailed'])
+    _add_keyed_entries(index, 'order', mage['orders_detailed'])
+    _add_keyed_entries(index, 'legacy', mage['legacies_detailed'])
+
+
+def _index_werewolf_keys(index, lookup_data):
+    werewolf = lookup_data.werewolf_data
+    _add_keyed_entries(index, 'gift', werewolf['gifts'])
+    _add_keyed_entries(index, 'auspice', werewolf['auspices_detailed'])
+    _add_keyed_entries(index, 'tribe', werewolf['tribes_detailed'])
+    _add_keyed_entries(index, 'lodge', werewolf['lodges_detailed'])
+
+
+def _index_changeling_keys(index, lookup_data):
+    changeling = lookup_data.changeling_data
+    _add_keyed_entries(index, 'contract', changeling['contracts'])
+    _add_keyed_entries(index, 'seeming', changeling['seemings_detailed'])
+    _add_listed_entries(index, 'court', changeling['courts'])
+    _add_keyed_entries(index, 'kith', changeling['kiths_detailed'])
+    _add_keyed_entries(index, 'entitlement', changeling['entitlements_detailed'])
+
+
+def _index_geist_keys(index, lookup_data):
+    geist = lookup_data.geist_data
+    _add_keyed_entries(index, 'key', geist['keys_detailed'])
+    _add_keyed_entries(index, 'haunt', geist['haunts_detailed'])
+    _add_listed_entries(index, 'burden', geist['burdens'])
+    _add_listed_entries(index, 'krewe', geist['krewe_types'])
+    _add_listed_entries(index, 'ceremony', geist['ceremonies'])
+
+
+def _index_demon_keys(index, lookup_data):
+    demon = lookup_data.demon_data
+    _add_listed_entries(index, 'incarnation', demon['incarnations'])
+    _add_listed_entries(index, 'agenda', demon['agendas'])
+    _add_keyed_entries(index, 'embed', demon['embeds'])
+    _add_keyed_entries(index, 'exploit', demon['exploits'])
+    _add_keyed_entries(index, 'demon_modification', demon['modifications'])
+    _add_keyed_entries(index, 'demon_technology', demon['technologies'])
+    _add_keyed_entries(index, 'demon_propulsion', demon['propulsions'])
+    _add_keyed_entries(index, 'demon_process', demon['processes'])
+
+
+def _index_mummy_keys(index, lookup_data):
+    mummy = lookup_data.mummy_data
+    _add_listed_entries(index, 'guild', mummy['guilds'])
+    _add_listed_entries(index, 'decree', mummy['decrees'])
+    _add_listed_entries(index, 'judge', mummy['judges'])
+    _add_keyed_entries(index, 'utterance', mummy['utterances'])
+    _add_keyed_entries(index, 'affinity', mummy['affinities'])
+
+
+def _index_promethean_keys(index, lookup_data):
+    promethean = lookup_data.promethean_data
+    _add_listed_entries(index, 'transmutation', promethean['transmutations'])
+    _add_listed_entries(index, 'bestowment', promethean['bestowments'])
+    _add_listed_entries(index, 'lineage', promethean['lineages'])
+
+
+def _index_deviant_keys(index, lookup_data):
+    deviant = lookup_data.deviant_data
+    _add_listed_entries(index, 'origin', deviant['origins'])
+    _add_listed_entries(index, 'clade', deviant['clades'])
+    _add_keyed_entries(index, 'variation', deviant['variations_detailed'])
+    _add_keyed_entries(index, 'scar', deviant['scars_detailed'])
+    _add_keyed_entries(index, 'adaptation', deviant['adaptations'])
+
+
+def _index_hunter_keys(index, lookup_data):
+    hunter = lookup_data.hunter_data
+    _add_keyed_entries(index, 'endowment', hunter['endowments'])
+    _add_keyed_entries(index, 'tactic', hunter['tactics_detailed'])
+    _add_keyed_entries(index, 'compact', hunter['compacts_detailed'])
+    _add_keyed_entries(index, 'conspiracy', hunter['conspiracies_detailed'])
+
+
+def _index_mortal_plus_keys(index, lookup_data):
+    mortal_plus = lookup_data.mortal_plus_data
+    _add_listed_entries(index, 'mortal_plus_type', mortal_plus['types'])
+    _add_listed_entries(index, 'psychic_power', mortal_plus['psychic_powers'])
+    _add_listed_entries(index, 'wolf_blooded_tell', mortal_plus['wolf_blooded_tells'])
+
+
+def _index_changing_breeds_keys(index, lookup_data):
+    _add_keyed_entries(index, 'favor', lookup_data.changing_breeds_data['favors'])
+    _add_keyed_entries(index, 'aspect', lookup_data.changing_breeds_data['aspects'])
+
+
+# Key index sections per game line. LookupData adds a section when it loads
+# that game line, so only loaded lines pay for indexing.
+KEY_INDEX_SECTIONS = {
+    'core': _index_core_keys,
+    'merits': _index_merit_keys,
+    'vampire': _index_vampire_keys,
+    'mage': _index_mage_keys,
+    'werewolf': _index_werewolf_keys,
+    'changeling': _index_changeling_keys,
+    'geist': _index_geist_keys,
+    'demon': _index_demon_keys,
+    'mummy': _index_mummy_keys,
+    'promethean': _index_promethean_keys,
+    'deviant': _index_deviant_keys,
+    'hunter': _index_hunter_keys,
+    'mortal_plus': _index_mortal_plus_keys,
+    'changing_breeds': _index_changing_breeds_keys,
+}
+
+# Game line that provides each key index category
+KEY_CATEGORY_LINES = {
+    'attribute': 'core', 'skill': 'core', 'advantage': 'core', 'anchor': 'core',
+    'merit': 'merits',
+    'discipline': 'vampire', 'discipline_power': 'vampire', 'coil': 'vampire',
+    'bloodline_discipline': 'vampire', 'devotion': 'vampire', 'ritual': 'vampire',
+    'clan': 'vampire', 'bloodline': 'vampire', 'covenant': 'vampire',
+    'arcanum': 'mage', 'spell': 'mage', 'path': 'mage', 'order': 'mage', 'legacy': 'mage',
+    'gift': 'werewolf', 'auspice': 'werewolf', 'tribe': 'werewolf', 'lodge': 'werewolf',
+    'contract': 'changeling', 'seeming': 'changeling', 'court': 'changeling',
+    'kith': 'changeling', 'entitlement': 'changeling',
+    'key': 'geist', 'haunt': 'geist', 'burden': 'geist', 'krewe': 'geist', 'ceremony': 'geist',
+    'incarnation': 'demon', 'agenda': 'demon', 'embed': 'demon', 'exploit': 'demon',
+    'demon_modification': 'demon', 'demon_technology': 'demon',
+    'demon_propulsion': 'demon', 'demon_process': 'demon',
+    'guild': 'mummy', 'decree': 'mummy', 'judge': 'mummy',
+    'utterance': 'mummy', 'affinity': 'mummy',
+    'transmutation': 'promethean', 'bestowment': 'promethean', 'lineage': 'promethean',
+    'origin': 'deviant', 'clade': 'deviant', 'variation': 'deviant',
+    'scar': 'deviant', 'adaptation': 'deviant',
+    'endowment': 'hunter', 'tactic': 'hunter', 'compact': 'hunter', 'conspiracy': 'hunter',
+    'mortal_plus_type': 'mortal_plus', 'psychic_power': 'mortal_plus',
+    'wolf_blooded_tell': 'mortal_plus',
+    'favor': 'changing_breeds', 'aspect': 'changing_breeds',
+}
+
+
+def build_key_index(lookup_data):
+    """
+    Build the canonical-key index over all data aggregated by LookupData.
+
+    Args:
+        lookup_data (LookupData): The consolidated lookup data
+
+    Returns:
+        KeyIndex: Index shared by +lookup detail pages and +stat validation
+    """
+    index = KeyIndex()
+    for add_section in KEY_INDEX_SECTIONS.values():
+        add_section(index, lookup_data)
+    return index
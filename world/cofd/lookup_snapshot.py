@@ -0,0 +1,144 @@
+"""
+Versioned binary snapshot of the +lookup reference data.
+
+Executing the large dict-literal modules under world/cofd/powers, merits and
+templates dominates LookupData load time, especially after an edit when the
+bytecode caches are stale. The build step pickles every game line's data into
+one file, stamped with a format version and a hash of the source modules.
+LookupData uses the snapshot only while that hash still matches and falls back
+to importing the modules otherwise, so a stale snapshot is never served.
+
+Each game line is pickled separately, so lazy per-line loading still applies.
+
+Build or refresh the snapshot with:
+    python -m world.cofd.lookup_snapshot
+"""
+
+import hashlib
+import os
+import pickle
+
+# Bump when the snapshot layout or the shape of LookupData's game line data changes
+SNAPSHOT_VERSION = 1
+
+COFD_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(COFD_DIR, "lookup_snapshot.bin")
+
+# Source modules the snapshot is built from, relative to world/cofd
+SOURCE_PATHS = (
+    "powers", "merits", "templates",
+    "stat_types.py", "stat_dictionary.py", "lookup_data.py",
+)
+
+
+def _source_files():
+    """Yield every source file covered by the hash, in a stable order."""
+    for relative in SOURCE_PATHS:
+        path = os.path.join(COFD_DIR, relative)
+        if os.path.isfile(path):
+            yield relative, path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for filename in sorted(files):
+                if filename.endswith(".py"):
+                    full_path = os.path.join(root, filename)
+                    yield os.path.relpath(full_path, COFD_DIR), full_path
+
+
+def source_hash():
+    """
+    Hash the reference data source modules.
+
+    Returns:
+        str: SHA-256 hex digest over file names and contents
+    """
+    digest = hashlib.sha256(f"v{SNAPSHOT_VERSION}".encode())
+    for relative, path in _source_files():
+        digest.update(relative.replace(os.sep, "/").encode())
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+class LookupSnapshot:
+    """
+    Read side of the snapshot, opened on the first game line request.
+
+    status is one of 'unread', 'loaded', 'missing', 'stale' or 'corrupt'.
+    Anything but 'loaded' makes get() return None so the caller imports
+    the source modules instead.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = path
+        self.status = "unread"
+        self._lines = {}
+
+    def load(self):
+        """Read and verify the snapshot file once."""
+        if self.status != "unread":
+            return
+        try:
+            with open(self.path, "rb") as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+        except FileNotFoundError:
+            self.status = "missing"
+            return
+        except Exception:
+            self.status = "corrupt"
+            return
+
+        if (not isinstance(snapshot, dict)
+                or snapshot.get("version") != SNAPSHOT_VERSION
+                or snapshot.get("source_hash") != source_hash()):
+            self.status = "stale"
+            return
+
+        self._lines = snapshot["lines"]
+        self.status = "loaded"
+
+    def get(self, game_line):
+        """
+        Get the attributes for one game line.
+
+        Returns:
+            dict: {attribute name: value}, or None if the snapshot can't be used
+        """
+        self.load()
+        payload = self._lines.get(game_line)
+        if payload is None:
+            return None
+        return pickle.loads(payload)
+
+
+def build_snapshot(path=SNAPSHOT_PATH):
+    """
+    Import every game line from source and write the snapshot.
+
+    Returns:
+        tuple: (path, source hash, size in bytes)
+    """
+    from world.cofd.lookup_data import LookupData
+
+    # Build from the source modules, never from an existing snapshot
+    lookup_data = LookupData(snapshot=None)
+    lines = {}
+    for game_line, attributes in LookupData.GAME_LINES.items():
+        values = {attribute: getattr(lookup_data, attribute) for attribute in attributes}
+        lines[game_line] = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+    digest = source_hash()
+    snapshot = {"version": SNAPSHOT_VERSION, "source_hash": digest, "lines": lines}
+
+    # Write atomically so a running server never reads a partial file
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    return path, digest, os.path.getsize(path)
+
+
+if __name__ == "__main__":
+    snapshot_path, digest, size = build_snapshot()
+    print(f"Wrote {snapshot_path} ({size} bytes, source hash {digest[:12]})")
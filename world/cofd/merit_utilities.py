@@ -66,12 +66,8 @@ def set_merit(character, merit_key, merit_obj, dots, caller):
     # Parse instance if present
     base_merit_name, instance_name = parse_merit_instance(merit_key)
     
-    # Ensure merits category exists
-    if "merits" not in character.db.stats:
-        character.db.stats["merits"] = {}
-    
     # Store merit data with full key (including instance if present)
-    character.db.stats["merits"][merit_key] = {
+    merit_data = {
         "dots": dots,
         "max_dots": merit_obj.max_value,
         "merit_type": merit_obj.merit_type,
@@ -81,7 +77,8 @@ def set_merit(character, merit_key, merit_obj, dots, caller):
     
     # If this is an instanced merit, also store the instance name
     if instance_name:
-        character.db.stats["merits"][merit_key]["instance"] = instance_name
+        merit_data["instance"] = instance_name
+    character.stats.set("merits", merit_key, merit_data)
     
     # Format success message
     merit_display = merit_obj.name
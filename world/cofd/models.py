@@ -87,8 +87,15 @@ class CombatInstance(SharedMemoryModel):
     location = models.ForeignKey('objects.ObjectDB', on_delete=models.SET_NULL, null=True, related_name='combats')
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
-    is_active = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True, db_index=True)
     current_turn = models.IntegerField(default=0)
+    round_number = models.IntegerField(default=1)
+    next_team = models.IntegerField(default=1)
+    current_actor = models.ForeignKey('objects.ObjectDB', on_delete=models.SET_NULL, null=True, blank=True,
+                                      related_name='+')
+    # Initiative queue key of the slot the round has reached, which a held action
+    # taken late doesn't move; null before anyone has acted this round
+    round_position = models.JSONField(null=True, blank=True)
     
     def __str__(self):
         return f"Combat: {self.name}"
@@ -101,6 +108,11 @@ class CombatParticipant(SharedMemoryModel):
     has_acted = models.BooleanField(default=False)
     defense_applied = models.IntegerField(default=0)
     conditions = models.JSONField(default=list)
+    team = models.IntegerField(default=1)
+    # Initiative queue sequence number, breaking exact ties; -1 if not in the order
+    order = models.IntegerField(default=-1)
+    # Remaining per-participant tracker flags: prone, cover, grapple state, ...
+    state = models.JSONField(default=dict)
     
     class Meta:
         unique_together = ('combat', 'character')
@@ -225,3 +237,53 @@ class GroupMembership(SharedMemoryModel):
     
     def __str__(self):
         return f"{self.character.name} - {self.group.name}"
+
+# Stat Index Models
+class CharacterStatIndex(models.Model):
+    """
+    Denormalized copy of one character stat, for SQL census and search.
+
+    The source of truth stays in the character's stat Attributes; rows are
+    rewritten by the StatHandler write path (see world.cofd.stat_index).
+    Dotted stats and merits store their rating in numeric_value, text stats
+    (bio fields, template) in string_value. Approval is indexed as
+    category 'status', stat_name 'approved'.
+    
+    A plain Model rather than SharedMemoryModel: rows are only read and
+    written in bulk and shouldn't be kept in the idmapper cache.
+    """
+    character = models.ForeignKey('objects.ObjectDB', on_delete=models.CASCADE, related_name='stat_index')
+    category = models.CharField(max_length=32)
+    stat_name = models.CharField(max_length=100)
+    numeric_value = models.IntegerField(null=True, blank=True)
+    string_value = models.CharField(max_length=255, blank=True, default='')
+    
+    class Meta:
+        unique_together = ('character', 'category', 'stat_name')
+        indexes = [
+            models.Index(fields=['category', 'stat_name', 'numeric_value']),
+            models.Index(fields=['category', 'stat_name', 'string_value']),
+        ]
+    
+    def __str__(self):
+        value = self.numeric_value if self.numeric_value is not None else self.string_value
+        return f"{self.character_id}: {self.category}.{self.stat_name} = {value}"
+
+# Census Models
+class CensusCounter(models.Model):
+    """
+    Running count of approved characters for one +census line.
+    
+    scope is 'template' for the overall breakdown, or 'template:<Template>'
+    for that template's subtypes; label is the displayed name, e.g. 'Vampire'
+    or 'Daeva (Invictus)'. Maintained incrementally by world.cofd.census.
+    """
+    scope = models.CharField(max_length=64)
+    label = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+    
+    class Meta:
+        unique_together = ('scope', 'label')
+    
+    def __str__(self):
+        return f"{self.scope}: {self.label} = {self.count}"
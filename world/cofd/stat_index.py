@@ -0,0 +1,203 @@
+"""
+Denormalized stat index for census and stat searches.
+
+Keeps CharacterStatIndex rows in step with each character's stats so that
+questions like "how many approved Vampires", "who has Occult 4+" or "clan
+breakdown" are single indexed SQL queries instead of loading and unpickling
+every character.
+
+StatHandler.save() calls sync_categories() for the categories it wrote, and
+Character.set_approved() calls sync_approval(). Writes through db.stats go
+through the StatHandler too; only code that writes the stat Attributes
+themselves bypasses the index, and rebuild_stat_index() recovers from that.
+The index is built at server start if it is empty, e.g. on first deploy.
+"""
+
+from django.db import transaction
+from django.db.models import Count
+
+from world.cofd.models import CharacterStatIndex
+
+STATUS_CATEGORY = "status"
+
+# Sheet categories mirrored into the index
+INDEXED_CATEGORIES = ("attributes", "skills", "advantages", "anchors", "bio", "merits", "other")
+
+MAX_STRING_LENGTH = 255
+
+
+def index_value(value):
+    """
+    Split a stat value into its (numeric_value, string_value) columns.
+
+    Merits are stored as {'dots': n, ...} and index their dots.
+    """
+    if isinstance(value, dict):
+        value = value.get("dots", value.get("value"))
+    if isinstance(value, bool):
+        return int(value), ""
+    if isinstance(value, int):
+        return value, ""
+    if isinstance(value, float):
+        return int(value), ""
+    if value is None:
+        return None, ""
+    return None, str(value)[:MAX_STRING_LENGTH]
+
+
+def _rows_for(character, category, values):
+    """Build unsaved index rows for one category of a character's stats."""
+    rows = []
+    for stat_name, value in values.items():
+        numeric_value, string_value = index_value(value)
+        rows.append(CharacterStatIndex(
+            character_id=character.id, category=category, stat_name=str(stat_name)[:100],
+            numeric_value=numeric_value, string_value=string_value
+        ))
+    return rows
+
+
+def sync_categories(character, categories):
+    """
+    Replace the index rows for some categories of a character.
+
+    Args:
+        character (ObjectDB): The character whose stats changed
+        categories (dict): {category: {stat_name: value}} as just saved
+    """
+    categories = {name: values for name, values in categories.items()
+                  if name in INDEXED_CATEGORIES and isinstance(values, dict)}
+    if not categories:
+        return
+
+    rows = []
+    for category, values in categories.items():
+        rows.extend(_rows_for(character, category, values))
+
+    with transaction.atomic():
+        CharacterStatIndex.objects.filter(character_id=character.id, category__in=categories).delete()
+        CharacterStatIndex.objects.bulk_create(rows)
+
+
+def sync_approval(character, approved):
+    """Record a character's approval status in the index."""
+    CharacterStatIndex.objects.update_or_create(
+        character_id=character.id, category=STATUS_CATEGORY, stat_name="approved",
+        defaults={"numeric_value": int(bool(approved)), "string_value": ""}
+    )
+
+
+def reindex_character(character):
+    """Rebuild every index row for one character from its stored stats."""
+    stats = character.stats.as_dict()
+    with transaction.atomic():
+        CharacterStatIndex.objects.filter(character_id=character.id).delete()
+        sync_categories(character, stats)
+        sync_approval(character, character.attributes.get("approved"))
+
+
+def rebuild_stat_index():
+    """
+    Rebuild the whole index from every character's stored stats.
+
+    Returns:
+        int: Number of characters indexed
+    """
+    from typeclasses.characters import Character
+
+    count = 0
+    with transaction.atomic():
+        CharacterStatIndex.objects.all().delete()
+        for character in Character.objects.all_family():
+            reindex_character(character)
+            count += 1
+    return count
+
+
+def ensure_stat_index():
+    """
+    Build the index if it has never been built.
+
+    Returns:
+        int: Number of characters indexed, 0 if the index already had rows
+    """
+    if CharacterStatIndex.objects.exists():
+        return 0
+    return rebuild_stat_index()
+
+
+# Queries
+
+def approved_character_ids():
+    """Queryset of ids of approved characters, usable as a subquery."""
+    return CharacterStatIndex.objects.filter(
+        category=STATUS_CATEGORY, stat_name="approved", numeric_value=1
+    ).values("character_id")
+
+
+def stat_rows(approved_only=True):
+    """Base queryset of index rows, restricted to approved characters by default."""
+    rows = CharacterStatIndex.objects.all()
+    if approved_only:
+        rows = rows.filter(character_id__in=approved_character_ids())
+    return rows
+
+
+def count_values(category, stat_name, approved_only=True):
+    """
+    Count characters by the string value of one stat, e.g. template or clan.
+
+    Returns:
+        dict: {string_value: count}
+    """
+    rows = (stat_rows(approved_only)
+            .filter(category=category, stat_name=stat_name)
+            .values("string_value").annotate(total=Count("id")))
+    return {row["string_value"]: row["total"] for row in rows}
+
+
+def count_stats(category, approved_only=True, minimum=1):
+    """
+    Count how many characters have each stat in a category at a minimum rating.
+
+    Returns:
+        dict: {stat_name: count}
+    """
+    rows = (stat_rows(approved_only)
+            .filter(category=category, numeric_value__gte=minimum)
+            .values("stat_name").annotate(total=Count("id")))
+    return {row["stat_name"]: row["total"] for row in rows}
+
+
+def characters_with_stat(category, stat_name, minimum=1, approved_only=True):
+    """
+    Find characters with a stat at or above a rating, e.g. Occult 4+.
+
+    Returns:
+        QuerySet: CharacterStatIndex rows with their character, highest rating first
+    """
+    return (stat_rows(approved_only)
+            .filter(category=category, stat_name=stat_name, numeric_value__gte=minimum)
+            .select_related("character")
+            .order_by("-numeric_value", "character__db_key"))
+
+
+def bio_values(template, fields, approved_only=True):
+    """
+    Fetch selected bio fields for every character of a template.
+
+    Returns:
+        dict: {character_id: {field: value}}
+    """
+    template_ids = (stat_rows(approved_only)
+                    .filter(category="other", stat_name="template", string_value=template)
+                    .values("character_id"))
+    rows = (CharacterStatIndex.objects
+            .filter(character_id__in=template_ids, category="bio", stat_name__in=fields)
+            .values_list("character_id", "stat_name", "string_value"))
+    result = {}
+    for character_id in template_ids.values_list("character_id", flat=True):
+        result[character_id] = {}
+    for character_id, stat_name, string_value in rows:
+        result.setdefault(character_id, {})[stat_name] = string_value
+    return result
@@ -224,9 +224,8 @@ class TemplateRegistry:
                 installed_by=installer
             )
             
-            # Clear cache to force reload
-            self._cache = {}
-            self._loaded = False
+            # Clear caches to force reload
+            self.clear_cache()
             
             return True, f"Successfully installed template '{template.display_name}'", template
             
@@ -496,6 +495,10 @@ register_template({name.upper()}_TEMPLATE)
         self._cache = {}
         self._loaded = False
         
+        # Rendered +lookup pages may list template data
+        from .lookup_cache import LOOKUP_PAGE_CACHE
+        LOOKUP_PAGE_CACHE.clear()
+        
         # Also clear Django's query cache
         try:
             from django.core.cache import cache
@@ -1,11 +1,64 @@
 """
 Template Registration System for Chronicles of Darkness.
-This module automatically registers all template definitions when imported.
+Each template module registers its definition, power pools and derived
+stats when it is imported. Modules are imported on first use, so a game only
+loads the game lines it touches: load_template_module() for one template,
+load_all_templates() for every one.
 """
 
+import importlib
+
+# Templates register their own derived stats and power pools here too
+from world.cofd.derived_stats import DerivedStat, register_derived_stat, register_power_pool
+
 # Registry for template definitions
 _template_definitions = {}
 
+# Template modules in this package, loaded on first use
+TEMPLATE_MODULES = (
+    "mortal", "vampire", "mage", "changeling", "werewolf", "geist",
+    # "beast",  # Beast template disabled, incomplete
+    "deviant", "demon", "hunter", "promethean", "mummy", "mortal_plus",
+    # Legacy template modules for 1st Edition support
+    "legacy_vampire", "legacy_mage", "legacy_changeling", "legacy_werewolf",
+    "legacy_geist", "legacy_promethean", "legacy_hunter", "legacy_changingbreeds",
+)
+
+
+def template_module_name(template_name):
+    """Get the module name for a template name, e.g. 'Mortal+' -> 'mortal_plus'."""
+    return template_name.strip().lower().replace("+", "_plus").replace(" ", "_")
+
+
+def load_template_module(template_name):
+    """
+    Import one template's module, registering what it defines.
+
+    Args:
+        template_name (str): Template or module name
+
+    Returns:
+        module: The template module, or None if there isn't one
+    """
+    module_name = template_module_name(template_name)
+    if module_name not in TEMPLATE_MODULES:
+        return None
+    return importlib.import_module(f"{__name__}.{module_name}")
+
+
+def load_all_templates():
+    """Import every template module."""
+    for module_name in TEMPLATE_MODULES:
+        importlib.import_module(f"{__name__}.{module_name}")
+
+
+def __getattr__(name):
+    # Lets callers keep using world.cofd.templates.<module> without importing it first
+    if name in TEMPLATE_MODULES:
+        return load_template_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def register_template(template_dict):
     """
     Register a template definition.
@@ -19,37 +72,17 @@ def register_template(template_dict):
 
 def get_template_definition(name):
     """Get a specific template definition by name."""
-    return _template_definitions.get(name.lower())
+    name = name.lower()
+    if name not in _template_definitions:
+        if load_template_module(name) is None:
+            load_all_templates()
+    return _template_definitions.get(name)
 
 def get_all_template_definitions():
     """Get all registered template definitions."""
+    load_all_templates()
     return _template_definitions.copy()
 
-# Import all template modules to auto-register them
-from . import mortal
-from . import vampire
-from . import mage
-from . import changeling
-from . import werewolf
-from . import geist
-# from . import beast  # Beast template disabled, incomplete
-from . import deviant
-from . import demon
-from . import hunter
-from . import promethean
-from . import mummy
-from . import mortal_plus
-
-# Import legacy template modules for 1st Edition support
-from . import legacy_vampire
-from . import legacy_mage
-from . import legacy_changeling
-from . import legacy_werewolf
-from . import legacy_geist
-from . import legacy_promethean
-from . import legacy_hunter
-from . import legacy_changingbreeds
-
 
 # Template power list utilities
 def get_template_primary_powers(template_name):
@@ -64,29 +97,7 @@ def get_template_primary_powers(template_name):
     """
     template_name = template_name.lower()
     
-    # Map template names to their modules
-    template_modules = {
-        'vampire': vampire,
-        'mage': mage,
-        'werewolf': werewolf,
-        'changeling': changeling,
-        'geist': geist,
-        'promethean': promethean,
-        'demon': demon,
-        'hunter': hunter,
-        'deviant': deviant,
-        'mummy': mummy,
-        'legacy_vampire': legacy_vampire,
-        'legacy_mage': legacy_mage,
-        'legacy_werewolf': legacy_werewolf,
-        'legacy_changeling': legacy_changeling,
-        'legacy_geist': legacy_geist,
-        'legacy_promethean': legacy_promethean,
-        'legacy_hunter': legacy_hunter,
-        'legacy_changingbreeds': legacy_changingbreeds,
-    }
-    
-    module = template_modules.get(template_name)
+    module = load_template_module(template_name)
     if module and hasattr(module, 'get_primary_powers'):
         return module.get_primary_powers()
     
@@ -110,29 +121,7 @@ def get_template_secondary_powers(template_name):
     """
     template_name = template_name.lower()
     
-    # Map template names to their modules
-    template_modules = {
-        'vampire': vampire,
-        'mage': mage,
-        'werewolf': werewolf,
-        'changeling': changeling,
-        'geist': geist,
-        'promethean': promethean,
-        'demon': demon,
-        'hunter': hunter,
-        'deviant': deviant,
-        'mummy': mummy,
-        'legacy_vampire': legacy_vampire,
-        'legacy_mage': legacy_mage,
-        'legacy_werewolf': legacy_werewolf,
-        'legacy_changeling': legacy_changeling,
-        'legacy_geist': legacy_geist,
-        'legacy_promethean': legacy_promethean,
-        'legacy_hunter': legacy_hunter,
-        'legacy_changingbreeds': legacy_changingbreeds,
-    }
-    
-    module = template_modules.get(template_name)
+    module = load_template_module(template_name)
     if module and hasattr(module, 'get_secondary_powers'):
         return module.get_secondary_powers()
     
@@ -151,29 +140,7 @@ def get_template_all_powers(template_name):
     """
     template_name = template_name.lower()
     
-    # Map template names to their modules
-    template_modules = {
-        'vampire': vampire,
-        'mage': mage,
-        'werewolf': werewolf,
-        'changeling': changeling,
-        'geist': geist,
-        'promethean': promethean,
-        'demon': demon,
-        'hunter': hunter,
-        'deviant': deviant,
-        'mummy': mummy,
-        'legacy_vampire': legacy_vampire,
-        'legacy_mage': legacy_mage,
-        'legacy_werewolf': legacy_werewolf,
-        'legacy_changeling': legacy_changeling,
-        'legacy_geist': legacy_geist,
-        'legacy_promethean': legacy_promethean,
-        'legacy_hunter': legacy_hunter,
-        'legacy_changingbreeds': legacy_changingbreeds,
-    }
-    
-    module = template_modules.get(template_name)
+    module = load_template_module(template_name)
     if module and hasattr(module, 'get_all_powers'):
         return module.get_all_powers()
     
@@ -3,7 +3,7 @@ Changeling Template Definition for Chronicles of Darkness.
 Changeling: The Lost template with Seeming, Court, and Kith validations.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 
 # Valid seemings for Changeling characters
 CHANGELING_SEEMINGS = [
@@ -167,6 +167,7 @@ CHANGELING_TEMPLATE = {
 
 # Register the template
 register_template(CHANGELING_TEMPLATE)
+register_power_pool("glamour", "wyrd", "changeling")
 
 
 # Power list helper functions
@@ -3,7 +3,7 @@ Demon: The Descent Template Definition for Chronicles of Darkness.
 Demons are fallen angels who have escaped from the God-Machine's control.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 from world.cofd.powers.demon_form import (
     DEMON_MODIFICATIONS, DEMON_TECHNOLOGIES, DEMON_PROPULSIONS, DEMON_PROCESSES,
     ALL_DEMON_MODIFICATIONS, ALL_DEMON_TECHNOLOGIES, ALL_DEMON_PROPULSIONS, ALL_DEMON_PROCESSES
@@ -71,6 +71,7 @@ DEMON_TEMPLATE = {
 
 # Register the template
 register_template(DEMON_TEMPLATE)
+register_power_pool("aether", "primum", "demon")
 
 
 # Power list helper functions
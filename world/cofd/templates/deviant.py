@@ -3,7 +3,7 @@ Deviant: The Renegades Template Definition for Chronicles of Darkness.
 Deviants are people transformed by conspiracies, escaped from laboratories and secret programs.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 from world.cofd.powers.deviant_data import (
     ALL_VARIATIONS, ALL_SCARS, DEVIANT_FORMS,
     VARIATION_CATEGORIES, SCAR_ACTIVATION_TYPES, SCAR_ATTRIBUTES,
@@ -52,6 +52,7 @@ DEVIANT_TEMPLATE = {
 
 # Register the template
 register_template(DEVIANT_TEMPLATE)
+register_power_pool("instability", "deviation", "deviant")
 
 
 # Sheet Rendering Functions
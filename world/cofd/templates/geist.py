@@ -3,7 +3,7 @@ Geist: The Sin-Eaters Template Definition for Chronicles of Darkness.
 Sin-Eaters are those who have died and returned, bound to powerful ghosts called geists.
 """
 
-from . import register_template, get_template_definition
+from . import register_template, register_power_pool, get_template_definition
 from world.cofd.powers.geist_powers import (
     GEIST_BURDENS, GEIST_KREWE_TYPES,
     GEIST_PRIMARY_POWERS, GEIST_SECONDARY_POWERS, GEIST_ALL_POWERS,
@@ -62,6 +62,7 @@ GEIST_TEMPLATE = {
 
 # Register the template
 register_template(GEIST_TEMPLATE)
+register_power_pool("plasm", "synergy", "geist")
 
 
 # Sheet Rendering Functions
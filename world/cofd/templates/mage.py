@@ -3,7 +3,7 @@ Mage Template Definition for Chronicles of Darkness.
 Mage: The Awakening template with Path and Order validations.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 
 # Valid paths for Mage characters
 MAGE_PATHS = [
@@ -147,6 +147,7 @@ MAGE_TEMPLATE = {
 
 # Register the template
 register_template(MAGE_TEMPLATE)
+register_power_pool("mana", "gnosis", "mage")
 
 
 # Power list helper functions
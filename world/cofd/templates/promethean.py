@@ -3,7 +3,7 @@ Promethean: The Created Template Definition for Chronicles of Darkness.
 Prometheans are artificial beings seeking to become truly human through the Great Work.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 from world.cofd.powers.promethean_powers import (
     PROMETHEAN_LINEAGES, PROMETHEAN_BESTOWMENTS, PROMETHEAN_REFINEMENTS,
     PROMETHEAN_TRANSMUTATIONS, PROMETHEAN_ALEMBICS, ALL_ALEMBICS, PROMETHEAN_DISTILLATIONS
@@ -43,4 +43,5 @@ PROMETHEAN_TEMPLATE = {
 
 # Register the template
 register_template(PROMETHEAN_TEMPLATE)
+register_power_pool("pyros", "azoth", "promethean")
 
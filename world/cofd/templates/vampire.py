@@ -3,7 +3,8 @@ Vampire Template Definition for Chronicles of Darkness.
 Vampire: The Requiem template with Clan and Covenant validations.
 """
 
-from . import register_template
+from world.cofd.derived_stats import POOL_LOOKUP, stat_value
+from . import register_template, register_derived_stat, DerivedStat
 
 # Valid clans for Vampire characters
 VAMPIRE_CLANS = [
@@ -127,6 +128,22 @@ VAMPIRE_TEMPLATE = {
 register_template(VAMPIRE_TEMPLATE)
 
 
+def vitae_pool(stats):
+    """Vitae maximum from Blood Potency; Blood Potency 0 uses Stamina."""
+    blood_potency = stat_value(stats, "advantages", "blood_potency")
+    if blood_potency is None:
+        return None
+    if blood_potency == 0:
+        return stats.get("attributes", "stamina", 1)
+    return POOL_LOOKUP.get(blood_potency, 10)
+
+
+register_derived_stat(DerivedStat(
+    "vitae", vitae_pool, kind="pool", templates=["vampire"],
+    depends_on=[("advantages", "blood_potency"), ("attributes", "stamina")],
+))
+
+
 # Power list helper functions
 def get_primary_powers():
     """Get list of primary vampire powers (disciplines rated 1-5)."""
@@ -3,7 +3,7 @@ Werewolf: The Forsaken Template Definition for Chronicles of Darkness.
 Werewolves are spirit-touched shapeshifters who hunt in the border between flesh and spirit.
 """
 
-from . import register_template
+from . import register_template, register_power_pool
 
 # Valid werewolf tribes
 WEREWOLF_TRIBES = [
@@ -97,6 +97,7 @@ WEREWOLF_TEMPLATE = {
 
 # Register the template
 register_template(WEREWOLF_TEMPLATE)
+register_power_pool("essence", "primal_urge", "werewolf")
 
 
 # Power list helper functions
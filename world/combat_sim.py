@@ -0,0 +1,520 @@
+"""
+Headless combat simulation for balancing NPC archetypes against player builds.
+
+Fights are run with the live CombatTracker and CmdCombat's _perform_*_attack
+methods, so pools, Defense, weapon tags and wound penalties follow the same
+rules as +combat. Combatants are in-memory stand-ins with no sessions or
+database rows, messages go nowhere, and attack dice come from the batched
+dice engine, pre-rolled in bulk for each pool size. Fights are split into
+chunks and run across a process pool.
+
+Attack dice are reproducible from the report's seed. Archetype stat
+generation and initiative use the game's own random sources.
+
+Run it from `evennia shell`, not a live server process, so the pool can fork
+a fully loaded game:
+
+    from world.combat_sim import run_simulation
+    report = run_simulation(
+        [{"archetype": "vampire_tank", "npc_type": "major", "weapon": "sword"}],
+        ["brawler", "gunslinger"],
+        fights=5000,
+    )
+    print(report.format())
+
+A side is a list of combatants. Each is a PLAYER_BUILDS key, an
+ARCHETYPE_REGISTRY key, or a dict with either "archetype" (plus optional
+"npc_type") or "attributes"/"skills", and an optional "weapon" and "name".
+"""
+
+import hashlib
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from commands.combat import CmdCombat, CombatTracker
+from world.cofd import derived_stats
+from world.cofd.npc_archetypes import ARCHETYPE_REGISTRY
+from world.utils.dice_engine import DiceStream, again_threshold, roll_dice_batch
+from world.utils.dice_utils import RollType
+from world.utils.health_utils import calculate_wound_penalty, get_health_track, set_health_track, compact_track
+
+# Fights end in a draw after this many rounds
+MAX_ROUNDS = 20
+# Fights per process pool task
+CHUNK_SIZE = 250
+# Attack rolls pre-rolled at a time for each pool size
+DICE_BATCH_SIZE = 512
+
+ATTRIBUTES = (
+    "strength", "dexterity", "stamina",
+    "presence", "manipulation", "composure",
+    "intelligence", "wits", "resolve",
+)
+
+# Sample starting player characters; unlisted attributes are 1, skills 0
+PLAYER_BUILDS = {
+    "brawler": {
+        "attributes": {"strength": 4, "dexterity": 3, "stamina": 3, "wits": 2, "composure": 2},
+        "skills": {"brawl": 3, "athletics": 2, "intimidation": 2},
+        "weapon": "brass_knuckles",
+    },
+    "swordsman": {
+        "attributes": {"strength": 3, "dexterity": 3, "stamina": 2, "wits": 3, "composure": 2},
+        "skills": {"weaponry": 3, "athletics": 3},
+        "weapon": "sword",
+    },
+    "gunslinger": {
+        "attributes": {"strength": 2, "dexterity": 4, "stamina": 2, "wits": 3, "composure": 3},
+        "skills": {"firearms": 3, "athletics": 2},
+        "weapon": "heavy_pistol",
+    },
+    "bruiser": {
+        "attributes": {"strength": 3, "dexterity": 2, "stamina": 4, "wits": 2, "composure": 3},
+        "skills": {"weaponry": 2, "athletics": 2, "brawl": 2},
+        "weapon": "metal_club",
+    },
+}
+
+
+class _Attributes:
+    """Stand-in for a character's db attribute namespace."""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+    def __getattr__(self, name):
+        # Unset Attributes read as None, as on a typeclass
+        return None
+
+
+class _SheetStats:
+    """The parts of StatHandler derived stat recomputation uses, over a plain dict."""
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+
+    @property
+    def template(self):
+        return self.get("other", "template", "Mortal") or "Mortal"
+
+    def get(self, category, name, default=None):
+        return self.sheet.get(category, {}).get(name, default)
+
+    def set(self, category, name, value):
+        self.sheet.setdefault(category, {})[name] = value
+
+    @contextmanager
+    def batch(self):
+        yield self
+
+
+class _SilentLocation:
+    """Stand-in room that drops every message."""
+
+    def msg_contents(self, *args, **kwargs):
+        pass
+
+
+class SimulatedCombatant:
+    """
+    In-memory character for simulated fights.
+
+    Args:
+        combatant_id (int): Unique id within the fight
+        name (str): Display name
+        location (_SilentLocation): Room the fight happens in
+        stats (dict): Character sheet, as stored in db.stats
+        weapon (str): WEAPON_DATABASE key of the wielded weapon
+        npc_type (str): NPC tier for archetype generation
+    """
+
+    def __init__(self, combatant_id, name, location, stats, weapon=None, npc_type="standard"):
+        self.id = combatant_id
+        self.key = self.name = name
+        self.location = location
+        self.db = _Attributes(stats=stats, health_damage={}, wielded_weapon=weapon,
+                              npc_type=npc_type, equipment={})
+        self.stats = _SheetStats(stats)
+
+    def calculate_derived_stats(self):
+        """Work out health, Defense and the rest as the Character typeclass does."""
+        return derived_stats.recompute(self.stats, kind="derived")
+
+    @property
+    def health(self):
+        return self.db.stats.get("advantages", {}).get("health", 7)
+
+    @property
+    def damage_taken(self):
+        return len(self.db.health_damage)
+
+    @property
+    def is_defeated(self):
+        """Incapacitated once every health box is filled."""
+        return self.damage_taken >= self.health
+
+    def take_damage(self, amount, damage_type):
+        """
+        Mark damage on the health track.
+
+        Returns:
+            int: Boxes actually filled; damage past a full track is lost
+        """
+        track = get_health_track(self)
+        filled = sum(1 for box in track if box)
+        added = min(amount, len(track) - filled)
+        track[filled:filled + added] = [damage_type] * added
+        compact_track(track)
+        set_health_track(self, track)
+        return added
+
+
+class DiceReservoir:
+    """
+    Attack dice rolled in bulk.
+
+    Each (pool, again threshold, rote) combination keeps a buffer of results
+    filled DICE_BATCH_SIZE at a time by roll_dice_batch(). Rolls are
+    independent, so drawing the next buffered result is the same as rolling
+    then and there.
+
+    Args:
+        stream (DiceStream): Source of dice
+        batch_size (int): Results rolled per refill
+    """
+
+    def __init__(self, stream, batch_size=DICE_BATCH_SIZE):
+        self.stream = stream
+        self.batch_size = batch_size
+        self._buffers = {}
+
+    def roll(self, dice_pool, roll_types):
+        """
+        Roll a pool.
+
+        Returns:
+            tuple: ([], successes, ones); individual dice aren't kept
+        """
+        roll_types = roll_types or {RollType.NORMAL}
+        dice_pool = max(dice_pool, 0)
+        key = (dice_pool, again_threshold(roll_types), RollType.ROTE in roll_types)
+        buffer = self._buffers.get(key)
+        if not buffer:
+            buffer = roll_dice_batch([dice_pool] * self.batch_size, roll_types=roll_types,
+                                     stream=self.stream, with_rolls=False)
+            buffer.reverse()
+            self._buffers[key] = buffer
+        return buffer.pop()
+
+
+class HeadlessCombat(CmdCombat):
+    """
+    CmdCombat driven directly, without a caller session or messages.
+
+    Args:
+        tracker (CombatTracker): The fight's tracker
+        dice (DiceReservoir): Source of attack rolls
+    """
+
+    def __init__(self, tracker, dice):
+        super().__init__()
+        self.combat = tracker
+        self.dice = dice
+        self.caller = None
+        self.hits = []
+
+    def perform_attack(self, attacker, target):
+        """Attack with the attacker's wielded weapon, as +combat/attack does."""
+        self.caller = attacker
+        weapon = self._get_weapon()
+        if weapon.weapon_type == "ranged":
+            self._perform_ranged_attack(target, weapon)
+        elif weapon.weapon_type == "thrown":
+            self._perform_thrown_attack(target, weapon)
+        else:
+            self._perform_melee_attack(target, weapon)
+
+    def _roll_attack(self, dice_pool, roll_types):
+        return self.dice.roll(dice_pool, roll_types)
+
+    def _get_wound_penalty(self, character):
+        return calculate_wound_penalty(character)
+
+    def _apply_damage(self, target, damage, damage_type, weapon=None):
+        target.take_damage(damage, damage_type)
+        self.hits.append((self.combat.get_team(self.caller), damage))
+
+
+def resolve_spec(spec):
+    """
+    Expand a combatant spec to a dict.
+
+    Returns:
+        dict: The spec with 'archetype' or 'attributes'/'skills' filled in
+
+    Raises:
+        ValueError: If a name isn't a known build or archetype
+    """
+    if isinstance(spec, str):
+        key = spec.lower().replace(" ", "_")
+        if key in PLAYER_BUILDS:
+            return dict(PLAYER_BUILDS[key], name=key)
+        if key in ARCHETYPE_REGISTRY:
+            return {"archetype": key, "name": key}
+        raise ValueError(f"Unknown player build or NPC archetype: {spec}")
+    if "archetype" in spec and spec["archetype"] not in ARCHETYPE_REGISTRY:
+        raise ValueError(f"Unknown NPC archetype: {spec['archetype']}")
+    return dict(spec)
+
+
+def build_combatant(spec, combatant_id, location):
+    """
+    Create a combatant from a resolved spec.
+
+    Returns:
+        SimulatedCombatant
+    """
+    stats = {"attributes": {}, "skills": {}, "advantages": {}, "merits": {}, "other": {}}
+    name = spec.get("name") or spec.get("archetype") or "combatant"
+    combatant = SimulatedCombatant(
+        combatant_id, f"{name}-{combatant_id}", location, stats,
+        weapon=spec.get("weapon"), npc_type=spec.get("npc_type", "standard"),
+    )
+
+    if "archetype" in spec:
+        archetype = ARCHETYPE_REGISTRY[spec["archetype"]]
+        stats["other"]["template"] = archetype.template
+        archetype.apply_to_npc(combatant)
+    else:
+        stats["attributes"] = {attribute: spec.get("attributes", {}).get(attribute, 1)
+                               for attribute in ATTRIBUTES}
+        stats["skills"] = dict(spec.get("skills", {}))
+        stats["other"]["template"] = spec.get("template", "Mortal")
+        combatant.calculate_derived_stats()
+    return combatant
+
+
+def start_fight(side_a, side_b, dice):
+    """
+    Set up a fight: build both sides, roll everyone's initiative, and start
+    round 1 from the highest initiative.
+
+    Args:
+        side_a (list): Resolved specs for team 1
+        side_b (list): Resolved specs for team 2
+        dice (DiceReservoir): Source of attack rolls
+
+    Returns:
+        tuple: (CombatTracker, HeadlessCombat)
+    """
+    location = _SilentLocation()
+    tracker = CombatTracker(location, persist=False)
+    combat = HeadlessCombat(tracker, dice)
+
+    combatant_id = 0
+    for team, side in ((1, side_a), (2, side_b)):
+        for spec in side:
+            combatant_id += 1
+            tracker.add_participant(build_combatant(spec, combatant_id, location), team)
+    for combatant in list(tracker.participants):
+        tracker.roll_initiative(combatant)
+    tracker.start()
+    return tracker, combat
+
+
+def simulate_fight(side_a, side_b, dice, max_rounds=MAX_ROUNDS):
+    """
+    Fight one battle to the end.
+
+    Everyone attacks the first opponent still standing with their wielded
+    weapon, in initiative order, until one side is down or max_rounds pass.
+
+    Args:
+        side_a (list): Resolved specs for team 1
+        side_b (list): Resolved specs for team 2
+        dice (DiceReservoir): Source of attack rolls
+        max_rounds (int): Rounds before the fight is a draw
+
+    Returns:
+        dict: 'winner' (1, 2 or None for a draw), 'rounds', 'hits' as
+            (team, damage) pairs, and 'damage_taken' by each team
+    """
+    tracker, combat = start_fight(side_a, side_b, dice)
+
+    def standing(team):
+        return [combatant for combatant in tracker.teams[team] if not combatant.is_defeated]
+
+    while tracker.round_number <= max_rounds:
+        actor = tracker.current_actor
+        if not actor.is_defeated:
+            targets = standing(3 - tracker.get_team(actor))
+            if not targets:
+                break
+            combat.perform_attack(actor, targets[0])
+            if not standing(3 - tracker.get_team(actor)):
+                break
+        tracker.advance_turn()
+
+    survivors = [team for team in (1, 2) if standing(team)]
+    return {
+        'winner': survivors[0] if len(survivors) == 1 else None,
+        'rounds': min(tracker.round_number, max_rounds),
+        'hits': combat.hits,
+        'damage_taken': {team: sum(combatant.damage_taken for combatant in tracker.teams[team])
+                         for team in (1, 2)},
+    }
+
+
+class SimulationReport:
+    """
+    Totals from a batch of simulated fights.
+
+    Args:
+        seed (str): Hex seed the fights' dice came from
+    """
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.fights = 0
+        self.wins = Counter()
+        self.rounds = {1: Counter(), 2: Counter(), None: Counter()}
+        self.hit_damage = {1: Counter(), 2: Counter()}
+        self.damage_taken = {1: Counter(), 2: Counter()}
+
+    def add_fight(self, result):
+        """Count one simulate_fight() result."""
+        self.fights += 1
+        self.wins[result['winner']] += 1
+        self.rounds[result['winner']][result['rounds']] += 1
+        for team, damage in result['hits']:
+            self.hit_damage[team][damage] += 1
+        for team, damage in result['damage_taken'].items():
+            self.damage_taken[team][damage] += 1
+
+    def merge(self, other):
+        """Add another report's totals into this one."""
+        self.fights += other.fights
+        self.wins.update(other.wins)
+        for key, counts in other.rounds.items():
+            self.rounds[key].update(counts)
+        for team in (1, 2):
+            self.hit_damage[team].update(other.hit_damage[team])
+            self.damage_taken[team].update(other.damage_taken[team])
+
+    def win_rate(self, team):
+        """Share of fights a team won; None gives the draw rate."""
+        return self.wins[team] / self.fights if self.fights else 0.0
+
+    def mean_rounds(self, winner):
+        """Average rounds until a team won, or None if it never did."""
+        counts = self.rounds[winner]
+        total = sum(counts.values())
+        if not total:
+            return None
+        return sum(rounds * count for rounds, count in counts.items()) / total
+
+    def format(self):
+        """
+        Format the report as a text table.
+
+        Returns:
+            str: Win rates, rounds to win and damage distributions
+        """
+        lines = [f"{self.fights} fights, dice seed {self.seed}"]
+        lines.append(f"{'':<8}{'win rate':>10}{'rounds to win':>15}"
+                     f"{'avg hit':>10}{'damage taken (avg)':>20}")
+        for team, label in ((1, "Side A"), (2, "Side B")):
+            rounds = self.mean_rounds(team)
+            lines.append(
+                f"{label:<8}{self.win_rate(team):>10.1%}"
+                f"{(f'{rounds:.2f}' if rounds is not None else '-'):>15}"
+                f"{_mean(self.hit_damage[team]):>10.2f}"
+                f"{_mean(self.damage_taken[team]):>20.2f}"
+            )
+        lines.append(f"Draws: {self.win_rate(None):.1%}")
+        for team, label in ((1, "Side A"), (2, "Side B")):
+            lines.append(f"{label} damage per hit: {_histogram(self.hit_damage[team])}")
+        for team, label in ((1, "Side A"), (2, "Side B")):
+            lines.append(f"{label} damage taken per fight: {_histogram(self.damage_taken[team])}")
+        return "\n".join(lines)
+
+
+def _mean(counts):
+    total = sum(counts.values())
+    return sum(value * count for value, count in counts.items()) / total if total else 0.0
+
+
+def _histogram(counts):
+    total = sum(counts.values())
+    if not total:
+        return "-"
+    return " ".join(f"{value}:{count / total:.1%}" for value, count in sorted(counts.items()))
+
+
+def _chunk_seed(seed, index):
+    return hashlib.sha256(seed + index.to_bytes(8, "big")).digest()
+
+
+def _run_chunk(side_a, side_b, fights, seed, max_rounds):
+    """Run some fights in this process and return their report."""
+    stream = DiceStream(seed)
+    dice = DiceReservoir(stream)
+    report = SimulationReport(stream.seed_hex)
+    for _ in range(fights):
+        report.add_fight(simulate_fight(side_a, side_b, dice, max_rounds))
+    return report
+
+
+def _run_chunk_args(args):
+    return _run_chunk(*args)
+
+
+def run_simulation(side_a, side_b, fights=1000, workers=None, seed=None,
+                   max_rounds=MAX_ROUNDS, chunk_size=CHUNK_SIZE):
+    """
+    Simulate many fights between two sides.
+
+    Chunks of fights run in a process pool when the platform can fork, and
+    in this process otherwise. Each chunk's dice come from its own stream,
+    derived from the seed and the chunk's position, so a seed gives the same
+    dice whatever the number of workers.
+
+    Args:
+        side_a (list): Team 1's combatant specs
+        side_b (list): Team 2's combatant specs
+        fights (int): Number of fights
+        workers (int): Processes to use; defaults to the CPU count
+        seed (bytes or str): Dice seed, or its hex, to replay a run
+        max_rounds (int): Rounds before a fight is a draw
+        chunk_size (int): Fights per process pool task
+
+    Returns:
+        SimulationReport: Combined results
+
+    Raises:
+        ValueError: If a spec names an unknown build or archetype
+    """
+    side_a = [resolve_spec(spec) for spec in side_a]
+    side_b = [resolve_spec(spec) for spec in side_b]
+    seed = DiceStream(seed).seed
+    chunks = [
+        (side_a, side_b, min(chunk_size, fights - start), _chunk_seed(seed, index), max_rounds)
+        for index, start in enumerate(range(0, fights, chunk_size))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(chunks) > 1 and "fork" in multiprocessing.get_all_start_methods():
+        # Forked workers inherit the loaded game, which spawned ones would have to set up again
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as pool:
+            results = list(pool.map(_run_chunk_args, chunks))
+    else:
+        results = [_run_chunk(*chunk) for chunk in chunks]
+
+    report = SimulationReport(seed.hex())
+    for result in results:
+        report.merge(result)
+    return report
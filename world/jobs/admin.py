@@ -51,70 +51,22 @@ class JobAdminForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         # Make these fields not required
         self.fields['template_args'].required = False
-        self.fields['comments'].required = False
-        self.fields['last_viewed'].required = False
         
         # Set default values for fields that should never be empty
         if not self.instance.template_args:
             self.instance.template_args = {}
-        if not self.instance.comments:
-            self.instance.comments = []
-        if not self.instance.last_viewed:
-            self.instance.last_viewed = {}
-
-        # Format existing comments for display
-        if self.instance.pk:
-            self.instance.formatted_comments = []
-            if self.instance.comments:
-                for comment in self.instance.comments:
-                    # Replace %r with actual newlines for display
-                    text = comment['text'].replace('%r', '\n')
-                    self.instance.formatted_comments.append({
-                        'text': text,
-                        'author': comment['author'],
-                        'created_at': comment['created_at']
-                    })
 
     def clean(self):
         cleaned_data = super().clean()
         # Ensure template_args is a dict
         if not cleaned_data.get('template_args'):
             cleaned_data['template_args'] = {}
-        # Ensure comments is a list
-        if not cleaned_data.get('comments'):
-            cleaned_data['comments'] = []
-        # Ensure last_viewed is a dict
-        if not cleaned_data.get('last_viewed'):
-            cleaned_data['last_viewed'] = {}
         return cleaned_data
 
-    def save(self, commit=True):
-        instance = super().save(commit=False)
-        
-        # Handle new comment if provided
+    def new_comment_text(self):
+        """Get the new comment with newlines converted to %r for MUSH compatibility."""
         new_comment = self.cleaned_data.get('new_comment')
-        if new_comment:
-            # Convert newlines to %r for MUSH compatibility
-            formatted_text = new_comment.replace('\n', '%r')
-            
-            if not instance.comments:
-                instance.comments = []
-                
-            # Add the new comment
-            instance.comments.append({
-                'author': 'Admin',
-                'text': formatted_text,
-                'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-
-            # Update last_viewed timestamp for admin
-            if not instance.last_viewed:
-                instance.last_viewed = {}
-            instance.last_viewed['admin'] = timezone.now().isoformat()
-        
-        if commit:
-            instance.save()
-        return instance
+        return new_comment.replace('\n', '%r') if new_comment else ''
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
@@ -123,7 +75,8 @@ class JobAdmin(admin.ModelAdmin):
     list_filter = ('status', 'queue', 'created_at', 'closed_at')
     search_fields = ('title', 'description', 'requester__username', 'assignee__username')
     raw_id_fields = ('requester', 'assignee', 'participants')
-    readonly_fields = ('created_at', 'updated_at', 'formatted_comments')
+    readonly_fields = ('created_at', 'updated_at', 'last_activity_at', 'formatted_comments')
+    exclude = ('legacy_comments', 'legacy_last_viewed')
     date_hierarchy = 'created_at'
     
     def get_form(self, request, obj=None, **kwargs):
@@ -131,19 +84,27 @@ class JobAdmin(admin.ModelAdmin):
         form.current_user = request.user
         return form
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        new_comment = form.new_comment_text()
+        if new_comment:
+            obj.add_comment('Admin', new_comment)
+            obj.mark_viewed(request.user)
+
     def formatted_comments(self, obj):
-        if not hasattr(obj, 'formatted_comments'):
+        comments = list(obj.comments.all()) if obj.pk else []
+        if not comments:
             return "No comments"
         
         html = '<div class="job-comments">'
-        for i, comment in enumerate(obj.formatted_comments, 1):
+        for i, comment in enumerate(comments, 1):
             html += '<div class="comment-box">'
             html += f'<div class="comment-header">Comment {i}</div>'
-            html += f'<div class="comment-meta">By {comment["author"]} on {comment["created_at"]}</div>'
+            html += f'<div class="comment-meta">By {comment.author} on {comment.timestamp}</div>'
             html += '<div class="comment-text">'
             
-            # Handle roll results and warnings specially
-            text = comment["text"]
+            # Handle roll results and warnings specially; %r is a MUSH newline
+            text = comment.text.replace('%r', '\n')
             if "Roll Result:" in text or "Warning:" in text:
                 lines = text.split('\n')
                 for line in lines:
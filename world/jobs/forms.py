@@ -1,5 +1,5 @@
 from django import forms
-from .models import Job, Queue, JobTemplate, JobAttachment
+from .models import Job, Queue, JobTemplate, JobAttachment, JobComment
 from evennia.accounts.models import AccountDB
 from evennia.objects.models import ObjectDB
 
@@ -13,15 +13,15 @@ class JobForm(forms.ModelForm):
     due_date = forms.DateTimeField(required=False, widget=forms.DateTimeInput(attrs={'type': 'datetime-local'}))
     template = forms.ModelChoiceField(queryset=JobTemplate.objects.all(), required=False)
     template_args = forms.JSONField(required=False, widget=forms.HiddenInput())
-    comments = forms.JSONField(required=False, widget=forms.HiddenInput())
     attached_objects = forms.ModelMultipleChoiceField(queryset=ObjectDB.objects.all(), required=False)
 
     class Meta:
         model = Job
         fields = ['title', 'description', 'queue', 'assignee', 'participants', 
-                 'due_date', 'template', 'template_args', 'comments', 'attached_objects']
+                 'due_date', 'template', 'template_args', 'attached_objects']
         exclude = ['id', 'archive_id', 'requester', 'created_at', 'updated_at', 
-                  'closed_at', 'status', 'approved', 'last_viewed']
+                  'closed_at', 'status', 'approved', 'legacy_comments', 'legacy_last_viewed',
+                  'last_activity_at']
 
     def __init__(self, *args, **kwargs):
         self.requester = kwargs.pop('requester', None)
@@ -31,9 +31,7 @@ class JobForm(forms.ModelForm):
         if self.requester:
             self.fields['requester'].initial = self.requester
             self.fields['status'].initial = 'open'
-            self.fields['comments'].initial = []
             self.fields['template_args'].initial = {}
-            self.fields['last_viewed'].initial = {}
 
 class QueueForm(forms.ModelForm):
     """Form for creating and editing queues."""
@@ -72,8 +70,11 @@ class JobAttachmentForm(forms.ModelForm):
             'attached_to_arg': forms.TextInput(attrs={'placeholder': 'Template argument (optional)'}),
         }
 
-class JobCommentForm(forms.Form):
-    """Form for adding comments to jobs."""
-    text = forms.CharField(widget=forms.Textarea(attrs={'rows': 3}))
-    author = forms.ModelChoiceField(queryset=AccountDB.objects.all(), widget=forms.HiddenInput())
-    created_at = forms.DateTimeField(widget=forms.HiddenInput()) 
\ No newline at end of file
+class JobCommentForm(forms.ModelForm):
+    """Form for adding comments to jobs. The view fills in the author and time."""
+    class Meta:
+        model = JobComment
+        fields = ['text']
+        widgets = {
+            'text': forms.Textarea(attrs={'rows': 3}),
+        } 
\ No newline at end of file
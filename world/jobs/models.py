@@ -4,7 +4,10 @@ from evennia.objects.models import ObjectDB  # Assuming objects are instances of
 from django.utils import timezone
 from evennia.utils.idmapper.models import SharedMemoryModel
 from django.utils.functional import lazy
-from django.db.models import Max
+import time
+
+from django.db import IntegrityError, OperationalError, transaction
+from django.db.models import F, Max
 from evennia.accounts.models import AccountDB
 
 # Remove this line:
@@ -25,11 +28,15 @@ class Job(SharedMemoryModel):
     status = models.CharField(max_length=20, choices=[('open', 'Open'), ('claimed', 'Claimed'), ('closed', 'Closed'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled'), ('completed', 'Completed')], default='open')
     template_args = models.JSONField(default=dict)  # Actual values of the args provided during job creation
     approved = models.BooleanField(default=False)
-    comments = models.JSONField(default=list)
+    # Comments and view times from before JobComment and JobReadMarker; moved
+    # out by migrate_legacy_job_comments()
+    legacy_comments = models.JSONField(default=list, blank=True, db_column='comments')
     due_date = models.DateTimeField(null=True, blank=True)
     attached_objects = models.ManyToManyField(ObjectDB, through='JobAttachment', related_name="attached_jobs", blank=True)
     template = models.ForeignKey('JobTemplate', on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
-    last_viewed = models.JSONField(default=dict)  # Store last viewed timestamps per user
+    legacy_last_viewed = models.JSONField(default=dict, blank=True, db_column='last_viewed')
+    # Latest comment or close time, so unread checks are one comparison
+    last_activity_at = models.DateTimeField(null=True, blank=True, db_index=True)
 
     class Meta:
         app_label = 'jobs'
@@ -53,15 +60,40 @@ class Job(SharedMemoryModel):
 
 
     def close(self, closer, reason=""):
+        """
+        Close the job and queue it to be archived.
+
+        The status changes straight away; building the transcript, archiving
+        and mailing the requester are left to JobClosureScript, so closing
+        many jobs in a row doesn't stall the server.
+
+        Args:
+            closer (AccountDB): Account closing the job
+            reason (str): Closing reason, included in the requester's mail
+
+        Returns:
+            bool: False if the job was already closed or rejected
+        """
         if self.status in ['closed', 'rejected']:
-            return False, None, None, None
+            return False
 
-        self.status = "closed" if self.approved else "rejected"
-        self.closed_at = timezone.now()
-        self.save()
+        with transaction.atomic():
+            self.status = "closed" if self.approved else "rejected"
+            self.closed_at = timezone.now()
+            self.save()
+            JobClosure.objects.update_or_create(job=self, defaults={'closer': closer, 'reason': reason})
+
+        from world.scripts.job_closure_script import start_job_closure_script
+        start_job_closure_script()
+        return True
 
-        # Archive the job
-        comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" for comment in self.comments])
+    def archive(self):
+        """
+        Copy a closed job and its comments to the archive.
+
+        Returns:
+            ArchivedJob: The archived copy
+        """
         archived_job = ArchivedJob.objects.create(
             original_id=self.id,
             title=self.title,
@@ -72,40 +104,13 @@ class Job(SharedMemoryModel):
             created_at=self.created_at,
             closed_at=self.closed_at,
             status=self.status,
-            comments=comments_text
+            comments=self.comments_text()
         )
 
-        # Prepare mail summary
-        recipients = [self.requester] + list(self.participants.all())
-        if self.assignee:
-            recipients.append(self.assignee)
-        recipients = list(set(recipients))  # Remove duplicates
-
-        subject = f"Job #{self.id} {self.status.capitalize()}: {self.title}"
-        message = f"""
-Job #{self.id} has been {self.status}.
-
-Title: {self.title}
-Requester: {self.requester.username}
-Assignee: {self.assignee.username if self.assignee else 'N/A'}
-Created: {self.created_at}
-Closed: {self.closed_at}
-Status: {self.status.capitalize()}
-
-Description:
-{self.description}
-
-Closing Reason:
-{reason}
-
-Comments:
-{comments_text}
-        """
-
         if self.approved:
             self.execute_close_commands()
 
-        return True, subject, message, recipients
+        return archived_job
 
     def execute_close_commands(self):
         # If there's a JobTemplate associated with this job, execute its close commands
@@ -119,48 +124,145 @@ Comments:
 
     def save(self, *args, **kwargs):
         if not self.id:
-            max_id = Job.objects.aggregate(Max('id'))['id__max'] or 0
-            self.id = max_id + 1
+            self.id = allocate_job_id()
+        if self.closed_at and (self.last_activity_at is None or self.closed_at > self.last_activity_at):
+            self.last_activity_at = self.closed_at
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'last_activity_at' not in update_fields:
+                kwargs['update_fields'] = list(update_fields) + ['last_activity_at']
         super().save(*args, **kwargs)
 
+    def add_comment(self, author, text, created_at=None):
+        """
+        Append a comment to the job.
+
+        This inserts one JobComment row and bumps last_activity_at, without
+        rewriting the job or any earlier comments.
+
+        Args:
+            author (str): Name shown for the comment
+            text (str): Comment text
+            created_at (datetime): When it was made; defaults to now
+
+        Returns:
+            JobComment: The new comment
+        """
+        comment = JobComment.objects.create(
+            job=self, author=author, text=text, created_at=created_at or timezone.now()
+        )
+        if self.last_activity_at is None or comment.created_at > self.last_activity_at:
+            self.last_activity_at = comment.created_at
+            Job.objects.filter(pk=self.pk).update(last_activity_at=comment.created_at)
+        return comment
+
+    def comments_text(self):
+        """Get every comment as plain text, as stored on archived jobs."""
+        return "\n\n".join(
+            f"{comment.author} [{comment.timestamp}]: {comment.text}" for comment in self.comments.all()
+        )
+
     def mark_viewed(self, account):
         """Mark the job as viewed by an account."""
-        if not self.last_viewed:
-            self.last_viewed = {}
-        # Store as timezone-aware ISO format string
-        self.last_viewed[str(account.id)] = timezone.now().isoformat()
-        self.save()
+        JobReadMarker.objects.update_or_create(
+            job=self, account=account, defaults={'last_read_at': timezone.now()}
+        )
+
+    def is_updated_since(self, last_read_at):
+        """
+        Check if the job has had comments or been closed since a time.
+
+        Args:
+            last_read_at (datetime): When the job was last viewed, or None if never
+        """
+        if last_read_at is None:
+            return True
+        return self.last_activity_at is not None and self.last_activity_at > last_read_at
 
     def is_updated_since_last_view(self, account):
         """Check if the job has been updated since the account last viewed it."""
-        if not self.last_viewed or str(account.id) not in self.last_viewed:
-            return True
-            
-        last_viewed = timezone.datetime.fromisoformat(self.last_viewed[str(account.id)])
-        # Ensure last_viewed is timezone-aware
-        if timezone.is_naive(last_viewed):
-            last_viewed = timezone.make_aware(last_viewed)
-        
-        # Check if any comments were added after last view
-        if self.comments:
-            latest_comment = max(
-                timezone.make_aware(timezone.datetime.fromisoformat(comment['created_at']))
-                if timezone.is_naive(timezone.datetime.fromisoformat(comment['created_at']))
-                else timezone.datetime.fromisoformat(comment['created_at'])
-                for comment in self.comments
-            )
-            if latest_comment > last_viewed:
-                return True
-                
-        # Check if status changed after last view
-        if self.closed_at:
-            closed_at = self.closed_at
-            if timezone.is_naive(closed_at):
-                closed_at = timezone.make_aware(closed_at)
-            if closed_at > last_viewed:
-                return True
-        
-        return False
+        last_read_at = JobReadMarker.objects.filter(job=self, account=account).values_list(
+            'last_read_at', flat=True
+        ).first()
+        return self.is_updated_since(last_read_at)
+
+
+class JobComment(models.Model):
+    """
+    A comment on a job.
+
+    Comments are append-only rows rather than a list on the job, so adding
+    one is a single insert however long the job's history is. Plain model
+    rather than SharedMemoryModel, so long-running jobs don't keep every
+    comment in memory.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='comments')
+    author = models.CharField(max_length=255)
+    text = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        app_label = 'jobs'
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['job', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Comment on Job #{self.job_id} by {self.author}"
+
+    @property
+    def timestamp(self):
+        """The creation time as shown in job output."""
+        return self.created_at.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class JobReadMarker(models.Model):
+    """When an account last viewed a job."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='read_markers')
+    account = models.ForeignKey("accounts.AccountDB", on_delete=models.CASCADE, related_name='job_read_markers')
+    last_read_at = models.DateTimeField()
+
+    class Meta:
+        app_label = 'jobs'
+        unique_together = ('job', 'account')
+
+    def __str__(self):
+        return f"Job #{self.job_id} read by {self.account_id} at {self.last_read_at}"
+
+    @classmethod
+    def read_times(cls, account, jobs):
+        """
+        Get when an account last viewed each of several jobs, in one query.
+
+        Returns:
+            dict: Job id -> last_read_at, for jobs the account has viewed
+        """
+        return dict(cls.objects.filter(account=account, job__in=[job.id for job in jobs])
+                    .values_list('job_id', 'last_read_at'))
+
+
+class JobClosure(models.Model):
+    """
+    A closed job waiting to be archived and have its requester mailed.
+
+    Job.close() queues one; JobClosureScript works through the queue a
+    batch at a time and deletes each entry once it's done. Entries that keep
+    failing stay queued with their last error for +jobs/closequeue to show.
+    """
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name='pending_closure')
+    closer = models.ForeignKey("accounts.AccountDB", null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    reason = models.TextField(blank=True, default='')
+    queued_at = models.DateTimeField(default=timezone.now, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        app_label = 'jobs'
+        ordering = ['queued_at', 'id']
+
+    def __str__(self):
+        return f"Closure of Job #{self.job_id} queued at {self.queued_at}"
+
 
 class JobAttachment(SharedMemoryModel):
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
@@ -213,11 +315,152 @@ class ArchivedJob(SharedMemoryModel):
 
     def save(self, *args, **kwargs):
         if not self.archive_id:
-            # If archive_id is not set, get the maximum archive_id and increment by 1
-            max_archive_id = ArchivedJob.objects.aggregate(Max('archive_id'))['archive_id__max'] or 0
-            self.archive_id = max_archive_id + 1
+            self.archive_id = allocate_archive_id()
         super().save(*args, **kwargs)
 
     class Meta:
         ordering = ['archive_id']
         app_label = 'jobs'
+
+
+class JobCounter(models.Model):
+    """
+    A named counter that hands out job and archive numbers.
+
+    Taking a number is one UPDATE ... SET value = value + 1 on this row, which
+    the database serializes, instead of a MAX() over every job that two
+    concurrent creators could both read before either inserted.
+    """
+    name = models.CharField(max_length=32, primary_key=True)
+    value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = 'jobs'
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+
+JOB_COUNTER = 'job'
+ARCHIVE_COUNTER = 'archive'
+
+# Attempts before giving up on a counter that keeps conflicting, and the
+# delay before the first retry, doubled on each one
+ALLOCATE_RETRIES = 8
+ALLOCATE_RETRY_DELAY = 0.01
+
+
+def _allocate(name, seed):
+    """
+    Take the next number from a counter, creating it on first use.
+
+    Args:
+        name (str): Counter name
+        seed (callable): Returns the highest number already in use; only
+            called when the counter doesn't exist yet
+
+    Returns:
+        int: A number no other caller has been or will be given
+
+    Raises:
+        OperationalError: If the counter stayed locked through every retry
+    """
+    delay = ALLOCATE_RETRY_DELAY
+    for attempt in range(ALLOCATE_RETRIES):
+        try:
+            with transaction.atomic():
+                if JobCounter.objects.filter(name=name).update(value=F('value') + 1):
+                    return JobCounter.objects.values_list('value', flat=True).get(name=name)
+                # Another creator may insert the counter first; that's a conflict to retry
+                return JobCounter.objects.create(name=name, value=seed() + 1).value
+        except (IntegrityError, OperationalError):
+            if attempt == ALLOCATE_RETRIES - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
+def _max_job_id():
+    return Job.objects.aggregate(Max('id'))['id__max'] or 0
+
+
+def _max_archive_id():
+    return max(
+        ArchivedJob.objects.aggregate(Max('archive_id'))['archive_id__max'] or 0,
+        Job.objects.aggregate(Max('archive_id'))['archive_id__max'] or 0,
+    )
+
+
+def allocate_job_id():
+    """Take the next job number."""
+    return _allocate(JOB_COUNTER, _max_job_id)
+
+
+def allocate_archive_id():
+    """Take the next archive number, shared by ArchivedJob and archived Jobs."""
+    return _allocate(ARCHIVE_COUNTER, _max_archive_id)
+
+
+def reset_job_counters():
+    """Restart numbering from whatever jobs remain, e.g. after clearing the archive."""
+    JobCounter.objects.filter(name__in=[JOB_COUNTER, ARCHIVE_COUNTER]).delete()
+
+
+def _parse_legacy_timestamp(value, default):
+    """Parse a timestamp from the legacy JSON fields, treating naive times as local."""
+    try:
+        timestamp = timezone.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return default
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    return timestamp
+
+
+def migrate_legacy_job_comments():
+    """
+    Move comments and view times still held in jobs' legacy JSON fields into
+    JobComment and JobReadMarker rows. Only jobs with legacy data are loaded,
+    so this is cheap to run on every server start.
+
+    Returns:
+        int: Number of jobs migrated
+    """
+    jobs = Job.objects.exclude(legacy_comments=[], legacy_last_viewed={})
+    migrated = 0
+    for job in jobs:
+        with transaction.atomic():
+            comments = [
+                JobComment(
+                    job=job,
+                    author=comment.get('author', ''),
+                    text=comment.get('text', ''),
+                    created_at=_parse_legacy_timestamp(comment.get('created_at'), job.created_at),
+                )
+                for comment in job.legacy_comments or []
+            ]
+            JobComment.objects.bulk_create(comments)
+
+            views = {}
+            for account_id, viewed_at in (job.legacy_last_viewed or {}).items():
+                # The admin site stored its views under 'admin' rather than an account
+                if str(account_id).isdigit():
+                    views[int(account_id)] = _parse_legacy_timestamp(viewed_at, None)
+            existing = AccountDB.objects.filter(id__in=views).values_list('id', flat=True)
+            for account_id in existing:
+                if views[account_id] is not None:
+                    JobReadMarker.objects.update_or_create(
+                        job=job, account_id=account_id, defaults={'last_read_at': views[account_id]}
+                    )
+
+            activity = [comment.created_at for comment in comments]
+            if job.last_activity_at:
+                activity.append(job.last_activity_at)
+            if job.closed_at:
+                activity.append(job.closed_at)
+            job.last_activity_at = max(activity) if activity else None
+            job.legacy_comments = []
+            job.legacy_last_viewed = {}
+            job.save(update_fields=['legacy_comments', 'legacy_last_viewed', 'last_activity_at'])
+        migrated += 1
+    return migrated
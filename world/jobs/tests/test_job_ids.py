@@ -0,0 +1,108 @@
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+from evennia.accounts.models import AccountDB
+from world.jobs.models import (
+    ArchivedJob, Job, JobCounter, Queue, allocate_archive_id, allocate_job_id, reset_job_counters
+)
+
+
+def run_in_threads(target, threads, per_thread):
+    """
+    Call target per_thread times in each of several threads.
+
+    Returns:
+        tuple: (results, errors) collected from every thread
+    """
+    results = []
+    errors = []
+    lock = threading.Lock()
+    start = threading.Barrier(threads)
+
+    def worker():
+        try:
+            start.wait()
+            for _ in range(per_thread):
+                value = target()
+                with lock:
+                    results.append(value)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return results, errors
+
+
+class TestJobIdAllocation(TransactionTestCase):
+    """
+    Job and archive numbers come from JobCounter. These tests need real
+    transactions so each thread's connection sees the others' commits.
+    """
+
+    THREADS = 8
+    PER_THREAD = 10
+
+    def setUp(self):
+        self.requester = AccountDB.objects.create(username="Requester")
+        self.queue = Queue.objects.create(name="REQ")
+
+    def create_job(self):
+        return Job.objects.create(
+            title="Concurrent request",
+            description="Created from a worker thread",
+            requester=self.requester,
+            queue=self.queue,
+        ).id
+
+    def test_concurrent_job_creation_gets_unique_ids(self):
+        ids, errors = run_in_threads(self.create_job, self.THREADS, self.PER_THREAD)
+
+        self.assertEqual(errors, [])
+        total = self.THREADS * self.PER_THREAD
+        self.assertEqual(len(ids), total)
+        self.assertEqual(len(set(ids)), total)
+        self.assertEqual(Job.objects.count(), total)
+        # Numbers always go up; a failed insert may leave a gap
+        self.assertGreaterEqual(max(ids), total)
+        self.assertEqual(JobCounter.objects.get(name="job").value, max(ids))
+
+    def test_concurrent_archive_ids_are_unique(self):
+        ids, errors = run_in_threads(allocate_archive_id, self.THREADS, self.PER_THREAD)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(ids)), self.THREADS * self.PER_THREAD)
+
+    def test_counter_seeds_from_existing_numbers(self):
+        Job.objects.create(id=41, title="Old", description="", requester=self.requester, queue=self.queue)
+        JobCounter.objects.all().delete()
+
+        self.assertEqual(allocate_job_id(), 42)
+
+    def test_archived_job_gets_next_archive_id(self):
+        first = allocate_archive_id()
+        archived = Job(title="Done", description="", requester=self.requester, queue=self.queue)
+        archived.save()
+        archived_job = ArchivedJob(
+            original_id=archived.id, title=archived.title, description="",
+            requester=self.requester, queue=self.queue,
+            created_at=archived.created_at, closed_at=archived.created_at,
+            status="closed", comments="",
+        )
+        archived_job.save()
+
+        self.assertEqual(archived_job.archive_id, first + 1)
+
+    def test_reset_restarts_numbering(self):
+        self.create_job()
+        Job.objects.all().delete()
+        reset_job_counters()
+
+        self.assertEqual(self.create_job(), 1)
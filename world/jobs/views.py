@@ -4,11 +4,14 @@ from django.contrib import messages
 from django.utils import timezone
 from django.db.models import Q
 from django.http import JsonResponse
+from django.core.paginator import Paginator
 from .models import Job, Queue, JobTemplate, JobAttachment, ArchivedJob
 from .forms import JobForm, QueueForm, JobTemplateForm, JobAttachmentForm, JobCommentForm
 from evennia.accounts.models import AccountDB
 from evennia.objects.models import ObjectDB
 
+JOBS_PER_PAGE = 25
+
 @login_required
 def job_list(request):
     """List all jobs."""
@@ -21,7 +24,15 @@ def job_list(request):
             status__in=['open', 'claimed']
         ).distinct().order_by('-created_at')
     
-    return render(request, 'jobs/job_list.html', {'jobs': jobs})
+    # Fetch the related rows each row shows with the jobs, a page at a time
+    jobs = jobs.select_related('requester', 'assignee', 'queue')
+    page_obj = Paginator(jobs, JOBS_PER_PAGE).get_page(request.GET.get('page'))
+    
+    return render(request, 'jobs/job_list.html', {
+        'jobs': page_obj.object_list,
+        'page_obj': page_obj,
+        'is_paginated': page_obj.has_other_pages(),
+    })
 
 @login_required
 def job_detail(request, pk):
@@ -40,21 +51,10 @@ def job_detail(request, pk):
     job.mark_viewed(request.user)
     
     # Handle comment submission
-    if request.method == 'POST' and 'comment' in request.POST:
+    if request.method == 'POST' and 'text' in request.POST:
         comment_form = JobCommentForm(request.POST)
         if comment_form.is_valid():
-            comment = comment_form.save(commit=False)
-            comment.author = request.user
-            comment.created_at = timezone.now()
-            
-            if not job.comments:
-                job.comments = []
-            job.comments.append({
-                'author': request.user.username,
-                'text': comment.text,
-                'created_at': comment.created_at.strftime('%Y-%m-%d %H:%M:%S')
-            })
-            job.save()
+            job.add_comment(request.user.username, comment_form.cleaned_data['text'])
             messages.success(request, 'Comment added successfully.')
             return redirect('job_detail', pk=pk)
     else:
@@ -156,11 +156,9 @@ def job_close(request, pk):
         reason = request.POST.get('reason', '')
         is_approved = 'approve' in request.POST
         job.approved = is_approved
-        success, subject, message, recipients = job.close(request.user, reason)
-        
-        if success:
+        if job.close(request.user, reason):
             status = "closed" if is_approved else "rejected"
-            messages.success(request, f'Job #{job.id} has been {status} and archived.')
+            messages.success(request, f'Job #{job.id} has been {status} and queued for archiving.')
         else:
             messages.error(request, f'Job #{job.id} is already closed or rejected.')
     
@@ -0,0 +1,147 @@
+"""
+Job Closure Script
+
+Archives closed jobs and mails their requesters in the background.
+
++jobs/close and the web close view only mark a job closed and queue a
+JobClosure. This script works through the queue every few seconds, a batch
+at a time, so staff closing dozens of jobs during weekly approvals don't
+stall the server on transcripts, archive rows and mail.
+"""
+
+from django.db import transaction
+from evennia import DefaultScript, logger
+
+SCRIPT_KEY = "job_closure_queue"
+
+# Closures archived per tick, and attempts before a closure is left for staff
+BATCH_SIZE = 10
+MAX_ATTEMPTS = 5
+
+
+class JobClosureScript(DefaultScript):
+    """
+    Script that archives queued job closures in batches.
+    """
+
+    def at_script_creation(self):
+        """Called when the script is first created"""
+        self.key = SCRIPT_KEY
+        self.desc = "Archives closed jobs and mails their requesters"
+        self.interval = 5
+        self.persistent = True
+        self.start_delay = True
+
+    def at_repeat(self):
+        """Called every interval"""
+        process_job_closures()
+
+
+def send_closure_mail(closure):
+    """
+    Mail a job's requester that it was closed, as +jobs/close used to.
+
+    Args:
+        closure (JobClosure): A processed closure
+    """
+    from evennia.utils import create
+
+    job = closure.job
+    recipient = job.requester
+    # Don't mail people about closing their own jobs
+    if not recipient or recipient == closure.closer:
+        return
+
+    message = f"Job #{job.id} has been {job.status}.\n\nReason: {closure.reason}"
+    try:
+        new_mail = create.create_message(
+            closure.closer,
+            f"Job #{job.id}: {job.title}\n\n{message}",
+            receivers=recipient,
+            header=f"Job #{job.id} Update"
+        )
+        new_mail.tags.add("new", category="mail")
+        new_mail.tags.add("mail", category="mail")
+        new_mail.tags.add("job", category="mail")
+        if recipient.is_connected:
+            recipient.msg(f"|yYou have received new mail about job #{job.id}. Type '@mail' to view.|n")
+    except Exception as e:
+        logger.log_err(f"JobClosureScript: Failed to mail closure of Job #{job.id}: {e}")
+
+
+def process_job_closures(batch_size=BATCH_SIZE):
+    """
+    Archive the oldest queued closures, then mail their requesters.
+
+    Each closure is archived in its own transaction, so one failure doesn't
+    hold up the rest of the batch. Mail goes out only once the archive rows
+    are committed.
+
+    Args:
+        batch_size (int): Most closures to process
+
+    Returns:
+        int: Number of closures archived
+    """
+    from world.jobs.models import JobClosure
+
+    closures = list(
+        JobClosure.objects.filter(attempts__lt=MAX_ATTEMPTS)
+        .select_related('job', 'job__requester', 'job__assignee', 'job__queue', 'closer')[:batch_size]
+    )
+
+    archived = []
+    for closure in closures:
+        try:
+            with transaction.atomic():
+                closure.job.archive()
+                closure.delete()
+        except Exception as e:
+            closure.attempts += 1
+            closure.last_error = str(e)
+            closure.save(update_fields=['attempts', 'last_error'])
+            logger.log_err(f"JobClosureScript: Failed to archive Job #{closure.job_id} "
+                           f"(attempt {closure.attempts}): {e}")
+            continue
+        archived.append(closure)
+
+    for closure in archived:
+        send_closure_mail(closure)
+    return len(archived)
+
+
+def job_closure_status():
+    """
+    Summarize the closure queue.
+
+    Returns:
+        dict: 'pending' and 'failed' closures, oldest first, and whether
+            the script is running
+    """
+    from evennia import search_script
+    from world.jobs.models import JobClosure
+
+    closures = list(JobClosure.objects.select_related('job', 'closer'))
+    return {
+        'pending': [closure for closure in closures if closure.attempts < MAX_ATTEMPTS],
+        'failed': [closure for closure in closures if closure.attempts >= MAX_ATTEMPTS],
+        'running': any(script.is_active for script in search_script(SCRIPT_KEY)),
+    }
+
+
+def start_job_closure_script():
+    """
+    Start the job closure script.
+
+    Returns:
+        JobClosureScript: The created script object
+    """
+    from evennia import search_script, create_script
+
+    # Check if script already exists
+    existing_scripts = search_script(SCRIPT_KEY)
+    if existing_scripts:
+        return existing_scripts[0]
+
+    # Create new script
+    return create_script(JobClosureScript, key=SCRIPT_KEY)
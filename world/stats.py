@@ -0,0 +1,530 @@
+"""
+Stat handler for characters.
+
+A character's sheet is stored one Attribute per category ("attributes",
+"skills", "merits" and so on), all in the "stats" Attribute category, so
+saving a changed category re-pickles and writes only that category.
+StatHandler keeps a plain, deserialized copy of the sheet in memory, tracks
+which categories changed, and writes back once per change (or once per
+batch of changes). Nothing is written when no category changed. Written
+categories are mirrored into the SQL stat index (world.cofd.stat_index), and
+template or bio changes move the character's +census counters
+(world.cofd.census).
+
+Sheets saved before the split lived in a single self.db.stats Attribute.
+The handler moves such a sheet into per-category Attributes the first time
+it loads the character.
+
+Code that still uses self.db.stats keeps working through StatsDbHolder,
+which Character uses for self.db: db.stats is a StatsView over the handler,
+so a nested write like db.stats["skills"]["occult"] = 3 saves just that
+category and updates the stat index like handler.set() does, and assigning
+a whole sheet to db.stats writes only the categories that differ. The
+handler notices a category saved behind its back and reloads it on next
+access.
+"""
+
+import copy
+from collections.abc import MutableMapping, MutableSequence
+from contextlib import contextmanager
+from types import MappingProxyType
+
+# Attribute category holding one Attribute per sheet category
+STATS_CATEGORY = "stats"
+# Key of the single, uncategorized Attribute sheets were stored in before the split
+LEGACY_STATS_ATTRIBUTE = "stats"
+
+# Categories every sheet has, in display order
+STAT_CATEGORIES = (
+    "attributes", "skills", "advantages", "anchors", "bio",
+    "merits", "specialties", "powers", "other",
+)
+
+
+def _plain(value):
+    """Turn a stored _Saver* value into plain dicts and lists."""
+    if hasattr(value, "deserialize"):
+        return value.deserialize()
+    return value
+
+
+class StatCategory:
+    """One category of a character's sheet and whether it has unsaved changes."""
+
+    __slots__ = ("name", "values", "dirty")
+
+    def __init__(self, name, values=None):
+        self.name = name
+        self.values = values if values is not None else {}
+        self.dirty = False
+
+
+class StatHandler:
+    """
+    Handler for reading and writing a character's stats.
+
+    Usage:
+        character.stats.get("attributes", "wits")
+        character.stats.set("skills", "occult", 3)
+        with character.stats.batch():
+            character.stats.set("attributes", "dexterity", 3)
+            character.stats.set("advantages", "defense", 2)
+    """
+
+    __slots__ = ("obj", "_categories", "_source", "_removed", "_batch_depth")
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._categories = {}
+        self._source = {}
+        self._removed = set()
+        self._batch_depth = 0
+        self._load()
+
+    def _stored_attribute(self, category):
+        """Get the Attribute object holding one category, or None."""
+        return self.obj.attributes.get(category, category=STATS_CATEGORY, return_obj=True)
+
+    def _migrate_legacy(self):
+        """Split a sheet still stored in the single db.stats Attribute into categories."""
+        legacy = self.obj.attributes.get(LEGACY_STATS_ATTRIBUTE, return_obj=True)
+        if legacy is None:
+            return
+        stored = _plain(legacy.value)
+        if isinstance(stored, dict):
+            for name, values in stored.items():
+                if not self.obj.attributes.has(name, category=STATS_CATEGORY):
+                    self.obj.attributes.add(name, values, category=STATS_CATEGORY)
+        self.obj.attributes.remove(LEGACY_STATS_ATTRIBUTE)
+
+    def _load(self):
+        """Read every stored category once into plain dicts."""
+        self._migrate_legacy()
+        self._categories = {}
+        self._source = {}
+        self._removed = set()
+        attributes = self.obj.attributes.get(category=STATS_CATEGORY, return_obj=True, return_list=True)
+        for attribute in attributes or ():
+            if attribute is None:
+                continue
+            self._categories[attribute.db_key] = StatCategory(attribute.db_key, _plain(attribute.value))
+            self._source[attribute.db_key] = attribute.db_value
+        for name in STAT_CATEGORIES:
+            if name not in self._categories:
+                self._categories[name] = StatCategory(name)
+
+    def _check_fresh(self, category):
+        """Reload a category if it was saved outside the handler since we read it."""
+        stat_category = self._categories.get(category)
+        if stat_category is not None and stat_category.dirty:
+            return
+        attribute = self._stored_attribute(category)
+        if (attribute.db_value if attribute else None) is self._source.get(category):
+            return
+        if attribute is None:
+            self._source.pop(category, None)
+            if stat_category is not None:
+                stat_category.values = {}
+            return
+        self._categories[category] = StatCategory(category, _plain(attribute.value))
+        self._source[category] = attribute.db_value
+
+    def reload(self):
+        """Drop unsaved changes and re-read the stored sheet."""
+        self._load()
+
+    def _category(self, category):
+        """Get a category, creating it if the sheet doesn't have it yet."""
+        stat_category = self._categories.get(category)
+        if stat_category is None:
+            stat_category = self._categories[category] = StatCategory(category)
+            self._removed.discard(category)
+        return stat_category
+
+    # Reading
+
+    def get(self, category, name, default=None):
+        """
+        Get a single stat value.
+
+        Args:
+            category (str): Sheet category, e.g. 'attributes' or 'merits'
+            name (str): Stat key within the category
+            default: Returned when the stat isn't set
+
+        Returns:
+            The stored value or default
+        """
+        self._check_fresh(category)
+        stat_category = self._categories.get(category)
+        if stat_category is None:
+            return default
+        return stat_category.values.get(name, default)
+
+    def get_category(self, category):
+        """
+        Get a read-only view of one category.
+
+        Returns:
+            MappingProxyType: Live view of the category's values
+        """
+        self._check_fresh(category)
+        return MappingProxyType(self._category(category).values)
+
+    def has(self, category, name):
+        """Check if a stat is set in a category."""
+        self._check_fresh(category)
+        stat_category = self._categories.get(category)
+        return stat_category is not None and name in stat_category.values
+
+    def categories(self):
+        """Get the names of the sheet's categories."""
+        return list(self._categories)
+
+    def _live(self, category):
+        """Get a category's in-memory values, for StatsView to read and write in place."""
+        self._check_fresh(category)
+        return self._category(category).values
+
+    @property
+    def template(self):
+        """The character's template name, 'Mortal' if unset."""
+        return self.get("other", "template", "Mortal") or "Mortal"
+
+    def as_dict(self):
+        """Get a deep copy of the whole sheet in the self.db.stats layout."""
+        for name in list(self._categories):
+            self._check_fresh(name)
+        return {name: copy.deepcopy(category.values) for name, category in self._categories.items()}
+
+    # Writing
+
+    def set(self, category, name, value):
+        """Set a single stat, saving unless inside a batch."""
+        self._check_fresh(category)
+        stat_category = self._category(category)
+        if name in stat_category.values and stat_category.values[name] == value:
+            return
+        stat_category.values[name] = value
+        stat_category.dirty = True
+        self._autosave()
+
+    def update(self, category, values):
+        """Set several stats in one category."""
+        with self.batch():
+            for name, value in values.items():
+                self.set(category, name, value)
+
+    def remove(self, category, name):
+        """
+        Remove a stat from a category.
+
+        Returns:
+            bool: True if the stat existed
+        """
+        self._check_fresh(category)
+        stat_category = self._categories.get(category)
+        if stat_category is None or name not in stat_category.values:
+            return False
+        del stat_category.values[name]
+        stat_category.dirty = True
+        self._autosave()
+        return True
+
+    def replace_category(self, category, values):
+        """Replace a whole category's contents, writing only if they changed."""
+        self._check_fresh(category)
+        values = _plain(values)
+        values = dict(values) if isinstance(values, dict) else values
+        unchanged = category in self._categories and self._categories[category].values == values
+        stat_category = self._category(category)
+        if unchanged:
+            return
+        stat_category.values = values
+        stat_category.dirty = True
+        self._autosave()
+
+    def remove_category(self, category):
+        """Remove a whole category from the sheet."""
+        if self._categories.pop(category, None) is None:
+            return
+        self._removed.add(category)
+        self._autosave()
+
+    def replace_all(self, stats):
+        """
+        Replace the whole sheet, e.g. when resetting for a new template.
+
+        Only categories whose contents differ from what is stored are written.
+        """
+        stats = _plain(stats) or {}
+        with self.batch():
+            for name in list(self._categories):
+                if name not in stats and name not in STAT_CATEGORIES:
+                    self.remove_category(name)
+            for name, values in stats.items():
+                self.replace_category(name, values)
+            for name in STAT_CATEGORIES:
+                if name not in stats:
+                    self.replace_category(name, {})
+
+    def mark_dirty(self, category):
+        """Flag a category as changed after mutating a value in place."""
+        self._category(category).dirty = True
+        self._autosave()
+
+    # Persistence
+
+    def is_dirty(self, category=None):
+        """Check if a category, or any category, has unsaved changes."""
+        if category is not None:
+            stat_category = self._categories.get(category)
+            return bool(stat_category and stat_category.dirty) or category in self._removed
+        return bool(self._removed) or any(stat_category.dirty for stat_category in self._categories.values())
+
+    def dirty_categories(self):
+        """Get the names of categories with unsaved changes."""
+        return [name for name, stat_category in self._categories.items() if stat_category.dirty]
+
+    @contextmanager
+    def batch(self):
+        """Defer write-back until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.save()
+
+    def _autosave(self):
+        if not self._batch_depth:
+            self.save()
+
+    def save(self):
+        """
+        Write changed categories back to storage.
+
+        Each dirty category is saved to its own Attribute; the others are
+        left untouched. Nothing is written when no category changed.
+
+        Returns:
+            list: Names of the categories that were written or removed
+        """
+        dirty = self.dirty_categories()
+        removed = sorted(self._removed)
+        if not dirty and not removed:
+            return []
+
+        written = {}
+        for name in dirty:
+            stat_category = self._categories[name]
+            self.obj.attributes.add(name, stat_category.values, category=STATS_CATEGORY)
+            attribute = self._stored_attribute(name)
+            self._source[name] = attribute.db_value if attribute else None
+            stat_category.dirty = False
+            written[name] = stat_category.values
+        for name in removed:
+            self.obj.attributes.remove(name, category=STATS_CATEGORY)
+            self._source.pop(name, None)
+            written[name] = {}
+        self._removed = set()
+
+        # Keep the SQL stat index and census counters in step with what was just written
+        from world.cofd.stat_index import sync_categories
+        sync_categories(self.obj, written)
+        if "bio" in written or "other" in written:
+            from world.cofd.census import update_character_census
+            update_character_census(self.obj)
+        return list(written)
+
+
+class _TrackedDict(MutableMapping):
+    """
+    A dict inside the sheet, as seen through db.stats. Writes at any depth
+    mark its category dirty on the handler, which saves it.
+    """
+
+    def __init__(self, handler, category, data):
+        self._handler = handler
+        self._category = category
+        self._data = data
+
+    def _changed(self):
+        self._handler.mark_dirty(self._category)
+
+    def __getitem__(self, key):
+        return _track(self._handler, self._category, self._data[key])
+
+    def __setitem__(self, key, value):
+        self._data[key] = _plain(value)
+        self._changed()
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._changed()
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def deserialize(self):
+        return copy.deepcopy(self._data)
+
+    def copy(self):
+        return copy.deepcopy(self._data)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._data, memo)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+class _TrackedList(MutableSequence):
+    """A list inside the sheet, as seen through db.stats."""
+
+    def __init__(self, handler, category, data):
+        self._handler = handler
+        self._category = category
+        self._data = data
+
+    def _changed(self):
+        self._handler.mark_dirty(self._category)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return copy.deepcopy(self._data[index])
+        return _track(self._handler, self._category, self._data[index])
+
+    def __setitem__(self, index, value):
+        self._data[index] = _plain(value)
+        self._changed()
+
+    def __delitem__(self, index):
+        del self._data[index]
+        self._changed()
+
+    def __len__(self):
+        return len(self._data)
+
+    def insert(self, index, value):
+        self._data.insert(index, _plain(value))
+        self._changed()
+
+    def __eq__(self, other):
+        return self._data == _plain(other)
+
+    def deserialize(self):
+        return copy.deepcopy(self._data)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._data, memo)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+def _track(handler, category, value):
+    """Wrap a dict or list from the sheet so in-place writes reach the handler."""
+    if isinstance(value, dict):
+        return _TrackedDict(handler, category, value)
+    if isinstance(value, list):
+        return _TrackedList(handler, category, value)
+    return value
+
+
+class StatsView(MutableMapping):
+    """
+    What db.stats returns on a character: the sheet as a mapping.
+
+    Reads come from the character's StatHandler, and writes at any depth go
+    back through it, so they save only the category they touch and reach
+    the stat index like any other handler write.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def __getitem__(self, category):
+        if category not in self.handler.categories():
+            raise KeyError(category)
+        return _track(self.handler, category, self.handler._live(category))
+
+    def __setitem__(self, category, values):
+        self.handler.replace_category(category, values)
+
+    def __delitem__(self, category):
+        if category not in self.handler.categories():
+            raise KeyError(category)
+        self.handler.remove_category(category)
+
+    def __iter__(self):
+        return iter(self.handler.categories())
+
+    def __len__(self):
+        return len(self.handler.categories())
+
+    def __contains__(self, category):
+        return category in self.handler.categories()
+
+    def deserialize(self):
+        """Get the sheet as plain dicts, as _SaverDict.deserialize() does."""
+        return self.handler.as_dict()
+
+    def copy(self):
+        return self.handler.as_dict()
+
+    def __deepcopy__(self, memo):
+        return self.handler.as_dict()
+
+    def __repr__(self):
+        return repr(self.handler.as_dict())
+
+
+class StatsDbHolder:
+    """
+    Stand-in for a character's self.db that serves db.stats from the
+    per-category storage and passes every other attribute through.
+
+    Args:
+        obj: The character
+        holder: Evennia's own DbHolder for the character
+    """
+
+    __slots__ = ("_obj", "_holder")
+
+    def __init__(self, obj, holder):
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_holder", holder)
+
+    def __getattribute__(self, attrname):
+        if attrname == LEGACY_STATS_ATTRIBUTE:
+            return StatsView(object.__getattribute__(self, "_obj").stats)
+        return getattr(object.__getattribute__(self, "_holder"), attrname)
+
+    def __setattr__(self, attrname, value):
+        if attrname != LEGACY_STATS_ATTRIBUTE:
+            setattr(object.__getattribute__(self, "_holder"), attrname, value)
+            return
+        handler = object.__getattribute__(self, "_obj").stats
+        if isinstance(value, StatsView):
+            if value.handler is handler:
+                # Reassigning our own sheet after nested writes; those already saved
+                return
+            value = value.handler.as_dict()
+        handler.replace_all(value or {})
+
+    def __delattr__(self, attrname):
+        if attrname != LEGACY_STATS_ATTRIBUTE:
+            delattr(object.__getattribute__(self, "_holder"), attrname)
+            return
+        handler = object.__getattribute__(self, "_obj").stats
+        with handler.batch():
+            for name in handler.categories():
+                handler.remove_category(name)
@@ -0,0 +1,39 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from world.combat_sim import DiceReservoir, resolve_spec, simulate_fight, start_fight
+from world.utils.dice_engine import DiceStream
+
+SEED = "00112233445566778899aabbccddeeff00112233445566778899aabbccddeeff"
+
+
+def sides(side_a, side_b):
+    return [resolve_spec(spec) for spec in side_a], [resolve_spec(spec) for spec in side_b]
+
+
+class TestStartFight(TestCase):
+
+    def test_fight_opens_with_the_highest_initiative(self):
+        side_a, side_b = sides(["brawler"], ["gunslinger", "swordsman", "bruiser"])
+        # Side A rolls first and low; everyone after rolls high
+        rolls = [0, 9, 9, 9]
+        with patch("commands.combat.secrets.randbelow", side_effect=rolls):
+            tracker, _ = start_fight(side_a, side_b, DiceReservoir(DiceStream(SEED)))
+
+        order = tracker.initiative_order
+        self.assertEqual(tracker.current_actor, order[0])
+        self.assertEqual(tracker.get_team(order[0]), 2)
+
+        acted = [tracker.current_actor]
+        for _ in range(len(order) - 1):
+            tracker.advance_turn()
+            acted.append(tracker.current_actor)
+        self.assertEqual(acted, order)
+        self.assertEqual(tracker.round_number, 1)
+
+    def test_fight_reports_a_result(self):
+        side_a, side_b = sides(["brawler"], ["bruiser"])
+        result = simulate_fight(side_a, side_b, DiceReservoir(DiceStream(SEED)))
+
+        self.assertIn(result["winner"], (1, 2, None))
+        self.assertGreaterEqual(result["rounds"], 1)
@@ -6,5 +6,7 @@ def get_or_create_bbs_controller():
         controller = BBSController.objects.get(db_key="BBSController")
     except BBSController.DoesNotExist:
         controller = create_object(BBSController, key="BBSController")
-        controller.db.boards = {}  # Initialize with an empty boards dictionary
-    return controller
\ No newline at end of file
+    # Move any boards and read state still stored in the old Attributes into the database
+    controller.migrate_legacy_boards()
+    controller.migrate_legacy_read_posts()
+    return controller
@@ -0,0 +1,412 @@
+"""
+Batched and analytic dice engines for Chronicles of Darkness rolls.
+
+roll_dice() in dice_utils rolls one pool a die at a time, which is right for
+a player's +roll but slow for large NPC pools, mass combat and analytics.
+This module adds:
+
+- roll_dice_batch(): rolls many pools at once and returns the same
+  (rolls, successes, ones) tuple roll_dice() does for each. Dice come from a
+  DiceStream, a SHAKE-256 keystream over a secret seed. Logging the seed lets
+  staff replay a batch exactly. NumPy does the work when it is installed,
+  and a pure Python path is used otherwise. Both draw the stream in the same
+  order, so a seed gives the same dice either way.
+
+- success_distribution(): works out the probability of each number of
+  successes for a pool without rolling, for showing odds.
+
+Usage:
+    stream = DiceStream()
+    results = roll_dice_batch([7, 7, 12, 0], roll_types={RollType.NINE_AGAIN}, stream=stream)
+    logger.log_info(f"Mass combat dice seed: {stream.seed_hex}")
+
+    odds = success_distribution(7, roll_types={RollType.ROTE})
+    odds.at_least(1), odds.expected
+"""
+
+import hashlib
+import math
+import secrets
+
+from world.utils.dice_utils import RollType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bytes at or above this are discarded so each d10 face is equally likely
+_BYTE_LIMIT = 250
+
+# Distribution entries past this much remaining probability are dropped
+DISTRIBUTION_TAIL = 1e-12
+# Largest pool success_distribution() works out; the work grows with the square of the pool
+MAX_DISTRIBUTION_POOL = 200
+# Successes worked out for one die and its again rerolls, before trimming the tail
+_DIE_SERIES_LENGTH = 64
+# Standard deviations above the mean a pool's distribution is worked out to
+_DISTRIBUTION_SIGMAS = 12
+
+
+def again_threshold(roll_types):
+    """Get the lowest face that rerolls, as roll_dice() picks it."""
+    roll_types = roll_types or ()
+    if RollType.EIGHT_AGAIN in roll_types:
+        return 8
+    if RollType.NINE_AGAIN in roll_types:
+        return 9
+    return 10
+
+
+class DiceStream:
+    """
+    Reproducible stream of d10 results from a secret seed.
+
+    Blocks of SHAKE-256 output over the seed and a block counter are turned
+    into faces by discarding bytes of 250 and up and taking the rest mod 10.
+    Without the seed the stream can't be predicted; with it, every die can be
+    replayed.
+
+    Args:
+        seed (bytes or str): Seed bytes, or their hex form from seed_hex.
+            A fresh 32-byte seed from the secrets module is used if omitted.
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = secrets.token_bytes(32)
+        elif isinstance(seed, str):
+            seed = bytes.fromhex(seed)
+        self.seed = bytes(seed)
+        self.drawn = 0
+        self._block = 0
+        self._faces = b""
+        self._position = 0
+
+    @property
+    def seed_hex(self):
+        """The seed as hex, for logging and replay."""
+        return self.seed.hex()
+
+    def _refill(self):
+        raw = hashlib.shake_256(self.seed + self._block.to_bytes(8, "big")).digest(self.BLOCK_SIZE)
+        self._block += 1
+        # Faces are stored as 0-9 bytes; translate() drops the rejected ones
+        self._faces = self._faces[self._position:] + raw.translate(_FACE_TABLE, _REJECTED)
+        self._position = 0
+
+    def _take(self, count):
+        while len(self._faces) - self._position < count:
+            self._refill()
+        faces = self._faces[self._position:self._position + count]
+        self._position += count
+        self.drawn += count
+        return faces
+
+    def draw(self, count):
+        """
+        Draw some d10 results.
+
+        Returns:
+            list: Faces from 1 to 10
+        """
+        return [face + 1 for face in self._take(count)]
+
+    def draw_array(self, count):
+        """
+        Draw some d10 results as a NumPy array. Requires NumPy.
+
+        Returns:
+            ndarray: int64 faces from 1 to 10
+        """
+        return np.frombuffer(self._take(count), dtype=np.uint8).astype(np.int64) + 1
+
+
+_FACE_TABLE = bytes(value % 10 for value in range(256))
+_REJECTED = bytes(range(_BYTE_LIMIT, 256))
+
+
+def roll_dice_batch(pools, difficulty=8, roll_types=None, stream=None, with_rolls=True):
+    """
+    Roll many dice pools at once under roll_dice() rules.
+
+    Each pool rolls its dice, rerolls faces at or above the again threshold
+    until they stop, and with rote rerolls once every die whose chain scored
+    no success. A pool of 0 or less rolls a single chance die.
+
+    Dice are drawn breadth first: every pool's first dice, then each round of
+    again rerolls, then rote rerolls.
+
+    Args:
+        pools (iterable): Dice pool sizes
+        difficulty (int): Lowest face that counts as a success
+        roll_types (set): RollType values, as for roll_dice()
+        stream (DiceStream): Source of dice; a fresh one if omitted
+        with_rolls (bool): Include each pool's individual dice. Analytics
+            that only need totals can skip building the lists.
+
+    Returns:
+        list: A (rolls, successes, ones) tuple per pool, in the same order.
+            rolls is empty when with_rolls is False.
+    """
+    pools = [int(pool) for pool in pools]
+    if not pools:
+        return []
+    roll_types = roll_types or {RollType.NORMAL}
+    stream = stream or DiceStream()
+    threshold = again_threshold(roll_types)
+    rote = RollType.ROTE in roll_types
+
+    if np is not None:
+        return _roll_batch_numpy(pools, difficulty, threshold, rote, stream, with_rolls)
+    return _roll_batch_python(pools, difficulty, threshold, rote, stream, with_rolls)
+
+
+def _roll_batch_python(pools, difficulty, threshold, rote, stream, with_rolls):
+    """roll_dice_batch() without NumPy."""
+    # One chain per initial die: (pool index, can reroll)
+    chains = []
+    for index, pool in enumerate(pools):
+        if pool <= 0:
+            chains.append((index, False))
+        else:
+            chains.extend((index, True) for _ in range(pool))
+
+    chain_rolls = [[face] for face in stream.draw(len(chains))]
+    pending = [chain for chain, (_, again) in enumerate(chains) if again and chain_rolls[chain][0] >= threshold]
+    while pending:
+        faces = stream.draw(len(pending))
+        for chain, face in zip(pending, faces):
+            chain_rolls[chain].append(face)
+        pending = [chain for chain, face in zip(pending, faces) if face >= threshold]
+
+    rote_rolls = [[] for _ in pools]
+    if rote:
+        failed = [chain for chain, (_, again) in enumerate(chains)
+                  if again and not any(face >= difficulty for face in chain_rolls[chain])]
+        for chain, face in zip(failed, stream.draw(len(failed))):
+            rote_rolls[chains[chain][0]].append(face)
+
+    results = [[[], 0, 0] for _ in pools]
+    for (index, _), faces in zip(chains, chain_rolls):
+        _tally(results[index], faces, difficulty, with_rolls)
+    for index, faces in enumerate(rote_rolls):
+        _tally(results[index], faces, difficulty, with_rolls)
+    return [tuple(result) for result in results]
+
+
+def _tally(result, faces, difficulty, with_rolls):
+    if with_rolls:
+        result[0].extend(faces)
+    for face in faces:
+        if face >= difficulty:
+            result[1] += 1
+        if face == 1:
+            result[2] += 1
+
+
+def _roll_batch_numpy(pools, difficulty, threshold, rote, stream, with_rolls):
+    """roll_dice_batch() with NumPy, drawing the stream in the same order."""
+    pool_array = np.asarray(pools, dtype=np.int64)
+    dice_per_pool = np.where(pool_array > 0, pool_array, 1)
+    chain_pool = np.repeat(np.arange(len(pools)), dice_per_pool)
+    chain_again = np.repeat(pool_array > 0, dice_per_pool)
+    chain_count = len(chain_pool)
+
+    # Every die rolled, as parallel arrays: face, chain, and order within the pool
+    faces = [stream.draw_array(chain_count)]
+    chains = [np.arange(chain_count)]
+    depths = [np.zeros(chain_count, dtype=np.int64)]
+
+    pending = chains[0][chain_again & (faces[0] >= threshold)]
+    depth = 0
+    while pending.size:
+        depth += 1
+        rerolled = stream.draw_array(pending.size)
+        faces.append(rerolled)
+        chains.append(pending)
+        depths.append(np.full(pending.size, depth, dtype=np.int64))
+        pending = pending[rerolled >= threshold]
+
+    all_faces = np.concatenate(faces)
+    all_chains = np.concatenate(chains)
+    all_depths = np.concatenate(depths)
+
+    if rote:
+        chain_successes = np.bincount(all_chains, weights=all_faces >= difficulty, minlength=chain_count)
+        failed = np.flatnonzero(chain_again & (chain_successes == 0))
+        if failed.size:
+            all_faces = np.concatenate([all_faces, stream.draw_array(failed.size)])
+            all_chains = np.concatenate([all_chains, failed])
+            # Rote dice come after every chain in the pool's roll list
+            all_depths = np.concatenate([all_depths, np.full(failed.size, -1, dtype=np.int64)])
+
+    roll_pool = chain_pool[all_chains]
+    pool_count = len(pools)
+    successes = np.bincount(roll_pool, weights=all_faces >= difficulty, minlength=pool_count).astype(np.int64)
+    ones = np.bincount(roll_pool, weights=all_faces == 1, minlength=pool_count).astype(np.int64)
+
+    if not with_rolls:
+        return [([], int(hits), int(misses)) for hits, misses in zip(successes, ones)]
+
+    # Order each pool's dice as roll_dice() lists them: chain by chain, then rote rerolls
+    is_rote = all_depths < 0
+    order = np.lexsort((all_depths, all_chains, is_rote, roll_pool))
+    sorted_faces = all_faces[order].tolist()
+    bounds = np.searchsorted(roll_pool[order], np.arange(pool_count + 1))
+    return [
+        (sorted_faces[bounds[index]:bounds[index + 1]], int(successes[index]), int(ones[index]))
+        for index in range(pool_count)
+    ]
+
+
+class SuccessDistribution:
+    """
+    Probability of each number of successes on a roll.
+
+    Args:
+        probabilities (list): probabilities[k] is the chance of exactly k successes
+        dramatic_failure (float): Chance of a dramatic failure (chance dice only)
+
+    Attributes:
+        expected (float): Mean number of successes
+    """
+
+    __slots__ = ("probabilities", "dramatic_failure", "expected", "_tail")
+
+    def __init__(self, probabilities, dramatic_failure=0.0):
+        self.probabilities = probabilities
+        self.dramatic_failure = dramatic_failure
+        self.expected = sum(successes * chance for successes, chance in enumerate(probabilities))
+        # _tail[k] is the chance of k or more successes
+        tail = [0.0] * (len(probabilities) + 1)
+        for successes in range(len(probabilities) - 1, -1, -1):
+            tail[successes] = tail[successes + 1] + probabilities[successes]
+        self._tail = tail
+
+    def exactly(self, successes):
+        """Chance of exactly this many successes."""
+        if 0 <= successes < len(self.probabilities):
+            return self.probabilities[successes]
+        return 0.0
+
+    def at_least(self, successes):
+        """Chance of this many successes or more."""
+        return self._tail[min(max(successes, 0), len(self.probabilities))]
+
+    @property
+    def success(self):
+        """Chance of at least one success."""
+        return self.at_least(1)
+
+    @property
+    def exceptional(self):
+        """Chance of an exceptional success (five or more)."""
+        return self.at_least(5)
+
+
+def _chain_distribution(difficulty, threshold, limit):
+    """
+    Successes scored by one die and its again rerolls, as a power series.
+
+    Each face adds one success if it meets the difficulty and rerolls if it
+    meets the threshold, so C = A + B * C, where A sums the faces that stop
+    and B the faces that reroll. Solved term by term as C = A / (1 - B).
+    """
+    stop = [0.0, 0.0]
+    reroll = [0.0, 0.0]
+    for face in range(1, 11):
+        target = reroll if face >= threshold else stop
+        target[1 if face >= difficulty else 0] += 0.1
+
+    chain = []
+    for successes in range(limit):
+        value = stop[successes] if successes < 2 else 0.0
+        if successes >= 1:
+            value += reroll[1] * chain[successes - 1]
+        chain.append(value / (1.0 - reroll[0]))
+    return chain
+
+
+def _multiply(left, right, limit):
+    """Multiply two truncated power series."""
+    product = [0.0] * min(len(left) + len(right) - 1, limit)
+    for i, a in enumerate(left):
+        if not a:
+            continue
+        for j, b in enumerate(right[:limit - i]):
+            product[i + j] += a * b
+    return product
+
+
+def success_distribution(dice_pool, difficulty=8, roll_types=None):
+    """
+    Work out the chance of each number of successes for a roll.
+
+    Follows roll_dice() rules, including rote rerolls that don't explode and
+    a chance die for pools of 0 or less. Again rerolls can go on forever, so
+    the series is worked out to well past the pool's mean (by its standard
+    deviation) and successes whose combined chance is below
+    DISTRIBUTION_TAIL are dropped.
+
+    Args:
+        dice_pool (int): Number of dice, at most MAX_DISTRIBUTION_POOL
+        difficulty (int): Lowest face that counts as a success
+        roll_types (set): RollType values, as for roll_dice()
+
+    Returns:
+        SuccessDistribution
+
+    Raises:
+        ValueError: If the pool is larger than MAX_DISTRIBUTION_POOL
+    """
+    roll_types = roll_types or {RollType.NORMAL}
+    face_success = max(0, min(10, 11 - difficulty)) / 10
+
+    if dice_pool <= 0:
+        dramatic = 0.1 if difficulty > 1 else 0.0
+        return SuccessDistribution([1.0 - face_success, face_success], dramatic)
+    if dice_pool > MAX_DISTRIBUTION_POOL:
+        raise ValueError(f"Odds can only be worked out for pools of up to {MAX_DISTRIBUTION_POOL} dice.")
+
+    die = _chain_distribution(difficulty, again_threshold(roll_types), _DIE_SERIES_LENGTH)
+    if RollType.ROTE in roll_types:
+        # A die whose chain scored nothing is rerolled once, without again
+        failed = die[0]
+        die = list(die)
+        die[0] = failed * (1.0 - face_success)
+        die[1] += failed * face_success
+    die = _trim(die)
+
+    # Successes on the pool are a sum of independent dice, so their mean and
+    # variance are the die's times the pool
+    mean = sum(successes * chance for successes, chance in enumerate(die))
+    variance = sum((successes - mean) ** 2 * chance for successes, chance in enumerate(die))
+    spread = dice_pool * mean + _DISTRIBUTION_SIGMAS * math.sqrt(dice_pool * variance)
+    limit = max(len(die), math.ceil(spread) + 2)
+
+    # Raise the single-die series to the pool size by repeated squaring
+    result = [1.0]
+    power = die
+    remaining = dice_pool
+    while remaining:
+        if remaining & 1:
+            result = _trim(_multiply(result, power, limit))
+        remaining >>= 1
+        if remaining:
+            power = _trim(_multiply(power, power, limit))
+
+    assert abs(sum(result) - 1.0) < 1e-9, f"Success distribution for {dice_pool} dice lost probability"
+    return SuccessDistribution(result)
+
+
+def _trim(series):
+    """Drop trailing terms once what's left is below DISTRIBUTION_TAIL."""
+    total = 0.0
+    for length, value in enumerate(series, 1):
+        total += value
+        if total >= 1.0 - DISTRIBUTION_TAIL:
+            return series[:length]
+    return series
@@ -458,4 +458,63 @@ def format_roll_display(successes: int, ones: int, rolls: List[int], dice_pool:
         output.append("|Y|[bExceptional Success achieved! You may add a condition.|n|Y]|n")
         output.append("|yUse: |w+condition/add <condition_name>|n")
     
-    return "\n".join(output)
\ No newline at end of file
+    return "\n".join(output)
+
+
+# Largest dice pool kept in the odds table; bigger pools are worked out on demand
+ODDS_MAX_POOL = 30
+
+# (dice pool, again threshold, rote) -> SuccessDistribution at difficulty 8
+_ODDS_TABLE = {}
+
+
+def build_odds_table():
+    """
+    Fill the odds table for every pool from chance die to ODDS_MAX_POOL,
+    each again threshold, with and without rote.
+
+    Returns:
+        dict: The odds table
+    """
+    from world.utils.dice_engine import success_distribution
+
+    for rote in (False, True):
+        roll_types = {RollType.ROTE} if rote else set()
+        for threshold, again in ((8, RollType.EIGHT_AGAIN), (9, RollType.NINE_AGAIN), (10, RollType.TEN_AGAIN)):
+            for dice_pool in range(ODDS_MAX_POOL + 1):
+                _ODDS_TABLE[(dice_pool, threshold, rote)] = success_distribution(
+                    dice_pool, 8, roll_types | {again}
+                )
+    return _ODDS_TABLE
+
+
+def roll_odds(dice_pool: int, roll_types: Set[RollType] = None):
+    """
+    Look up the odds of a +roll at the standard difficulty of 8.
+
+    The table is built on first use, so lookups after that don't compute
+    anything. Pools of 0 or less share the chance die entry.
+
+    Args:
+        dice_pool (int): Final dice pool, after modifiers and wound penalties
+        roll_types (Set[RollType]): Roll types, as for roll_dice()
+
+    Returns:
+        SuccessDistribution: Chance of each number of successes, with
+            expected, at_least(), exceptional and dramatic_failure
+
+    Raises:
+        ValueError: If the pool is too large to work out odds for
+    """
+    from world.utils.dice_engine import again_threshold, success_distribution
+
+    if not _ODDS_TABLE:
+        build_odds_table()
+
+    roll_types = roll_types or set()
+    key = (max(dice_pool, 0), again_threshold(roll_types), RollType.ROTE in roll_types)
+    odds = _ODDS_TABLE.get(key)
+    if odds is None:
+        # Only the table's own pools are kept, so odd requests can't grow it
+        odds = success_distribution(dice_pool, 8, roll_types)
+    return odds
@@ -0,0 +1,291 @@
+"""
+Initiative order for combat.
+
+InitiativeQueue keeps combatants in Chronicles of Darkness initiative order:
+highest initiative first, ties going to the higher Dexterity, then the
+higher Composure, then whoever joined first. Each round is a heap of the
+combatants still to act, so joining, leaving, delaying and taking the next
+turn are O(log n) however many NPCs are in the fight. Nothing is ever
+re-sorted or searched for in a list.
+
+Beyond plain turn order it handles the two ways to act later:
+
+- Delay: act later in the round at a lower initiative, which then stays
+  lowered for the rest of the fight.
+- Hold: step out of the order and act at any point later in the round.
+  A held action that isn't taken by the end of the round is lost.
+
+Usage:
+    queue = InitiativeQueue()
+    queue.add(alice, 12, dexterity=3, composure=2)
+    queue.add(bob, 9)
+    actor, new_round = queue.next()
+"""
+
+import heapq
+
+
+class InitiativeQueue:
+    """
+    Turn order for one fight.
+
+    The queue only knows the order; whose turn it is comes from next() and
+    release(), which set current.
+    """
+
+    def __init__(self):
+        self._keys = {}  # character: (-initiative, -dexterity, -composure, sequence)
+        self._pending = {}  # character: heap entry, for characters yet to act this round
+        self._round = []  # heap of [key, character] entries; removed entries have character None
+        self._held = set()
+        self._next_sequence = 0
+        self._position = None  # key of the slot the round has reached
+        self.current = None
+
+    def __contains__(self, character):
+        return character in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self.order())
+
+    @staticmethod
+    def _sort_key(initiative, dexterity, composure, sequence):
+        return (-initiative, -dexterity, -composure, sequence)
+
+    def _take_sequence(self, sequence=None):
+        """Get the sequence number for a new key, keeping later ones after it."""
+        if sequence is None:
+            sequence = self._next_sequence
+        self._next_sequence = max(self._next_sequence, sequence + 1)
+        return sequence
+
+    def _schedule(self, character):
+        """Put a character in this round's heap at their key."""
+        entry = [self._keys[character], character]
+        self._pending[character] = entry
+        heapq.heappush(self._round, entry)
+
+    def _unschedule(self, character):
+        """Take a character out of this round's heap, if they're in it."""
+        entry = self._pending.pop(character, None)
+        if entry is not None:
+            # Left in the heap and skipped when it comes up
+            entry[1] = None
+
+    def _passed(self, key):
+        """Check if the round has already gone past a slot."""
+        return self._position is not None and key < self._position
+
+    def add(self, character, initiative, dexterity=0, composure=0, sequence=None):
+        """
+        Add a character, or give one already in the fight a new initiative.
+
+        A character whose slot the round has already passed, or whose turn
+        it is now, next acts next round.
+
+        Args:
+            character: The combatant
+            initiative (int): Initiative total
+            dexterity (int): Dexterity, for breaking ties
+            composure (int): Composure, for breaking ties
+            sequence (int): Saved sequence number, when restoring a fight;
+                by default they go after everyone already added
+        """
+        self._unschedule(character)
+        self._held.discard(character)
+        key = self._sort_key(initiative, dexterity, composure, self._take_sequence(sequence))
+        self._keys[character] = key
+        if character != self.current and not self._passed(key):
+            self._schedule(character)
+
+    def remove(self, character):
+        """Take a character out of the fight."""
+        if character not in self._keys:
+            return
+        self._unschedule(character)
+        self._held.discard(character)
+        del self._keys[character]
+        if self.current == character:
+            self.current = None
+
+    def initiative(self, character):
+        """Get a character's current initiative."""
+        return -self._keys[character][0]
+
+    def sequence(self, character):
+        """
+        Get a character's sequence number, which breaks exact ties.
+
+        It changes only when they're added again or delay, so saving it
+        with their initiative is enough to restore the order.
+        """
+        return self._keys[character][3]
+
+    def is_holding(self, character):
+        """Check if a character is holding their action."""
+        return character in self._held
+
+    def has_acted(self, character):
+        """Check if a character's turn this round has come and gone."""
+        return (character in self._keys and character not in self._pending
+                and character not in self._held and character != self.current)
+
+    def order(self):
+        """
+        Get every character in initiative order.
+
+        Returns:
+            list: Characters, highest initiative first
+        """
+        return [character for character, _ in sorted(self._keys.items(), key=lambda item: item[1])]
+
+    def _start_round(self):
+        self._held.clear()
+        self._pending = {}
+        self._round = []
+        for character, key in self._keys.items():
+            entry = [key, character]
+            self._pending[character] = entry
+            self._round.append(entry)
+        heapq.heapify(self._round)
+        self._position = None
+
+    def next(self):
+        """
+        Move on to the next character to act.
+
+        Returns:
+            tuple: (character, new_round). character is None if nobody is
+                in the fight; new_round is True if this turn starts a round.
+        """
+        new_round = False
+        while True:
+            while self._round:
+                key, character = heapq.heappop(self._round)
+                if character is None:
+                    continue
+                del self._pending[character]
+                self._position = key
+                self.current = character
+                return character, new_round
+            if new_round or not self._keys:
+                self.current = None
+                return None, new_round
+            self._start_round()
+            new_round = True
+
+    def restart(self):
+        """
+        Start the round over from the top of the order, with nobody having
+        acted, e.g. once everyone has rolled before the fight begins.
+        """
+        self._start_round()
+        self.current = None
+
+    def delay(self, character, initiative):
+        """
+        Delay a character's action to a lower initiative.
+
+        The lowered initiative sticks for the rest of the fight. Ties at the
+        new initiative still go by Dexterity and Composure.
+
+        Args:
+            character: The current character, or one yet to act this round
+            initiative (int): Initiative to act at
+
+        Raises:
+            ValueError: If the character has already acted or is holding,
+                or the initiative isn't lower than their current one
+        """
+        if character in self._held:
+            raise ValueError("A held action can't be delayed; take it when you're ready.")
+        if character not in self._pending and character != self.current:
+            raise ValueError("Only a character who hasn't acted yet this round can delay.")
+        if initiative >= self.initiative(character):
+            raise ValueError(f"You can only delay to an initiative below {self.initiative(character)}.")
+
+        self._unschedule(character)
+        _, dexterity_key, composure_key, _ = self._keys[character]
+        self._keys[character] = (-initiative, dexterity_key, composure_key, self._take_sequence())
+        self._schedule(character)
+        if self.current == character:
+            self.current = None
+
+    def hold(self, character):
+        """
+        Hold a character's action to take later this round.
+
+        Args:
+            character: The current character, or one yet to act this round
+
+        Raises:
+            ValueError: If the character has already acted or is holding
+        """
+        if character in self._held:
+            raise ValueError("You are already holding your action.")
+        if character not in self._pending and character != self.current:
+            raise ValueError("Only a character who hasn't acted yet this round can hold their action.")
+        self._unschedule(character)
+        self._held.add(character)
+        if self.current == character:
+            self.current = None
+
+    def release(self, character):
+        """
+        Take a held action now.
+
+        The character becomes current, and the round then carries on from
+        where it had reached.
+
+        Raises:
+            ValueError: If the character isn't holding their action
+        """
+        if character not in self._held:
+            raise ValueError("You aren't holding an action.")
+        self._held.discard(character)
+        self.current = character
+
+    def round_position(self):
+        """
+        Get the slot the round has reached, to save along with the fight.
+
+        This isn't always the current character's slot: someone taking a
+        held action is current while the round stays where it had reached.
+
+        Returns:
+            list: The sort key of the last slot taken, or None if nobody
+                has taken a turn this round
+        """
+        return list(self._position) if self._position is not None else None
+
+    def resume(self, current=None, held=(), position=None):
+        """
+        Pick a round back up part way through, e.g. after a reload.
+
+        Everyone up to and including the slot the round had reached has had
+        their turn this round, and so has the current character.
+
+        Args:
+            current: The character whose turn it is
+            held (iterable): Characters holding their action
+            position (list): The saved round_position(); defaults to the
+                current character's slot
+        """
+        self._start_round()
+        if position is None and current in self._keys:
+            position = self._keys[current]
+        if position is not None:
+            self._position = tuple(position)
+            for character, key in self._keys.items():
+                if key <= self._position:
+                    self._unschedule(character)
+        if current in self._keys:
+            self._unschedule(current)
+            self.current = current
+        for character in held:
+            if character in self._keys:
+                self._unschedule(character)
+                self._held.add(character)
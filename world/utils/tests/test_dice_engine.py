@@ -0,0 +1,151 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from world.utils import dice_engine, dice_utils
+from world.utils.dice_engine import (
+    DiceStream, MAX_DISTRIBUTION_POOL, roll_dice_batch, success_distribution
+)
+from world.utils.dice_utils import RollType, roll_dice, roll_odds
+
+SEED = "00112233445566778899aabbccddeeff00112233445566778899aabbccddeeff"
+
+
+class ScriptedStream:
+    """Stands in for a DiceStream, handing out faces in a fixed order."""
+
+    def __init__(self, faces):
+        self.faces = list(faces)
+
+    def draw(self, count):
+        drawn, self.faces = self.faces[:count], self.faces[count:]
+        return drawn
+
+    def draw_array(self, count):
+        return dice_engine.np.asarray(self.draw(count), dtype=dice_engine.np.int64)
+
+
+def scripted_roll_dice(faces, dice_pool, roll_types):
+    """Call roll_dice() with its dice coming from a list of faces."""
+    with patch.object(dice_utils.secrets, "randbelow", side_effect=[face - 1 for face in faces]):
+        return roll_dice(dice_pool, 8, roll_types)
+
+
+class TestDiceStream(TestCase):
+
+    def test_seed_replays_the_same_dice(self):
+        pools = [5, 0, 12, 3]
+        first = roll_dice_batch(pools, roll_types={RollType.EIGHT_AGAIN}, stream=DiceStream(SEED))
+        replay = roll_dice_batch(pools, roll_types={RollType.EIGHT_AGAIN}, stream=DiceStream(SEED))
+
+        self.assertEqual(first, replay)
+        self.assertEqual(DiceStream(SEED).seed_hex, SEED)
+
+    def test_different_seeds_give_different_dice(self):
+        self.assertNotEqual(DiceStream(SEED).draw(50), DiceStream(bytes(32)).draw(50))
+
+    def test_faces_are_d10(self):
+        faces = DiceStream(SEED).draw(5000)
+
+        self.assertEqual(set(faces), set(range(1, 11)))
+
+
+class TestRollDiceBatch(TestCase):
+
+    @skipIf(dice_engine.np is None, "NumPy is not installed")
+    def test_numpy_and_python_paths_agree(self):
+        pools = [0, 1, 4, 7, 10, -2, 15]
+        for threshold, rote in ((10, False), (9, True), (8, False), (8, True)):
+            python = dice_engine._roll_batch_python(pools, 8, threshold, rote, DiceStream(SEED), True)
+            numpy = dice_engine._roll_batch_numpy(pools, 8, threshold, rote, DiceStream(SEED), True)
+            self.assertEqual(python, numpy)
+
+    def test_chance_die_matches_roll_dice(self):
+        for face in (1, 5, 8, 10):
+            expected = scripted_roll_dice([face], 0, {RollType.EIGHT_AGAIN})
+            batch = roll_dice_batch([0], roll_types={RollType.EIGHT_AGAIN}, stream=ScriptedStream([face]))
+            self.assertEqual(batch, [expected])
+
+    def test_again_chain_matches_roll_dice(self):
+        faces = [10, 10, 4]
+        expected = scripted_roll_dice(faces, 1, {RollType.TEN_AGAIN})
+        batch = roll_dice_batch([1], roll_types={RollType.TEN_AGAIN}, stream=ScriptedStream(faces))
+
+        self.assertEqual(batch, [expected])
+        self.assertEqual(expected, ([10, 10, 4], 2, 0))
+
+    def test_rote_rerolls_failed_dice_once_matching_roll_dice(self):
+        faces = [3, 9, 1, 8, 1]
+        roll_types = {RollType.ROTE}
+        expected = scripted_roll_dice(faces, 3, roll_types)
+        batch = roll_dice_batch([3], roll_types=roll_types, stream=ScriptedStream(faces))
+
+        self.assertEqual(batch, [expected])
+        self.assertEqual(expected, ([3, 9, 1, 8, 1], 2, 2))
+
+    def test_totals_without_rolls(self):
+        results = roll_dice_batch([6, 6], stream=DiceStream(SEED), with_rolls=False)
+        full = roll_dice_batch([6, 6], stream=DiceStream(SEED))
+
+        self.assertEqual([result[1:] for result in results], [result[1:] for result in full])
+        self.assertEqual([result[0] for result in results], [[], []])
+
+
+class TestSuccessDistribution(TestCase):
+
+    def test_mean_is_pool_times_die_mean(self):
+        # A d10 at difficulty 8 scores 0.3, and each again reroll adds its own chain
+        self.assertAlmostEqual(success_distribution(9).expected, 9 * 0.3 / 0.9)
+        self.assertAlmostEqual(success_distribution(7, roll_types={RollType.EIGHT_AGAIN}).expected, 7 * 0.3 / 0.7)
+
+    def test_at_least_known_values(self):
+        odds = success_distribution(4)
+        self.assertAlmostEqual(odds.at_least(0), 1.0)
+        self.assertAlmostEqual(odds.at_least(1), 1 - 0.7 ** 4)
+
+        one_die = success_distribution(1)
+        # Two successes from one die need a 10 and then a success on the reroll chain
+        self.assertAlmostEqual(one_die.at_least(2), 0.1 * 0.3)
+
+        rote = success_distribution(1, roll_types={RollType.ROTE})
+        self.assertAlmostEqual(rote.at_least(1), 1 - 0.7 * 0.7)
+
+    def test_chance_die(self):
+        # As in roll_dice(), the chance die succeeds at the roll's difficulty and never rerolls
+        odds = success_distribution(0, roll_types={RollType.EIGHT_AGAIN})
+
+        self.assertAlmostEqual(odds.success, 0.3)
+        self.assertAlmostEqual(odds.dramatic_failure, 0.1)
+        self.assertEqual(odds.at_least(2), 0.0)
+
+    def test_large_pools_keep_all_their_probability(self):
+        odds = success_distribution(MAX_DISTRIBUTION_POOL, roll_types={RollType.EIGHT_AGAIN})
+
+        self.assertAlmostEqual(sum(odds.probabilities), 1.0, places=9)
+        self.assertAlmostEqual(odds.expected, MAX_DISTRIBUTION_POOL * 0.3 / 0.7, places=6)
+
+    def test_pools_past_the_limit_are_refused(self):
+        with self.assertRaises(ValueError):
+            success_distribution(MAX_DISTRIBUTION_POOL + 1)
+
+    def test_matches_seeded_batch_rolls(self):
+        roll_types = {RollType.NINE_AGAIN}
+        results = roll_dice_batch([5] * 20000, roll_types=roll_types, stream=DiceStream(SEED), with_rolls=False)
+        mean = sum(successes for _, successes, _ in results) / len(results)
+
+        self.assertAlmostEqual(mean, success_distribution(5, roll_types=roll_types).expected, delta=0.05)
+
+
+class TestRollOdds(TestCase):
+
+    def test_table_entries_are_reused(self):
+        roll_types = {RollType.NINE_AGAIN}
+
+        self.assertIs(roll_odds(6, roll_types), roll_odds(6, roll_types))
+        self.assertIs(roll_odds(-3), roll_odds(0))
+
+    def test_pools_past_the_table_are_not_kept(self):
+        dice_pool = dice_utils.ODDS_MAX_POOL + 5
+        odds = roll_odds(dice_pool)
+
+        self.assertAlmostEqual(odds.expected, dice_pool * 0.3 / 0.9)
+        self.assertNotIn((dice_pool, 10, False), dice_utils._ODDS_TABLE)
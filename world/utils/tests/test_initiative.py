@@ -0,0 +1,347 @@
+from unittest import TestCase
+
+from world.utils.initiative import InitiativeQueue
+
+
+def take_turns(queue, turns):
+    """Advance the queue some number of turns and return who acted."""
+    return [queue.next()[0] for _ in range(turns)]
+
+
+class TestInitiativeOrder(TestCase):
+
+    def setUp(self):
+        self.queue = InitiativeQueue()
+
+    def test_highest_initiative_acts_first(self):
+        self.queue.add("slow", 5)
+        self.queue.add("fast", 12)
+        self.queue.add("middle", 8)
+
+        self.assertEqual(self.queue.order(), ["fast", "middle", "slow"])
+        self.assertEqual(take_turns(self.queue, 3), ["fast", "middle", "slow"])
+
+    def test_ties_go_to_dexterity_then_composure_then_join_order(self):
+        self.queue.add("first", 10, dexterity=2, composure=2)
+        self.queue.add("second", 10, dexterity=2, composure=2)
+        self.queue.add("composed", 10, dexterity=2, composure=4)
+        self.queue.add("quick", 10, dexterity=3, composure=1)
+
+        self.assertEqual(self.queue.order(), ["quick", "composed", "first", "second"])
+
+    def test_rounds_wrap_and_report_new_round(self):
+        self.queue.add("a", 10)
+        self.queue.add("b", 5)
+
+        self.assertEqual(self.queue.next(), ("a", False))
+        self.assertEqual(self.queue.next(), ("b", False))
+        self.assertEqual(self.queue.next(), ("a", True))
+        self.assertEqual(self.queue.next(), ("b", False))
+
+    def test_empty_queue_has_no_next(self):
+        self.assertEqual(self.queue.next(), (None, False))
+
+    def test_removed_character_is_skipped(self):
+        for name, initiative in (("a", 10), ("b", 8), ("c", 6)):
+            self.queue.add(name, initiative)
+        self.queue.next()
+        self.queue.remove("b")
+
+        self.assertEqual(take_turns(self.queue, 3), ["c", "a", "c"])
+        self.assertNotIn("b", self.queue)
+
+    def test_removing_current_character_clears_current(self):
+        self.queue.add("a", 10)
+        self.queue.next()
+        self.queue.remove("a")
+
+        self.assertIsNone(self.queue.current)
+        self.assertEqual(self.queue.next(), (None, False))
+
+    def test_joining_mid_round_after_current_acts_this_round(self):
+        self.queue.add("a", 10)
+        self.queue.add("c", 4)
+        self.queue.next()
+        self.queue.add("b", 7)
+
+        self.assertEqual(take_turns(self.queue, 2), ["b", "c"])
+
+    def test_joining_mid_round_before_current_waits_for_next_round(self):
+        self.queue.add("a", 10)
+        self.queue.add("c", 4)
+        self.queue.next()
+        self.queue.add("early", 15)
+
+        self.assertEqual(take_turns(self.queue, 3), ["c", "early", "a"])
+
+    def test_rerolling_during_own_turn_does_not_act_twice(self):
+        self.queue.add("a", 10)
+        self.queue.add("b", 5)
+        self.queue.next()
+        self.queue.add("a", 3)
+
+        self.assertEqual(self.queue.next(), ("b", False))
+        self.assertEqual(self.queue.next(), ("b", True))
+        self.assertEqual(self.queue.next(), ("a", False))
+
+    def test_restart_after_rolling_starts_from_the_top(self):
+        # The first to roll becomes current at once, so later higher rolls have "passed"
+        self.queue.add("a", 5)
+        self.queue.next()
+        self.queue.add("b", 15)
+        self.queue.add("c", 12)
+        self.queue.add("d", 3)
+        self.queue.restart()
+
+        self.assertIsNone(self.queue.current)
+        self.assertEqual(take_turns(self.queue, 4), ["b", "c", "a", "d"])
+        self.assertEqual(self.queue.next(), ("b", True))
+
+    def test_large_fight_orders_like_a_sort(self):
+        combatants = [(f"npc{index}", (index * 7919) % 23, index % 5, index % 3) for index in range(500)]
+        for name, initiative, dexterity, composure in combatants:
+            self.queue.add(name, initiative, dexterity, composure)
+
+        expected = [name for name, *_ in sorted(
+            combatants, key=lambda combatant: (-combatant[1], -combatant[2], -combatant[3]))]
+        self.assertEqual(take_turns(self.queue, 500), expected)
+        self.assertEqual(self.queue.next(), (expected[0], True))
+
+
+class TestDelayedActions(TestCase):
+
+    def setUp(self):
+        self.queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 9), ("c", 6), ("d", 3)):
+            self.queue.add(name, initiative)
+
+    def test_delay_acts_later_this_round(self):
+        self.queue.next()
+        self.queue.delay("a", 5)
+
+        self.assertIsNone(self.queue.current)
+        self.assertEqual(take_turns(self.queue, 4), ["b", "c", "a", "d"])
+
+    def test_delayed_initiative_sticks_next_round(self):
+        self.queue.next()
+        self.queue.delay("a", 5)
+        take_turns(self.queue, 4)
+
+        self.assertEqual(self.queue.initiative("a"), 5)
+        self.assertEqual(take_turns(self.queue, 4), ["b", "c", "a", "d"])
+
+    def test_delay_below_everyone_acts_last(self):
+        self.queue.next()
+        self.queue.delay("a", -2)
+
+        self.assertEqual(take_turns(self.queue, 4), ["b", "c", "d", "a"])
+        self.assertEqual(self.queue.next(), ("b", True))
+
+    def test_delay_into_tie_breaks_by_dexterity(self):
+        queue = InitiativeQueue()
+        queue.add("delayer", 10, dexterity=4)
+        queue.add("clumsy", 6, dexterity=1)
+        queue.add("nimble", 6, dexterity=5)
+        queue.next()
+        queue.delay("delayer", 6)
+
+        self.assertEqual(take_turns(queue, 3), ["nimble", "delayer", "clumsy"])
+
+    def test_delay_into_exact_tie_goes_after(self):
+        self.queue.next()
+        self.queue.delay("a", 6)
+
+        self.assertEqual(take_turns(self.queue, 3), ["b", "c", "a"])
+
+    def test_waiting_character_can_delay_before_their_turn(self):
+        self.queue.next()
+        self.queue.delay("c", 1)
+
+        self.assertEqual(self.queue.current, "a")
+        self.assertEqual(take_turns(self.queue, 3), ["b", "d", "c"])
+
+    def test_cannot_delay_to_same_or_higher_initiative(self):
+        self.queue.next()
+
+        with self.assertRaises(ValueError):
+            self.queue.delay("a", 12)
+        with self.assertRaises(ValueError):
+            self.queue.delay("a", 20)
+        self.assertEqual(self.queue.initiative("a"), 12)
+
+    def test_cannot_delay_after_acting(self):
+        take_turns(self.queue, 2)
+
+        self.assertTrue(self.queue.has_acted("a"))
+        with self.assertRaises(ValueError):
+            self.queue.delay("a", 1)
+
+    def test_delayed_character_removed_before_acting_is_skipped(self):
+        self.queue.next()
+        self.queue.delay("a", 5)
+        self.queue.remove("a")
+
+        self.assertEqual(take_turns(self.queue, 4), ["b", "c", "d", "b"])
+
+    def test_delay_twice_in_one_round(self):
+        self.queue.next()
+        self.queue.delay("a", 8)
+        self.queue.next()
+        self.queue.next()
+        self.assertEqual(self.queue.current, "a")
+        self.queue.delay("a", 2)
+
+        self.assertEqual(take_turns(self.queue, 3), ["c", "d", "a"])
+
+
+class TestHeldActions(TestCase):
+
+    def setUp(self):
+        self.queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 9), ("c", 6)):
+            self.queue.add(name, initiative)
+
+    def test_held_character_is_skipped_until_released(self):
+        self.queue.next()
+        self.queue.hold("a")
+
+        self.assertTrue(self.queue.is_holding("a"))
+        self.assertEqual(self.queue.next(), ("b", False))
+        self.queue.release("a")
+        self.assertEqual(self.queue.current, "a")
+        self.assertFalse(self.queue.is_holding("a"))
+        # The round carries on from where it had reached
+        self.assertEqual(take_turns(self.queue, 2), ["c", "a"])
+
+    def test_unused_held_action_is_lost_at_round_end(self):
+        self.queue.next()
+        self.queue.hold("a")
+        take_turns(self.queue, 2)
+
+        self.assertEqual(self.queue.next(), ("a", True))
+        self.assertFalse(self.queue.is_holding("a"))
+        with self.assertRaises(ValueError):
+            self.queue.release("a")
+
+    def test_release_without_holding_raises(self):
+        self.queue.next()
+
+        with self.assertRaises(ValueError):
+            self.queue.release("b")
+
+    def test_cannot_hold_twice_or_after_acting(self):
+        self.queue.next()
+        self.queue.hold("a")
+
+        with self.assertRaises(ValueError):
+            self.queue.hold("a")
+        self.queue.next()
+        self.queue.next()
+        with self.assertRaises(ValueError):
+            self.queue.hold("b")
+
+    def test_held_action_cannot_be_delayed(self):
+        self.queue.next()
+        self.queue.hold("a")
+
+        with self.assertRaises(ValueError):
+            self.queue.delay("a", 1)
+
+    def test_released_character_cannot_act_again_this_round(self):
+        self.queue.next()
+        self.queue.hold("a")
+        self.queue.next()
+        self.queue.release("a")
+        self.queue.next()
+
+        self.assertTrue(self.queue.has_acted("a"))
+        with self.assertRaises(ValueError):
+            self.queue.hold("a")
+
+    def test_removed_while_holding(self):
+        self.queue.next()
+        self.queue.hold("a")
+        self.queue.remove("a")
+
+        self.assertEqual(take_turns(self.queue, 3), ["b", "c", "b"])
+
+
+class TestResume(TestCase):
+
+    def test_resume_continues_after_current(self):
+        queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 9), ("c", 6), ("d", 3)):
+            queue.add(name, initiative)
+        queue.resume("b")
+
+        self.assertEqual(queue.current, "b")
+        self.assertTrue(queue.has_acted("a"))
+        self.assertEqual(take_turns(queue, 3), ["c", "d", "a"])
+
+    def test_resume_keeps_held_actions(self):
+        queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 9), ("c", 6)):
+            queue.add(name, initiative)
+        queue.resume("b", held=["a"])
+
+        self.assertTrue(queue.is_holding("a"))
+        queue.release("a")
+        self.assertEqual(take_turns(queue, 2), ["c", "a"])
+
+    def test_resume_while_taking_a_held_action(self):
+        queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 10), ("c", 8), ("d", 6)):
+            queue.add(name, initiative)
+        queue.next()
+        queue.hold("a")
+        take_turns(queue, 2)
+        queue.release("a")
+        position = queue.round_position()
+
+        restored = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 10), ("c", 8), ("d", 6)):
+            restored.add(name, initiative)
+        restored.resume("a", position=position)
+
+        self.assertEqual(restored.current, "a")
+        self.assertEqual(take_turns(restored, 2), ["d", "a"])
+        self.assertEqual(restored.next(), ("b", False))
+
+    def test_resume_releasing_before_own_slot(self):
+        queue = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 10), ("c", 8)):
+            queue.add(name, initiative)
+        queue.next()
+        queue.hold("c")
+        queue.release("c")
+        position = queue.round_position()
+
+        restored = InitiativeQueue()
+        for name, initiative in (("a", 12), ("b", 10), ("c", 8)):
+            restored.add(name, initiative)
+        restored.resume("c", position=position)
+
+        self.assertEqual(take_turns(restored, 2), ["b", "a"])
+
+    def test_saved_sequences_restore_tie_order(self):
+        queue = InitiativeQueue()
+        for name in ("a", "b", "c"):
+            queue.add(name, 8)
+        queue.add("a", 8)
+        saved = {name: queue.sequence(name) for name in ("a", "b", "c")}
+
+        restored = InitiativeQueue()
+        for name in ("c", "a", "b"):
+            restored.add(name, 8, sequence=saved[name])
+        restored.add("late", 8)
+
+        self.assertEqual(restored.order(), ["b", "c", "a", "late"])
+        self.assertEqual(restored.order(), queue.order() + ["late"])
+
+    def test_resume_without_current_starts_a_round(self):
+        queue = InitiativeQueue()
+        queue.add("a", 12)
+        queue.add("b", 9)
+        queue.resume()
+
+        self.assertEqual(take_turns(queue, 2), ["a", "b"])